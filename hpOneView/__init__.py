@@ -9,9 +9,6 @@ from __future__ import unicode_literals
 from __future__ import print_function
 from __future__ import division
 from __future__ import absolute_import
-from future import standard_library
-
-standard_library.install_aliases()
 
 __title__ = 'hpOneView'
 __version__ = '5.0.0'
@@ -56,6 +53,11 @@ elif PYTHON_VERSION < (3, 4):
         warning_message += ' Use of Python v3.4+ is advised.'
         warnings.warn(warning_message % '.'.join(map(str, PYTHON_VERSION)), Warning)
 
+if PY2:
+    # The standard library modules are only renamed on Python 2
+    from future import standard_library
+    standard_library.install_aliases()
+
 from hpOneView.connection import *
 from hpOneView.exceptions import *
 
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2026) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+"""
+This module implements the asyncio counterpart of the HPE OneView connection. It requires Python 3.5 or later.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import json
+import logging
+import ssl
+
+from hpOneView.connection import get_ssl_context, uri
+from hpOneView.exceptions import HPOneViewException
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncResponse(object):
+    """
+    HTTP response read by the AsyncConnection, with the same accessors as http.client.HTTPResponse.
+    """
+
+    def __init__(self, version, status, reason, headers, data):
+        self.version = version
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data = data
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name.lower(), default)
+
+    @property
+    def will_close(self):
+        return self.version == 'HTTP/1.0' or self.getheader('Connection', '').lower() == 'close'
+
+
+class AsyncConnection(object):
+    """
+    Non-blocking connection to an HPE OneView appliance, driven by an asyncio event loop.
+
+    The HTTP/1.1 requests are sent over keep-alive HTTPS streams, which are reused between the requests. The number of
+    requests in flight is bounded by max_connections.
+    """
+
+    PORT = 443
+    DEFAULT_MAX_CONNECTIONS = 20
+
+    def __init__(self, applianceIp, api_version=300, sslBundle=False, timeout=None,
+                 max_connections=DEFAULT_MAX_CONNECTIONS):
+        self._session = None
+        self._host = applianceIp
+        self._cred = None
+        self._apiVersion = int(api_version)
+        self._headers = {
+            'X-API-Version': self._apiVersion,
+            'Accept': 'application/json',
+            'Content-Type': 'application/json'}
+        self._sslBundle = sslBundle
+        self._timeout = timeout
+        self._validateVersion = False
+        self._max_connections = max_connections
+        self._semaphore = None
+        self._idle_streams = []
+
+    @property
+    def max_connections(self):
+        return self._max_connections
+
+    def get_session(self):
+        return self._session
+
+    def get_session_id(self):
+        return self._headers.get('auth')
+
+    def set_session_id(self, session_id):
+        self._headers['auth'] = session_id
+        self._session = True
+
+    def get_host(self):
+        return self._host
+
+    def get_ssl_context(self):
+        if self._sslBundle:
+            return get_ssl_context(self._sslBundle, ssl.CERT_REQUIRED)
+        return get_ssl_context(verify_mode=ssl.CERT_NONE)
+
+    async def do_http(self, method, path, body, custom_headers=None):
+        """
+        Sends a request and reads its response.
+
+        Args:
+            method: HTTP method.
+            path: URI of the request.
+            body: Body of the request, already serialized.
+            custom_headers: Headers added to the default headers of the connection.
+
+        Returns:
+            tuple: The AsyncResponse and its body, decoded from JSON when possible.
+        """
+        http_headers = self._headers.copy()
+        if custom_headers:
+            http_headers.update(custom_headers)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_connections)
+
+        async with self._semaphore:
+            while True:
+                reader, writer, reused = await self.__open_stream()
+                try:
+                    response = await asyncio.wait_for(self.__send(reader, writer, method, path, body, http_headers),
+                                                      self._timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if not reused:
+                        raise
+                    # The appliance dropped an idle keep-alive stream, try again with a new one
+                    logger.debug('Idle connection was closed by the appliance. Trying again...')
+                    continue
+                except BaseException:
+                    writer.close()
+                    raise
+
+                if response.will_close:
+                    writer.close()
+                else:
+                    self._idle_streams.append((reader, writer))
+
+                return response, self.__read_response_body(response, body)
+
+    async def close(self):
+        """
+        Closes the idle keep-alive streams.
+        """
+        while self._idle_streams:
+            reader, writer = self._idle_streams.pop()
+            writer.close()
+
+    async def __open_stream(self):
+        while self._idle_streams:
+            reader, writer = self._idle_streams.pop()
+            if not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(self._host, self.PORT, ssl=self.get_ssl_context()),
+                                                self._timeout)
+        return reader, writer, False
+
+    async def __send(self, reader, writer, method, path, body, http_headers):
+        if body is None:
+            body = ''
+        payload = body.encode('utf-8') if isinstance(body, str) else body
+
+        request_lines = ['{} {} HTTP/1.1'.format(method, path), 'Host: {}'.format(self._host),
+                         'Content-Length: {}'.format(len(payload))]
+        request_lines.extend('{}: {}'.format(key, value) for key, value in http_headers.items())
+        writer.write(('\r\n'.join(request_lines) + '\r\n\r\n').encode('latin-1') + payload)
+        await writer.drain()
+
+        return await self.__read_response(reader, method)
+
+    async def __read_response(self, reader, method):
+        status_line = (await reader.readline()).decode('latin-1').rstrip('\r\n')
+        if not status_line:
+            raise ConnectionResetError('The connection was closed before the response was received')
+
+        status_parts = status_line.split(' ', 2)
+        version, status = status_parts[0], int(status_parts[1])
+        reason = status_parts[2] if len(status_parts) > 2 else ''
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1').rstrip('\r\n')
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            data = await self.__read_chunks(reader)
+        elif 'content-length' in headers:
+            data = await reader.readexactly(int(headers['content-length']))
+        elif status in (204, 304) or 100 <= status < 200 or method == 'HEAD':
+            data = b''
+        else:
+            data = await reader.read()
+            headers['connection'] = 'close'
+
+        return AsyncResponse(version, status, reason, headers, data)
+
+    @staticmethod
+    async def __read_chunks(reader):
+        chunks = []
+        while True:
+            size_line = (await reader.readline()).decode('latin-1')
+            size = int(size_line.split(';', 1)[0].strip(), 16)
+            if size == 0:
+                # Skip the trailer headers
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    @staticmethod
+    def __read_response_body(response, default_body):
+        try:
+            text = response.data.decode('utf-8')
+        except UnicodeDecodeError:  # Might be binary data
+            return response.data
+
+        if not text:
+            return default_body
+
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text
+
+    async def get(self, uri):
+        response, body = await self.do_http('GET', uri, '')
+        if response.status >= 400:
+            raise HPOneViewException(body)
+        if response.status == 302:
+            body = await self.get(response.getheader('Location'))
+        return body
+
+    async def get_if_modified(self, uri, etag):
+        """
+        Gets a resource only when it changed, sending its known ETag in an If-None-Match header.
+
+        Args:
+            uri: URI of the resource.
+            etag: ETag of the known version of the resource.
+
+        Returns:
+            The resource, or None when it was not modified.
+        """
+        response, body = await self.do_http('GET', uri, '', {'If-None-Match': etag})
+        if response.status == 304:
+            return None
+        if response.status >= 400:
+            raise HPOneViewException(body)
+        if response.status == 302:
+            body = await self.get(response.getheader('Location'))
+        return body
+
+    async def delete(self, uri, custom_headers=None):
+        return await self.__do_rest_call('DELETE', uri, {}, custom_headers=custom_headers)
+
+    async def put(self, uri, body, custom_headers=None):
+        return await self.__do_rest_call('PUT', uri, body, custom_headers=custom_headers)
+
+    async def post(self, uri, body, custom_headers=None):
+        return await self.__do_rest_call('POST', uri, body, custom_headers=custom_headers)
+
+    async def patch(self, uri, body, custom_headers=None):
+        return await self.__do_rest_call('PATCH', uri, body, custom_headers=custom_headers)
+
+    async def __do_rest_call(self, http_method, uri, body, custom_headers):
+        response, body = await self.do_http(method=http_method,
+                                            path=uri,
+                                            body=json.dumps(body),
+                                            custom_headers=custom_headers)
+        if response.status >= 400:
+            raise HPOneViewException(body)
+
+        if response.status == 202:
+            location = response.getheader('Location')
+            if location:
+                task = await self.get(location)
+            elif isinstance(body, dict) and 'taskState' in body:
+                task = body
+            else:
+                task = None
+            return task, body
+
+        if isinstance(body, dict) and body.get('category') == 'tasks':
+            return body, body
+
+        return None, body
+
+    async def validateVersion(self):
+        version = await self.get(uri['version'])
+        if 'minimumVersion' in version:
+            if self._apiVersion < version['minimumVersion']:
+                raise HPOneViewException('Unsupported API Version')
+        if 'currentVersion' in version:
+            if self._apiVersion > version['currentVersion']:
+                raise HPOneViewException('Unsupported API Version')
+        self._validateVersion = True
+
+    async def login(self, cred):
+        if self._validateVersion is False:
+            await self.validateVersion()
+
+        self._cred = cred
+        try:
+            if self._cred.get("sessionID"):
+                self.set_session_id(self._cred["sessionID"])
+                task, body = await self.put(uri['loginSessions'], None)
+            else:
+                self._cred.pop("sessionID", None)
+                task, body = await self.post(uri['loginSessions'], self._cred)
+        except HPOneViewException:
+            logger.exception('Login failed')
+            raise
+
+        self._headers['auth'] = body['sessionID']
+        self._session = True
+        logger.info('Logged in successfully')
+
+    async def logout(self):
+        try:
+            await self.delete(uri['loginSessions'])
+        except HPOneViewException:
+            logger.exception('Logout failed')
+            raise
+        finally:
+            await self.close()
+
+        del self._headers['auth']
+        self._session = False
+        logger.info('Logged out successfully')
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2026) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+"""
+This module implements the asyncio counterpart of the OneViewClient. It requires Python 3.5 or later.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from hpOneView.aio.connection import AsyncConnection
+from hpOneView.aio.resource import AsyncResourceHelper
+from hpOneView.aio.task_monitor import AsyncTaskMonitor
+from hpOneView.oneview_client import OneViewClient
+from hpOneView.resources.task_monitor import ExponentialPollPolicy
+
+# Options of the OneViewClient configuration which are not implemented by the AsyncConnection
+UNSUPPORTED_CONFIG_OPTIONS = ('image_streamer_ip', 'proxy', 'connection_pool', 'response_cache', 'conditional_requests',
+                              'trusted_data_age', 'parallel_pagination', 'file_transfer', 'session_cache',
+                              'request_limits', 'retry_policy', 'circuit_breaker', 'task_notifications')
+
+UNSUPPORTED_CONFIG_OPTIONS_ERROR = 'The AsyncOneViewClient does not support the options: {}'
+
+
+class AsyncOneViewClient(object):
+    """
+    Non-blocking client of the HPE OneView REST API, driven by an asyncio event loop.
+
+    It takes the ip, api_version, ssl_certificate, timeout, credentials and task_polling options of the OneViewClient
+    configuration, plus max_connections, the maximum number of requests in flight. A ValueError is raised for the other
+    options of the OneViewClient, such as proxy or retry_policy, which it does not support. The login is asynchronous,
+    so the client must be used as an asynchronous context manager, or login must be awaited before the first request:
+
+        >>> async with AsyncOneViewClient(config) as oneview_client:
+        >>>     fc_networks = oneview_client.resource_helper(FcNetworks)
+        >>>     networks = await fc_networks.get_all()
+    """
+
+    DEFAULT_API_VERSION = OneViewClient.DEFAULT_API_VERSION
+
+    def __init__(self, config):
+        unsupported_options = [option for option in UNSUPPORTED_CONFIG_OPTIONS if config.get(option)]
+        if unsupported_options:
+            raise ValueError(UNSUPPORTED_CONFIG_OPTIONS_ERROR.format(', '.join(unsupported_options)))
+
+        self.__connection = AsyncConnection(config["ip"],
+                                            config.get('api_version', self.DEFAULT_API_VERSION),
+                                            config.get('ssl_certificate', False),
+                                            config.get('timeout'),
+                                            config.get('max_connections', AsyncConnection.DEFAULT_MAX_CONNECTIONS))
+        self.__credentials = config["credentials"]
+        poll_policy = ExponentialPollPolicy.from_config(config["task_polling"]) if config.get("task_polling") else None
+        self.__task_monitor = AsyncTaskMonitor(self.__connection, poll_policy)
+        self.__resource_helpers = {}
+
+    async def __aenter__(self):
+        await self.login()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.logout()
+
+    async def login(self):
+        """
+        Validates the API version and logs in the appliance.
+        """
+        await self.__connection.login(self.__credentials)
+
+    async def logout(self):
+        """
+        Logs out of the appliance and closes the idle connections.
+        """
+        await self.__connection.logout()
+
+    @property
+    def api_version(self):
+        """
+        Gets the OneView API Version.
+
+        Returns:
+            int: API Version.
+        """
+        return self.__connection._apiVersion
+
+    @property
+    def connection(self):
+        """
+        Gets the underlying asynchronous connection used by the AsyncOneViewClient.
+
+        Returns:
+            AsyncConnection:
+        """
+        return self.__connection
+
+    @property
+    def task_monitor(self):
+        """
+        Gets the task monitor used to wait for the tasks.
+
+        Returns:
+            AsyncTaskMonitor:
+        """
+        return self.__task_monitor
+
+    def resource_helper(self, resource):
+        """
+        Gets the asynchronous helper of a resource type.
+
+        Args:
+            resource: Resource class, such as FcNetworks, whose URI and DEFAULT_VALUES are used; or a base URI.
+
+        Returns:
+            AsyncResourceHelper:
+        """
+        base_uri = getattr(resource, 'URI', resource)
+        if base_uri not in self.__resource_helpers:
+            self.__resource_helpers[base_uri] = AsyncResourceHelper(base_uri,
+                                                                    self.__connection,
+                                                                    self.__task_monitor,
+                                                                    getattr(resource, 'DEFAULT_VALUES', None))
+        return self.__resource_helpers[base_uri]
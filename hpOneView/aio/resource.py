@@ -0,0 +1,473 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2026) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+"""
+This module implements the asyncio counterpart of the ResourceHelper. It requires Python 3.5 or later.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import logging
+
+from urllib.parse import quote
+
+from hpOneView import exceptions
+from hpOneView.resources.resource import ResourceHelper, RESOURCE_CLIENT_INVALID_FIELD, RESOURCE_CLIENT_TASK_EXPECTED, \
+    build_page_uris, get_default_values
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncResourceHelper(ResourceHelper):
+    """
+    Non-blocking counterpart of the ResourceHelper.
+
+    The URIs are built by the methods inherited from ResourceHelper; the requests are coroutines run by the
+    AsyncConnection and the tasks are waited by the AsyncTaskMonitor.
+    """
+
+    def __init__(self, base_uri, connection, task_monitor, default_values=None):
+        super(AsyncResourceHelper, self).__init__(base_uri, connection, task_monitor)
+        self._default_values = default_values
+
+    async def get_all(self, start=0, count=-1, filter='', query='', sort='', view='', fields='', uri=None, scope_uris=''):
+        """Gets all items according with the given arguments.
+
+        Args:
+            start: The first item to return, using 0-based indexing.
+                If not specified, the default is 0 - start with the first available item.
+            count: The number of resources to return. A count of -1 requests all items (default).
+            filter (list or str): A general filter/query string to narrow the list of items returned. The default is no
+                filter; all resources are returned.
+            query: A single query parameter can do what would take multiple parameters or multiple GET requests using
+                filter. Use query for more complex queries.
+            sort: The sort order of the returned data set. By default, the sort order is based on create time with the
+                oldest entry first.
+            view: Returns a specific subset of the attributes of the resource or collection by specifying the name of a
+                predefined view.
+            fields: Name of the fields.
+            uri: A specific URI (optional)
+            scope_uris: An expression to restrict the resources returned according to the scopes to
+                which they are assigned.
+
+        Returns:
+             list: A list of items matching the specified filter.
+        """
+        uri = self.build_query_uri(uri=uri or self._base_uri,
+                                   start=start,
+                                   count=count,
+                                   filter=filter,
+                                   query=query,
+                                   sort=sort,
+                                   view=view,
+                                   fields=fields,
+                                   scope_uris=scope_uris)
+
+        logger.debug('Getting all resources with uri: {0}'.format(uri))
+
+        return await self.do_requests_to_getall(uri, count)
+
+    def iter_all(self, start=0, count=-1, filter='', query='', sort='', view='', fields='', uri=None, scope_uris='',
+                 prefetch=False):
+        """Iterates over all items according with the given arguments, requesting one page at a time.
+
+        Args:
+            start: The first item to return, using 0-based indexing.
+                If not specified, the default is 0 - start with the first available item.
+            count: The number of resources to return. A count of -1 requests all items (default).
+            filter (list or str): A general filter/query string to narrow the list of items returned. The default is no
+                filter; all resources are returned.
+            query: A single query parameter can do what would take multiple parameters or multiple GET requests using
+                filter. Use query for more complex queries.
+            sort: The sort order of the returned data set. By default, the sort order is based on create time with the
+                oldest entry first.
+            view: Returns a specific subset of the attributes of the resource or collection by specifying the name of a
+                predefined view.
+            fields: Name of the fields.
+            uri: A specific URI (optional)
+            scope_uris: An expression to restrict the resources returned according to the scopes to
+                which they are assigned.
+            prefetch: Requests the next page while the items of the current page are consumed.
+
+        Returns:
+            AsyncMembersIterator: The items matching the specified filter, to be consumed with async for.
+        """
+        uri = self.build_query_uri(uri=uri or self._base_uri,
+                                   start=start,
+                                   count=count,
+                                   filter=filter,
+                                   query=query,
+                                   sort=sort,
+                                   view=view,
+                                   fields=fields,
+                                   scope_uris=scope_uris)
+
+        logger.debug('Iterating over all resources with uri: {0}'.format(uri))
+
+        return AsyncMembersIterator(self._connection, uri, count, prefetch)
+
+    async def do_requests_to_getall(self, uri, requested_count):
+        """Helps to make http request for get_all method.
+
+        Note:
+            Once the first page tells the total of members, the following pages are requested at the same time; the
+            number of requests in flight is bounded by the connection.
+        """
+        items = []
+        first_page_uri = uri
+
+        while uri:
+            logger.debug('Making HTTP request to get all resources. Uri: {0}'.format(uri))
+            response = await self._connection.get(uri)
+            items += self.get_members(response)
+            uri = self.get_next_page(response, items, requested_count)
+
+            if uri and first_page_uri:
+                page_uris = build_page_uris(first_page_uri, response, requested_count)
+                first_page_uri = None
+
+                for response in await asyncio.gather(*[self._connection.get(page_uri) for page_uri in page_uris]):
+                    items += self.get_members(response)
+                    uri = self.get_next_page(response, items, requested_count)
+
+        logger.debug('Total # of members found = {0}'.format(str(len(items))))
+        return items
+
+    async def get_collection(self, uri=None, filter='', path=''):
+        """Retrieves a collection of resources.
+
+        Args:
+            filter (list or str): General filter/query string.
+            path (str): path to be added with base URI
+
+        Returns:
+             Collection of the requested resource.
+        """
+        if not uri:
+            uri = self._base_uri
+
+        if filter:
+            filter = self.make_query_filter(filter)
+            filter = "?" + filter[1:]
+
+        uri = "{uri}{path}{filter}".format(uri=uri, path=path, filter=filter)
+        logger.debug('Get resource collection (uri = %s)' % uri)
+
+        response = await self._connection.get(uri)
+
+        return self.get_members(response)
+
+    async def get_by(self, field, value):
+        """Gets the resources matching a field value, as Resource.get_by does.
+
+        Args:
+            field: Field name to filter.
+            value: Value to filter.
+
+        Returns:
+            list: The resources found.
+        """
+        if not field:
+            raise ValueError(RESOURCE_CLIENT_INVALID_FIELD)
+
+        filter = "\"{0}='{1}'\"".format(field, value)
+        results = await self.get_all(filter=filter)
+
+        # Workaround when the OneView filter does not work, it will filter again
+        if "." not in field:
+            results = [item for item in results if str(item.get(field, "")).lower() == value.lower()]
+
+        return results
+
+    async def create(self, data=None, uri=None, timeout=-1, custom_headers=None, force=False):
+        """Makes a POST request to create a resource, filling the default values of the API version.
+
+        Args:
+            data: Additional fields can be passed to create the resource.
+            uri: Resource uri
+            timeout: Timeout in seconds. Wait for task completion by default. The timeout does not abort the operation
+                in OneView; it just stops waiting for its completion.
+            custom_headers: Allows set specific HTTP headers.
+            force: Flag to force the operation.
+
+        Returns:
+            Created resource.
+        """
+        data = self.update_resource_fields(data or {}, get_default_values(self._default_values, self._connection._apiVersion))
+
+        if not uri:
+            uri = self._base_uri
+
+        if force:
+            uri += '?force={}'.format(force)
+
+        logger.debug('Create (uri = %s, resource = %s)' % (uri, str(data)))
+
+        return await self.do_post(uri, data, timeout, custom_headers)
+
+    async def delete(self, uri, force=False, timeout=-1, custom_headers=None):
+        """Deletes a resource.
+
+        Args:
+            uri: Resource uri
+            force: Flag to delete the resource forcefully, default is False.
+            timeout: Timeout in seconds.
+            custom_headers: Allows to set custom http headers.
+        """
+        if force:
+            uri += '?force=True'
+
+        logger.debug("Delete resource (uri = %s)" % (str(uri)))
+
+        task, body = await self._connection.delete(uri, custom_headers=custom_headers)
+
+        if not task:
+            # 204 NO CONTENT
+            return True
+
+        return await self._task_monitor.wait_for_task(task, timeout=timeout)
+
+    async def delete_all(self, filter, force=False, timeout=-1):
+        """
+        Deletes all resources from the appliance that match the provided filter.
+
+        Args:
+            filter: A general filter/query string to narrow the list of items deleted.
+            force: If set to true, the operation completes despite any problems with network connectivity or errors
+                on the resource itself. The default is false.
+            timeout: Timeout in seconds.
+
+        Returns:
+            bool: Indicates if the resources were successfully deleted.
+        """
+        uri = "{}?filter={}&force={}".format(self._base_uri, quote(filter), force)
+        logger.debug("Delete all resources (uri = %s)" % uri)
+
+        return await self.delete(uri, timeout=timeout)
+
+    async def update(self, resource, uri=None, force=False, timeout=-1, custom_headers=None):
+        """Makes a PUT request to update a resource.
+
+        Args:
+            resource: Data to update the resource.
+            uri: Resource uri
+            force: If set to true, the operation completes despite any problems
+                with network connectivity or errors on the resource itself. The default is false.
+            timeout: Timeout in seconds. Wait for task completion by default. The timeout does not abort the operation
+                in OneView; it just stops waiting for its completion.
+            custom_headers: Allows to add custom HTTP headers.
+
+        Returns:
+            A dict with the updated resource data.
+        """
+        if not uri:
+            uri = resource['uri']
+
+        if force:
+            uri += '?force=True'
+
+        logger.debug('Update async (uri = %s, resource = %s)' % (uri, str(resource)))
+
+        return await self.do_put(uri, resource, timeout, custom_headers)
+
+    async def create_report(self, uri, timeout=-1):
+        """
+        Creates a report and returns the output.
+
+        Args:
+            uri: URI
+            timeout: Timeout in seconds.
+
+        Returns:
+            list:
+        """
+        task, _ = await self._connection.post(uri, {})
+
+        if not task:
+            raise exceptions.HPOneViewException(RESOURCE_CLIENT_TASK_EXPECTED)
+
+        task = await self._task_monitor.get_completed_task(task, timeout)
+
+        return task['taskOutput']
+
+    async def wait_for_task(self, task, timeout=-1):
+        """
+        Waits for a task and returns its associated resource.
+
+        Args:
+            task: task dict
+            timeout: timeout in seconds
+
+        Returns:
+            Associated resource when creating or updating; True when deleting.
+        """
+        return await self._task_monitor.wait_for_task(task, timeout)
+
+    async def do_get(self, uri):
+        """Helps to make get requests
+
+        Args:
+            uri: URI of the resource
+
+        Returns:
+            The resource data
+        """
+        self.validate_resource_uri(uri)
+        return await self._connection.get(uri)
+
+    async def do_get_if_modified(self, uri, etag):
+        """Helps to make get requests returning the resource only when it changed.
+
+        Args:
+            uri: URI of the resource
+            etag: ETag of the known version of the resource
+
+        Returns:
+            The resource data, or None when it was not modified
+        """
+        self.validate_resource_uri(uri)
+        return await self._connection.get_if_modified(uri, etag)
+
+    async def do_post(self, uri, resource, timeout, custom_headers):
+        """Helps to make post requests.
+
+        Args:
+            uri: URI of the resource.
+            resource: Resource data to post.
+            timeout: Time out for the request in seconds.
+            custom_headers: Allows to add custom http headers.
+
+        Returns:
+            Task object or the created resource.
+        """
+        self.validate_resource_uri(uri)
+
+        task, entity = await self._connection.post(uri, resource, custom_headers=custom_headers)
+
+        if not task:
+            return entity
+
+        return await self._task_monitor.wait_for_task(task, timeout)
+
+    async def do_put(self, uri, resource, timeout, custom_headers):
+        """Helps to make put requests.
+
+        Args:
+            uri: URI of the resource
+            timeout: Time out for the request in seconds.
+            custom_headers: Allows to set custom http headers.
+
+        Returns:
+            Task object or the updated resource
+        """
+        self.validate_resource_uri(uri)
+
+        task, body = await self._connection.put(uri, resource, custom_headers=custom_headers)
+
+        if not task:
+            return body
+
+        return await self._task_monitor.wait_for_task(task, timeout)
+
+    @staticmethod
+    def add_new_fields(data, data_to_add):
+        """Update resource data with the new fields, keeping the fields already set.
+
+        Args:
+            data: resource data
+            data_to_add: dict of data to add to the resource data
+
+        Returns:
+            dict
+        """
+        for key, value in data_to_add.items():
+            if not data.get(key):
+                data[key] = value
+
+        return data
+
+
+class AsyncMembersIterator(object):
+    """
+    Asynchronous iterator over the members of a collection, requesting its pages one at a time.
+
+    Args:
+        connection: AsyncConnection object.
+        uri: URI of the first page.
+        requested_count: Number of members requested. -1 requests all the members.
+        prefetch: Requests the next page in background while the members of the current page are consumed.
+    """
+
+    def __init__(self, connection, uri, requested_count, prefetch=False):
+        self._connection = connection
+        self._next_page_uri = uri
+        self._requested_count = requested_count
+        self._prefetch = prefetch
+        self._next_page = None
+        self._members = []
+        self._members_count = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._members:
+            response = await self.__get_next_page()
+            if response is None:
+                raise StopAsyncIteration
+            self.__read_page(response)
+
+        return self._members.pop(0)
+
+    async def __get_next_page(self):
+        if self._next_page:
+            next_page, self._next_page = self._next_page, None
+            return await next_page
+
+        if not self._next_page_uri:
+            return None
+
+        next_page_uri, self._next_page_uri = self._next_page_uri, None
+        logger.debug('Making HTTP request to iterate over resources. Uri: {0}'.format(next_page_uri))
+        return await self._connection.get(next_page_uri)
+
+    def __read_page(self, response):
+        if not isinstance(response, dict):
+            # Not a collection page, such as an empty or a list response
+            return
+
+        self._members = list(response.get('members') or [])
+        self._members_count += len(self._members)
+
+        next_page_uri = response.get('nextPageUri')
+        if next_page_uri == response.get('uri') or \
+                (self._requested_count != -1 and self._members_count >= self._requested_count):
+            next_page_uri = None
+
+        if next_page_uri and self._prefetch:
+            logger.debug('Making HTTP request to iterate over resources. Uri: {0}'.format(next_page_uri))
+            self._next_page = asyncio.ensure_future(self._connection.get(next_page_uri))
+        else:
+            self._next_page_uri = next_page_uri
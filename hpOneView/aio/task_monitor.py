@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2026) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+"""
+This module implements the asyncio counterpart of the TaskMonitor. It requires Python 3.5 or later.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import logging
+import time
+
+from hpOneView.exceptions import HPOneViewInvalidResource, HPOneViewTimeout, HPOneViewTaskError, HPOneViewUnknownType
+from hpOneView.resources.task_monitor import PollPolicy, TASK_PENDING_STATES, TASK_ERROR_STATES, MSG_UNKNOWN_OBJECT_TYPE, \
+    MSG_TASK_TYPE_UNRECONIZED, MSG_UNKNOWN_EXCEPTION, MSG_TIMEOUT, MSG_INVALID_TASK, UNLIMITED_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTaskMonitor(object):
+    """
+    Waits for the OneView tasks without blocking the event loop.
+    """
+
+    def __init__(self, con, poll_policy=None):
+        self._connection = con
+        self._poll_policy = poll_policy or PollPolicy()
+
+    async def wait_for_task(self, task, timeout=-1):
+        """
+        Wait for task execution and return associated resource.
+
+        Args:
+            task: task dict
+            timeout: timeout in seconds
+
+        Returns:
+            Associated resource when creating or updating; True when deleting.
+        """
+        task = await self.get_completed_task(task, timeout)
+
+        if task['taskState'] in TASK_ERROR_STATES and task['taskState'] != 'Warning':
+            error = (task.get('taskErrors') or [{}])[0]
+            raise HPOneViewTaskError(error.get('message') or task.get('taskStatus') or MSG_UNKNOWN_EXCEPTION,
+                                     error.get('errorCode'))
+
+        if task.get('name') in ['Delete', 'Remove', 'Delete server hardware type', 'Remove SAN manager']:
+            return True
+
+        if task.get('type', '').startswith('Task'):
+            task, entity = await self.get_associated_resource(task)
+            return entity
+
+        logger.warning('Task completed, unknown response: ' + str(task))
+        return task
+
+    async def get_completed_task(self, task, timeout=-1):
+        """
+        Waits until the task is completed and returns the task resource.
+
+        Args:
+            task: TaskResource
+            timeout: Timeout in seconds
+
+        Returns:
+            dict: TaskResource
+        """
+        if not task or 'uri' not in task:
+            raise HPOneViewUnknownType(MSG_INVALID_TASK)
+
+        start_time = time.time()
+        attempt = 0
+        task = await self.get(task)
+        while task.get('taskState') in TASK_PENDING_STATES:
+            if (timeout != UNLIMITED_TIMEOUT) and (start_time + timeout < time.time()):
+                raise HPOneViewTimeout(MSG_TIMEOUT % str(timeout))
+
+            attempt += 1
+            await asyncio.sleep(self._poll_policy.get_interval(attempt, task, time.time() - start_time))
+            task = await self.get(task)
+
+        return task
+
+    async def get(self, task):
+        """
+        Retrieve a task by its uri.
+
+        Args:
+            task: task dict, must have 'uri' key.
+
+        Returns:
+            task dict
+        """
+        return await self._connection.get(task['uri'])
+
+    async def get_associated_resource(self, task):
+        """
+        Retrieve a resource associated with a task.
+
+        Args:
+            task: task dict
+
+        Returns:
+            tuple: task (updated), the entity found (dict)
+        """
+        if not task:
+            raise HPOneViewUnknownType(MSG_INVALID_TASK)
+
+        if task['category'] != 'tasks' and task['category'] != 'backups':
+            raise HPOneViewUnknownType(MSG_UNKNOWN_OBJECT_TYPE)
+
+        if task['type'] == 'TaskResourceV2':
+            resource_uri = task['associatedResource']['resourceUri']
+
+            if resource_uri and resource_uri.startswith("/rest/appliance/support-dumps/"):
+                return task, resource_uri
+
+        elif task['type'] == 'BACKUP':
+            task = await self._connection.get(task['taskUri'])
+            resource_uri = task['uri']
+        else:
+            raise HPOneViewInvalidResource(MSG_TASK_TYPE_UNRECONIZED % task['type'])
+
+        entity = {}
+
+        if resource_uri:
+            entity = await self._connection.get(resource_uri)
+
+        return task, entity
@@ -34,26 +34,857 @@ from __future__ import unicode_literals
 
 from builtins import open
 from builtins import str
-from future import standard_library
-
-standard_library.install_aliases()
 
+import email.utils
+import fnmatch
+import hashlib
+import hmac
 import http.client
 import json
 import logging
-import shutil  # for shutil.copyfileobj()
-import mmap  # so we can upload the iso without having to load it in memory
 import os
+import random
+import re
+import socket
 import ssl
+import tempfile
+import threading
 import time
 import traceback
+import warnings
+from collections import OrderedDict
+from contextlib import contextmanager
+from copy import deepcopy
+from multiprocessing.pool import ThreadPool
 
-from hpOneView.exceptions import HPOneViewException
+from hpOneView.exceptions import HPOneViewException, HPOneViewCircuitOpen
 
 logger = logging.getLogger(__name__)
 
+_ssl_contexts = {}
+_ssl_contexts_lock = threading.Lock()
+
+_request_limiters = {}
+_request_limiters_lock = threading.Lock()
+
+_circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+class _ResumableSSLContext(ssl.SSLContext):
+    """
+    SSL context that offers the last TLS session negotiated with a server when connecting to it again,
+    so the appliances can resume the session instead of doing a full handshake.
+    """
+
+    def wrap_socket(self, sock, *args, **kwargs):
+        server_hostname = kwargs.get('server_hostname')
+        sessions = self.__dict__.setdefault('_tls_sessions', {})
+
+        # TLS sessions can only be passed to wrap_socket from Python 3.6
+        if hasattr(ssl, 'SSLSession') and server_hostname and 'session' not in kwargs:
+            kwargs['session'] = sessions.get(server_hostname)
+
+        ssl_sock = super(_ResumableSSLContext, self).wrap_socket(sock, *args, **kwargs)
+
+        if server_hostname and getattr(ssl_sock, 'session', None):
+            sessions[server_hostname] = ssl_sock.session
+
+        return ssl_sock
+
+
+def get_ssl_context(ssl_bundle=None, verify_mode=ssl.CERT_NONE):
+    """
+    Gets the SSL context for a CA bundle and verify mode.
+
+    The contexts are created once and shared by all the connections of the process, so the CA bundle is parsed
+    only once and the TLS sessions can be resumed by any connection to the same appliance.
+
+    Args:
+        ssl_bundle: Path of the trusted CA bundle.
+        verify_mode: ssl.CERT_REQUIRED to validate the appliance certificate, or ssl.CERT_NONE.
+
+    Returns:
+        ssl.SSLContext:
+    """
+    key = (ssl_bundle, verify_mode)
+    with _ssl_contexts_lock:
+        context = _ssl_contexts.get(key)
+        if context is None:
+            context = _ResumableSSLContext(ssl.PROTOCOL_TLSv1_2)
+            context.verify_mode = verify_mode
+            if verify_mode != ssl.CERT_NONE:
+                context.load_verify_locations(ssl_bundle)
+            _ssl_contexts[key] = context
+
+    return context
+
+
+def clear_ssl_context_cache():
+    """Discards the cached SSL contexts, e.g. after a CA bundle changed on disk."""
+    with _ssl_contexts_lock:
+        _ssl_contexts.clear()
+
+
+class ConnectionPool(object):
+    """
+    Thread-safe pool of keep-alive HTTPS connections.
+
+    Idle connections are grouped by a key, usually the appliance host and the proxy in use, and are
+    handed out to one caller at a time. Connections idle for longer than the idle timeout are closed
+    instead of being reused.
+
+    Args:
+        max_size: Maximum number of idle connections kept for each key.
+        idle_timeout: Seconds an idle connection is kept before it is discarded.
+    """
+    DEFAULT_MAX_SIZE = 10
+    DEFAULT_IDLE_TIMEOUT = 30
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self._max_size = int(max_size)
+        self._idle_timeout = idle_timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def idle_timeout(self):
+        return self._idle_timeout
+
+    def acquire(self, key):
+        """
+        Takes an idle connection out of the pool.
+
+        Args:
+            key: Pool key.
+
+        Returns:
+            An idle connection or None when there is no connection available for the key.
+        """
+        expired = []
+        conn = None
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                candidate, last_used = idle.pop()
+                if self._idle_timeout is not None and time.time() - last_used > self._idle_timeout:
+                    expired.append(candidate)
+                else:
+                    conn = candidate
+                    break
+
+        for expired_conn in expired:
+            expired_conn.close()
+
+        return conn
+
+    def release(self, key, conn):
+        """
+        Returns a connection to the pool. The connection is closed when the pool is full.
+
+        Args:
+            key: Pool key.
+            conn: Connection to be reused.
+        """
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_size:
+                idle.append((conn, time.time()))
+                return
+
+        conn.close()
+
+    def clear(self):
+        """Closes all the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for connections in idle.values():
+            for conn, _ in connections:
+                conn.close()
+
+
+class TokenBucket(object):
+    """
+    Thread-safe token bucket, letting through a sustained rate of requests and bursts of up to its capacity after an
+    idle period.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum number of tokens kept. Defaults to the rate, or 1 when the rate is lower.
+    """
+    # Not affected by the changes of the system time where available
+    _clock = staticmethod(getattr(time, 'monotonic', time.time))
+
+    def __init__(self, rate, capacity=None):
+        self._rate = float(rate)
+        self._capacity = float(capacity or max(self._rate, 1))
+        self._tokens = self._capacity
+        self._updated_at = self._clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    def reserve(self):
+        """
+        Takes a token, borrowing it from the future when the bucket is empty.
+
+        Returns:
+            Seconds to wait before the token can be used.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return max(-self._tokens / self._rate, 0)
+
+    def acquire(self):
+        """Waits for a token."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RequestLimiter(object):
+    """
+    Limits the rate and the concurrency of the requests sent to an appliance, with separate budgets for the reads
+    (GET requests), the writes (POST, PUT, PATCH and DELETE requests) and the polls of the tasks.
+
+    Each budget can have a rate, in requests per second, a burst, the number of requests sent at once after an idle
+    period, and a max_in_flight, the number of requests waiting for their response at the same time. A request
+    waits until its budget lets it through. The budgets without limits are not limited.
+
+    Args:
+        limits: dict of the limits by budget name ('read', 'write' or 'task'), each one a dict with the optional
+            'rate', 'burst' and 'max_in_flight' keys.
+    """
+    BUDGETS = ('read', 'write', 'task')
+
+    def __init__(self, limits):
+        self._limits = deepcopy(limits)
+        self._buckets = {}
+        self._semaphores = {}
+        for budget, budget_limits in limits.items():
+            if budget not in self.BUDGETS:
+                raise ValueError('Unknown request budget: %s' % budget)
+            if budget_limits.get('rate'):
+                self._buckets[budget] = TokenBucket(budget_limits['rate'], budget_limits.get('burst'))
+            if budget_limits.get('max_in_flight'):
+                self._semaphores[budget] = threading.BoundedSemaphore(int(budget_limits['max_in_flight']))
+
+    @property
+    def limits(self):
+        return deepcopy(self._limits)
+
+    @staticmethod
+    def get_budget(method, path):
+        """
+        Gets the budget of a request.
+
+        Returns:
+            str: 'read', 'write' or 'task'.
+        """
+        if method.upper() not in ('GET', 'HEAD'):
+            return 'write'
+        return 'task' if path.startswith(uri['task']) else 'read'
+
+    @contextmanager
+    def limit(self, method, path):
+        """
+        Context manager waiting until the budget of a request lets it through, and holding one of its requests in
+        flight until the response is read.
+
+        Args:
+            method: HTTP method of the request.
+            path: Path of the request.
+        """
+        budget = self.get_budget(method, path)
+        semaphore = self._semaphores.get(budget)
+        if semaphore:
+            semaphore.acquire()
+        try:
+            bucket = self._buckets.get(budget)
+            if bucket:
+                bucket.acquire()
+            yield
+        finally:
+            if semaphore:
+                semaphore.release()
+
+
+def get_request_limiter(host, limits):
+    """
+    Gets the request limiter of an appliance.
+
+    The limiters are shared by all the connections of the process to the same host configured with the same limits,
+    so the budgets apply to the appliance and not to each client.
+
+    Args:
+        host: Appliance host.
+        limits: Limits by budget, see RequestLimiter.
+
+    Returns:
+        RequestLimiter:
+    """
+    key = (host, json.dumps(limits, sort_keys=True))
+    with _request_limiters_lock:
+        limiter = _request_limiters.get(key)
+        if limiter is None:
+            limiter = RequestLimiter(limits)
+            _request_limiters[key] = limiter
+
+    return limiter
+
+
+@contextmanager
+def _unlimited():
+    yield
+
+
+class RetryPolicy(object):
+    """
+    Decides which failed requests are sent again, and how long to wait before each new attempt.
+
+    Only the idempotent requests are sent again, after a connection failure or a response with a retried status,
+    such as 503 Service Unavailable. The delay grows exponentially with a random jitter, so that many clients do not
+    retry in lockstep, and is extended to the delay asked by the Retry-After header of the response.
+    """
+
+    DEFAULT_MAX_ATTEMPTS = 5
+    DEFAULT_MIN_DELAY = 1
+    DEFAULT_MAX_DELAY = 30
+    DEFAULT_MULTIPLIER = 2
+    DEFAULT_JITTER = 0.2
+    DEFAULT_RETRY_STATUSES = (502, 503, 504)
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+    def __init__(self, max_attempts=DEFAULT_MAX_ATTEMPTS, min_delay=DEFAULT_MIN_DELAY, max_delay=DEFAULT_MAX_DELAY,
+                 multiplier=DEFAULT_MULTIPLIER, jitter=DEFAULT_JITTER, retry_statuses=DEFAULT_RETRY_STATUSES):
+        """
+        Args:
+            max_attempts (int): Maximum number of attempts of a request, 1 to never send it again.
+            min_delay (float): Seconds to wait before the second attempt.
+            max_delay (float): Maximum number of seconds between two attempts.
+            multiplier (float): Growth factor of the delay after each attempt.
+            jitter (float): Fraction of the delay randomly added or removed, between 0 and 1.
+            retry_statuses: HTTP statuses of the responses to retry.
+        """
+        self.max_attempts = max(int(max_attempts), 1)
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retry_statuses = tuple(retry_statuses)
+
+    @classmethod
+    def from_config(cls, retry_config):
+        """
+        Builds the policy from the retry_policy entry of the client configuration.
+
+        Args:
+            retry_config: dict with the policy options, or True to use the default options.
+
+        Returns:
+            RetryPolicy:
+        """
+        if not isinstance(retry_config, dict):
+            retry_config = {}
+
+        return cls(max_attempts=retry_config.get("max_attempts", cls.DEFAULT_MAX_ATTEMPTS),
+                   min_delay=retry_config.get("min_delay", cls.DEFAULT_MIN_DELAY),
+                   max_delay=retry_config.get("max_delay", cls.DEFAULT_MAX_DELAY),
+                   multiplier=retry_config.get("multiplier", cls.DEFAULT_MULTIPLIER),
+                   jitter=retry_config.get("jitter", cls.DEFAULT_JITTER),
+                   retry_statuses=retry_config.get("retry_statuses", cls.DEFAULT_RETRY_STATUSES))
+
+    def can_retry(self, method, attempt):
+        """
+        Indicates if a failed request can be sent again.
+
+        Args:
+            method: HTTP method of the request.
+            attempt: Number of the failed attempt, starting at 1.
+        """
+        return attempt < self.max_attempts and method.upper() in self.IDEMPOTENT_METHODS
+
+    def get_delay(self, attempt, retry_after=None):
+        """
+        Gets the seconds to wait before sending a request again.
+
+        Args:
+            attempt: Number of the failed attempt, starting at 1.
+            retry_after: Seconds asked by the Retry-After header of the response, if any.
+        """
+        delay = min(self.min_delay * self.multiplier ** max(attempt - 1, 0), self.max_delay)
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        if retry_after is not None:
+            delay = min(max(delay, retry_after), self.max_delay)
+        return delay
+
+
+class CircuitBreaker(object):
+    """
+    Fails the requests to an appliance fast while it is down.
+
+    The circuit opens after consecutive failures, counting the connection failures and the responses with a status
+    retried by the retry policy. While it is open, the requests raise HPOneViewCircuitOpen without being sent. Once
+    the reset timeout elapsed, a single request is sent to probe the appliance: its success closes the circuit, and
+    its failure opens it again.
+
+    Args:
+        failure_threshold: Number of consecutive failures opening the circuit.
+        reset_timeout: Seconds the circuit stays open before a request probes the appliance.
+    """
+    DEFAULT_FAILURE_THRESHOLD = 5
+    DEFAULT_RESET_TIMEOUT = 30
+
+    _clock = TokenBucket._clock
+
+    def __init__(self, failure_threshold=DEFAULT_FAILURE_THRESHOLD, reset_timeout=DEFAULT_RESET_TIMEOUT):
+        self._failure_threshold = max(int(failure_threshold), 1)
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def failure_threshold(self):
+        return self._failure_threshold
+
+    @property
+    def reset_timeout(self):
+        return self._reset_timeout
+
+    @property
+    def is_open(self):
+        return self._opened_at is not None
+
+    def before_request(self):
+        """
+        Lets a request through, or raises HPOneViewCircuitOpen while the circuit is open.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._probing or self._clock() - self._opened_at < self._reset_timeout:
+                raise HPOneViewCircuitOpen('The appliance is not available after %d consecutive failures.'
+                                           % self._failures)
+            self._probing = True
+
+    def record_success(self):
+        """Closes the circuit."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        """Counts a failure, opening the circuit at the threshold or when the probe failed."""
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self._failure_threshold:
+                self._opened_at = self._clock()
+                self._probing = False
+
+
+def get_circuit_breaker(host, failure_threshold=CircuitBreaker.DEFAULT_FAILURE_THRESHOLD,
+                        reset_timeout=CircuitBreaker.DEFAULT_RESET_TIMEOUT):
+    """
+    Gets the circuit breaker of an appliance.
+
+    The circuit breakers are shared by all the connections of the process to the same host configured with the same
+    options, so the failures of any client open the circuit of the appliance.
+
+    Args:
+        host: Appliance host.
+        failure_threshold: Number of consecutive failures opening the circuit.
+        reset_timeout: Seconds the circuit stays open before a request probes the appliance.
+
+    Returns:
+        CircuitBreaker:
+    """
+    key = (host, failure_threshold, reset_timeout)
+    with _circuit_breakers_lock:
+        circuit_breaker = _circuit_breakers.get(key)
+        if circuit_breaker is None:
+            circuit_breaker = CircuitBreaker(failure_threshold, reset_timeout)
+            _circuit_breakers[key] = circuit_breaker
+
+    return circuit_breaker
+
+
+class _LruCache(object):
+    """
+    Thread-safe store of entries by URI, discarding the least recently used entry when it is full.
+    """
+    DEFAULT_MAX_SIZE = 256
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self._max_size = int(max_size)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    def _get_entry(self, uri, is_valid=None):
+        with self._lock:
+            entry = self._entries.pop(uri, None)
+            if entry is None or (is_valid and not is_valid(entry)):
+                return None
+            # Moves the entry to the end, as the most recently used
+            self._entries[uri] = entry
+
+        return entry
+
+    def _put_entry(self, uri, entry):
+        with self._lock:
+            self._entries.pop(uri, None)
+            self._entries[uri] = entry
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, uri_prefix=None):
+        """
+        Discards the entries of the URIs starting with a prefix.
+
+        Args:
+            uri_prefix: URI prefix, or None to discard all the entries.
+        """
+        with self._lock:
+            if uri_prefix is None:
+                self._entries.clear()
+                return
+
+            for uri in [uri for uri in self._entries if uri.startswith(uri_prefix)]:
+                del self._entries[uri]
+
+    def clear(self):
+        """Discards all the entries."""
+        self.invalidate()
+
+
+class ResponseCache(_LruCache):
+    """
+    Thread-safe cache of the GET responses.
+
+    Only the URIs matching a policy are cached, for the time to live of the policy. The policies are keyed by URI
+    prefixes, which can contain '*' wildcards, and the longest matching prefix is used. When the cache is full, the
+    least recently used response is discarded.
+
+    Args:
+        policies: dict of time to live, in seconds, by URI prefix. Defaults to DEFAULT_POLICIES.
+        max_size: Maximum number of responses kept.
+    """
+    DEFAULT_TTL = 300
+    DEFAULT_POLICIES = {
+        '/rest/server-hardware-types': DEFAULT_TTL,
+        '/rest/interconnect-types': DEFAULT_TTL,
+        '/rest/switch-types': DEFAULT_TTL,
+        '/rest/sas-interconnect-types': DEFAULT_TTL,
+        '/rest/version': DEFAULT_TTL,
+        '/rest/*/schema': DEFAULT_TTL,
+    }
+
+    def __init__(self, policies=None, max_size=_LruCache.DEFAULT_MAX_SIZE):
+        super(ResponseCache, self).__init__(max_size)
+        self._policies = dict(self.DEFAULT_POLICIES if policies is None else policies)
+
+    @property
+    def policies(self):
+        return self._policies.copy()
+
+    def get_ttl(self, uri):
+        """
+        Gets the time to live of the responses of a URI.
+
+        Returns:
+            Seconds, or None when the responses of the URI are not cached.
+        """
+        matches = [prefix for prefix in self._policies if fnmatch.fnmatchcase(uri, prefix + '*')]
+        if not matches:
+            return None
+
+        ttl = self._policies[max(matches, key=len)]
+        return ttl if ttl and ttl > 0 else None
+
+    def get(self, uri):
+        """
+        Gets a copy of the cached response of a URI.
+
+        Returns:
+            The response body, or None when it is not cached or expired.
+        """
+        now = time.time()
+        entry = self._get_entry(uri, lambda entry: entry[0] >= now)
+        if entry is None:
+            return None
+
+        return deepcopy(entry[1])
+
+    def put(self, uri, body):
+        """
+        Caches the response of a URI when a policy matches it.
+
+        Args:
+            uri: URI of the GET request.
+            body: Response body.
+        """
+        ttl = self.get_ttl(uri)
+        if ttl is None or not isinstance(body, (dict, list)):
+            return
+
+        self._put_entry(uri, (time.time() + ttl, deepcopy(body)))
+
+
+class ETagCache(_LruCache):
+    """
+    Thread-safe store of the last ETag and body received for each URI, so the GET requests can be sent with an
+    If-None-Match header and a 304 Not Modified response can reuse the body.
+
+    Args:
+        max_size: Maximum number of responses kept.
+    """
+
+    def get(self, uri):
+        """
+        Gets the ETag and a copy of the body of the last response of a URI.
+
+        Returns:
+            tuple: The ETag and the body, or None when there is no response with an ETag for the URI.
+        """
+        entry = self._get_entry(uri)
+        if entry is None:
+            return None
+
+        return entry[0], deepcopy(entry[1])
+
+    def put(self, uri, etag, body):
+        """
+        Keeps the ETag and the body of a response.
+
+        Args:
+            uri: URI of the GET request.
+            etag: ETag of the response.
+            body: Response body.
+        """
+        if not etag or not isinstance(body, (dict, list)):
+            with self._lock:
+                self._entries.pop(uri, None)
+            return
+
+        self._put_entry(uri, (etag, deepcopy(body)))
+
+
+class SessionCache(object):
+    """
+    Store of the login sessions and of the versions of the appliances, kept in files so the processes logging in to
+    the same appliance with the same credentials skip the version validation and the login requests.
+
+    Each entry is a JSON file named after an HMAC of its key, created readable by its owner only in a directory
+    accessible by its owner only. The HMAC is keyed with a random secret kept in the directory, so the keys cannot be
+    guessed from the file names. An entry is used during its time to live, and a session rejected by the appliance is
+    discarded by the connection, which logs in again.
+
+    Args:
+        path: Directory of the entries. Defaults to DEFAULT_PATH.
+        ttl: Seconds during which an entry is used.
+    """
+    DEFAULT_PATH = os.path.join(os.path.expanduser('~'), '.hpOneView', 'sessions')
+    DEFAULT_TTL = 3600
+    SECRET_FILE_NAME = 'secret'
+    SECRET_SIZE = 32
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL):
+        self._path = path or self.DEFAULT_PATH
+        self._ttl = ttl
+        self._secret = None
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+    def get(self, key):
+        """
+        Gets the value of an entry.
+
+        Returns:
+            The value, or None when there is no entry for the key or it expired.
+        """
+        try:
+            file_path = self.__get_file_path(key, create_secret=False)
+            if not file_path:
+                return None
+            with open(file_path, 'r') as entry_file:
+                entry = json.load(entry_file)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get('expires', 0) < time.time():
+            self.discard(key)
+            return None
+
+        return entry.get('value')
+
+    def put(self, key, value):
+        """
+        Keeps the value of an entry. The entry is written to a temporary file renamed once complete, so the other
+        processes never read a partial entry. Failures to write are logged and ignored.
+
+        Args:
+            key: Key of the entry.
+            value: Value, serializable to JSON.
+        """
+        try:
+            file_path = self.__get_file_path(key)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=self._path, suffix='.tmp')
+            with os.fdopen(file_descriptor, 'w') as entry_file:
+                entry_file.write(json.dumps({'expires': time.time() + self._ttl, 'value': value}))
+            getattr(os, 'replace', os.rename)(temp_path, file_path)
+        except (IOError, OSError):
+            logger.debug('Could not write the session cache entry.\n %s' % traceback.format_exc())
+
+    def discard(self, key):
+        """
+        Removes an entry.
+
+        Args:
+            key: Key of the entry.
+        """
+        try:
+            file_path = self.__get_file_path(key, create_secret=False)
+            if file_path:
+                os.remove(file_path)
+        except (IOError, OSError):
+            pass
+
+    def __get_file_path(self, key, create_secret=True):
+        secret = self.__get_secret(create_secret)
+        if not secret:
+            return None
+        return os.path.join(self._path, hmac.new(secret, key.encode('utf-8'), hashlib.sha256).hexdigest() + '.json')
+
+    def __get_secret(self, create):
+        """
+        Gets the secret keying the HMAC of the file names, creating it readable by its owner only when missing.
+        Returns None when it is missing and create is False, as there is no entry then.
+        """
+        if self._secret:
+            return self._secret
+
+        secret_path = os.path.join(self._path, self.SECRET_FILE_NAME)
+        if not os.path.isfile(secret_path):
+            if not create:
+                return None
+            if not os.path.isdir(self._path):
+                os.makedirs(self._path, 0o700)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=self._path, suffix='.tmp')
+            with os.fdopen(file_descriptor, 'wb') as secret_file:
+                secret_file.write(os.urandom(self.SECRET_SIZE))
+            getattr(os, 'replace', os.rename)(temp_path, secret_path)
+
+        # Read back, as another process may have created the secret at the same time
+        with open(secret_path, 'rb') as secret_file:
+            secret = secret_file.read()
+        if len(secret) == self.SECRET_SIZE:
+            self._secret = secret
+        return self._secret
+
+
+class TransferProgress(object):
+    """
+    Reports the progress of an upload or a download to callbacks.
+
+    The callbacks are called after each chunk transferred with a dict with the keys 'uri', 'direction' ('upload' or
+    'download'), 'bytes_transferred', 'total_bytes' (None while it is unknown), 'elapsed' (seconds since the start
+    of the transfer), 'throughput' (bytes per second since the previous report) and 'average_throughput' (bytes per
+    second since the start of the transfer).
+
+    Args:
+        callbacks: Functions called with the progress.
+        uri: URI of the transfer.
+        direction: 'upload' or 'download'.
+        total_bytes: Size of the transfer, if known.
+        bytes_transferred: Bytes already transferred before the start, e.g. when a download is resumed.
+    """
+
+    def __init__(self, callbacks, uri, direction, total_bytes=None, bytes_transferred=0):
+        self._callbacks = callbacks
+        self.uri = uri
+        self.direction = direction
+        self.total_bytes = total_bytes
+        self.bytes_transferred = bytes_transferred
+        self._initial_bytes = bytes_transferred
+        self._lock = threading.Lock()
+        self._started = self._last_report = time.time()
+
+    def set_total_bytes(self, total_bytes):
+        """Sets the size of the transfer when it was not known at the start."""
+        if self.total_bytes is None:
+            self.total_bytes = total_bytes
+
+    def restart(self):
+        """Goes back to the bytes transferred at the start, when the transfer is sent again from its beginning."""
+        with self._lock:
+            self.bytes_transferred = self._initial_bytes
+            self._started = self._last_report = time.time()
+
+    def update(self, size):
+        """
+        Adds the bytes of a chunk to the transfer and reports the progress.
+
+        Args:
+            size: Bytes of the chunk.
+        """
+        with self._lock:
+            now = time.time()
+            self.bytes_transferred += size
+            elapsed = now - self._started
+            interval = now - self._last_report
+            self._last_report = now
+            progress = dict(uri=self.uri,
+                            direction=self.direction,
+                            bytes_transferred=self.bytes_transferred,
+                            total_bytes=self.total_bytes,
+                            elapsed=elapsed,
+                            throughput=size / interval if interval > 0 else None,
+                            average_throughput=(self.bytes_transferred - self._initial_bytes) / elapsed
+                            if elapsed > 0 else None)
+
+        for callback in self._callbacks:
+            callback(progress)
+
 
 class connection(object):
+    # Bytes of the uploaded files sent at a time; each chunk is kept in memory while it is sent
+    DEFAULT_UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+    MULTIPART_BOUNDARY = '----------ThIs_Is_tHe_bouNdaRY_$'
+
+    # Bytes of the downloaded files read at a time
+    DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+    # Bytes requested by each worker of a parallel download
+    DEFAULT_DOWNLOAD_SEGMENT_SIZE = 64 * 1024 * 1024
+
     def __init__(self, applianceIp, api_version=300, sslBundle=False, timeout=None):
         self._session = None
         self._host = applianceIp
@@ -75,9 +906,28 @@ class connection(object):
         self._numDisplayedRecords = 0
         self._validateVersion = False
         self._timeout = timeout
+        self._connection_pool = None
+        self._max_page_workers = 1
+        self._task_listener = None
+        self._poll_policy = None
+        self._upload_chunk_size = self.DEFAULT_UPLOAD_CHUNK_SIZE
+        self._download_chunk_size = self.DEFAULT_DOWNLOAD_CHUNK_SIZE
+        self._max_download_workers = 1
+        self._download_segment_size = self.DEFAULT_DOWNLOAD_SEGMENT_SIZE
+        self._transfer_callback = None
+        self._response_cache = None
+        self._etag_cache = None
+        self._trusted_data_age = None
+        self._collection_states = {}
+        self._collection_states_lock = threading.Lock()
+        self._session_cache = None
+        self._login_lock = threading.Lock()
+        self._request_limiter = None
+        self._retry_policy = RetryPolicy()
+        self._circuit_breaker = None
 
     def validateVersion(self):
-        version = self.get(uri['version'])
+        version = self.__get_version()
         if 'minimumVersion' in version:
             if self._apiVersion < version['minimumVersion']:
                 raise HPOneViewException('Unsupported API Version')
@@ -86,11 +936,256 @@ class connection(object):
                 raise HPOneViewException('Unsupported API Version')
         self._validateVersion = True
 
+    def __get_version(self):
+        if not self._session_cache:
+            return self.get(uri['version'])
+
+        key = json.dumps(['version', self._host])
+        version = self._session_cache.get(key)
+        if version is None:
+            version = self.get(uri['version'])
+            self._session_cache.put(key, version)
+        return version
+
     def set_proxy(self, proxyHost, proxyPort):
         self._proxyHost = proxyHost
         self._proxyPort = proxyPort
         self._doProxy = True
 
+    def set_connection_pool(self, connection_pool):
+        """
+        Sets the pool used to reuse keep-alive connections between requests.
+
+        Args:
+            connection_pool (ConnectionPool): Pool of connections, or None to open a new connection per request.
+        """
+        self._connection_pool = connection_pool
+
+    def get_connection_pool(self):
+        return self._connection_pool
+
+    def set_response_cache(self, response_cache):
+        """
+        Sets the cache of the GET responses. The cached responses of a collection are discarded when a POST, PUT,
+        PATCH or DELETE request is sent to it.
+
+        Args:
+            response_cache (ResponseCache): Cache of the responses, or None to send every GET request.
+        """
+        self._response_cache = response_cache
+
+    def get_response_cache(self):
+        return self._response_cache
+
+    def set_etag_cache(self, etag_cache):
+        """
+        Sets the store of the ETags received, so the GET requests are sent again with an If-None-Match header and
+        the body of a 304 Not Modified response is taken from the store.
+
+        Args:
+            etag_cache (ETagCache): Store of the ETags, or None to send unconditional GET requests.
+        """
+        self._etag_cache = etag_cache
+
+    def get_etag_cache(self):
+        return self._etag_cache
+
+    def set_trusted_data_age(self, max_age):
+        """
+        Sets for how long the data of a resource, retrieved with an eTag, is used by the updates without being
+        retrieved again.
+
+        Args:
+            max_age: Seconds, or None to retrieve the resource data before each update.
+        """
+        self._trusted_data_age = max_age
+
+    def get_trusted_data_age(self):
+        return self._trusted_data_age
+
+    def set_session_cache(self, session_cache):
+        """
+        Sets the store of the login sessions and of the appliance versions shared with the other processes, so the
+        login reuses a session created with the same credentials instead of validating the version and logging in.
+
+        Args:
+            session_cache (SessionCache): Store of the sessions, or None to always log in.
+        """
+        self._session_cache = session_cache
+
+    def get_session_cache(self):
+        return self._session_cache
+
+    def set_request_limiter(self, request_limiter):
+        """
+        Sets the limits of the rate and the concurrency of the requests, applied to every request sent, including
+        the downloads and the uploads.
+
+        Args:
+            request_limiter (RequestLimiter): Limiter of the requests, usually shared by the connections to the
+                appliance, see get_request_limiter, or None to send the requests without limits.
+        """
+        self._request_limiter = request_limiter
+
+    def get_request_limiter(self):
+        return self._request_limiter
+
+    def set_retry_policy(self, retry_policy):
+        """
+        Sets which failed requests are sent again and how long to wait before each new attempt.
+
+        Args:
+            retry_policy (RetryPolicy): Policy of the new attempts. RetryPolicy(max_attempts=1) never sends a request
+                again.
+        """
+        self._retry_policy = retry_policy
+
+    def get_retry_policy(self):
+        return self._retry_policy
+
+    def set_circuit_breaker(self, circuit_breaker):
+        """
+        Sets the circuit breaker failing the requests fast while the appliance is down.
+
+        Args:
+            circuit_breaker (CircuitBreaker): Circuit breaker, usually shared by the connections to the appliance,
+                see get_circuit_breaker, or None to always send the requests.
+        """
+        self._circuit_breaker = circuit_breaker
+
+    def get_circuit_breaker(self):
+        return self._circuit_breaker
+
+    def _limit_request(self, method, path):
+        if self._request_limiter:
+            return self._request_limiter.limit(method, path)
+        return _unlimited()
+
+    def get_collection_state(self, name, factory):
+        """
+        Gets a state kept for this connection about a collection, such as an index or the synchronization of its
+        members, so it outlives the resource clients.
+
+        Args:
+            name: Name of the state.
+            factory: Function creating the state when it does not exist yet.
+
+        Returns:
+            The state.
+        """
+        with self._collection_states_lock:
+            if name not in self._collection_states:
+                self._collection_states[name] = factory()
+            return self._collection_states[name]
+
+    def set_max_page_workers(self, max_workers):
+        """
+        Sets how many pages of a collection can be requested at the same time by the get_all methods.
+
+        Args:
+            max_workers (int): Maximum number of concurrent page requests. 1 requests the pages one at a time.
+        """
+        self._max_page_workers = max(int(max_workers), 1)
+
+    def get_max_page_workers(self):
+        return self._max_page_workers
+
+    def set_upload_chunk_size(self, chunk_size):
+        """
+        Sets how many bytes of a file are read and sent at a time by the uploads.
+
+        Args:
+            chunk_size (int): Size of the chunks in bytes.
+        """
+        self._upload_chunk_size = max(int(chunk_size), 1)
+
+    def get_upload_chunk_size(self):
+        return self._upload_chunk_size
+
+    def set_download_chunk_size(self, chunk_size):
+        """
+        Sets how many bytes of a download are read and written at a time.
+
+        Args:
+            chunk_size (int): Size of the chunks in bytes.
+        """
+        self._download_chunk_size = max(int(chunk_size), 1)
+
+    def get_download_chunk_size(self):
+        return self._download_chunk_size
+
+    def set_max_download_workers(self, max_workers):
+        """
+        Sets how many segments of a file can be downloaded at the same time by download_to_file.
+
+        Args:
+            max_workers (int): Maximum number of concurrent segment requests. 1 downloads the file in one request.
+        """
+        self._max_download_workers = max(int(max_workers), 1)
+
+    def get_max_download_workers(self):
+        return self._max_download_workers
+
+    def set_download_segment_size(self, segment_size):
+        """
+        Sets the size of the segments requested by the workers of a parallel download.
+
+        Args:
+            segment_size (int): Size of the segments in bytes.
+        """
+        self._download_segment_size = max(int(segment_size), 1)
+
+    def get_download_segment_size(self):
+        return self._download_segment_size
+
+    def set_transfer_callback(self, callback):
+        """
+        Sets a function called with the progress of all the uploads and downloads of the connection, e.g. to record
+        the transfer throughputs. See TransferProgress for the progress reported.
+
+        Args:
+            callback: Function called with the progress dict, or None.
+        """
+        self._transfer_callback = callback
+
+    def get_transfer_callback(self):
+        return self._transfer_callback
+
+    def _get_transfer_progress(self, uri, direction, progress_callback, total_bytes=None, bytes_transferred=0):
+        """
+        Gets the TransferProgress reporting to the progress callback of a transfer and to the transfer callback of
+        the connection, or None when there is no callback.
+        """
+        callbacks = [callback for callback in (progress_callback, self._transfer_callback) if callback]
+        if not callbacks:
+            return None
+
+        return TransferProgress(callbacks, uri, direction, total_bytes, bytes_transferred)
+
+    def set_task_listener(self, task_listener):
+        """
+        Sets the listener notified when the tasks are completed, so the task waits do not need to poll the appliance.
+
+        Args:
+            task_listener (TaskListener): Listener of the task state changes, or None to poll the tasks.
+        """
+        self._task_listener = task_listener
+
+    def get_task_listener(self):
+        return self._task_listener
+
+    def set_poll_policy(self, poll_policy):
+        """
+        Sets the policy scheduling the polls of the running tasks.
+
+        Args:
+            poll_policy (PollPolicy): Poll policy, or None to use the default one.
+        """
+        self._poll_policy = poll_policy
+
+    def get_poll_policy(self):
+        return self._poll_policy
+
     def set_trusted_ssl_bundle(self, sslBundle):
         if sslBundle:
             self._sslTrustAll = False
@@ -116,80 +1211,316 @@ class connection(object):
         return 'https://%s%s' % (self._host, path)
 
     def do_http(self, method, path, body, custom_headers=None):
+        session_id = self.get_session_id()
+        resp, response_body = self.__do_http(method, path, body, custom_headers)
+
+        if resp.status == 401 and self.__renew_session(session_id, path):
+            resp, response_body = self.__do_http(method, path, body, custom_headers)
+
+        return resp, response_body
+
+    def __do_http(self, method, path, body, custom_headers):
         http_headers = self._headers.copy()
         if custom_headers:
             http_headers.update(custom_headers)
 
-        bConnected = False
-        conn = None
-        while bConnected is False:
+        attempt = 1
+        while True:
+            self.__before_request()
             try:
-                conn = self.get_connection()
-                conn.request(method, path, body, http_headers)
-                resp = conn.getresponse()
-                tempbytes = ''
-                try:
-                    tempbytes = resp.read()
-                    tempbody = tempbytes.decode('utf-8')
-                except UnicodeDecodeError:  # Might be binary data
-                    tempbody = tempbytes
-                    conn.close()
-                    bConnected = True
-                    return resp, tempbody
-                if tempbody:
-                    try:
-                        body = json.loads(tempbody)
-                    except ValueError:
-                        body = tempbody
-                conn.close()
-                bConnected = True
-            except http.client.BadStatusLine:
-                logger.warning('Bad Status Line. Trying again...')
+                resp, response_body = self.__send_request(method, path, body, http_headers)
+            except (http.client.HTTPException, socket.error) as error:
+                self.__record_request_result(False)
+                if not self._retry_policy.can_retry(method, attempt):
+                    if isinstance(error, socket.error):
+                        raise
+                    raise HPOneViewException('Failure during the request %s %s.\n %s'
+                                             % (method, path, traceback.format_exc()))
+                logger.warning('Request %s %s failed: %s. Trying again...' % (method, path, error))
+                retry_after = None
+            else:
+                if not self.__should_retry_response(resp, method, attempt):
+                    return resp, response_body
+                logger.warning('Request %s %s failed with status %s. Trying again...' % (method, path, resp.status))
+                retry_after = get_retry_after(resp)
+
+            time.sleep(self._retry_policy.get_delay(attempt, retry_after))
+            attempt += 1
+
+    def __send_request(self, method, path, body, http_headers):
+        """
+        Sends a request, again on a new connection when the appliance closed the pooled connection used before
+        processing the request. The other failures are left to the retry policy.
+        """
+        while True:
+            conn = None
+            reused = False
+            request_sent = False
+            try:
+                with self._limit_request(method, path):
+                    conn, reused = self._acquire_connection()
+                    conn.request(method, path, body, http_headers)
+                    request_sent = True
+                    resp = conn.getresponse()
+                    response_body = self.__read_response_body(resp, body)
+                self._release_connection(conn)
+                return resp, response_body
+            except (http.client.HTTPException, socket.error) as error:
                 if conn:
                     conn.close()
-                time.sleep(1)
-                continue
-            except http.client.HTTPException:
-                raise HPOneViewException('Failure during login attempt.\n %s' % traceback.format_exc())
+                if not reused or not is_dropped_connection(error, request_sent):
+                    raise
+                # The appliance dropped a pooled keep-alive connection, try again with a new one
+                logger.debug('Pooled connection was closed by the appliance. Trying again...')
+
+    def __before_request(self):
+        if self._circuit_breaker:
+            self._circuit_breaker.before_request()
+
+    def __record_request_result(self, succeeded):
+        if self._circuit_breaker:
+            if succeeded:
+                self._circuit_breaker.record_success()
+            else:
+                self._circuit_breaker.record_failure()
 
-        return resp, body
+    def __should_retry_response(self, resp, method, attempt):
+        failed = resp.status in self._retry_policy.retry_statuses
+        self.__record_request_result(not failed)
+        return failed and self._retry_policy.can_retry(method, attempt)
 
-    def download_to_stream(self, stream_writer, url, body='', method='GET', custom_headers=None):
+    def __read_response_body(self, resp, default_body):
+        tempbytes = ''
+        try:
+            tempbytes = resp.read()
+            tempbody = tempbytes.decode('utf-8')
+        except UnicodeDecodeError:  # Might be binary data
+            return tempbytes
+
+        if not tempbody:
+            return default_body
+
+        try:
+            return json.loads(tempbody)
+        except ValueError:
+            return tempbody
+
+    def download_to_stream(self, stream_writer, url, body='', method='GET', custom_headers=None, offset=0,
+                           chunk_size=None, progress_callback=None):
+        """
+        Writes the content of a URL to a stream.
+
+        When the connection is dropped during the transfer, the content is requested again from the last byte
+        written, with an HTTP Range header, instead of from the start.
+
+        Args:
+            stream_writer: Stream the content is written to.
+            url: URL of the content.
+            body: Body of the request.
+            method: HTTP method of the request.
+            custom_headers: Headers added to the request.
+            offset: Position of the first byte to download, e.g. the size of a partial download to resume.
+            chunk_size: Bytes read and written at a time. Defaults to the download chunk size of the connection.
+            progress_callback: Function called with the progress of the download, see TransferProgress.
+
+        Returns:
+            bool: Indicates if the content was successfully downloaded.
+        """
         http_headers = self._headers.copy()
         if custom_headers:
             http_headers.update(custom_headers)
 
-        chunk_size = 4096
-        conn = None
+        transfer_progress = self._get_transfer_progress(url, 'download', progress_callback, bytes_transferred=offset)
+        self.__download_range(stream_writer, method, url, body, http_headers, offset, None, transfer_progress,
+                              chunk_size)
 
-        successful_connected = False
-        while not successful_connected:
-            try:
-                conn = self.get_connection()
-                conn.request(method, url, body, http_headers)
-                resp = conn.getresponse()
+        return True
 
-                if resp.status >= 400:
-                    self.__handle_download_error(resp, conn)
+    def download_to_file(self, url, file_path, resume=False, max_workers=None, progress_callback=None):
+        """
+        Downloads the content of a URL to a file.
 
-                tempbytes = True
-                while tempbytes:
-                    tempbytes = resp.read(chunk_size)
-                    if tempbytes:  # filter out keep-alive new chunks
-                        stream_writer.write(tempbytes)
+        When the appliance accepts HTTP Range requests and the content is larger than the download segment size,
+        up to max_workers segments of the file are downloaded at the same time, each one over its own connection.
 
-                conn.close()
-                successful_connected = True
-            except http.client.BadStatusLine:
-                logger.warning('Bad Status Line. Trying again...')
+        Args:
+            url: URL of the content.
+            file_path: Path of the destination file.
+            resume: Continues a previous download, keeping the bytes already in the file.
+            max_workers: Maximum number of concurrent segment requests. Defaults to the maximum number of download
+                workers of the connection.
+            progress_callback: Function called with the progress of the download, see TransferProgress.
+
+        Returns:
+            bool: Indicates if the file was successfully downloaded.
+        """
+        max_workers = max_workers or self._max_download_workers
+        offset = 0
+        if resume and os.path.exists(file_path):
+            offset = os.path.getsize(file_path)
+
+        end = None
+        if max_workers > 1:
+            end = offset + self._download_segment_size - 1
+
+        transfer_progress = self._get_transfer_progress(url, 'download', progress_callback, bytes_transferred=offset)
+        with self._open(file_path, 'ab' if offset else 'wb') as stream_writer:
+            total_size = self.__download_range(stream_writer, 'GET', url, '', self._headers.copy(), offset, end,
+                                               transfer_progress)
+
+        if end is not None and total_size and total_size > end + 1:
+            self.__download_segments(url, file_path, end + 1, total_size, max_workers, transfer_progress)
+
+        return True
+
+    def __download_segments(self, url, file_path, start, total_size, max_workers, transfer_progress):
+        segment_size = self._download_segment_size
+        segments = [(position, min(position + segment_size, total_size) - 1)
+                    for position in range(start, total_size, segment_size)]
+
+        def download_segment(segment):
+            try:
+                with self._open(file_path, 'r+b') as stream_writer:
+                    stream_writer.seek(segment[0])
+                    self.__download_range(stream_writer, 'GET', url, '', self._headers.copy(), segment[0], segment[1],
+                                          transfer_progress)
+            except Exception as error:
+                return error
+
+        logger.debug('Downloading {0} segments with {1} workers'.format(len(segments), max_workers))
+        pool = ThreadPool(min(max_workers, len(segments)))
+        try:
+            errors = pool.map(download_segment, segments)
+        finally:
+            pool.close()
+            pool.join()
+
+        for segment, error in zip(segments, errors):
+            if error:
+                # Keep only the bytes downloaded in sequence, so the download can be resumed from the file size
+                with self._open(file_path, 'r+b') as stream_writer:
+                    stream_writer.truncate(segment[0])
+                raise error
+
+    def __download_range(self, stream_writer, method, url, body, http_headers, start, end, transfer_progress=None,
+                         chunk_size=None):
+        """
+        Writes the bytes from start to end, included, of the content of a URL to a stream, resuming the transfer
+        from the last byte written when the connection is dropped.
+
+        The end is ignored, and the rest of the content is written, when the appliance does not accept ranges.
+
+        Returns:
+            int: The size of the whole content when the appliance sent a range of it, otherwise None.
+        """
+        chunk_size = chunk_size or self._download_chunk_size
+        download_range = {'position': start, 'end': end}
+        attempt = 1
+        resuming = False
+
+        while True:
+            headers = http_headers
+            attempt_position = download_range['position']
+            if attempt_position or download_range['end'] is not None:
+                headers = http_headers.copy()
+                headers['Range'] = 'bytes=%d-%s' % (attempt_position,
+                                                    '' if download_range['end'] is None else download_range['end'])
+
+            # A resume is part of the request already let through by the circuit breaker
+            if not resuming:
+                self.__before_request()
+            resuming = False
+            conn = None
+            reused = False
+            try:
+                with self._limit_request(method, url):
+                    conn, reused = self._acquire_connection()
+                    conn.request(method, url, body, headers)
+                    resp = conn.getresponse()
+                    if not self.__should_retry_response(resp, method, attempt):
+                        return self.__write_range(resp, conn, stream_writer, chunk_size, download_range,
+                                                  attempt_position, transfer_progress)
+                    resp.read()
+                    conn.close()
+                logger.warning('Download of {0} failed with status {1}. Trying again...'.format(url, resp.status))
+                retry_after = get_retry_after(resp)
+            except (http.client.HTTPException, socket.error) as error:
                 if conn:
                     conn.close()
-                time.sleep(1)
-                continue
-            except http.client.HTTPException:
-                raise HPOneViewException('Failure during login attempt.\n %s' % traceback.format_exc())
+                if download_range['position'] != attempt_position or reused:
+                    logger.warning('Download of {0} interrupted at byte {1}. Resuming...'.format(url, download_range['position']))
+                    resuming = True
+                    continue
+                self.__record_request_result(False)
+                if not self._retry_policy.can_retry(method, attempt):
+                    if isinstance(error, (http.client.IncompleteRead, socket.error)):
+                        raise
+                    raise HPOneViewException('Failure during the download of %s.\n %s' % (url, traceback.format_exc()))
+                logger.warning('Download of {0} failed: {1}. Trying again...'.format(url, error))
+                retry_after = None
+
+            time.sleep(self._retry_policy.get_delay(attempt, retry_after))
+            attempt += 1
+
+    def __write_range(self, resp, conn, stream_writer, chunk_size, download_range, attempt_position,
+                      transfer_progress):
+        total_size = None
+        if resp.status in (206, 416):
+            total_size = get_content_range_size(resp.getheader('Content-Range'))
+        if resp.status == 416 and attempt_position and total_size == attempt_position:
+            # Nothing left to download
+            resp.read()
+            self._release_connection(conn)
+            return total_size
+
+        if resp.status >= 400:
+            self.__handle_download_error(resp, conn)
+
+        if self.__write_response(resp, stream_writer, chunk_size, download_range, transfer_progress):
+            self._release_connection(conn)
+        else:
+            conn.close()
+        return total_size
+
+    def __write_response(self, resp, stream_writer, chunk_size, download_range, transfer_progress):
+        """
+        Writes the body of a download response to a stream, from the position and up to the end of the download range,
+        and moves the position forward as the bytes are written.
 
-        return successful_connected
+        Returns:
+            bool: True when the whole body was read, False when the reading stopped at the end of the range.
+        """
+        skip = 0
+        if resp.status == 206:
+            content_size = get_content_range_size(resp.getheader('Content-Range'))
+        else:
+            # The whole content was sent, the bytes already written are skipped
+            skip = download_range['position']
+            download_range['end'] = None
+            content_size = get_content_length(resp)
+
+        if transfer_progress:
+            transfer_progress.set_total_bytes(content_size)
+
+        while True:
+            tempbytes = resp.read(chunk_size)
+            if not tempbytes:  # filter out keep-alive new chunks
+                return True
+
+            skipped = min(skip, len(tempbytes))
+            skip -= skipped
+            tempbytes = tempbytes[skipped:]
+            if download_range['end'] is not None:
+                tempbytes = tempbytes[:download_range['end'] + 1 - download_range['position']]
+
+            if tempbytes:
+                stream_writer.write(tempbytes)
+                download_range['position'] += len(tempbytes)
+                if transfer_progress:
+                    transfer_progress.update(len(tempbytes))
+
+            if download_range['end'] is not None and download_range['position'] > download_range['end']:
+                return False
 
     def __handle_download_error(self, resp, conn):
         try:
@@ -208,33 +1539,49 @@ class connection(object):
         conn.close()
         raise HPOneViewException(body)
 
+    def _get_connection_pool_key(self):
+        return self._host, self._proxyHost, self._proxyPort
+
+    def _acquire_connection(self):
+        """
+        Gets a connection to the appliance, reusing an idle one from the connection pool when possible.
+
+        Returns:
+            tuple: The connection and a flag indicating whether it was reused from the pool.
+        """
+        if self._connection_pool:
+            conn = self._connection_pool.acquire(self._get_connection_pool_key())
+            if conn:
+                return conn, True
+
+        return self.get_connection(), False
+
+    def _release_connection(self, conn):
+        """
+        Gives back a connection whose response was fully read. It is kept alive in the connection pool when
+        there is one, otherwise it is closed.
+        """
+        if self._connection_pool:
+            self._connection_pool.release(self._get_connection_pool_key(), conn)
+        else:
+            conn.close()
+
     def get_connection(self):
-        context = ssl.SSLContext(ssl.PROTOCOL_TLSv1_2)
         if self._sslTrustAll is False:
-            context.verify_mode = ssl.CERT_REQUIRED
-            context.load_verify_locations(self._sslTrustedBundle)
-            if self._doProxy is False:
-                conn = http.client.HTTPSConnection(self._host,
-                                                   context=context,
-                                                   timeout=self._timeout)
-            else:
-                conn = http.client.HTTPSConnection(self._proxyHost,
-                                                   self._proxyPort,
-                                                   context=context,
-                                                   timeout=self._timeout)
-                conn.set_tunnel(self._host, 443)
+            context = get_ssl_context(self._sslTrustedBundle, ssl.CERT_REQUIRED)
         else:
-            context.verify_mode = ssl.CERT_NONE
-            if self._doProxy is False:
-                conn = http.client.HTTPSConnection(self._host,
-                                                   context=context,
-                                                   timeout=self._timeout)
-            else:
-                conn = http.client.HTTPSConnection(self._proxyHost,
-                                                   self._proxyPort,
-                                                   context=context,
-                                                   timeout=self._timeout)
-                conn.set_tunnel(self._host, 443)
+            context = get_ssl_context(verify_mode=ssl.CERT_NONE)
+
+        if self._doProxy is False:
+            conn = http.client.HTTPSConnection(self._host,
+                                               context=context,
+                                               timeout=self._timeout)
+        else:
+            conn = http.client.HTTPSConnection(self._proxyHost,
+                                               self._proxyPort,
+                                               context=context,
+                                               timeout=self._timeout)
+            conn.set_tunnel(self._host, 443)
 
         return conn
 
@@ -243,35 +1590,20 @@ class connection(object):
 
     def encode_multipart_formdata(self, fields, files, baseName, verbose=False):
         """
-        Fields is a sequence of (name, value) elements for regular form fields.
-        Files is a sequence of (name, filename, value) elements for data
-        to be uploaded as files
+        Gets the content type of a file uploaded as a multipart/form-data body.
+
+        Deprecated: post_multipart streams the file itself, between the parts returned by get_multipart_envelope, and
+        no encoded copy of the file is written any more.
 
-        Returns: (content_type, body) ready for httplib.HTTP instance
+        Returns: content_type
         """
-        BOUNDARY = '----------ThIs_Is_tHe_bouNdaRY_$'
-        CRLF = '\r\n'
-        content_type = 'multipart/form-data; boundary=%s' % BOUNDARY
-        if verbose is True:
-            print(('Encoding ' + baseName + ' for upload...'))
-        fin = self._open(files, 'rb')
-        fout = self._open(files + '.b64', 'wb')
-        fout.write(bytearray('--' + BOUNDARY + CRLF, 'utf-8'))
-        fout.write(bytearray('Content-Disposition: form-data'
-                             '; name="file"; filename="' + baseName + '"' + CRLF, "utf-8"))
-        fout.write(bytearray('Content-Type: application/octet-stream' + CRLF,
-                             'utf-8'))
-        fout.write(bytearray(CRLF, 'utf-8'))
-        shutil.copyfileobj(fin, fout)
-        fout.write(bytearray(CRLF, 'utf-8'))
-        fout.write(bytearray('--' + BOUNDARY + '--' + CRLF, 'utf-8'))
-        fout.write(bytearray(CRLF, 'utf-8'))
-        fout.close()
-        fin.close()
+        warnings.warn('encode_multipart_formdata is deprecated, post_multipart streams the file without an encoded '
+                      'copy; use get_multipart_envelope to build the multipart body.', DeprecationWarning, stacklevel=2)
+        content_type, _, _ = self.get_multipart_envelope(baseName)
         return content_type
 
-    def post_multipart_with_response_handling(self, uri, file_path, baseName):
-        resp, body = self.post_multipart(uri, None, file_path, baseName)
+    def post_multipart_with_response_handling(self, uri, file_path, baseName, progress_callback=None):
+        resp, body = self.post_multipart(uri, None, file_path, baseName, progress_callback=progress_callback)
 
         if resp.status == 202:
             task = self.__get_task_from_response(resp, body)
@@ -282,61 +1614,150 @@ class connection(object):
 
         return None, body
 
-    def post_multipart(self, uri, fields, files, baseName, verbose=False):
-        content_type = self.encode_multipart_formdata(fields, files, baseName,
-                                                      verbose)
-        inputfile = self._open(files + '.b64', 'rb')
-        mappedfile = mmap.mmap(inputfile.fileno(), 0, access=mmap.ACCESS_READ)
+    def get_multipart_envelope(self, baseName):
+        """
+        Builds the parts of a multipart/form-data body sent before and after the content of an uploaded file.
+
+        Returns: (content_type, preamble, epilogue)
+        """
+        CRLF = '\r\n'
+        content_type = 'multipart/form-data; boundary=%s' % self.MULTIPART_BOUNDARY
+        preamble = ('--' + self.MULTIPART_BOUNDARY + CRLF +
+                    'Content-Disposition: form-data; name="file"; filename="' + baseName + '"' + CRLF +
+                    'Content-Type: application/octet-stream' + CRLF +
+                    CRLF)
+        epilogue = CRLF + '--' + self.MULTIPART_BOUNDARY + '--' + CRLF + CRLF
+        return content_type, preamble.encode('utf-8'), epilogue.encode('utf-8')
+
+    def post_multipart(self, uri, fields, files, baseName, verbose=False, chunk_size=None, progress_callback=None):
+        """
+        Uploads a file as a multipart/form-data body.
+
+        The file is streamed to the appliance between the multipart preamble and epilogue, one chunk at a time, so
+        no copy of the file is written to disk.
+
+        Args:
+            uri: URI of the upload.
+            fields: Not used.
+            files: Path of the file to upload.
+            baseName: File name sent to the appliance.
+            verbose: Prints the progress of the upload.
+            chunk_size: Bytes read and sent at a time. Defaults to the upload chunk size of the connection.
+            progress_callback: Function called with the progress of the upload, see TransferProgress.
+
+        Returns:
+            tuple: The response and its body.
+        """
+        chunk_size = chunk_size or self._upload_chunk_size
+        fileSize = os.path.getsize(files)
+        transfer_progress = self._get_transfer_progress(uri, 'upload', progress_callback, total_bytes=fileSize)
         if verbose is True:
             print(('Uploading ' + files + '...'))
-        conn = self.get_connection()
-        # conn.set_debuglevel(1)
-        conn.connect()
-        conn.putrequest('POST', uri)
-        conn.putheader('uploadfilename', baseName)
-        conn.putheader('auth', self._headers['auth'])
-        conn.putheader('Content-Type', content_type)
-        totalSize = os.path.getsize(files + '.b64')
-        conn.putheader('Content-Length', totalSize)
-        conn.putheader('X-API-Version', self._apiVersion)
-        conn.endheaders()
-
-        while mappedfile.tell() < mappedfile.size():
-            # Send 1MB at a time
-            # NOTE: Be careful raising this value as the read chunk
-            # is stored in RAM
-            readSize = 1048576
-            conn.send(mappedfile.read(readSize))
-            if verbose is True:
-                print('%d bytes sent... \r' % mappedfile.tell())
-        mappedfile.close()
-        inputfile.close()
-        os.remove(files + '.b64')
-        response = conn.getresponse()
-        body = response.read().decode('utf-8')
-
-        if body:
-            try:
-                body = json.loads(body)
-            except ValueError:
-                body = response.read().decode('utf-8')
 
-        conn.close()
+        # The uploads are not idempotent, so they are not retried, but they count for the circuit breaker
+        self.__before_request()
+        try:
+            with self._limit_request('POST', uri):
+                response, body = self.__send_multipart(uri, files, baseName, fileSize, verbose, chunk_size,
+                                                       transfer_progress)
+        except (http.client.HTTPException, socket.error):
+            self.__record_request_result(False)
+            raise
+        self.__record_request_result(response.status not in self._retry_policy.retry_statuses)
+
+        if self._response_cache:
+            self._response_cache.invalidate(get_collection_uri(uri))
 
         if response.status >= 400:
             raise HPOneViewException(body)
 
         return response, body
 
+    def __send_multipart(self, uri, files, baseName, fileSize, verbose, chunk_size, transfer_progress):
+        """
+        Sends a file as a multipart/form-data body and reads the response, again on a new connection when the
+        appliance closed the pooled connection used before processing the upload, as __send_request does.
+        """
+        content_type, preamble, epilogue = self.get_multipart_envelope(baseName)
+        totalSize = len(preamble) + fileSize + len(epilogue)
+
+        while True:
+            conn, reused = self._acquire_connection()
+            request_sent = False
+            try:
+                if not reused:
+                    conn.connect()
+                conn.putrequest('POST', uri)
+                conn.putheader('uploadfilename', baseName)
+                conn.putheader('auth', self._headers['auth'])
+                conn.putheader('Content-Type', content_type)
+                conn.putheader('Content-Length', totalSize)
+                conn.putheader('X-API-Version', self._apiVersion)
+                conn.endheaders()
+                conn.send(preamble)
+                self.__send_file(conn, files, verbose, chunk_size, transfer_progress)
+                conn.send(epilogue)
+                request_sent = True
+
+                response = conn.getresponse()
+                body = response.read().decode('utf-8')
+            except (http.client.HTTPException, socket.error) as error:
+                conn.close()
+                if not reused or not is_dropped_connection(error, request_sent):
+                    raise
+                # The appliance dropped a pooled keep-alive connection, send the file again on a new one
+                logger.debug('Pooled connection was closed by the appliance. Trying again...')
+                if transfer_progress:
+                    transfer_progress.restart()
+                continue
+            except BaseException:
+                conn.close()
+                raise
+
+            self._release_connection(conn)
+
+            if body:
+                try:
+                    body = json.loads(body)
+                except ValueError:
+                    # Not a JSON body, keep its text
+                    pass
+
+            return response, body
+
+    def __send_file(self, conn, files, verbose, chunk_size, transfer_progress):
+        inputfile = self._open(files, 'rb')
+        try:
+            sent = 0
+            chunk = inputfile.read(chunk_size)
+            while chunk:
+                conn.send(chunk)
+                sent += len(chunk)
+                if transfer_progress:
+                    transfer_progress.update(len(chunk))
+                if verbose is True:
+                    print('%d bytes sent... \r' % sent)
+                chunk = inputfile.read(chunk_size)
+        finally:
+            inputfile.close()
+
     ###########################################################################
     # Utility functions for making requests - the HTTP verbs
     ###########################################################################
     def get(self, uri):
-        resp, body = self.do_http('GET', uri, '')
-        if resp.status >= 400:
-            raise HPOneViewException(body)
-        if resp.status == 302:
-            body = self.get(resp.getheader('Location'))
+        body = None
+        if self._response_cache:
+            body = self._response_cache.get(uri)
+
+        if body is None:
+            resp, body = self.__do_get(uri)
+            if resp.status >= 400:
+                raise HPOneViewException(body)
+            if resp.status == 302:
+                body = self.get(resp.getheader('Location'))
+            elif self._response_cache:
+                self._response_cache.put(uri, body)
+
         if type(body) is dict:
             if 'nextPageUri' in body:
                 self._nextPage = body['nextPageUri']
@@ -348,6 +1769,42 @@ class connection(object):
                 self._numDisplayedRecords = body['count']
         return body
 
+    def __do_get(self, uri):
+        if not self._etag_cache:
+            return self.do_http('GET', uri, '')
+
+        cached = self._etag_cache.get(uri)
+        if cached is None:
+            resp, body = self.do_http('GET', uri, '')
+        else:
+            resp, body = self.do_http('GET', uri, '', {'If-None-Match': cached[0]})
+            if resp.status == 304:
+                return resp, cached[1]
+
+        if resp.status == 200:
+            self._etag_cache.put(uri, get_etag(resp, body), body)
+        return resp, body
+
+    def get_if_modified(self, uri, etag):
+        """
+        Gets a resource only when it changed, sending its known ETag in an If-None-Match header.
+
+        Args:
+            uri: URI of the resource.
+            etag: ETag of the known version of the resource.
+
+        Returns:
+            The resource, or None when it was not modified.
+        """
+        resp, body = self.do_http('GET', uri, '', {'If-None-Match': etag})
+        if resp.status == 304:
+            return None
+        if resp.status >= 400:
+            raise HPOneViewException(body)
+        if resp.status == 302:
+            return self.get(resp.getheader('Location'))
+        return body
+
     def getNextPage(self):
         body = self.get(self._nextPage)
         return get_members(body)
@@ -395,10 +1852,14 @@ class connection(object):
         return task
 
     def __do_rest_call(self, http_method, uri, body, custom_headers):
-        resp, body = self.do_http(method=http_method,
-                                  path=uri,
-                                  body=json.dumps(body),
-                                  custom_headers=custom_headers)
+        try:
+            resp, body = self.do_http(method=http_method,
+                                      path=uri,
+                                      body=json.dumps(body),
+                                      custom_headers=custom_headers)
+        finally:
+            if self._response_cache:
+                self._response_cache.invalidate(get_collection_uri(uri))
         if resp.status >= 400:
             raise HPOneViewException(body)
 
@@ -441,6 +1902,9 @@ class connection(object):
     # Login/Logout to/from appliance
     ###########################################################################
     def login(self, cred, verbose=False):
+        if self.__login_with_cached_session(cred):
+            return
+
         try:
             if self._validateVersion is False:
                 self.validateVersion()
@@ -462,6 +1926,8 @@ class connection(object):
         # Add the auth ID to the headers dictionary
         self._headers['auth'] = auth
         self._session = True
+        if self._session_cache and not self._cred.get("sessionID"):
+            self._session_cache.put(self.__get_session_key(self._cred), auth)
         if verbose is True:
             print(('Session Key: ' + auth))
         logger.info('Logged in successfully')
@@ -476,11 +1942,62 @@ class connection(object):
             raise
         if verbose is True:
             print('Logged Out')
+        if self._session_cache and self._cred and not self._cred.get("sessionID"):
+            self._session_cache.discard(self.__get_session_key(self._cred))
         del self._headers['auth']
         self._session = False
+        if self._connection_pool:
+            self._connection_pool.clear()
+        if self._response_cache:
+            self._response_cache.clear()
+        if self._etag_cache:
+            self._etag_cache.clear()
         logger.info('Logged out successfully')
         return None
 
+    def __login_with_cached_session(self, cred):
+        if not self._session_cache or cred.get("sessionID"):
+            return False
+
+        session_id = self._session_cache.get(self.__get_session_key(cred))
+        if not session_id:
+            return False
+
+        self._cred = cred
+        self._validateVersion = True
+        self.set_session_id(session_id)
+        logger.info('Reused a cached session')
+        return True
+
+    def __renew_session(self, expired_session_id, path):
+        """
+        Logs in again with the credentials of the login when the session used by a request was rejected. Returns
+        whether the request can be sent again.
+        """
+        if not self._cred or self._cred.get("sessionID") or path.startswith(uri['loginSessions']):
+            return False
+
+        with self._login_lock:
+            # Another thread may already have renewed the session
+            if self.get_session_id() == expired_session_id:
+                logger.info('Session expired, logging in again')
+                if self._session_cache:
+                    self._session_cache.discard(self.__get_session_key(self._cred))
+                task, body = self.post(uri['loginSessions'], self._cred)
+                self.set_session_id(body['sessionID'])
+                if self._session_cache:
+                    self._session_cache.put(self.__get_session_key(self._cred), body['sessionID'])
+        return True
+
+    def __get_session_key(self, cred):
+        """
+        Gets the key of the session of some credentials in the session cache. The password is part of the key, so a
+        process with other credentials does not reuse the session, but the key is only stored as an HMAC keyed with
+        the secret of the cache.
+        """
+        return json.dumps(['session', self._host, self._apiVersion, cred.get('userName'),
+                           cred.get('authLoginDomain'), cred.get('password')])
+
     def enable_etag_validation(self):
         """
         Enable the concurrency control for the PUT and DELETE requests, in which the requests are conditionally
@@ -647,6 +2164,93 @@ uri = {
 ############################################################################
 
 
+def is_dropped_connection(error, request_sent):
+    """
+    Indicates if a request failed because the appliance had closed the idle keep-alive connection used, before
+    processing the request, so it can be sent again on a new connection whatever its method: the request could not be
+    sent, or the connection was closed without any byte of a response. A timeout never qualifies, as the appliance may
+    still be processing the request.
+
+    Args:
+        error: Exception raised by the request.
+        request_sent: Indicates if the request was completely sent.
+
+    Returns:
+        bool:
+    """
+    if isinstance(error, socket.timeout):
+        return False
+    if not request_sent:
+        return isinstance(error, socket.error)
+    # RemoteDisconnected, or BadStatusLine on Python 2, without any byte of the status line
+    return isinstance(error, http.client.BadStatusLine) and error.line in ('', "''")
+
+
+def get_retry_after(resp):
+    """
+    Gets the delay asked by the Retry-After header of a response, given in seconds or as an HTTP date.
+
+    Returns:
+        Seconds, or None when the response has no valid Retry-After header.
+    """
+    retry_after = resp.getheader('Retry-After')
+    if not retry_after:
+        return None
+
+    try:
+        return max(float(retry_after), 0)
+    except (TypeError, ValueError):
+        pass
+
+    retry_date = email.utils.parsedate_tz(retry_after)
+    if retry_date is None:
+        return None
+    return max(email.utils.mktime_tz(retry_date) - time.time(), 0)
+
+
+def get_etag(resp, body):
+    """
+    Gets the ETag of a response, from its ETag header or else from the eTag attribute of the resource.
+    """
+    etag = resp.getheader('ETag')
+    if not etag and isinstance(body, dict):
+        etag = body.get('eTag')
+    return etag
+
+
+def get_collection_uri(uri):
+    """
+    Gets the URI of the collection of a resource URI, e.g. '/rest/fc-networks' for '/rest/fc-networks/1?force=true'.
+    """
+    return '/'.join(uri.split('?')[0].split('/')[:3])
+
+
+def get_content_length(resp):
+    """
+    Gets the Content-Length of a response.
+
+    Returns:
+        int: The length, or None when it is unknown.
+    """
+    content_length = resp.getheader('Content-Length')
+    if content_length and str(content_length).isdigit():
+        return int(content_length)
+    return None
+
+
+def get_content_range_size(content_range):
+    """
+    Gets the size of the whole content from a Content-Range header, e.g. 'bytes 0-99/1000' or 'bytes */1000'.
+
+    Returns:
+        int: The size, or None when it is unknown.
+    """
+    match = re.match(r'bytes\s+(?:\d+-\d+|\*)/(\d+)', content_range or '')
+    if match:
+        return int(match.group(1))
+    return None
+
+
 def get_members(mlist):
     if not mlist:
         return []
@@ -26,9 +26,6 @@ from __future__ import unicode_literals
 from __future__ import print_function
 from __future__ import division
 from __future__ import absolute_import
-from future import standard_library
-
-standard_library.install_aliases()
 
 import logging
 import traceback
@@ -171,3 +168,15 @@ class HPOneViewMissingUniqueIdentifiers(HPOneViewException):
        msg (str): Exception message.
     """
     pass
+
+
+class HPOneViewCircuitOpen(HPOneViewException):
+    """
+    OneView Circuit Open Exception.
+    The exception is raised, without sending the request, while the circuit breaker of an appliance is open after
+    consecutive failures.
+
+    Attributes:
+       msg (str): Exception message.
+    """
+    pass
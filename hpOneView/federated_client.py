@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2019) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+"""
+This module implements a client running the same queries against many HPE OneView appliances.
+"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import logging
+from collections import OrderedDict
+
+from hpOneView.oneview_client import OneViewClient
+from hpOneView.resources.resource import fan_out, DEFAULT_FAN_OUT_WORKERS
+
+logger = logging.getLogger(__name__)
+
+FEDERATED_CLIENT_DUPLICATED_NAME = 'Duplicated appliance name: {0}'
+
+
+class FederatedResult(object):
+    """
+    Results of a query run against many appliances.
+
+    Attributes:
+        results (OrderedDict): Result of each appliance that answered, by appliance name.
+        errors (dict): Exception raised for each appliance that failed, by appliance name.
+        members (list): Members returned by all the appliances, in the order of the appliances, each one a copy
+            tagged with the name of its appliance under FederatedOneViewClient.APPLIANCE_KEY.
+    """
+
+    def __init__(self, results, errors, appliance_key):
+        self.results = results
+        self.errors = errors
+        self.members = []
+        for name, result in results.items():
+            if isinstance(result, list):
+                self.members.extend(tag_member(member, appliance_key, name) for member in result)
+
+    @property
+    def succeeded(self):
+        """Indicates if all the appliances answered."""
+        return not self.errors
+
+
+class FederatedOneViewClient(object):
+    """
+    Holds the clients of many appliances, and runs the same queries against all of them concurrently.
+
+    A failed appliance does not fail the query: the results of the other appliances are returned, and its error is
+    kept in the errors of the FederatedResult.
+
+    Args:
+        clients (dict): OneViewClient of each appliance, by appliance name.
+        max_workers: Maximum number of appliances queried at the same time.
+    """
+    # Field of the merged members holding the name of their appliance
+    APPLIANCE_KEY = 'appliance'
+
+    def __init__(self, clients, max_workers=DEFAULT_FAN_OUT_WORKERS):
+        self.__clients = dict(clients)
+        self.__names = sorted(self.__clients)
+        self.__max_workers = max_workers
+        self.__login_errors = {}
+
+    @classmethod
+    def from_configs(cls, configs, max_workers=DEFAULT_FAN_OUT_WORKERS):
+        """
+        Construct the clients of many appliances, logging in to all of them concurrently.
+
+        The appliances whose client could not be created are left out, with their error in login_errors.
+
+        Args:
+            configs: Configuration of each appliance, as given to OneViewClient, in a dict by appliance name, or in a
+                list to name the appliances after their ip.
+            max_workers: Maximum number of appliances queried at the same time.
+
+        Returns:
+            FederatedOneViewClient:
+
+        Raises:
+            ValueError: When two configurations of the list have the same ip.
+        """
+        if not isinstance(configs, dict):
+            configs_by_name = {}
+            for config in configs:
+                if config['ip'] in configs_by_name:
+                    raise ValueError(FEDERATED_CLIENT_DUPLICATED_NAME.format(config['ip']))
+                configs_by_name[config['ip']] = config
+            configs = configs_by_name
+
+        names = sorted(configs)
+        fan_out_results = fan_out(lambda name: OneViewClient(configs[name]), names, max_workers)
+
+        clients = {}
+        login_errors = {}
+        for name, fan_out_result in zip(names, fan_out_results):
+            if fan_out_result['error']:
+                logger.warning('Could not log in to the appliance %s: %s', name, fan_out_result['error'])
+                login_errors[name] = fan_out_result['error']
+            else:
+                clients[name] = fan_out_result['result']
+
+        federated_client = cls(clients, max_workers)
+        federated_client.__login_errors = login_errors
+        return federated_client
+
+    @property
+    def clients(self):
+        """
+        Gets the clients of the appliances.
+
+        Returns:
+            dict: OneViewClient by appliance name.
+        """
+        return self.__clients.copy()
+
+    @property
+    def login_errors(self):
+        """
+        Gets the errors raised when creating the clients with from_configs.
+
+        Returns:
+            dict: Exception by appliance name.
+        """
+        return self.__login_errors.copy()
+
+    def query(self, function):
+        """
+        Calls a function with the client of each appliance, concurrently.
+
+        Args:
+            function: Function called with a OneViewClient.
+
+        Returns:
+            FederatedResult: The result of each appliance, and the members of the lists returned.
+        """
+        fan_out_results = fan_out(lambda name: function(self.__clients[name]), self.__names, self.__max_workers)
+
+        results = OrderedDict()
+        errors = {}
+        for name, fan_out_result in zip(self.__names, fan_out_results):
+            if fan_out_result['error']:
+                logger.warning('Query of the appliance %s failed: %s', name, fan_out_result['error'])
+                errors[name] = fan_out_result['error']
+            else:
+                results[name] = fan_out_result['result']
+
+        return FederatedResult(results, errors, self.APPLIANCE_KEY)
+
+    def get_all(self, resource_name, *args, **kwargs):
+        """
+        Gets the members of a collection of all the appliances.
+
+        Args:
+            resource_name: Name of the resource client of OneViewClient, such as 'server_hardware'.
+            *args: Arguments of its get_all method.
+            **kwargs: Keyword arguments of its get_all method.
+
+        Returns:
+            FederatedResult: The members, tagged with their appliance.
+        """
+        return self.query(lambda client: getattr(client, resource_name).get_all(*args, **kwargs))
+
+    def get_by(self, resource_name, field, value, **kwargs):
+        """
+        Gets the members of a collection of all the appliances with a field value.
+
+        Args:
+            resource_name: Name of the resource client of OneViewClient, such as 'server_profiles'.
+            field: Field name to filter.
+            value: Value to filter.
+            **kwargs: Other keyword arguments of its get_by method.
+
+        Returns:
+            FederatedResult: The members found, tagged with their appliance.
+        """
+        return self.query(lambda client: getattr(client, resource_name).get_by(field, value, **kwargs))
+
+    def search(self, **kwargs):
+        """
+        Searches the index resources of all the appliances.
+
+        Args:
+            **kwargs: Keyword arguments of IndexResources.get_all, such as category, query or filter.
+
+        Returns:
+            FederatedResult: The index resources found, tagged with their appliance.
+        """
+        return self.get_all('index_resources', **kwargs)
+
+    def logout(self):
+        """
+        Logs out from all the appliances.
+
+        Returns:
+            FederatedResult: The appliances that failed to log out are in its errors.
+        """
+        return self.query(lambda client: client.connection.logout())
+
+
+def tag_member(member, appliance_key, name):
+    """Gets a copy of a member with the name of its appliance, or the member when it is not a dict."""
+    if not isinstance(member, dict):
+        return member
+
+    tagged_member = dict(member)
+    tagged_member[appliance_key] = name
+    return tagged_member
@@ -28,10 +28,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
-
-standard_library.install_aliases()
-
 
 from hpOneView.connection import connection
 from hpOneView.image_streamer.resources.golden_images import GoldenImages
@@ -25,10 +25,6 @@ from __future__ import print_function
 from __future__ import unicode_literals
 from __future__ import division
 from __future__ import absolute_import
-from future import standard_library
-
-standard_library.install_aliases()
-
 
 from hpOneView.resources.resource import ResourceClient, extract_id_from_uri
 
@@ -154,19 +150,20 @@ class ArtifactBundles(object):
         uri = self.BACKUP_ARCHIVE_PATH + '/' + extract_id_from_uri(id_or_uri)
         return self._client.download(uri, file_path)
 
-    def download_artifact_bundle(self, id_or_uri, file_path):
+    def download_artifact_bundle(self, id_or_uri, file_path, resume=False):
         """
         Download the Artifact Bundle.
 
         Args:
             id_or_uri: ID or URI of the Artifact Bundle.
             file_path(str): Destination file path.
+            resume(bool): Continues a previous download, keeping the bytes already in the file.
 
         Returns:
             bool: Successfully downloaded.
         """
         uri = self.DOWNLOAD_PATH + '/' + extract_id_from_uri(id_or_uri)
-        return self._client.download(uri, file_path)
+        return self._client.download(uri, file_path, resume=resume)
 
     def create_backup(self, resource, timeout=-1):
         """
@@ -184,25 +181,27 @@ class ArtifactBundles(object):
         """
         return self._client.create(resource, uri=self.BACKUPS_PATH, timeout=timeout)
 
-    def upload_bundle_from_file(self, file_path):
+    def upload_bundle_from_file(self, file_path, progress_callback=None):
         """
         Restore an Artifact Bundle from a backup file.
 
         Args:
             file_path (str): The File Path to restore the Artifact Bundle.
+            progress_callback: Function called with the progress of the upload, see connection.TransferProgress.
 
         Returns:
             dict: Artifact bundle.
         """
-        return self._client.upload(file_path)
+        return self._client.upload(file_path, progress_callback=progress_callback)
 
-    def upload_backup_bundle_from_file(self, file_path, deployment_groups_id_or_uri):
+    def upload_backup_bundle_from_file(self, file_path, deployment_groups_id_or_uri, progress_callback=None):
         """
         Restore an Artifact Bundle from a backup file.
 
         Args:
             file_path (str): The File Path to restore the Artifact Bundle.
             deployment_groups_id_or_uri: ID or URI of the Deployment Groups.
+            progress_callback: Function called with the progress of the upload, see connection.TransferProgress.
 
         Returns:
             dict: Deployment group.
@@ -214,7 +213,7 @@ class ArtifactBundles(object):
 
         uri = self.BACKUP_ARCHIVE_PATH + "?deploymentGrpUri=" + deployment_groups_uri
 
-        return self._client.upload(file_path, uri)
+        return self._client.upload(file_path, uri, progress_callback=progress_callback)
 
     def create(self, resource, timeout=-1):
         """
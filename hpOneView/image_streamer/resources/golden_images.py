@@ -25,10 +25,6 @@ from __future__ import print_function
 from __future__ import unicode_literals
 from __future__ import division
 from __future__ import absolute_import
-from future import standard_library
-
-standard_library.install_aliases()
-
 
 from hpOneView.resources.resource import ResourceClient, extract_id_from_uri
 from hpOneView.resources.task_monitor import TaskMonitor
@@ -87,7 +83,7 @@ class GoldenImages(object):
         data.update(resource)
         return self._client.create(data, timeout=timeout)
 
-    def upload(self, file_path, golden_image_info):
+    def upload(self, file_path, golden_image_info, progress_callback=None):
         """
         Adds a Golden Image resource from the file that is uploaded from a local drive. Only the .zip format file can
         be used for the upload.
@@ -95,6 +91,7 @@ class GoldenImages(object):
         Args:
             file_path (str): File name to upload.
             golden_image_info (dict): Golden Image information.
+            progress_callback: Function called with the progress of the upload, see connection.TransferProgress.
 
         Returns:
             dict: Golden Image.
@@ -103,7 +100,7 @@ class GoldenImages(object):
                                                     quote(golden_image_info.get('name', '')),
                                                     quote(golden_image_info.get('description', '')))
 
-        return self._client.upload(file_path, uri)
+        return self._client.upload(file_path, uri, progress_callback=progress_callback)
 
     def download_archive(self, id_or_uri, file_path):
         """
@@ -120,19 +117,20 @@ class GoldenImages(object):
         uri = self.URI + "/archive/" + extract_id_from_uri(id_or_uri)
         return self._client.download(uri, file_path)
 
-    def download(self, id_or_uri, file_path):
+    def download(self, id_or_uri, file_path, resume=False):
         """
         Downloads the content of the selected Golden Image as per the specified attributes.
 
         Args:
             id_or_uri: ID or URI of the Golden Image.
             file_path(str): Destination file path.
+            resume(bool): Continues a previous download, keeping the bytes already in the file.
 
         Returns:
             bool: Successfully downloaded.
         """
         uri = self.URI + "/download/" + extract_id_from_uri(id_or_uri)
-        return self._client.download(uri, file_path)
+        return self._client.download(uri, file_path, resume=resume)
 
     def get(self, id_or_uri):
         """
@@ -28,182 +28,130 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
-
-standard_library.install_aliases()
-
+import importlib
 import json
+import logging
 import os
 
-from hpOneView.connection import connection
-from hpOneView.image_streamer.image_streamer_client import ImageStreamerClient
-from hpOneView.resources.security.certificate_authority import CertificateAuthority
-from hpOneView.resources.servers.connections import Connections
-from hpOneView.resources.networking.fc_networks import FcNetworks
-from hpOneView.resources.networking.fcoe_networks import FcoeNetworks
-from hpOneView.resources.networking.ethernet_networks import EthernetNetworks
-from hpOneView.resources.networking.connection_templates import ConnectionTemplates
-from hpOneView.resources.networking.fabrics import Fabrics
-from hpOneView.resources.networking.network_sets import NetworkSets
-from hpOneView.resources.data_services.metric_streaming import MetricStreaming
-from hpOneView.resources.networking.switches import Switches
-from hpOneView.resources.networking.switch_types import SwitchTypes
-from hpOneView.resources.activity.tasks import Tasks
-from hpOneView.resources.settings.restores import Restores
-from hpOneView.resources.settings.scopes import Scopes
-from hpOneView.resources.settings.licenses import Licenses
-from hpOneView.resources.servers.enclosures import Enclosures
-from hpOneView.resources.servers.logical_enclosures import LogicalEnclosures
-from hpOneView.resources.servers.enclosure_groups import EnclosureGroups
-from hpOneView.resources.servers.server_hardware import ServerHardware
-from hpOneView.resources.servers.server_hardware_types import ServerHardwareTypes
-from hpOneView.resources.servers.id_pools_ranges import IdPoolsRanges
-from hpOneView.resources.servers.id_pools_ipv4_ranges import IdPoolsIpv4Ranges
-from hpOneView.resources.servers.id_pools_ipv4_subnets import IdPoolsIpv4Subnets
-from hpOneView.resources.servers.id_pools import IdPools
-from hpOneView.resources.networking.interconnects import Interconnects
-from hpOneView.resources.networking.interconnect_types import InterconnectTypes
-from hpOneView.resources.networking.interconnect_link_topologies import InterconnectLinkTopologies
-from hpOneView.resources.networking.sas_interconnect_types import SasInterconnectTypes
-from hpOneView.resources.networking.internal_link_sets import InternalLinkSets
-from hpOneView.resources.uncategorized.unmanaged_devices import UnmanagedDevices
-from hpOneView.resources.networking.logical_downlinks import LogicalDownlinks
-from hpOneView.resources.facilities.power_devices import PowerDevices
-from hpOneView.resources.facilities.racks import Racks
-from hpOneView.resources.facilities.datacenters import Datacenters
-from hpOneView.resources.fc_sans.managed_sans import ManagedSANs
-from hpOneView.resources.fc_sans.san_managers import SanManagers
-from hpOneView.resources.fc_sans.endpoints import Endpoints
-from hpOneView.resources.networking.logical_interconnects import LogicalInterconnects
-from hpOneView.resources.networking.logical_interconnect_groups import LogicalInterconnectGroups
-from hpOneView.resources.networking.sas_logical_interconnects import SasLogicalInterconnects
-from hpOneView.resources.networking.logical_switch_groups import LogicalSwitchGroups
-from hpOneView.resources.networking.logical_switches import LogicalSwitches
-from hpOneView.resources.networking.sas_interconnects import SasInterconnects
-from hpOneView.resources.servers.server_profiles import ServerProfiles
-from hpOneView.resources.servers.server_profile_templates import ServerProfileTemplate
-from hpOneView.resources.storage.sas_logical_jbods import SasLogicalJbods
-from hpOneView.resources.storage.storage_systems import StorageSystems
-from hpOneView.resources.storage.storage_pools import StoragePools
-from hpOneView.resources.storage.storage_volume_templates import StorageVolumeTemplates
-from hpOneView.resources.storage.storage_volume_attachments import StorageVolumeAttachments
-from hpOneView.resources.storage.drive_enclosures import DriveEnclosures
-from hpOneView.resources.settings.firmware_drivers import FirmwareDrivers
-from hpOneView.resources.settings.firmware_bundles import FirmwareBundles
-from hpOneView.resources.settings.backups import Backups
-from hpOneView.resources.storage.volumes import Volumes
-from hpOneView.resources.storage.sas_logical_jbod_attachments import SasLogicalJbodAttachments
-from hpOneView.resources.networking.uplink_sets import UplinkSets
-from hpOneView.resources.servers.migratable_vc_domains import MigratableVcDomains
-from hpOneView.resources.networking.sas_logical_interconnect_groups import SasLogicalInterconnectGroups
-from hpOneView.resources.search.index_resources import IndexResources
-from hpOneView.resources.search.labels import Labels
-from hpOneView.resources.activity.alerts import Alerts
-from hpOneView.resources.activity.events import Events
-from hpOneView.resources.uncategorized.os_deployment_plans import OsDeploymentPlans
-from hpOneView.resources.uncategorized.os_deployment_servers import OsDeploymentServers
-from hpOneView.resources.security.certificate_rabbitmq import CertificateRabbitMQ
-from hpOneView.resources.security.login_details import LoginDetails
-from hpOneView.resources.security.roles import Roles
-from hpOneView.resources.security.users import Users
-from hpOneView.resources.settings.appliance_device_read_community import ApplianceDeviceReadCommunity
-from hpOneView.resources.settings.appliance_device_snmp_v1_trap_destinations import ApplianceDeviceSNMPv1TrapDestinations
-from hpOneView.resources.settings.appliance_device_snmp_v3_trap_destinations import ApplianceDeviceSNMPv3TrapDestinations
-from hpOneView.resources.settings.appliance_device_snmp_v3_users import ApplianceDeviceSNMPv3Users
-from hpOneView.resources.settings.appliance_node_information import ApplianceNodeInformation
-from hpOneView.resources.settings.appliance_time_and_locale_configuration import ApplianceTimeAndLocaleConfiguration
-from hpOneView.resources.settings.versions import Versions
+from hpOneView.connection import connection, ConnectionPool, ResponseCache, ETagCache, SessionCache, \
+    RetryPolicy, CircuitBreaker, get_request_limiter, get_circuit_breaker
+from hpOneView.resources.task_monitor import ExponentialPollPolicy
 
 ONEVIEW_CLIENT_INVALID_PROXY = 'Invalid Proxy format'
 
+# Resource clients by attribute name, with the module in hpOneView.resources, the class and the arguments before
+# the connection. The modules are imported on the first access to their client.
+RESOURCE_CLIENTS = {
+    'certificate_authority': ('security.certificate_authority', 'CertificateAuthority', ()),
+    'connections': ('servers.connections', 'Connections', ()),
+    'connection_templates': ('networking.connection_templates', 'ConnectionTemplates', ()),
+    'fc_networks': ('networking.fc_networks', 'FcNetworks', ()),
+    'fcoe_networks': ('networking.fcoe_networks', 'FcoeNetworks', ()),
+    'ethernet_networks': ('networking.ethernet_networks', 'EthernetNetworks', ()),
+    'fabrics': ('networking.fabrics', 'Fabrics', ()),
+    'restores': ('settings.restores', 'Restores', ()),
+    'scopes': ('settings.scopes', 'Scopes', ()),
+    'datacenters': ('facilities.datacenters', 'Datacenters', ()),
+    'network_sets': ('networking.network_sets', 'NetworkSets', ()),
+    'server_hardware': ('servers.server_hardware', 'ServerHardware', ()),
+    'server_hardware_types': ('servers.server_hardware_types', 'ServerHardwareTypes', ()),
+    'id_pools_vsn_ranges': ('servers.id_pools_ranges', 'IdPoolsRanges', ('vsn',)),
+    'id_pools_vmac_ranges': ('servers.id_pools_ranges', 'IdPoolsRanges', ('vmac',)),
+    'id_pools_vwwn_ranges': ('servers.id_pools_ranges', 'IdPoolsRanges', ('vwwn',)),
+    'id_pools_ipv4_ranges': ('servers.id_pools_ipv4_ranges', 'IdPoolsIpv4Ranges', ()),
+    'id_pools_ipv4_subnets': ('servers.id_pools_ipv4_subnets', 'IdPoolsIpv4Subnets', ()),
+    'id_pools': ('servers.id_pools', 'IdPools', ()),
+    'switches': ('networking.switches', 'Switches', ()),
+    'roles': ('security.roles', 'Roles', ()),
+    'switch_types': ('networking.switch_types', 'SwitchTypes', ()),
+    'logical_switch_groups': ('networking.logical_switch_groups', 'LogicalSwitchGroups', ()),
+    'logical_switches': ('networking.logical_switches', 'LogicalSwitches', ()),
+    'tasks': ('activity.tasks', 'Tasks', ()),
+    'enclosure_groups': ('servers.enclosure_groups', 'EnclosureGroups', ()),
+    'enclosures': ('servers.enclosures', 'Enclosures', ()),
+    'logical_enclosures': ('servers.logical_enclosures', 'LogicalEnclosures', ()),
+    'metric_streaming': ('data_services.metric_streaming', 'MetricStreaming', ()),
+    'interconnects': ('networking.interconnects', 'Interconnects', ()),
+    'interconnect_types': ('networking.interconnect_types', 'InterconnectTypes', ()),
+    'interconnect_link_topologies': ('networking.interconnect_link_topologies', 'InterconnectLinkTopologies', ()),
+    'sas_interconnect_types': ('networking.sas_interconnect_types', 'SasInterconnectTypes', ()),
+    'internal_link_sets': ('networking.internal_link_sets', 'InternalLinkSets', ()),
+    'logical_interconnect_groups': ('networking.logical_interconnect_groups', 'LogicalInterconnectGroups', ()),
+    'logical_interconnects': ('networking.logical_interconnects', 'LogicalInterconnects', ()),
+    'sas_logical_interconnects': ('networking.sas_logical_interconnects', 'SasLogicalInterconnects', ()),
+    'logical_downlinks': ('networking.logical_downlinks', 'LogicalDownlinks', ()),
+    'power_devices': ('facilities.power_devices', 'PowerDevices', ()),
+    'unmanaged_devices': ('uncategorized.unmanaged_devices', 'UnmanagedDevices', ()),
+    'racks': ('facilities.racks', 'Racks', ()),
+    'san_managers': ('fc_sans.san_managers', 'SanManagers', ()),
+    'endpoints': ('fc_sans.endpoints', 'Endpoints', ()),
+    'server_profiles': ('servers.server_profiles', 'ServerProfiles', ()),
+    'server_profile_templates': ('servers.server_profile_templates', 'ServerProfileTemplate', ()),
+    'storage_systems': ('storage.storage_systems', 'StorageSystems', ()),
+    'storage_pools': ('storage.storage_pools', 'StoragePools', ()),
+    'storage_volume_templates': ('storage.storage_volume_templates', 'StorageVolumeTemplates', ()),
+    'storage_volume_attachments': ('storage.storage_volume_attachments', 'StorageVolumeAttachments', ()),
+    'firmware_drivers': ('settings.firmware_drivers', 'FirmwareDrivers', ()),
+    'firmware_bundles': ('settings.firmware_bundles', 'FirmwareBundles', ()),
+    'uplink_sets': ('networking.uplink_sets', 'UplinkSets', ()),
+    'volumes': ('storage.volumes', 'Volumes', ()),
+    'sas_logical_jbod_attachments': ('storage.sas_logical_jbod_attachments', 'SasLogicalJbodAttachments', ()),
+    'managed_sans': ('fc_sans.managed_sans', 'ManagedSANs', ()),
+    'migratable_vc_domains': ('servers.migratable_vc_domains', 'MigratableVcDomains', ()),
+    'sas_interconnects': ('networking.sas_interconnects', 'SasInterconnects', ()),
+    'sas_logical_interconnect_groups': ('networking.sas_logical_interconnect_groups', 'SasLogicalInterconnectGroups', ()),
+    'drive_enclosures': ('storage.drive_enclosures', 'DriveEnclosures', ()),
+    'sas_logical_jbods': ('storage.sas_logical_jbods', 'SasLogicalJbods', ()),
+    'labels': ('search.labels', 'Labels', ()),
+    'index_resources': ('search.index_resources', 'IndexResources', ()),
+    'alerts': ('activity.alerts', 'Alerts', ()),
+    'events': ('activity.events', 'Events', ()),
+    'os_deployment_plans': ('uncategorized.os_deployment_plans', 'OsDeploymentPlans', ()),
+    'os_deployment_servers': ('uncategorized.os_deployment_servers', 'OsDeploymentServers', ()),
+    'certificate_rabbitmq': ('security.certificate_rabbitmq', 'CertificateRabbitMQ', ()),
+    'users': ('security.users', 'Users', ()),
+    'appliance_device_read_community': ('settings.appliance_device_read_community', 'ApplianceDeviceReadCommunity', ()),
+    'appliance_device_snmp_v1_trap_destinations': ('settings.appliance_device_snmp_v1_trap_destinations', 'ApplianceDeviceSNMPv1TrapDestinations', ()),
+    'appliance_device_snmp_v3_trap_destinations': ('settings.appliance_device_snmp_v3_trap_destinations', 'ApplianceDeviceSNMPv3TrapDestinations', ()),
+    'appliance_device_snmp_v3_users': ('settings.appliance_device_snmp_v3_users', 'ApplianceDeviceSNMPv3Users', ()),
+    'appliance_node_information': ('settings.appliance_node_information', 'ApplianceNodeInformation', ()),
+    'appliance_time_and_locale_configuration': ('settings.appliance_time_and_locale_configuration', 'ApplianceTimeAndLocaleConfiguration', ()),
+    'versions': ('settings.versions', 'Versions', ()),
+    'backups': ('settings.backups', 'Backups', ()),
+    'login_details': ('security.login_details', 'LoginDetails', ()),
+    'licenses': ('settings.licenses', 'Licenses', ()),
+}
+
+# Resource clients keeping the data of a resource, which are created on each access instead of being shared
+NEW_RESOURCE_CLIENTS = frozenset(['connection_templates', 'enclosures', 'ethernet_networks', 'fc_networks',
+                                  'interconnect_types', 'logical_interconnects', 'logical_switch_groups',
+                                  'os_deployment_plans', 'server_profile_templates', 'server_profiles', 'uplink_sets'])
+
+logger = logging.getLogger(__name__)
+
 
 class OneViewClient(object):
     DEFAULT_API_VERSION = 300
+    DEFAULT_MAX_PAGE_WORKERS = 4
 
     def __init__(self, config):
         self.__connection = connection(config["ip"], config.get('api_version', self.DEFAULT_API_VERSION), config.get('ssl_certificate', False),
                                        config.get('timeout'))
         self.__image_streamer_ip = config.get("image_streamer_ip")
         self.__set_proxy(config)
+        self.__set_connection_pool(config)
+        self.__set_response_cache(config)
+        self.__set_conditional_requests(config)
+        self.__connection.set_trusted_data_age(config.get("trusted_data_age"))
+        self.__set_parallel_pagination(config)
+        self.__set_task_polling(config)
+        self.__set_file_transfer(config)
+        self.__set_session_cache(config)
+        self.__set_request_limits(config)
+        self.__set_retries(config)
         self.__connection.login(config["credentials"])
-        self.__certificate_authority = None
-        self.__connections = None
-        self.__connection_templates = None
-        self.__fc_networks = None
-        self.__fcoe_networks = None
-        self.__ethernet_networks = None
-        self.__fabrics = None
-        self.__network_sets = None
-        self.__switches = None
-        self.__switch_types = None
-        self.__tasks = None
-        self.__scopes = None
-        self.__enclosures = None
-        self.__logical_enclosures = None
-        self.__enclosure_groups = None
-        self.__metric_streaming = None
-        self.__server_hardware = None
-        self.__server_hardware_types = None
-        self.__id_pools_vsn_ranges = None
-        self.__id_pools_vmac_ranges = None
-        self.__id_pools_vwwn_ranges = None
-        self.__id_pools_ipv4_ranges = None
-        self.__id_pools_ipv4_subnets = None
-        self.__id_pools = None
-        self.__interconnects = None
-        self.__interconnect_types = None
-        self.__interconnect_link_topologies = None
-        self.__sas_interconnect_types = None
-        self.__internal_link_sets = None
-        self.__power_devices = None
-        self.__unmanaged_devices = None
-        self.__racks = None
-        self.__roles = None
-        self.__datacenters = None
-        self.__san_managers = None
-        self.__endpoints = None
-        self.__logical_interconnects = None
-        self.__sas_logical_interconnects = None
-        self.__logical_interconnect_groups = None
-        self.__logical_switch_groups = None
-        self.__logical_switches = None
-        self.__logical_downlinks = None
-        self.__restores = None
-        self.__server_profiles = None
-        self.__server_profile_templates = None
-        self.__sas_logical_jbods = None
-        self.__storage_systems = None
-        self.__storage_pools = None
-        self.__storage_volume_templates = None
-        self.__storage_volume_attachments = None
-        self.__firmware_drivers = None
-        self.__firmware_bundles = None
-        self.__uplink_sets = None
-        self.__volumes = None
-        self.__sas_logical_jbod_attachments = None
-        self.__managed_sans = None
-        self.__migratable_vc_domains = None
-        self.__sas_interconnects = None
-        self.__index_resources = None
-        self.__labels = None
-        self.__sas_logical_interconnect_groups = None
-        self.__alerts = None
-        self.__events = None
-        self.__drive_enclures = None
-        self.__os_deployment_plans = None
-        self.__os_deployment_servers = None
-        self.__certificate_rabbitmq = None
-        self.__users = None
-        self.__appliance_device_read_community = None
-        self.__appliance_device_snmp_v1_trap_destinations = None
-        self.__appliance_device_snmp_v3_trap_destinations = None
-        self.__appliance_device_snmp_v3_users = None
-        self.__appliance_time_and_locale_configuration = None
-        self.__appliance_node_information = None
-        self.__versions = None
-        self.__backups = None
-        self.__login_details = None
-        self.__licenses = None
+        self.__resource_clients = {}
+        self.__set_task_notifications(config)
 
     @classmethod
     def from_json_file(cls, file_name):
@@ -269,6 +217,186 @@ class OneViewClient(object):
             proxy_port = int(splitted[1])
             self.__connection.set_proxy(proxy_host, proxy_port)
 
+    def __set_connection_pool(self, config):
+        """
+        Enable the reuse of keep-alive connections if needed
+        Args:
+            config: Config dict
+        """
+        pool_config = config.get("connection_pool")
+        if pool_config:
+            if not isinstance(pool_config, dict):
+                pool_config = {}
+
+            connection_pool = ConnectionPool(max_size=pool_config.get("max_size", ConnectionPool.DEFAULT_MAX_SIZE),
+                                             idle_timeout=pool_config.get("idle_timeout", ConnectionPool.DEFAULT_IDLE_TIMEOUT))
+            self.__connection.set_connection_pool(connection_pool)
+
+    def __set_response_cache(self, config):
+        """
+        Cache the GET responses of the URIs with a caching policy if needed
+        Args:
+            config: Config dict
+        """
+        cache_config = config.get("response_cache")
+        if cache_config:
+            if not isinstance(cache_config, dict):
+                cache_config = {}
+
+            policies = ResponseCache.DEFAULT_POLICIES.copy()
+            policies.update(cache_config.get("policies", {}))
+            response_cache = ResponseCache(policies=policies,
+                                           max_size=cache_config.get("max_size", ResponseCache.DEFAULT_MAX_SIZE))
+            self.__connection.set_response_cache(response_cache)
+
+    def __set_conditional_requests(self, config):
+        """
+        Send the GET requests again with the ETag received, so the unchanged resources are not downloaded, if needed
+        Args:
+            config: Config dict
+        """
+        conditional_config = config.get("conditional_requests")
+        if conditional_config:
+            if not isinstance(conditional_config, dict):
+                conditional_config = {}
+
+            etag_cache = ETagCache(max_size=conditional_config.get("max_size", ETagCache.DEFAULT_MAX_SIZE))
+            self.__connection.set_etag_cache(etag_cache)
+
+    def __set_parallel_pagination(self, config):
+        """
+        Allow the pages of the collections to be requested in parallel if needed
+        Args:
+            config: Config dict
+        """
+        pagination_config = config.get("parallel_pagination")
+        if pagination_config:
+            if not isinstance(pagination_config, dict):
+                pagination_config = {}
+
+            self.__connection.set_max_page_workers(pagination_config.get("max_workers", self.DEFAULT_MAX_PAGE_WORKERS))
+
+    def __set_task_polling(self, config):
+        """
+        Poll the running tasks with an exponential and jittered interval if needed
+        Args:
+            config: Config dict
+        """
+        polling_config = config.get("task_polling")
+        if polling_config:
+            self.__connection.set_poll_policy(ExponentialPollPolicy.from_config(polling_config))
+
+    def __set_file_transfer(self, config):
+        """
+        Set the chunk sizes used to stream the uploaded and downloaded files, and allow the downloads in parallel
+        segments, if needed
+        Args:
+            config: Config dict
+        """
+        transfer_config = config.get("file_transfer")
+        if transfer_config:
+            if not isinstance(transfer_config, dict):
+                transfer_config = {}
+
+            self.__connection.set_upload_chunk_size(transfer_config.get("upload_chunk_size",
+                                                                        connection.DEFAULT_UPLOAD_CHUNK_SIZE))
+            self.__connection.set_download_chunk_size(transfer_config.get("download_chunk_size",
+                                                                          connection.DEFAULT_DOWNLOAD_CHUNK_SIZE))
+            self.__connection.set_max_download_workers(transfer_config.get("max_download_workers", 1))
+            self.__connection.set_download_segment_size(transfer_config.get("download_segment_size",
+                                                                            connection.DEFAULT_DOWNLOAD_SEGMENT_SIZE))
+
+    def __set_session_cache(self, config):
+        """
+        Share the login sessions and the appliance versions with the other processes through files, so the login is
+        skipped while a session created with the same credentials is cached, if needed
+        Args:
+            config: Config dict
+        """
+        cache_config = config.get("session_cache")
+        if cache_config:
+            if not isinstance(cache_config, dict):
+                cache_config = {}
+
+            session_cache = SessionCache(path=cache_config.get("path"),
+                                         ttl=cache_config.get("ttl", SessionCache.DEFAULT_TTL))
+            self.__connection.set_session_cache(session_cache)
+
+    def __set_request_limits(self, config):
+        """
+        Limit the rate and the concurrency of the reads, the writes and the task polls sent to the appliance, if needed
+        Args:
+            config: Config dict
+        """
+        limits = config.get("request_limits")
+        if limits:
+            self.__connection.set_request_limiter(get_request_limiter(config["ip"], limits))
+
+    def __set_retries(self, config):
+        """
+        Set how the failed requests are sent again, and fail the requests fast while the appliance is down, if needed
+        Args:
+            config: Config dict
+        """
+        retry_config = config.get("retry_policy")
+        if retry_config:
+            self.__connection.set_retry_policy(RetryPolicy.from_config(retry_config))
+
+        breaker_config = config.get("circuit_breaker")
+        if breaker_config:
+            if not isinstance(breaker_config, dict):
+                breaker_config = {}
+
+            self.__connection.set_circuit_breaker(get_circuit_breaker(
+                config["ip"],
+                failure_threshold=breaker_config.get("failure_threshold", CircuitBreaker.DEFAULT_FAILURE_THRESHOLD),
+                reset_timeout=breaker_config.get("reset_timeout", CircuitBreaker.DEFAULT_RESET_TIMEOUT)))
+
+    def __set_task_notifications(self, config):
+        """
+        Wait for the tasks using the notifications of the State-Change Message Bus if needed
+        Args:
+            config: Config dict
+        """
+        notifications_config = config.get("task_notifications")
+        if notifications_config:
+            if not isinstance(notifications_config, dict):
+                notifications_config = {}
+
+            try:
+                # Imported when needed only, with the amqp package it depends on
+                from hpOneView.resources.task_listener import ScmbTaskListener
+
+                key_pair = self.certificate_rabbitmq.get_key_pair(notifications_config.get("alias_name", "default"))
+                task_listener = ScmbTaskListener(self.__connection._host,
+                                                 ca_certificate=self.certificate_authority.get(),
+                                                 key_pair=key_pair,
+                                                 port=notifications_config.get("port", ScmbTaskListener.PORT))
+                task_listener.start()
+            except Exception as e:
+                logger.warning('Task notifications are not available, the tasks will be polled: %s', e)
+            else:
+                self.__connection.set_task_listener(task_listener)
+
+    def __get_resource_client(self, name):
+        """
+        Gets a resource client of RESOURCE_CLIENTS, importing its module and creating it on the first access.
+
+        Args:
+            name: Attribute name of the resource client.
+
+        Returns:
+            The resource client, the same one on each access; or a new one for the NEW_RESOURCE_CLIENTS.
+        """
+        client = self.__resource_clients.get(name)
+        if client is None:
+            module_name, class_name, args = RESOURCE_CLIENTS[name]
+            module = importlib.import_module('hpOneView.resources.' + module_name)
+            client = getattr(module, class_name)(*(args + (self.__connection,)))
+            if name not in NEW_RESOURCE_CLIENTS:
+                client = self.__resource_clients.setdefault(name, client)
+        return client
+
     @property
     def api_version(self):
         """
@@ -296,10 +424,37 @@ class OneViewClient(object):
         Returns:
             ImageStreamerClient:
         """
+        from hpOneView.image_streamer.image_streamer_client import ImageStreamerClient
+
         image_streamer = ImageStreamerClient(self.__image_streamer_ip,
                                              self.__connection.get_session_id(),
                                              self.__connection._apiVersion,
                                              self.__connection._sslBundle)
+        image_streamer.connection.set_connection_pool(self.__connection.get_connection_pool())
+        response_cache = self.__connection.get_response_cache()
+        if response_cache:
+            image_streamer.connection.set_response_cache(ResponseCache(policies=response_cache.policies,
+                                                                       max_size=response_cache.max_size))
+        image_streamer.connection.set_trusted_data_age(self.__connection.get_trusted_data_age())
+        etag_cache = self.__connection.get_etag_cache()
+        if etag_cache:
+            image_streamer.connection.set_etag_cache(ETagCache(max_size=etag_cache.max_size))
+        image_streamer.connection.set_max_page_workers(self.__connection.get_max_page_workers())
+        image_streamer.connection.set_poll_policy(self.__connection.get_poll_policy())
+        image_streamer.connection.set_upload_chunk_size(self.__connection.get_upload_chunk_size())
+        image_streamer.connection.set_download_chunk_size(self.__connection.get_download_chunk_size())
+        image_streamer.connection.set_max_download_workers(self.__connection.get_max_download_workers())
+        image_streamer.connection.set_download_segment_size(self.__connection.get_download_segment_size())
+        request_limiter = self.__connection.get_request_limiter()
+        if request_limiter:
+            image_streamer.connection.set_request_limiter(get_request_limiter(self.__image_streamer_ip,
+                                                                              request_limiter.limits))
+        image_streamer.connection.set_retry_policy(self.__connection.get_retry_policy())
+        circuit_breaker = self.__connection.get_circuit_breaker()
+        if circuit_breaker:
+            image_streamer.connection.set_circuit_breaker(get_circuit_breaker(self.__image_streamer_ip,
+                                                                              circuit_breaker.failure_threshold,
+                                                                              circuit_breaker.reset_timeout))
 
         return image_streamer
 
@@ -311,9 +466,7 @@ class OneViewClient(object):
         Returns:
             CertificateAuthority:
         """
-        if not self.__certificate_authority:
-            self.__certificate_authority = CertificateAuthority(self.__connection)
-        return self.__certificate_authority
+        return self.__get_resource_client('certificate_authority')
 
     @property
     def connections(self):
@@ -323,10 +476,7 @@ class OneViewClient(object):
         Returns:
             Connections:
         """
-        if not self.__connections:
-            self.__connections = Connections(
-                self.__connection)
-        return self.__connections
+        return self.__get_resource_client('connections')
 
     @property
     def connection_templates(self):
@@ -336,7 +486,7 @@ class OneViewClient(object):
         Returns:
             ConnectionTemplates:
         """
-        return ConnectionTemplates(self.__connection)
+        return self.__get_resource_client('connection_templates')
 
     @property
     def fc_networks(self):
@@ -346,7 +496,7 @@ class OneViewClient(object):
         Returns:
             FcNetworks:
         """
-        return FcNetworks(self.__connection)
+        return self.__get_resource_client('fc_networks')
 
     @property
     def fcoe_networks(self):
@@ -356,9 +506,7 @@ class OneViewClient(object):
         Returns:
             FcoeNetworks:
         """
-        if not self.__fcoe_networks:
-            self.__fcoe_networks = FcoeNetworks(self.__connection)
-        return self.__fcoe_networks
+        return self.__get_resource_client('fcoe_networks')
 
     @property
     def ethernet_networks(self):
@@ -368,7 +516,7 @@ class OneViewClient(object):
         Returns:
             EthernetNetworks:
         """
-        return EthernetNetworks(self.__connection)
+        return self.__get_resource_client('ethernet_networks')
 
     @property
     def fabrics(self):
@@ -378,9 +526,7 @@ class OneViewClient(object):
         Returns:
             Fabrics:
         """
-        if not self.__fabrics:
-            self.__fabrics = Fabrics(self.__connection)
-        return self.__fabrics
+        return self.__get_resource_client('fabrics')
 
     @property
     def restores(self):
@@ -390,9 +536,7 @@ class OneViewClient(object):
         Returns:
             Restores:
         """
-        if not self.__restores:
-            self.__restores = Restores(self.__connection)
-        return self.__restores
+        return self.__get_resource_client('restores')
 
     @property
     def scopes(self):
@@ -402,9 +546,7 @@ class OneViewClient(object):
         Returns:
             Scopes:
         """
-        if not self.__scopes:
-            self.__scopes = Scopes(self.__connection)
-        return self.__scopes
+        return self.__get_resource_client('scopes')
 
     @property
     def datacenters(self):
@@ -414,9 +556,7 @@ class OneViewClient(object):
         Returns:
             Datacenters:
         """
-        if not self.__datacenters:
-            self.__datacenters = Datacenters(self.__connection)
-        return self.__datacenters
+        return self.__get_resource_client('datacenters')
 
     @property
     def network_sets(self):
@@ -426,9 +566,7 @@ class OneViewClient(object):
         Returns:
             NetworkSets:
         """
-        if not self.__network_sets:
-            self.__network_sets = NetworkSets(self.__connection)
-        return self.__network_sets
+        return self.__get_resource_client('network_sets')
 
     @property
     def server_hardware(self):
@@ -438,9 +576,7 @@ class OneViewClient(object):
         Returns:
             ServerHardware:
         """
-        if not self.__server_hardware:
-            self.__server_hardware = ServerHardware(self.__connection)
-        return self.__server_hardware
+        return self.__get_resource_client('server_hardware')
 
     @property
     def server_hardware_types(self):
@@ -450,10 +586,7 @@ class OneViewClient(object):
         Returns:
             ServerHardwareTypes:
         """
-        if not self.__server_hardware_types:
-            self.__server_hardware_types = ServerHardwareTypes(
-                self.__connection)
-        return self.__server_hardware_types
+        return self.__get_resource_client('server_hardware_types')
 
     @property
     def id_pools_vsn_ranges(self):
@@ -463,9 +596,7 @@ class OneViewClient(object):
         Returns:
             IdPoolsRanges:
         """
-        if not self.__id_pools_vsn_ranges:
-            self.__id_pools_vsn_ranges = IdPoolsRanges('vsn', self.__connection)
-        return self.__id_pools_vsn_ranges
+        return self.__get_resource_client('id_pools_vsn_ranges')
 
     @property
     def id_pools_vmac_ranges(self):
@@ -475,9 +606,7 @@ class OneViewClient(object):
         Returns:
             IdPoolsRanges:
         """
-        if not self.__id_pools_vmac_ranges:
-            self.__id_pools_vmac_ranges = IdPoolsRanges('vmac', self.__connection)
-        return self.__id_pools_vmac_ranges
+        return self.__get_resource_client('id_pools_vmac_ranges')
 
     @property
     def id_pools_vwwn_ranges(self):
@@ -487,9 +616,7 @@ class OneViewClient(object):
         Returns:
             IdPoolsRanges:
         """
-        if not self.__id_pools_vwwn_ranges:
-            self.__id_pools_vwwn_ranges = IdPoolsRanges('vwwn', self.__connection)
-        return self.__id_pools_vwwn_ranges
+        return self.__get_resource_client('id_pools_vwwn_ranges')
 
     @property
     def id_pools_ipv4_ranges(self):
@@ -499,9 +626,7 @@ class OneViewClient(object):
         Returns:
             IdPoolsIpv4Ranges:
         """
-        if not self.__id_pools_ipv4_ranges:
-            self.__id_pools_ipv4_ranges = IdPoolsIpv4Ranges(self.__connection)
-        return self.__id_pools_ipv4_ranges
+        return self.__get_resource_client('id_pools_ipv4_ranges')
 
     @property
     def id_pools_ipv4_subnets(self):
@@ -511,9 +636,7 @@ class OneViewClient(object):
         Returns:
             IdPoolsIpv4Subnets:
         """
-        if not self.__id_pools_ipv4_subnets:
-            self.__id_pools_ipv4_subnets = IdPoolsIpv4Subnets(self.__connection)
-        return self.__id_pools_ipv4_subnets
+        return self.__get_resource_client('id_pools_ipv4_subnets')
 
     @property
     def id_pools(self):
@@ -523,9 +646,7 @@ class OneViewClient(object):
         Returns:
             IdPools:
         """
-        if not self.__id_pools:
-            self.__id_pools = IdPools(self.__connection)
-        return self.__id_pools
+        return self.__get_resource_client('id_pools')
 
     @property
     def switches(self):
@@ -535,9 +656,7 @@ class OneViewClient(object):
         Returns:
             Switches:
         """
-        if not self.__switches:
-            self.__switches = Switches(self.__connection)
-        return self.__switches
+        return self.__get_resource_client('switches')
 
     @property
     def roles(self):
@@ -547,9 +666,7 @@ class OneViewClient(object):
         Returns:
             Roles:
         """
-        if not self.__roles:
-            self.__roles = Roles(self.__connection)
-        return self.__roles
+        return self.__get_resource_client('roles')
 
     @property
     def switch_types(self):
@@ -559,9 +676,7 @@ class OneViewClient(object):
         Returns:
             SwitchTypes:
         """
-        if not self.__switch_types:
-            self.__switch_types = SwitchTypes(self.__connection)
-        return self.__switch_types
+        return self.__get_resource_client('switch_types')
 
     @property
     def logical_switch_groups(self):
@@ -571,7 +686,7 @@ class OneViewClient(object):
         Returns:
             LogicalSwitchGroups:
         """
-        return LogicalSwitchGroups(self.__connection)
+        return self.__get_resource_client('logical_switch_groups')
 
     @property
     def logical_switches(self):
@@ -581,9 +696,7 @@ class OneViewClient(object):
         Returns:
             LogicalSwitches:
         """
-        if not self.__logical_switches:
-            self.__logical_switches = LogicalSwitches(self.__connection)
-        return self.__logical_switches
+        return self.__get_resource_client('logical_switches')
 
     @property
     def tasks(self):
@@ -593,9 +706,7 @@ class OneViewClient(object):
         Returns:
             Tasks:
         """
-        if not self.__tasks:
-            self.__tasks = Tasks(self.__connection)
-        return self.__tasks
+        return self.__get_resource_client('tasks')
 
     @property
     def enclosure_groups(self):
@@ -605,9 +716,7 @@ class OneViewClient(object):
         Returns:
             EnclosureGroups:
         """
-        if not self.__enclosure_groups:
-            self.__enclosure_groups = EnclosureGroups(self.__connection)
-        return self.__enclosure_groups
+        return self.__get_resource_client('enclosure_groups')
 
     @property
     def enclosures(self):
@@ -617,7 +726,7 @@ class OneViewClient(object):
         Returns:
             Enclosures:
         """
-        return Enclosures(self.__connection)
+        return self.__get_resource_client('enclosures')
 
     @property
     def logical_enclosures(self):
@@ -627,9 +736,7 @@ class OneViewClient(object):
         Returns:
             LogicalEnclosures:
         """
-        if not self.__logical_enclosures:
-            self.__logical_enclosures = LogicalEnclosures(self.__connection)
-        return self.__logical_enclosures
+        return self.__get_resource_client('logical_enclosures')
 
     @property
     def metric_streaming(self):
@@ -639,9 +746,7 @@ class OneViewClient(object):
         Returns:
             MetricStreaming:
         """
-        if not self.__metric_streaming:
-            self.__metric_streaming = MetricStreaming(self.__connection)
-        return self.__metric_streaming
+        return self.__get_resource_client('metric_streaming')
 
     @property
     def interconnects(self):
@@ -651,9 +756,7 @@ class OneViewClient(object):
         Returns:
             Interconnects:
         """
-        if not self.__interconnects:
-            self.__interconnects = Interconnects(self.__connection)
-        return self.__interconnects
+        return self.__get_resource_client('interconnects')
 
     @property
     def interconnect_types(self):
@@ -663,7 +766,7 @@ class OneViewClient(object):
         Returns:
             InterconnectTypes:
         """
-        return InterconnectTypes(self.__connection)
+        return self.__get_resource_client('interconnect_types')
 
     @property
     def interconnect_link_topologies(self):
@@ -673,9 +776,7 @@ class OneViewClient(object):
         Returns:
             InterconnectLinkTopologies:
         """
-        if not self.__interconnect_link_topologies:
-            self.__interconnect_link_topologies = InterconnectLinkTopologies(self.__connection)
-        return self.__interconnect_link_topologies
+        return self.__get_resource_client('interconnect_link_topologies')
 
     @property
     def sas_interconnect_types(self):
@@ -685,9 +786,7 @@ class OneViewClient(object):
         Returns:
             SasInterconnectTypes:
         """
-        if not self.__sas_interconnect_types:
-            self.__sas_interconnect_types = SasInterconnectTypes(self.__connection)
-        return self.__sas_interconnect_types
+        return self.__get_resource_client('sas_interconnect_types')
 
     @property
     def internal_link_sets(self):
@@ -697,9 +796,7 @@ class OneViewClient(object):
         Returns:
             InternalLinkSets:
         """
-        if not self.__internal_link_sets:
-            self.__internal_link_sets = InternalLinkSets(self.__connection)
-        return self.__internal_link_sets
+        return self.__get_resource_client('internal_link_sets')
 
     @property
     def logical_interconnect_groups(self):
@@ -709,10 +806,7 @@ class OneViewClient(object):
         Returns:
             LogicalInterconnectGroups:
         """
-        if not self.__logical_interconnect_groups:
-            self.__logical_interconnect_groups = LogicalInterconnectGroups(
-                self.__connection)
-        return self.__logical_interconnect_groups
+        return self.__get_resource_client('logical_interconnect_groups')
 
     @property
     def logical_interconnects(self):
@@ -722,7 +816,7 @@ class OneViewClient(object):
         Returns:
             LogicalInterconnects:
         """
-        return LogicalInterconnects(self.__connection)
+        return self.__get_resource_client('logical_interconnects')
 
     @property
     def sas_logical_interconnects(self):
@@ -732,9 +826,7 @@ class OneViewClient(object):
         Returns:
             SasLogicalInterconnects:
         """
-        if not self.__sas_logical_interconnects:
-            self.__sas_logical_interconnects = SasLogicalInterconnects(self.__connection)
-        return self.__sas_logical_interconnects
+        return self.__get_resource_client('sas_logical_interconnects')
 
     @property
     def logical_downlinks(self):
@@ -744,10 +836,7 @@ class OneViewClient(object):
         Returns:
             LogicalDownlinks:
         """
-        if not self.__logical_downlinks:
-            self.__logical_downlinks = LogicalDownlinks(
-                self.__connection)
-        return self.__logical_downlinks
+        return self.__get_resource_client('logical_downlinks')
 
     @property
     def power_devices(self):
@@ -757,9 +846,7 @@ class OneViewClient(object):
         Returns:
             PowerDevices:
         """
-        if not self.__power_devices:
-            self.__power_devices = PowerDevices(self.__connection)
-        return self.__power_devices
+        return self.__get_resource_client('power_devices')
 
     @property
     def unmanaged_devices(self):
@@ -769,9 +856,7 @@ class OneViewClient(object):
         Returns:
             UnmanagedDevices:
         """
-        if not self.__unmanaged_devices:
-            self.__unmanaged_devices = UnmanagedDevices(self.__connection)
-        return self.__unmanaged_devices
+        return self.__get_resource_client('unmanaged_devices')
 
     @property
     def racks(self):
@@ -781,9 +866,7 @@ class OneViewClient(object):
         Returns:
             Racks:
         """
-        if not self.__racks:
-            self.__racks = Racks(self.__connection)
-        return self.__racks
+        return self.__get_resource_client('racks')
 
     @property
     def san_managers(self):
@@ -793,9 +876,7 @@ class OneViewClient(object):
         Returns:
             SanManagers:
         """
-        if not self.__san_managers:
-            self.__san_managers = SanManagers(self.__connection)
-        return self.__san_managers
+        return self.__get_resource_client('san_managers')
 
     @property
     def endpoints(self):
@@ -805,9 +886,7 @@ class OneViewClient(object):
         Returns:
             Endpoints:
         """
-        if not self.__endpoints:
-            self.__endpoints = Endpoints(self.__connection)
-        return self.__endpoints
+        return self.__get_resource_client('endpoints')
 
     @property
     def server_profiles(self):
@@ -817,7 +896,7 @@ class OneViewClient(object):
         Returns:
             ServerProfiles:
         """
-        return ServerProfiles(self.__connection)
+        return self.__get_resource_client('server_profiles')
 
     @property
     def server_profile_templates(self):
@@ -827,7 +906,7 @@ class OneViewClient(object):
         Returns:
             ServerProfileTemplate:
         """
-        return ServerProfileTemplate(self.__connection)
+        return self.__get_resource_client('server_profile_templates')
 
     @property
     def storage_systems(self):
@@ -837,9 +916,7 @@ class OneViewClient(object):
         Returns:
             StorageSystems:
         """
-        if not self.__storage_systems:
-            self.__storage_systems = StorageSystems(self.__connection)
-        return self.__storage_systems
+        return self.__get_resource_client('storage_systems')
 
     @property
     def storage_pools(self):
@@ -849,9 +926,7 @@ class OneViewClient(object):
         Returns:
             StoragePools:
         """
-        if not self.__storage_pools:
-            self.__storage_pools = StoragePools(self.__connection)
-        return self.__storage_pools
+        return self.__get_resource_client('storage_pools')
 
     @property
     def storage_volume_templates(self):
@@ -861,9 +936,7 @@ class OneViewClient(object):
         Returns:
             StorageVolumeTemplates:
         """
-        if not self.__storage_volume_templates:
-            self.__storage_volume_templates = StorageVolumeTemplates(self.__connection)
-        return self.__storage_volume_templates
+        return self.__get_resource_client('storage_volume_templates')
 
     @property
     def storage_volume_attachments(self):
@@ -873,9 +946,7 @@ class OneViewClient(object):
         Returns:
             StorageVolumeAttachments:
         """
-        if not self.__storage_volume_attachments:
-            self.__storage_volume_attachments = StorageVolumeAttachments(self.__connection)
-        return self.__storage_volume_attachments
+        return self.__get_resource_client('storage_volume_attachments')
 
     @property
     def firmware_drivers(self):
@@ -885,9 +956,7 @@ class OneViewClient(object):
         Returns:
             FirmwareDrivers:
         """
-        if not self.__firmware_drivers:
-            self.__firmware_drivers = FirmwareDrivers(self.__connection)
-        return self.__firmware_drivers
+        return self.__get_resource_client('firmware_drivers')
 
     @property
     def firmware_bundles(self):
@@ -897,9 +966,7 @@ class OneViewClient(object):
         Returns:
             FirmwareBundles:
         """
-        if not self.__firmware_bundles:
-            self.__firmware_bundles = FirmwareBundles(self.__connection)
-        return self.__firmware_bundles
+        return self.__get_resource_client('firmware_bundles')
 
     @property
     def uplink_sets(self):
@@ -909,7 +976,7 @@ class OneViewClient(object):
         Returns:
             UplinkSets:
         """
-        return UplinkSets(self.__connection)
+        return self.__get_resource_client('uplink_sets')
 
     @property
     def volumes(self):
@@ -919,9 +986,7 @@ class OneViewClient(object):
         Returns:
             Volumes:
         """
-        if not self.__volumes:
-            self.__volumes = Volumes(self.__connection)
-        return self.__volumes
+        return self.__get_resource_client('volumes')
 
     @property
     def sas_logical_jbod_attachments(self):
@@ -931,9 +996,7 @@ class OneViewClient(object):
         Returns:
             SasLogicalJbodAttachments:
         """
-        if not self.__sas_logical_jbod_attachments:
-            self.__sas_logical_jbod_attachments = SasLogicalJbodAttachments(self.__connection)
-        return self.__sas_logical_jbod_attachments
+        return self.__get_resource_client('sas_logical_jbod_attachments')
 
     @property
     def managed_sans(self):
@@ -943,9 +1006,7 @@ class OneViewClient(object):
         Returns:
             ManagedSANs:
         """
-        if not self.__managed_sans:
-            self.__managed_sans = ManagedSANs(self.__connection)
-        return self.__managed_sans
+        return self.__get_resource_client('managed_sans')
 
     @property
     def migratable_vc_domains(self):
@@ -955,9 +1016,7 @@ class OneViewClient(object):
         Returns:
             MigratableVcDomains:
         """
-        if not self.__migratable_vc_domains:
-            self.__migratable_vc_domains = MigratableVcDomains(self.__connection)
-        return self.__migratable_vc_domains
+        return self.__get_resource_client('migratable_vc_domains')
 
     @property
     def sas_interconnects(self):
@@ -967,9 +1026,7 @@ class OneViewClient(object):
         Returns:
             SasInterconnects:
         """
-        if not self.__sas_interconnects:
-            self.__sas_interconnects = SasInterconnects(self.__connection)
-        return self.__sas_interconnects
+        return self.__get_resource_client('sas_interconnects')
 
     @property
     def sas_logical_interconnect_groups(self):
@@ -979,9 +1036,7 @@ class OneViewClient(object):
         Returns:
             SasLogicalInterconnectGroups:
         """
-        if not self.__sas_logical_interconnect_groups:
-            self.__sas_logical_interconnect_groups = SasLogicalInterconnectGroups(self.__connection)
-        return self.__sas_logical_interconnect_groups
+        return self.__get_resource_client('sas_logical_interconnect_groups')
 
     @property
     def drive_enclosures(self):
@@ -991,9 +1046,7 @@ class OneViewClient(object):
         Returns:
             DriveEnclosures:
         """
-        if not self.__drive_enclures:
-            self.__drive_enclures = DriveEnclosures(self.__connection)
-        return self.__drive_enclures
+        return self.__get_resource_client('drive_enclosures')
 
     @property
     def sas_logical_jbods(self):
@@ -1003,9 +1056,7 @@ class OneViewClient(object):
         Returns:
             SasLogicalJbod:
         """
-        if not self.__sas_logical_jbods:
-            self.__sas_logical_jbods = SasLogicalJbods(self.__connection)
-        return self.__sas_logical_jbods
+        return self.__get_resource_client('sas_logical_jbods')
 
     @property
     def labels(self):
@@ -1015,9 +1066,7 @@ class OneViewClient(object):
         Returns:
             Labels:
         """
-        if not self.__labels:
-            self.__labels = Labels(self.__connection)
-        return self.__labels
+        return self.__get_resource_client('labels')
 
     @property
     def index_resources(self):
@@ -1027,9 +1076,7 @@ class OneViewClient(object):
         Returns:
             IndexResources:
         """
-        if not self.__index_resources:
-            self.__index_resources = IndexResources(self.__connection)
-        return self.__index_resources
+        return self.__get_resource_client('index_resources')
 
     @property
     def alerts(self):
@@ -1039,9 +1086,7 @@ class OneViewClient(object):
         Returns:
             Alerts:
         """
-        if not self.__alerts:
-            self.__alerts = Alerts(self.__connection)
-        return self.__alerts
+        return self.__get_resource_client('alerts')
 
     @property
     def events(self):
@@ -1051,9 +1096,7 @@ class OneViewClient(object):
         Returns:
             Events:
         """
-        if not self.__events:
-            self.__events = Events(self.__connection)
-        return self.__events
+        return self.__get_resource_client('events')
 
     @property
     def os_deployment_plans(self):
@@ -1063,7 +1106,7 @@ class OneViewClient(object):
         Returns:
             OsDeploymentPlans:
         """
-        return OsDeploymentPlans(self.__connection)
+        return self.__get_resource_client('os_deployment_plans')
 
     @property
     def os_deployment_servers(self):
@@ -1073,9 +1116,7 @@ class OneViewClient(object):
         Returns:
             OsDeploymentServers:
         """
-        if not self.__os_deployment_servers:
-            self.__os_deployment_servers = OsDeploymentServers(self.__connection)
-        return self.__os_deployment_servers
+        return self.__get_resource_client('os_deployment_servers')
 
     @property
     def certificate_rabbitmq(self):
@@ -1085,9 +1126,7 @@ class OneViewClient(object):
         Returns:
             CertificateRabbitMQ:
         """
-        if not self.__certificate_rabbitmq:
-            self.__certificate_rabbitmq = CertificateRabbitMQ(self.__connection)
-        return self.__certificate_rabbitmq
+        return self.__get_resource_client('certificate_rabbitmq')
 
     @property
     def users(self):
@@ -1097,9 +1136,7 @@ class OneViewClient(object):
         Returns:
             Users:
         """
-        if not self.__users:
-            self.__users = Users(self.__connection)
-        return self.__users
+        return self.__get_resource_client('users')
 
     @property
     def appliance_device_read_community(self):
@@ -1109,9 +1146,7 @@ class OneViewClient(object):
         Returns:
             ApplianceDeviceReadCommunity:
         """
-        if not self.__appliance_device_read_community:
-            self.__appliance_device_read_community = ApplianceDeviceReadCommunity(self.__connection)
-        return self.__appliance_device_read_community
+        return self.__get_resource_client('appliance_device_read_community')
 
     @property
     def appliance_device_snmp_v1_trap_destinations(self):
@@ -1121,9 +1156,7 @@ class OneViewClient(object):
         Returns:
             ApplianceDeviceSNMPv1TrapDestinations:
         """
-        if not self.__appliance_device_snmp_v1_trap_destinations:
-            self.__appliance_device_snmp_v1_trap_destinations = ApplianceDeviceSNMPv1TrapDestinations(self.__connection)
-        return self.__appliance_device_snmp_v1_trap_destinations
+        return self.__get_resource_client('appliance_device_snmp_v1_trap_destinations')
 
     @property
     def appliance_device_snmp_v3_trap_destinations(self):
@@ -1133,9 +1166,7 @@ class OneViewClient(object):
         Returns:
             ApplianceDeviceSNMPv3TrapDestinations:
         """
-        if not self.__appliance_device_snmp_v3_trap_destinations:
-            self.__appliance_device_snmp_v3_trap_destinations = ApplianceDeviceSNMPv3TrapDestinations(self.__connection)
-        return self.__appliance_device_snmp_v3_trap_destinations
+        return self.__get_resource_client('appliance_device_snmp_v3_trap_destinations')
 
     @property
     def appliance_device_snmp_v3_users(self):
@@ -1145,9 +1176,7 @@ class OneViewClient(object):
         Returns:
             ApplianceDeviceSNMPv3Users:
         """
-        if not self.__appliance_device_snmp_v3_users:
-            self.__appliance_device_snmp_v3_users = ApplianceDeviceSNMPv3Users(self.__connection)
-        return self.__appliance_device_snmp_v3_users
+        return self.__get_resource_client('appliance_device_snmp_v3_users')
 
     @property
     def appliance_node_information(self):
@@ -1157,9 +1186,7 @@ class OneViewClient(object):
         Returns:
             ApplianceNodeInformation:
         """
-        if not self.__appliance_node_information:
-            self.__appliance_node_information = ApplianceNodeInformation(self.__connection)
-        return self.__appliance_node_information
+        return self.__get_resource_client('appliance_node_information')
 
     @property
     def appliance_time_and_locale_configuration(self):
@@ -1169,9 +1196,7 @@ class OneViewClient(object):
         Returns:
             ApplianceTimeAndLocaleConfiguration:
         """
-        if not self.__appliance_time_and_locale_configuration:
-            self.__appliance_time_and_locale_configuration = ApplianceTimeAndLocaleConfiguration(self.__connection)
-        return self.__appliance_time_and_locale_configuration
+        return self.__get_resource_client('appliance_time_and_locale_configuration')
 
     @property
     def versions(self):
@@ -1181,9 +1206,7 @@ class OneViewClient(object):
         Returns:
             Version:
         """
-        if not self.__versions:
-            self.__versions = Versions(self.__connection)
-        return self.__versions
+        return self.__get_resource_client('versions')
 
     @property
     def backups(self):
@@ -1193,9 +1216,7 @@ class OneViewClient(object):
         Returns:
             Backups:
         """
-        if not self.__backups:
-            self.__backups = Backups(self.__connection)
-        return self.__backups
+        return self.__get_resource_client('backups')
 
     @property
     def login_details(self):
@@ -1205,9 +1226,7 @@ class OneViewClient(object):
         Returns:
         List of login details
         """
-        if not self.__login_details:
-            self.__login_details = LoginDetails(self.__connection)
-        return self.__login_details
+        return self.__get_resource_client('login_details')
 
     @property
     def licenses(self):
@@ -1216,6 +1235,4 @@ class OneViewClient(object):
         Returns:
         List of licenses
         """
-        if not self.__licenses:
-            self.__licenses = Licenses(self.__connection)
-        return self.__licenses
+        return self.__get_resource_client('licenses')
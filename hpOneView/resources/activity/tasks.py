@@ -26,10 +26,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
-
-standard_library.install_aliases()
-
 
 from hpOneView.resources.resource import ResourceClient
 
@@ -96,3 +92,36 @@ class Tasks(object):
         """
         return self._client.get_all(start=start, count=count, filter=filter, query=query, sort=sort, view=view,
                                     fields=fields)
+
+    def iter_all(self, start=0, count=-1, fields='', filter='', query='', sort='', view='', prefetch=False):
+        """
+        Iterates over all the tasks based upon filters provided, requesting one page at a time.
+
+        Args:
+            start:
+                 The first item to return, using 0-based indexing. If not specified, the default is 0 - start with the
+                 first available item.
+            count:
+                The number of resources to return. A count of -1 requests all items.
+            fields:
+                 Specifies which fields should be returned in the result set.
+            filter (list or str):
+                 A general filter/query string to narrow the list of items returned. The default is no filter; all
+                 resources are returned.
+            query:
+                 A general query string to narrow the list of resources returned. The default is no query (all
+                 resources are returned).
+            sort:
+                The sort order of the returned data set. By default, the sort order is based on create time, with the
+                oldest entry first.
+            view:
+                 Returns a specific subset of the attributes of the resource or collection, by specifying the name of a
+                 predefined view.
+            prefetch:
+                Requests the next page while the tasks of the current page are consumed.
+
+        Returns:
+            generator: The tasks.
+        """
+        return self._client.iter_all(start=start, count=count, filter=filter, query=query, sort=sort, view=view,
+                                     fields=fields, prefetch=prefetch)
@@ -26,10 +26,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
-
-standard_library.install_aliases()
-
 
 from hpOneView.resources.resource import (Resource, ResourcePatchMixin,
                                           ensure_resource_client)
@@ -42,6 +38,8 @@ class EthernetNetworks(ResourcePatchMixin, Resource):
     """
     URI = '/rest/ethernet-networks'
 
+    INDEX_KEYS = {'name': 'name', 'uri': 'uri', 'vlanId': 'vlanId'}
+
     DEFAULT_VALUES = {
         '200': {"type": "ethernet-networkV3"},
         '300': {"type": "ethernet-networkV300"},
@@ -25,9 +25,6 @@ from __future__ import print_function
 from __future__ import unicode_literals
 from __future__ import division
 from __future__ import absolute_import
-from future import standard_library
-
-standard_library.install_aliases()
 
 from hpOneView.resources.resource import Resource, ResourcePatchMixin
 
@@ -40,6 +37,8 @@ class FcNetworks(ResourcePatchMixin, Resource):
 
     URI = '/rest/fc-networks'
 
+    INDEX_KEYS = {'name': 'name', 'uri': 'uri', 'fabricUri': 'fabricUri'}
+
     DEFAULT_VALUES = {
         '200': {'type': 'fc-networkV2'},
         '300': {"type": "fc-networkV300"},
@@ -26,10 +26,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
-
-standard_library.install_aliases()
-
 
 from hpOneView.resources.resource import Resource, ResourcePatchMixin
 
@@ -41,6 +37,8 @@ class FcoeNetworks(ResourcePatchMixin, Resource):
     """
     URI = '/rest/fcoe-networks'
 
+    INDEX_KEYS = {'name': 'name', 'uri': 'uri', 'vlanId': 'vlanId'}
+
     DEFAULT_VALUES = {
         '200': {"type": "fcoe-network"},
         '300': {"type": "fcoe-networkV300"},
@@ -26,10 +26,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
-
-standard_library.install_aliases()
-
 from hpOneView.exceptions import HPOneViewResourceNotFound
 from hpOneView.resources.resource import (Resource, ResourcePatchMixin, merge_resources,
                                           ensure_resource_client, unavailable_method)
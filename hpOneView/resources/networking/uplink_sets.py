@@ -26,12 +26,8 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
 
-standard_library.install_aliases()
-
-
-from hpOneView.resources.resource import Resource, ensure_resource_client
+from hpOneView.resources.resource import Resource, ensure_resource_client, fan_out, get_fan_out_results
 from hpOneView.resources.networking.ethernet_networks import EthernetNetworks
 from hpOneView.exceptions import HPOneViewResourceNotFound
 from builtins import isinstance
@@ -67,12 +63,8 @@ class UplinkSets(Resource):
         Returns:
             list: Associated ethernet networks.
         """
-        network_uris = self.data.get('networkUris')
-        networks = []
-        if network_uris:
-            for uri in network_uris:
-                networks.append(self._ethernet_networks.get_by_uri(uri))
-        return networks
+        network_uris = self.data.get('networkUris') or []
+        return get_fan_out_results(fan_out(self._ethernet_networks.get_by_uri, network_uris))
 
     @ensure_resource_client
     def add_ethernet_networks(self, ethernet_names):
@@ -115,12 +107,12 @@ class UplinkSets(Resource):
         associated_enets = self.data.get('networkUris', [])
         ethernet_uris = []
 
-        for i, enet in enumerate(ethernet_names):
-            enet_exists = self._ethernet_networks.get_by_name(enet)
+        enets_found = get_fan_out_results(fan_out(self._ethernet_networks.get_by_name, ethernet_names))
+        for enet, enet_exists in zip(ethernet_names, enets_found):
             if enet_exists:
                 ethernet_uris.append(enet_exists.data['uri'])
             else:
-                raise HPOneViewResourceNotFound("Ethernet: {} does not exist".foramt(enet))
+                raise HPOneViewResourceNotFound("Ethernet: {} does not exist".format(enet))
 
         if operation == "remove":
             enets_to_update = sorted(list(set(associated_enets) - set(ethernet_uris)))
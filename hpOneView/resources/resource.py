@@ -26,17 +26,17 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
-from future.utils import lmap
-
-standard_library.install_aliases()
-
 import logging
 import os
+import re
+import time
 from copy import deepcopy
+from multiprocessing.pool import ThreadPool
 from urllib.parse import quote
 from functools import partial
 
+from hpOneView.resources.resource_index import ResourceIndex
+from hpOneView.resources.resource_sync import CollectionSync
 from hpOneView.resources.task_monitor import TaskMonitor
 from hpOneView import exceptions
 
@@ -51,6 +51,11 @@ UNAVAILABLE_METHOD = "Method is not available for this resource"
 MISSING_UNIQUE_IDENTIFIERS = "Missing unique identifiers(URI/Name) for the resource"
 RESOURCE_DOES_NOT_EXIST = "Resource does not exist with the provided unique identifiers"
 
+# Default number of concurrent calls made by fan_out
+DEFAULT_FAN_OUT_WORKERS = 8
+# Seconds during which the lookups of the resource indexes do not request the modified members
+DEFAULT_INDEX_REFRESH_INTERVAL = 10
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,6 +100,13 @@ class Resource(object):
     # Default values required for the api versions
     DEFAULT_VALUES = {}
 
+    # Default projection of the collections, as comma-separated fields and a view name
+    DEFAULT_FIELDS = ''
+    DEFAULT_VIEW = ''
+
+    # Fields of the members indexed by get_index, by key name
+    INDEX_KEYS = {'name': 'name', 'uri': 'uri'}
+
     def __init__(self, connection, data=None):
         self._connection = connection
         self._task_monitor = TaskMonitor(connection)
@@ -107,6 +119,30 @@ class Resource(object):
         # Merge resoure data with the default values
         self._merge_default_values()
 
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._data_retrieved_at = time.time()
+
+    def is_data_trusted(self):
+        """Indicates if the resource data can be used to update the resource without retrieving it again.
+
+        The data is trusted when it has an eTag, so the appliance rejects an update of a resource that was modified
+        since, and it is not older than the trusted data age of the connection.
+
+        Returns:
+            bool
+        """
+        max_age = self._connection.get_trusted_data_age() if self._connection else None
+        if max_age is None or not self.data.get('eTag'):
+            return False
+
+        return time.time() - self._data_retrieved_at <= max_age
+
     def ensure_resource_data(self, update_data=False):
         """Retrieves data from OneView and updates resource object.
 
@@ -118,13 +154,20 @@ class Resource(object):
             raise exceptions.HPOneViewMissingUniqueIdentifiers(MISSING_UNIQUE_IDENTIFIERS)
 
         # Returns if data update is not required
-        if not update_data:
+        if not update_data or self.is_data_trusted():
             return
 
         resource_data = None
 
         if 'uri' in self.UNIQUE_IDENTIFIERS and self.data.get('uri'):
-            resource_data = self._helper.do_get(self.data['uri'])
+            if self.data.get('eTag'):
+                resource_data = self._helper.do_get_if_modified(self.data['uri'], self.data['eTag'])
+                if resource_data is None:
+                    # The resource was not modified since its data was retrieved
+                    self._data_retrieved_at = time.time()
+                    return
+            else:
+                resource_data = self._helper.do_get(self.data['uri'])
         else:
             for identifier in self.UNIQUE_IDENTIFIERS:
                 identifier_value = self.data.get(identifier)
@@ -137,15 +180,26 @@ class Resource(object):
 
         if resource_data:
             self.data.update(resource_data)
+            self._data_retrieved_at = time.time()
         else:
             raise exceptions.HPOneViewResourceNotFound(RESOURCE_DOES_NOT_EXIST)
 
     @ensure_resource_client
     def refresh(self):
-        """Helps to get the latest resource data from the server."""
-        self.data = self._helper.do_get(self.data["uri"])
+        """Helps to get the latest resource data from the server.
+
+        When the resource data has an eTag, the data is only downloaded again if the resource was modified.
+        """
+        if self.data.get("eTag"):
+            resource_data = self._helper.do_get_if_modified(self.data["uri"], self.data["eTag"])
+            if resource_data is not None:
+                self.data = resource_data
+            else:
+                self._data_retrieved_at = time.time()
+        else:
+            self.data = self._helper.do_get(self.data["uri"])
 
-    def get_all(self, start=0, count=-1, filter='', sort=''):
+    def get_all(self, start=0, count=-1, filter='', sort='', fields=None, view=None):
         """Gets all items according with the given arguments.
 
         Args:
@@ -156,14 +210,70 @@ class Resource(object):
                 filter; all resources are returned.
             sort: The sort order of the returned data set. By default, the sort order is based on create time with the
                 oldest entry first.
+            fields: Comma-separated names of the fields to return for each item, such as "uri,name,status".
+                The default is the DEFAULT_FIELDS of the resource; an empty string returns all the fields.
+            view: Name of the view of the items. The default is the DEFAULT_VIEW of the resource.
 
         Returns:
             list: A list of items matching the specified filter.
         """
-        result = self._helper.get_all(start=start, count=count, filter=filter, sort=sort)
+        result = self._helper.get_all(start=start, count=count, filter=filter, sort=sort,
+                                      **self._get_projection(fields, view))
 
         return result
 
+    def iter_all(self, start=0, count=-1, filter='', sort='', prefetch=False, fields=None, view=None):
+        """Iterates over all items according with the given arguments, requesting one page at a time.
+
+        Unlike get_all, the items are not kept in memory; each page is released once its items are consumed.
+
+        Args:
+            start: The first item to return, using 0-based indexing.
+                If not specified, the default is 0 - start with the first available item.
+            count: The number of resources to return. A count of -1 requests all items (default).
+            filter (list or str): A general filter/query string to narrow the list of items returned. The default is no
+                filter; all resources are returned.
+            sort: The sort order of the returned data set. By default, the sort order is based on create time with the
+                oldest entry first.
+            prefetch: Requests the next page while the items of the current page are consumed.
+            fields: Comma-separated names of the fields to return for each item. The default is the DEFAULT_FIELDS of
+                the resource; an empty string returns all the fields.
+            view: Name of the view of the items. The default is the DEFAULT_VIEW of the resource.
+
+        Returns:
+            generator: The items matching the specified filter.
+        """
+        return self._helper.iter_all(start=start, count=count, filter=filter, sort=sort, prefetch=prefetch,
+                                     **self._get_projection(fields, view))
+
+    def _get_projection(self, fields=None, view=None, required_fields=()):
+        """Gets the fields and view arguments of a collection request.
+
+        The arguments not given fall back to the DEFAULT_FIELDS and DEFAULT_VIEW of the resource. They are only
+        returned when a projection is set, so the resources overriding get_all without them keep working.
+
+        Args:
+            fields: Comma-separated names of the fields, None for the default.
+            view: Name of the view, None for the default.
+            required_fields: Fields added to a projection that does not include them.
+
+        Returns:
+            dict: The fields and view keyword arguments.
+        """
+        projection = {}
+
+        if fields is not None or self.DEFAULT_FIELDS:
+            fields = self.DEFAULT_FIELDS if fields is None else fields
+            if fields:
+                names = [name.strip() for name in fields.split(',')]
+                fields = ','.join(names + [name for name in required_fields if name not in names])
+            projection['fields'] = fields
+
+        if view is not None or self.DEFAULT_VIEW:
+            projection['view'] = self.DEFAULT_VIEW if view is None else view
+
+        return projection
+
     def create(self, data=None, uri=None, timeout=-1, custom_headers=None, force=False):
         """Makes a POST request to create a resource when a request body is required.
 
@@ -231,7 +341,84 @@ class Resource(object):
 
         return self
 
-    def get_by(self, field, value):
+    def bulk_create(self, items, timeout=-1, custom_headers=None, max_workers=DEFAULT_FAN_OUT_WORKERS):
+        """Creates many resources, sending up to max_workers requests at the same time and waiting for all the
+        tasks together.
+
+        Args:
+            items (list): Data of each resource, as given to create.
+            timeout: Timeout in seconds to wait for all the tasks.
+            custom_headers: Allows set specific HTTP headers.
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            list: A dict per item, in the same order as the items, with the keys 'item', 'result' (created resource
+            object, or None) and 'error' (exception raised for the item, or None).
+        """
+        default_values = self._get_default_values()
+
+        def submit(data):
+            data = self._helper.update_resource_fields(dict(data), default_values)
+            return self._connection.post(self.URI, data, custom_headers=custom_headers)
+
+        return self.__get_bulk_resources(submit_bulk(self._task_monitor, submit, items, timeout, max_workers))
+
+    def bulk_update(self, items, timeout=-1, custom_headers=None, force=False, max_workers=DEFAULT_FAN_OUT_WORKERS):
+        """Updates many resources with a PUT request each, sending up to max_workers requests at the same time and
+        waiting for all the tasks together.
+
+        Args:
+            items (list): Whole data of each resource, with its uri, as retrieved from OneView and then changed.
+            timeout: Timeout in seconds to wait for all the tasks.
+            custom_headers: Allows to add custom HTTP headers.
+            force: Force the update operations.
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            list: A dict per item, in the same order as the items, with the keys 'item', 'result' (updated resource
+            object, or None) and 'error' (exception raised for the item, or None).
+        """
+        def submit(data):
+            uri = data['uri']
+            self._helper.validate_resource_uri(uri)
+            if force:
+                uri += '?force=True'
+            return self._connection.put(uri, data, custom_headers=custom_headers)
+
+        return self.__get_bulk_resources(submit_bulk(self._task_monitor, submit, items, timeout, max_workers))
+
+    def bulk_delete(self, items, timeout=-1, custom_headers=None, force=False, max_workers=DEFAULT_FAN_OUT_WORKERS):
+        """Deletes many resources, sending up to max_workers requests at the same time and waiting for all the tasks
+        together.
+
+        Args:
+            items (list): URI of each resource, or its data with the uri.
+            timeout: Timeout in seconds to wait for all the tasks.
+            custom_headers: Allows to set custom http headers.
+            force: Flag to force the operations.
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            list: A dict per item, in the same order as the items, with the keys 'item', 'result' (True, or the
+            completed task) and 'error' (exception raised for the item, or None).
+        """
+        def submit(item):
+            uri = item['uri'] if isinstance(item, dict) else item
+            self._helper.validate_resource_uri(uri)
+            if force:
+                uri += '?force=True'
+            task, body = self._connection.delete(uri, custom_headers=custom_headers)
+            return task, True
+
+        return submit_bulk(self._task_monitor, submit, items, timeout, max_workers)
+
+    def __get_bulk_resources(self, bulk_results):
+        for bulk_result in bulk_results:
+            if bulk_result['result']:
+                bulk_result['result'] = self.new(self._connection, bulk_result['result'])
+        return bulk_results
+
+    def get_by(self, field, value, fields=None, view=None):
         """Get the resource by passing a field and its value.
 
         Note:
@@ -240,6 +427,9 @@ class Resource(object):
         Args:
             field: Field name to filter.
             value: Value to filter.
+            fields: Comma-separated names of the fields to return, as in get_all. The filtered field is always
+                returned.
+            view: Name of the view of the items, as in get_all.
 
         Returns:
             dict
@@ -249,7 +439,8 @@ class Resource(object):
             raise ValueError(RESOURCE_CLIENT_INVALID_FIELD)
 
         filter = "\"{0}='{1}'\"".format(field, value)
-        results = self.get_all(filter=filter)
+        required_fields = [field] if "." not in field else []
+        results = self.get_all(filter=filter, **self._get_projection(fields, view, required_fields))
 
         # Workaround when the OneView filter does not work, it will filter again
         if "." not in field:
@@ -258,19 +449,26 @@ class Resource(object):
 
         return results
 
-    def get_by_name(self, name):
+    def get_by_name(self, name, fields=None, view=None):
         """Retrieves a resource by its name.
 
         Args:
             name: Resource name.
+            fields: Comma-separated names of the fields to retrieve, as in get_all. The uri and name are always
+                retrieved. The eTag of a projected resource is discarded, so the whole resource is retrieved before
+                it is updated or refreshed.
+            view: Name of the view of the resource, as in get_all.
 
         Returns:
             Resource object or None if resource does not exist.
         """
-        result = self.get_by("name", name)
+        projection = self._get_projection(fields, view, ["uri", "name"])
+        result = self.get_by("name", name, **projection)
 
         if result:
             data = result[0]
+            if projection:
+                data.pop("eTag", None)
             new_resource = self.new(self._connection, data)
         else:
             new_resource = None
@@ -296,19 +494,76 @@ class Resource(object):
 
         return new_resource
 
+    def get_index(self):
+        """Gets the index of the members of the collection by the INDEX_KEYS fields.
+
+        The index is kept for the connection: it is built on the first lookup, iterating over the collection one page
+        at a time, and each later lookup only requests the members modified since the last refresh and the URIs of
+        the members, to remove the deleted ones, at most every refresh_interval seconds of the index.
+
+        Returns:
+            ResourceIndex
+        """
+        return self._connection.get_collection_state(self.URI + ':index', self.__create_index)
+
+    def __create_index(self):
+        helper = ResourceHelper(self.URI, self._connection, None)
+        return ResourceIndex(helper.iter_all, self.INDEX_KEYS, refresh_interval=DEFAULT_INDEX_REFRESH_INTERVAL,
+                             detect_deletions=True)
+
+    def get_by_index(self, key, value, refresh=True):
+        """Gets the members with the given value of an indexed field, without requesting them.
+
+        Note:
+            The search is case-insensitive.
+
+        Args:
+            key: Name of the indexed key, from INDEX_KEYS.
+            value: Value to find.
+            refresh: Requests the members modified since the last refresh, when the refresh interval has elapsed.
+
+        Returns:
+            list: The members found.
+        """
+        return self.get_index().find(key, value, refresh=refresh)
+
+    def get_collection_sync(self):
+        """Gets the synchronization of the members of the collection kept for the connection.
+
+        Its state can be saved to resume the synchronizations from another connection.
+
+        Returns:
+            CollectionSync
+        """
+        return self._connection.get_collection_state(self.URI + ':sync', self.__create_sync)
+
+    def __create_sync(self):
+        return CollectionSync(ResourceHelper(self.URI, self._connection, None).iter_all)
+
+    def get_changes(self, detect_deletions=True):
+        """Gets the members created or modified since the last call for the connection, and the deleted ones.
+
+        The first call returns all the members. The next ones only request the members modified since the most recent
+        modification seen, and the URIs of all the members to find the deleted ones.
+
+        Args:
+            detect_deletions: Finds the deleted members.
+
+        Returns:
+            dict: The "modified" members and the "deleted" URIs.
+        """
+        return self.get_collection_sync().sync(detect_deletions=detect_deletions)
+
     def _get_default_values(self, default_values=None):
         """Gets the default values set for a resource"""
 
         if not default_values:
             default_values = self.DEFAULT_VALUES
 
-        if default_values:
-            api_version = str(self._connection._apiVersion)
-            values = default_values.get(api_version, {}).copy()
-        else:
-            values = {}
+        if not default_values:
+            return {}
 
-        return values
+        return get_default_values(default_values, self._connection._apiVersion)
 
     def _merge_default_values(self):
         """Merge default values with resource data."""
@@ -375,6 +630,48 @@ class ResourceHelper(object):
 
         return self.do_requests_to_getall(uri, count)
 
+    def iter_all(self, start=0, count=-1, filter='', query='', sort='', view='', fields='', uri=None, scope_uris='',
+                 prefetch=False):
+        """Iterates over all items according with the given arguments, requesting one page at a time.
+
+        Args:
+            start: The first item to return, using 0-based indexing.
+                If not specified, the default is 0 - start with the first available item.
+            count: The number of resources to return. A count of -1 requests all items (default).
+            filter (list or str): A general filter/query string to narrow the list of items returned. The default is no
+                filter; all resources are returned.
+            query: A single query parameter can do what would take multiple parameters or multiple GET requests using
+                filter. Use query for more complex queries. NOTE: This parameter is experimental for OneView 2.0.
+            sort: The sort order of the returned data set. By default, the sort order is based on create time with the
+                oldest entry first.
+            view: Returns a specific subset of the attributes of the resource or collection by specifying the name of a
+                predefined view.
+            fields: Name of the fields.
+            uri: A specific URI (optional)
+            scope_uris: An expression to restrict the resources returned according to the scopes to
+                which they are assigned.
+            prefetch: Requests the next page while the items of the current page are consumed.
+
+        Returns:
+            generator: The items matching the specified filter.
+        """
+        if not uri:
+            uri = self._base_uri
+
+        uri = self.build_query_uri(uri=uri,
+                                   start=start,
+                                   count=count,
+                                   filter=filter,
+                                   query=query,
+                                   sort=sort,
+                                   view=view,
+                                   fields=fields,
+                                   scope_uris=scope_uris)
+
+        logger.debug('Iterating over all resources with uri: {0}'.format(uri))
+
+        return iterate_members(self._connection, uri, count, prefetch)
+
     def delete_all(self, filter, force=False, timeout=-1):
         """
         Deletes all resources from the appliance that match the provided filter.
@@ -681,8 +978,11 @@ class ResourceHelper(object):
         Note:
             This method will be checking for the pagination URI in the response
             and make request to pagination URI to get all the resources.
+            When the connection allows more than one page worker, the pages following the first one are
+            requested in parallel, using the start/count offsets computed from the first response.
         """
         items = []
+        first_page_uri = uri
 
         while uri:
             logger.debug('Making HTTP request to get all resources. Uri: {0}'.format(uri))
@@ -693,6 +993,14 @@ class ResourceHelper(object):
             logger.debug("Response getAll: nextPageUri = {0}, members list length: {1}".format(uri, str(len(members))))
             uri = self.get_next_page(response, items, requested_count)
 
+            if uri and first_page_uri and self._connection.get_max_page_workers() > 1:
+                page_uris = build_page_uris(first_page_uri, response, requested_count)
+                first_page_uri = None
+
+                for response in get_pages(self._connection, page_uris):
+                    items += self.get_members(response)
+                    uri = self.get_next_page(response, items, requested_count)
+
         logger.debug('Total # of members found = {0}'.format(str(len(items))))
         return items
 
@@ -719,6 +1027,19 @@ class ResourceHelper(object):
         self.validate_resource_uri(uri)
         return self._connection.get(uri)
 
+    def do_get_if_modified(self, uri, etag):
+        """Helps to make conditional get requests
+
+        Args:
+            uri: URI of the resource
+            etag: ETag of the known resource data
+
+        Returns:
+            Returns: Returns the resource data, or None when the resource was not modified
+        """
+        self.validate_resource_uri(uri)
+        return self._connection.get_if_modified(uri, etag)
+
     def do_post(self, uri, resource, timeout, custom_headers):
         """Helps to make post requests.
 
@@ -805,6 +1126,33 @@ class ResourcePatchMixin(object):
                                        timeout=timeout)
         return self
 
+    @ensure_resource_client(update_data=True)
+    def patch_changes(self, data, custom_headers=None, timeout=-1):
+        """Uses the PATCH to update the fields of the resource that differ from the given data.
+
+        A replace operation is sent for each changed field, in one PATCH request, instead of the whole resource. No
+        request is sent when nothing changed. The resource must accept the replace operations of these fields.
+
+        Args:
+            data: Data to update the resource.
+            timeout: Timeout in seconds. Wait for task completion by default. The timeout does not abort the operation
+                in OneView; it just stops waiting for its completion.
+            custom_headers: Allows to add custom http headers.
+
+        Returns:
+            Updated resource.
+        """
+        patch_request_body = [{'op': 'replace', 'path': '/' + key, 'value': value}
+                              for key, value in sorted(data.items()) if self.data.get(key) != value]
+        if not patch_request_body:
+            return self
+
+        self.data = self.patch_request(self.data['uri'],
+                                       body=patch_request_body,
+                                       custom_headers=custom_headers,
+                                       timeout=timeout)
+        return self
+
     def patch_request(self, uri, body, custom_headers=None, timeout=-1):
         """Uses the PATCH to update a resource.
 
@@ -837,7 +1185,7 @@ class ResourcePatchMixin(object):
 
 class ResourceFileHandlerMixin(object):
 
-    def upload(self, file_path, uri=None, timeout=-1):
+    def upload(self, file_path, uri=None, timeout=-1, progress_callback=None):
         """Makes a multipart request.
 
         Args:
@@ -845,6 +1193,7 @@ class ResourceFileHandlerMixin(object):
             uri: A specific URI (optional).
             timeout: Timeout in seconds. Wait for task completion by default. The timeout does not abort the operation
                 in OneView; it just stops waiting for its completion.
+            progress_callback: Function called with the progress of the upload, see connection.TransferProgress.
 
         Returns:
             dict: Response body.
@@ -853,25 +1202,27 @@ class ResourceFileHandlerMixin(object):
             uri = self.URI
 
         upload_file_name = os.path.basename(file_path)
-        task, entity = self._connection.post_multipart_with_response_handling(uri, file_path, upload_file_name)
+        task, entity = self._connection.post_multipart_with_response_handling(uri, file_path, upload_file_name,
+                                                                              progress_callback=progress_callback)
 
         if not task:
             return entity
 
         return self._task_monitor.wait_for_task(task, timeout)
 
-    def download(self, uri, file_path):
-        """Downloads the contents of the requested URI to a stream.
+    def download(self, uri, file_path, resume=False, progress_callback=None):
+        """Downloads the contents of the requested URI to a file.
 
         Args:
             uri: URI
             file_path: File path destination
+            resume: Continues a previous download, keeping the bytes already in the file.
+            progress_callback: Function called with the progress of the download, see connection.TransferProgress.
 
         Returns:
             bool: Indicates if the file was successfully downloaded.
         """
-        with open(file_path, 'wb') as file:
-            return self._connection.download_to_stream(file, uri)
+        return self._connection.download_to_file(uri, file_path, resume=resume, progress_callback=progress_callback)
 
 
 class ResourceUtilizationMixin(object):
@@ -1138,6 +1489,52 @@ class ResourceClient(object):
 
         return result
 
+    def iter_all(self, start=0, count=-1, filter='', query='', sort='', view='', fields='', uri=None, scope_uris='',
+                 prefetch=False):
+        """
+        Iterates over all items according with the given arguments, requesting one page at a time.
+
+        Unlike get_all, the items are not kept in memory; each page is released once its items are consumed.
+
+        Args:
+            start:
+                The first item to return, using 0-based indexing.
+                If not specified, the default is 0 - start with the first available item.
+            count:
+                The number of resources to return. A count of -1 requests all items (default).
+            filter (list or str):
+                A general filter/query string to narrow the list of items returned. The default is no
+                filter; all resources are returned.
+            query:
+                A single query parameter can do what would take multiple parameters or multiple GET requests using
+                filter. Use query for more complex queries. NOTE: This parameter is experimental for OneView 2.0.
+            sort:
+                The sort order of the returned data set. By default, the sort order is based on create time with the
+                oldest entry first.
+            view:
+                Returns a specific subset of the attributes of the resource or collection by specifying the name of a
+                predefined view.
+            fields:
+                Name of the fields.
+            uri:
+                A specific URI (optional)
+            scope_uris:
+                An expression to restrict the resources returned according to the scopes to
+                which they are assigned.
+            prefetch:
+                Requests the next page while the items of the current page are consumed.
+
+        Returns:
+            generator: The items matching the specified filter.
+        """
+
+        uri = self.build_query_uri(start=start, count=count, filter=filter,
+                                   query=query, sort=sort, view=view, fields=fields, uri=uri, scope_uris=scope_uris)
+
+        logger.debug('Iterating over all resources with uri: {0}'.format(uri))
+
+        return iterate_members(self._connection, uri, count, prefetch)
+
     def delete_all(self, filter, force=False, timeout=-1):
         """
         Deletes all resources from the appliance that match the provided filter.
@@ -1373,7 +1770,86 @@ class ResourceClient(object):
 
         return self.__do_post(uri, resource, timeout, custom_headers)
 
-    def upload(self, file_path, uri=None, timeout=-1):
+    def bulk_create(self, resources, timeout=-1, custom_headers=None, default_values={},
+                    max_workers=DEFAULT_FAN_OUT_WORKERS):
+        """
+        Creates many resources, sending up to max_workers requests at the same time and waiting for all the tasks
+        together.
+
+        Args:
+            resources (list): Information about each resource to create.
+            timeout: Timeout in seconds to wait for all the tasks.
+            custom_headers: Allows set specific HTTP headers.
+            default_values: Dictionary with default values grouped by OneView API version, as in create.
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            list: A dict per resource, in the same order as the resources, with the keys 'item', 'result' (created
+            resource, or None) and 'error' (exception raised for the resource, or None).
+        """
+        def submit(resource):
+            resource = self.merge_default_values(resource, default_values)
+            return self._connection.post(self._uri, resource, custom_headers=custom_headers)
+
+        return submit_bulk(self._task_monitor, submit, resources, timeout, max_workers)
+
+    def bulk_update(self, resources, force=False, timeout=-1, custom_headers=None, default_values={},
+                    max_workers=DEFAULT_FAN_OUT_WORKERS):
+        """
+        Updates many resources, sending up to max_workers requests at the same time and waiting for all the tasks
+        together.
+
+        Args:
+            resources (list): Information about each resource to update, with its uri.
+            force: If set to true, the operations complete despite any problems with network connectivity or errors
+                on the resources themselves. The default is false.
+            timeout: Timeout in seconds to wait for all the tasks.
+            custom_headers: Allows set specific HTTP headers.
+            default_values: Dictionary with default values grouped by OneView API version, as in update.
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            list: A dict per resource, in the same order as the resources, with the keys 'item', 'result' (updated
+            resource, or None) and 'error' (exception raised for the resource, or None).
+        """
+        def submit(resource):
+            uri = resource['uri']
+            if force:
+                uri += '?force=True'
+            resource = self.merge_default_values(resource, default_values)
+            return self._connection.put(uri, resource, custom_headers=custom_headers)
+
+        return submit_bulk(self._task_monitor, submit, resources, timeout, max_workers)
+
+    def bulk_delete(self, resources, force=False, timeout=-1, custom_headers=None, max_workers=DEFAULT_FAN_OUT_WORKERS):
+        """
+        Deletes many resources, sending up to max_workers requests at the same time and waiting for all the tasks
+        together.
+
+        Args:
+            resources (list): ID or URI of each resource, or its information with the uri.
+            force: If set to true, the operations complete despite any problems with network connectivity or errors
+                on the resources themselves. The default is false.
+            timeout: Timeout in seconds to wait for all the tasks.
+            custom_headers: Allows set specific HTTP headers.
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            list: A dict per resource, in the same order as the resources, with the keys 'item', 'result' (True, or
+            the completed task) and 'error' (exception raised for the resource, or None).
+        """
+        def submit(resource):
+            uri = resource.get('uri') if isinstance(resource, dict) else self.build_uri(resource)
+            if not uri:
+                raise exceptions.HPOneViewUnknownType(RESOURCE_CLIENT_UNKNOWN_OBJECT_TYPE)
+            if force:
+                uri += '?force=True'
+            task, body = self._connection.delete(uri, custom_headers=custom_headers)
+            return task, True
+
+        return submit_bulk(self._task_monitor, submit, resources, timeout, max_workers)
+
+    def upload(self, file_path, uri=None, timeout=-1, progress_callback=None):
         """
         Makes a multipart request.
 
@@ -1385,6 +1861,8 @@ class ResourceClient(object):
             timeout:
                 Timeout in seconds. Wait for task completion by default. The timeout does not abort the operation
                 in OneView; it just stops waiting for its completion.
+            progress_callback:
+                Function called with the progress of the upload, see connection.TransferProgress.
 
         Returns:
             dict: Response body.
@@ -1393,7 +1871,8 @@ class ResourceClient(object):
             uri = self._uri
 
         upload_file_name = os.path.basename(file_path)
-        task, entity = self._connection.post_multipart_with_response_handling(uri, file_path, upload_file_name)
+        task, entity = self._connection.post_multipart_with_response_handling(uri, file_path, upload_file_name,
+                                                                              progress_callback=progress_callback)
 
         if not task:
             return entity
@@ -1505,6 +1984,53 @@ class ResourceClient(object):
         else:
             return result[0]
 
+    def get_index(self, keys):
+        """
+        Gets the index of the members of the collection, kept for the connection.
+
+        The index is built on the first lookup, iterating over the collection one page at a time, and each later
+        lookup only requests the members modified since the last refresh and the URIs of the members, to remove the
+        deleted ones, at most every refresh_interval seconds of the index.
+
+        Args:
+            keys (dict): Indexed fields by key name, as described by ResourceIndex. They are only used to create the
+                index of the collection.
+
+        Returns:
+            ResourceIndex
+        """
+        client = ResourceClient(self._connection, self._uri)
+        return self._connection.get_collection_state(
+            self._uri + ':index', lambda: ResourceIndex(client.iter_all, keys, detect_deletions=True,
+                                                        refresh_interval=DEFAULT_INDEX_REFRESH_INTERVAL))
+
+    def get_collection_sync(self):
+        """
+        Gets the synchronization of the members of the collection kept for the connection.
+
+        Its state can be saved to resume the synchronizations from another connection.
+
+        Returns:
+            CollectionSync
+        """
+        client = ResourceClient(self._connection, self._uri)
+        return self._connection.get_collection_state(self._uri + ':sync', lambda: CollectionSync(client.iter_all))
+
+    def get_changes(self, detect_deletions=True):
+        """
+        Gets the members created or modified since the last call for the connection, and the deleted ones.
+
+        The first call returns all the members. The next ones only request the members modified since the most recent
+        modification seen, and the URIs of all the members to find the deleted ones.
+
+        Args:
+            detect_deletions: Finds the deleted members.
+
+        Returns:
+            dict: The "modified" members and the "deleted" URIs.
+        """
+        return self.get_collection_sync().sync(detect_deletions=detect_deletions)
+
     def get_utilization(self, id_or_uri, fields=None, filter=None, refresh=False, view=None):
         """
         Retrieves historical utilization data for the specified resource, metrics, and time span.
@@ -1646,19 +2172,20 @@ class ResourceClient(object):
 
             return uri
 
-    def download(self, uri, file_path):
+    def download(self, uri, file_path, resume=False, progress_callback=None):
         """
-        Downloads the contents of the requested URI to a stream.
+        Downloads the contents of the requested URI to a file.
 
         Args:
             uri: URI
             file_path: File path destination
+            resume: Continues a previous download, keeping the bytes already in the file.
+            progress_callback: Function called with the progress of the download, see connection.TransferProgress.
 
         Returns:
             bool: Indicates if the file was successfully downloaded.
         """
-        with open(file_path, 'wb') as file:
-            return self._connection.download_to_stream(file, uri)
+        return self._connection.download_to_file(uri, file_path, resume=resume, progress_callback=progress_callback)
 
     def __validate_resource_uri(self, path):
         if self._uri not in path:
@@ -1697,6 +2224,7 @@ class ResourceClient(object):
 
     def __do_requests_to_getall(self, uri, requested_count):
         items = []
+        first_page_uri = uri
 
         while uri:
             logger.debug('Making HTTP request to get all resources. Uri: {0}'.format(uri))
@@ -1707,6 +2235,14 @@ class ResourceClient(object):
             logger.debug("Response getAll: nextPageUri = {0}, members list length: {1}".format(uri, str(len(members))))
             uri = self.__get_next_page(response, items, requested_count)
 
+            if uri and first_page_uri and self._connection.get_max_page_workers() > 1:
+                page_uris = build_page_uris(first_page_uri, response, requested_count)
+                first_page_uri = None
+
+                for response in get_pages(self._connection, page_uris):
+                    items += self.__get_members(response)
+                    uri = self.__get_next_page(response, items, requested_count)
+
         logger.debug('Total # of members found = {0}'.format(str(len(items))))
         return items
 
@@ -1766,7 +2302,216 @@ def merge_default_values(resource_list, default_values):
     def merge_item(resource):
         return merge_resources(default_values, resource)
 
-    return lmap(merge_item, resource_list)
+    return list(map(merge_item, resource_list))
+
+
+def get_default_values(default_values, api_version):
+    """
+    Gets the default values of a resource for an API version.
+
+    Args:
+        default_values: dict of default values keyed by API version, as in Resource.DEFAULT_VALUES.
+        api_version: API version of the connection.
+
+    Returns:
+        dict: A copy of the default values for the API version, empty when there are none.
+    """
+    if not default_values:
+        return {}
+
+    return default_values.get(str(api_version), {}).copy()
+
+
+def build_page_uris(uri, first_page, requested_count):
+    """
+    Builds the URIs of the pages following the first page of a collection, using the start/count offsets.
+
+    Args:
+        uri: URI used to request the first page. It must contain the start and count query parameters.
+        first_page: Response of the first page, with the total of members of the collection.
+        requested_count: Number of members requested. -1 requests all the members.
+
+    Returns:
+        list: URIs of the remaining pages, in order. Empty when the pages cannot be computed.
+    """
+    start_match = re.search(r'([?&])start=(\d+)', uri)
+    count_match = re.search(r'([?&])count=(-?\d+)', uri)
+    total = first_page.get('total') if isinstance(first_page, dict) else None
+    page_size = len(first_page.get('members') or []) if total else 0
+
+    if not start_match or not count_match or not page_size:
+        return []
+
+    first_start = int(start_match.group(2))
+    end = total if requested_count == -1 else min(total, first_start + requested_count)
+
+    page_uris = []
+    for start in range(first_start + page_size, end, page_size):
+        count = min(page_size, end - start)
+        page_uri = re.sub(r'([?&])start=\d+', r'\g<1>start={}'.format(start), uri, count=1)
+        page_uri = re.sub(r'([?&])count=-?\d+', r'\g<1>count={}'.format(count), page_uri, count=1)
+        page_uris.append(page_uri)
+
+    return page_uris
+
+
+def get_pages(connection, page_uris):
+    """
+    Requests the pages of a collection in parallel, bounded by the number of page workers of the connection.
+
+    Args:
+        connection: OneView connection object.
+        page_uris: URIs of the pages.
+
+    Returns:
+        list: Responses, in the same order as the URIs.
+    """
+    logger.debug('Requesting {0} pages with {1} workers'.format(len(page_uris), connection.get_max_page_workers()))
+
+    return get_fan_out_results(fan_out(connection.get, page_uris, connection.get_max_page_workers()))
+
+
+def fan_out(function, items, max_workers=DEFAULT_FAN_OUT_WORKERS):
+    """
+    Calls a function for each item, with a bounded number of concurrent calls.
+
+    An error raised for an item does not stop the calls for the other items.
+
+    Args:
+        function: Function called with each item.
+        items: Items to call the function with.
+        max_workers: Maximum number of concurrent calls. 1 calls the function for one item after the other.
+
+    Returns:
+        list: A dict per item, in the same order as the items, with the keys 'item', 'result' (value returned by
+        the function, or None) and 'error' (exception raised by the function, or None).
+    """
+    def call(item):
+        try:
+            return dict(item=item, result=function(item), error=None)
+        except Exception as error:
+            return dict(item=item, result=None, error=error)
+
+    items = list(items)
+    max_workers = min(max_workers, len(items))
+    if max_workers <= 1:
+        return [call(item) for item in items]
+
+    pool = ThreadPool(max_workers)
+    try:
+        return pool.map(call, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def submit_bulk(task_monitor, submit, items, timeout=-1, max_workers=DEFAULT_FAN_OUT_WORKERS):
+    """
+    Sends a request per item, with a bounded number of concurrent requests, then waits for all the tasks together.
+
+    Args:
+        task_monitor: TaskMonitor waiting for the tasks.
+        submit: Function sending the request of an item, returning its task, or None, and its result when there is
+            no task to wait for.
+        items: Items to send the requests for.
+        timeout: Timeout in seconds to wait for all the tasks.
+        max_workers: Maximum number of concurrent requests.
+
+    Returns:
+        list: A dict per item, in the same order as the items, with the keys 'item', 'result' (result of the request,
+        or resource associated with its task) and 'error' (exception raised for the item, or None).
+    """
+    submitted = fan_out(submit, items, max_workers)
+
+    tasks = [submit_result['result'][0] for submit_result in submitted
+             if not submit_result['error'] and submit_result['result'][0]]
+    task_results = iter(task_monitor.wait_for_tasks(tasks, timeout=timeout, concurrency=max_workers))
+
+    bulk_results = []
+    for submit_result in submitted:
+        if submit_result['error']:
+            bulk_results.append(submit_result)
+            continue
+
+        task, result = submit_result['result']
+        if task:
+            task_result = next(task_results)
+            result, error = task_result['result'], task_result['error']
+        else:
+            error = None
+        bulk_results.append(dict(item=submit_result['item'], result=result, error=error))
+
+    return bulk_results
+
+
+def get_fan_out_results(fan_out_results):
+    """
+    Gets the results of fan_out, raising the error of the first item that failed.
+
+    Args:
+        fan_out_results: list returned by fan_out.
+
+    Returns:
+        list: The results, in the same order as the items.
+    """
+    for fan_out_result in fan_out_results:
+        if fan_out_result['error']:
+            raise fan_out_result['error']
+
+    return [fan_out_result['result'] for fan_out_result in fan_out_results]
+
+
+def iterate_members(connection, uri, requested_count, prefetch=False):
+    """
+    Yields the members of a collection page by page, following the pagination URIs.
+
+    Args:
+        connection: OneView connection object.
+        uri: URI of the first page.
+        requested_count: Number of members requested. -1 requests all the members.
+        prefetch: Requests the next page in background while the members of the current page are consumed.
+
+    Returns:
+        generator: The members of the collection.
+    """
+    pool = ThreadPool(1) if prefetch else None
+    members_count = 0
+
+    try:
+        logger.debug('Making HTTP request to iterate over resources. Uri: {0}'.format(uri))
+        response = connection.get(uri)
+
+        while response is not None:
+            if not isinstance(response, dict):
+                # Not a collection page, such as an empty or a list response
+                break
+
+            members = response.get('members') or []
+            members_count += len(members)
+
+            next_page_uri = response.get('nextPageUri')
+            if next_page_uri == response.get('uri') or (requested_count != -1 and members_count >= requested_count):
+                next_page_uri = None
+
+            next_page = None
+            if next_page_uri:
+                logger.debug('Making HTTP request to iterate over resources. Uri: {0}'.format(next_page_uri))
+                if pool:
+                    next_page = pool.apply_async(connection.get, (next_page_uri,))
+
+            response = None
+
+            for member in members:
+                yield member
+
+            if next_page:
+                response = next_page.get()
+            elif next_page_uri:
+                response = connection.get(next_page_uri)
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
 
 
 def transform_list_to_dict(list):
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2017) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+from builtins import str
+
+import threading
+import time
+
+from copy import deepcopy
+
+from hpOneView.exceptions import HPOneViewException
+from hpOneView.resources.resource_sync import CollectionSync
+
+RESOURCE_NOT_FOUND = 'RESOURCE_NOT_FOUND'
+
+
+class ResourceIndex(object):
+    """
+    Keeps the members of a collection indexed by some of their fields, answering the lookups without requests.
+
+    The index is built with one request of the whole collection. Each refresh then only requests the members modified
+    since the most recent modification already indexed, as described by CollectionSync. Unless detect_deletions is
+    set, the deleted members are not detected by the refreshes, so the URIs found should be checked, and discarded
+    when the resource no longer exists.
+
+    The values are compared ignoring the case, as the filters of OneView do.
+
+    Args:
+        get_all: Function returning, or iterating over, the members of the collection, called with a filter keyword
+            argument.
+        keys (dict): Indexed fields by key name. Each one is a function returning the value, or a list of values, of
+            a member, or the path of a field, or a list of paths. A path is made of the field names separated by
+            dots, and goes through the lists, such as "connectionSettings.connections.mac".
+        refresh_interval: Seconds during which the lookups use the index without refreshing it.
+        detect_deletions: Requests the URIs of all the members on each refresh to remove the deleted ones. The get_all
+            function must then accept the fields keyword argument.
+    """
+
+    def __init__(self, get_all, keys, refresh_interval=0, detect_deletions=False):
+        self._sync = CollectionSync(get_all)
+        self._keys = dict((key, get_key_function(field)) for key, field in keys.items())
+        self.refresh_interval = refresh_interval
+        self.detect_deletions = detect_deletions
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        """Discards the indexed members, so the next refresh requests the whole collection again."""
+        self._sync.reset()
+        self._entries = dict((key, {}) for key in self._keys)
+        self._values_by_uri = {}
+        self._members = {}
+        self._refreshed_at = None
+
+    def refresh(self):
+        """Indexes the members modified since the last refresh, or the whole collection when it is not indexed yet."""
+        with self._lock:
+            changes = self._sync.sync(detect_deletions=self.detect_deletions)
+
+            for member in changes['modified']:
+                self.__add(member)
+            for uri in changes['deleted']:
+                self.__remove(uri)
+            self._refreshed_at = time.time()
+
+    def lookup(self, key, value, refresh=True):
+        """
+        Gets the URIs of the members with the given value.
+
+        Args:
+            key: Name of the indexed key.
+            value: Value of the key.
+            refresh: Refreshes the index before the lookup, when its refresh interval has elapsed.
+
+        Returns:
+            list: URIs of the members.
+        """
+        self.__ensure_refreshed(refresh)
+
+        with self._lock:
+            return sorted(self._entries[key].get(normalize(value), ()))
+
+    def find(self, key, value, refresh=True):
+        """
+        Gets the indexed members with the given value.
+
+        Args:
+            key: Name of the indexed key.
+            value: Value of the key.
+            refresh: Refreshes the index before the lookup, when its refresh interval has elapsed.
+
+        Returns:
+            list: Copies of the members, as retrieved by the last refresh.
+        """
+        self.__ensure_refreshed(refresh)
+
+        with self._lock:
+            uris = sorted(self._entries[key].get(normalize(value), ()))
+            return [deepcopy(self._members[uri]) for uri in uris]
+
+    def get_members(self, key, value, get):
+        """
+        Gets the members with the given value, discarding from the index the ones that no longer exist.
+
+        Args:
+            key: Name of the indexed key.
+            value: Value of the key.
+            get: Function returning a member by its URI.
+
+        Returns:
+            list: The members found.
+        """
+        members = []
+        for uri in self.lookup(key, value):
+            try:
+                members.append(get(uri))
+            except HPOneViewException as exception:
+                if not is_not_found(exception):
+                    raise
+                self.discard(uri)
+        return members
+
+    def discard(self, uri):
+        """
+        Removes a member from the index.
+
+        Args:
+            uri: URI of the member.
+        """
+        with self._lock:
+            self.__remove(uri)
+
+    def __ensure_refreshed(self, refresh):
+        refreshed_at = self._refreshed_at
+        if refreshed_at is None or (refresh and time.time() - refreshed_at >= self.refresh_interval):
+            self.refresh()
+
+    def __add(self, member):
+        uri = member.get('uri')
+        if not uri:
+            return
+
+        self.__remove(uri)
+
+        values = {}
+        for key, get_values in self._keys.items():
+            member_values = get_values(member)
+            if not isinstance(member_values, (list, tuple, set)):
+                member_values = [member_values]
+            values[key] = set(normalize(value) for value in member_values if value)
+            for value in values[key]:
+                self._entries[key].setdefault(value, set()).add(uri)
+        self._values_by_uri[uri] = values
+        self._members[uri] = member
+
+    def __remove(self, uri):
+        self._members.pop(uri, None)
+        values = self._values_by_uri.pop(uri, {})
+        for key, key_values in values.items():
+            for value in key_values:
+                uris = self._entries[key].get(value)
+                if uris:
+                    uris.discard(uri)
+                    if not uris:
+                        del self._entries[key][value]
+
+
+def is_not_found(exception):
+    """Indicates if an exception reports that the requested resource does not exist."""
+    response = exception.oneview_response
+    return isinstance(response, dict) and response.get('errorCode') == RESOURCE_NOT_FOUND
+
+
+def is_invalid_filter(exception):
+    """Indicates if an exception reports that the appliance rejected the filter of a request, such as INVALID_FILTER."""
+    response = exception.oneview_response
+    return isinstance(response, dict) and 'FILTER' in str(response.get('errorCode', ''))
+
+
+def get_key_function(field):
+    """Gets the function returning the values of an indexed field of a member."""
+    if callable(field):
+        return field
+
+    paths = [field] if isinstance(field, str) else field
+    return lambda member: [value for path in paths for value in get_field_values(member, path.split('.'))]
+
+
+def get_field_values(data, names):
+    """Gets the values of a field from its path, going through the lists found."""
+    if isinstance(data, list):
+        return [value for item in data for value in get_field_values(item, names)]
+    if not names:
+        return [data]
+    if not isinstance(data, dict) or names[0] not in data:
+        return []
+    return get_field_values(data[names[0]], names[1:])
+
+
+def normalize(value):
+    return value.lower() if isinstance(value, str) else value
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2017) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+
+MODIFIED_SINCE_FILTER = "\"modified>='{0}'\""
+
+
+class CollectionSync(object):
+    """
+    Tracks the changes of the members of a collection between synchronizations.
+
+    The first synchronization requests the whole collection. The next ones only request the members modified since the
+    most recent modification already seen, and detect the deleted members with a listing of the URIs only. The members
+    without modified date are compared by their eTag, requesting the whole collection each time.
+
+    The state can be saved and given back to a new instance to resume the synchronizations later.
+
+    Args:
+        get_all: Function returning, or iterating over, the members of the collection, called with the filter and
+            fields keyword arguments.
+        state (dict): State of a previous instance.
+    """
+
+    def __init__(self, get_all, state=None):
+        self._get_all = get_all
+        self._lock = threading.Lock()
+        self.reset()
+        if state:
+            self._last_modified = state.get('lastModified')
+            self._versions = dict(state.get('versions', {}))
+            self._synced = True
+
+    def reset(self):
+        """Forgets the members seen, so the next synchronization requests the whole collection again."""
+        self._versions = {}
+        self._last_modified = None
+        self._synced = False
+
+    @property
+    def state(self):
+        """Gets the state of the synchronizations, as a dict that can be serialized to JSON."""
+        with self._lock:
+            return {'lastModified': self._last_modified, 'versions': dict(self._versions)}
+
+    def sync(self, detect_deletions=True):
+        """
+        Gets the members created or modified since the last synchronization, and the URIs of the deleted ones.
+
+        Args:
+            detect_deletions: Requests the URIs of all the members to find the deleted ones. It is not needed when the
+                whole collection is requested.
+
+        Returns:
+            dict: The "modified" members and the "deleted" URIs.
+        """
+        with self._lock:
+            full_listing = not (self._synced and self._last_modified)
+            if full_listing:
+                members = self._get_all(filter='')
+            else:
+                members = self._get_all(filter=MODIFIED_SINCE_FILTER.format(self._last_modified))
+
+            modified = []
+            listed_uris = set()
+            for member in members:
+                uri = member.get('uri')
+                if not uri:
+                    continue
+                listed_uris.add(uri)
+                version = member.get('modified') or member.get('eTag')
+                if uri not in self._versions or version is None or self._versions[uri] != version:
+                    modified.append(member)
+                self._versions[uri] = version
+                if member.get('modified') and (not self._last_modified or member['modified'] > self._last_modified):
+                    self._last_modified = member['modified']
+
+            if not full_listing and detect_deletions:
+                listed_uris = set(member.get('uri') for member in self._get_all(filter='', fields='uri'))
+
+            deleted = []
+            if full_listing or detect_deletions:
+                deleted = sorted(uri for uri in self._versions if uri not in listed_uris)
+                for uri in deleted:
+                    del self._versions[uri]
+
+            self._synced = True
+
+            return {'modified': modified, 'deleted': deleted}
@@ -25,13 +25,14 @@ from __future__ import print_function
 from __future__ import unicode_literals
 from __future__ import division
 from __future__ import absolute_import
-from future import standard_library
-
-standard_library.install_aliases()
 
+from hpOneView.exceptions import HPOneViewException
 from hpOneView.resources.resource import (Resource, ResourcePatchMixin,
                                           ResourceZeroBodyMixin, ResourceUtilizationMixin,
                                           ensure_resource_client)
+from hpOneView.resources.resource_index import ResourceIndex, is_invalid_filter
+
+HOSTNAME_FILTER = "\"activeOaPreferredIP='{0}' OR standbyOaPreferredIP='{0}'\""
 
 
 class Enclosures(ResourcePatchMixin, ResourceZeroBodyMixin, ResourceUtilizationMixin, Resource):
@@ -119,14 +120,26 @@ class Enclosures(ResourcePatchMixin, ResourceZeroBodyMixin, ResourceUtilizationM
         return self.update_with_zero_body(uri=uri, timeout=timeout)
 
     def get_by_hostname(self, hostname):
-        """Get enclosure by it's hostname"""
-        def filter_by_hostname(hostname, enclosure):
-            is_primary_ip = ('activeOaPreferredIP' in enclosure and enclosure['activeOaPreferredIP'] == hostname)
-            is_standby_ip = ('standbyOaPreferredIP' in enclosure and enclosure['standbyOaPreferredIP'] == hostname)
-            return is_primary_ip or is_standby_ip
+        """Get enclosure by it's hostname
 
-        enclosures = self.get_all()
-        result = [x for x in enclosures if filter_by_hostname(hostname, x)]
+        The enclosures are filtered by the appliance. When the filter is rejected or finds nothing, the enclosure is
+        found through an index of the enclosure hostnames kept for the connection.
+        """
+        filter = HOSTNAME_FILTER.format(hostname)
+        try:
+            enclosures = self.get_all(filter=filter)
+        except HPOneViewException as exception:
+            if not is_invalid_filter(exception):
+                raise
+            enclosures = []
+
+        result = [x for x in enclosures if hostname in get_hostnames(x)]
+
+        if not result:
+            # Some appliances ignore the filter or do not find the hostnames with it
+            index = self._connection.get_collection_state(self.URI + ':hostname', self.__create_hostname_index)
+            enclosures = index.get_members('hostname', hostname, self._helper.do_get)
+            result = [x for x in enclosures if hostname in get_hostnames(x)]
 
         if result:
             new_resource = self.new(self._connection, result[0])
@@ -135,6 +148,9 @@ class Enclosures(ResourcePatchMixin, ResourceZeroBodyMixin, ResourceUtilizationM
 
         return new_resource
 
+    def __create_hostname_index(self):
+        return ResourceIndex(Enclosures(self._connection).get_all, {'hostname': get_hostnames})
+
     @ensure_resource_client
     def get_environmental_configuration(self):
         """
@@ -266,3 +282,8 @@ class Enclosures(ResourcePatchMixin, ResourceZeroBodyMixin, ResourceUtilizationM
 
         headers = {'Content-Type': 'application/json'}
         return self._helper.do_put(uri, certificate_data, -1, headers)
+
+
+def get_hostnames(enclosure):
+    """Gets the preferred IPs of the active and standby Onboard Administrators of an enclosure."""
+    return [enclosure.get('activeOaPreferredIP'), enclosure.get('standbyOaPreferredIP')]
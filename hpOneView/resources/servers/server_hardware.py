@@ -26,10 +26,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
-
-standard_library.install_aliases()
-
 
 from hpOneView.resources.resource import (Resource, ResourceUtilizationMixin,
                                           ResourcePatchMixin, ensure_resource_client)
@@ -44,6 +40,15 @@ class ServerHardware(ResourcePatchMixin, ResourceUtilizationMixin, Resource):
     """
     URI = '/rest/server-hardware'
 
+    INDEX_KEYS = {
+        'name': 'name',
+        'uri': 'uri',
+        'serialNumber': 'serialNumber',
+        'mac': ['portMap.deviceSlots.physicalPorts.mac', 'portMap.deviceSlots.physicalPorts.virtualPorts.mac'],
+        'wwn': ['portMap.deviceSlots.physicalPorts.wwn', 'portMap.deviceSlots.physicalPorts.virtualPorts.wwpn',
+                'portMap.deviceSlots.physicalPorts.virtualPorts.wwnn'],
+    }
+
     def __init__(self, connection, data=None):
         super(ServerHardware, self).__init__(connection, data)
 
@@ -25,11 +25,6 @@ from __future__ import print_function
 from __future__ import unicode_literals
 from __future__ import division
 from __future__ import absolute_import
-from future import standard_library
-
-
-standard_library.install_aliases()
-
 
 from hpOneView.resources.resource import Resource, ensure_resource_client
 
@@ -26,10 +26,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
-
-standard_library.install_aliases()
-
 from copy import deepcopy
 
 from hpOneView.resources.resource import (Resource, ResourcePatchMixin,
@@ -43,6 +39,16 @@ class ServerProfiles(ResourcePatchMixin, ResourceSchemaMixin, Resource):
     """
     URI = '/rest/server-profiles'
 
+    INDEX_KEYS = {
+        'name': 'name',
+        'uri': 'uri',
+        'serialNumber': 'serialNumber',
+        'serverHardwareUri': 'serverHardwareUri',
+        'mac': ['connectionSettings.connections.mac', 'connections.mac'],
+        'wwn': ['connectionSettings.connections.wwpn', 'connectionSettings.connections.wwnn',
+                'connections.wwpn', 'connections.wwnn'],
+    }
+
     DEFAULT_VALUES = {
         '200': {"type": "ServerProfileV5"},
         '300': {"type": "ServerProfileV6"},
@@ -25,10 +25,6 @@ from __future__ import print_function
 from __future__ import unicode_literals
 from __future__ import division
 from __future__ import absolute_import
-from future import standard_library
-
-standard_library.install_aliases()
-
 
 from hpOneView.resources.resource import ResourceClient
 
@@ -82,18 +78,19 @@ class Backups(object):
         """
         return self._client.create_with_zero_body(timeout=timeout)
 
-    def download(self, id_or_uri, file_path):
+    def download(self, id_or_uri, file_path, resume=False):
         """
         Downloads a backup archive previously created on the appliance. Uploaded backup files cannot be downloaded.
 
         Args:
             id_or_uri: ID or URI of the Artifact Bundle.
             file_path(str): Destination file path.
+            resume(bool): Continues a previous download, keeping the bytes already in the file.
 
         Returns:
             bool: Successfully downloaded.
         """
-        return self._client.download(id_or_uri, file_path)
+        return self._client.download(id_or_uri, file_path, resume=resume)
 
     def upload(self, file_path):
         """
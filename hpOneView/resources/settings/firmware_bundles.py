@@ -26,10 +26,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
-
-standard_library.install_aliases()
-
 
 from hpOneView.resources.resource import ResourceClient
 
@@ -45,7 +41,7 @@ class FirmwareBundles(object):
         self._connection = con
         self._client = ResourceClient(con, self.URI)
 
-    def upload(self, file_path, timeout=-1):
+    def upload(self, file_path, timeout=-1, progress_callback=None):
         """
         Upload an SPP ISO image file or a hotfix file to the appliance.
         The API supports upload of one hotfix at a time into the system.
@@ -55,8 +51,9 @@ class FirmwareBundles(object):
             file_path: Full path to firmware.
             timeout: Timeout in seconds. Wait for task completion by default. The timeout does not abort the operation
                 in OneView; it just stops waiting for its completion.
+            progress_callback: Function called with the progress of the upload, see connection.TransferProgress.
 
         Returns:
           dict: Information about the updated firmware bundle.
         """
-        return self._client.upload(file_path, timeout=timeout)
+        return self._client.upload(file_path, timeout=timeout, progress_callback=progress_callback)
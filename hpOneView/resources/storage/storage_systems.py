@@ -26,11 +26,24 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
+from hpOneView.exceptions import HPOneViewException
+from hpOneView.resources.resource import ResourceClient
+from hpOneView.resources.resource_index import ResourceIndex, is_invalid_filter
 
-standard_library.install_aliases()
 
-from hpOneView.resources.resource import ResourceClient
+def get_ip_hostname(storage_system):
+    return storage_system.get('credentials', {}).get('ip_hostname')
+
+
+def get_hostname(storage_system):
+    return storage_system.get('hostname')
+
+
+# Fields of the storage systems looked up by get_by_ip_hostname and get_by_hostname, with their getters
+INDEXED_FIELDS = {
+    'ip_hostname': ('credentials.ip_hostname', get_ip_hostname),
+    'hostname': ('hostname', get_hostname),
+}
 
 
 class StorageSystems(object):
@@ -214,20 +227,16 @@ class StorageSystems(object):
 
         Works only with API version <= 300.
 
+        The storage systems are filtered by the appliance. When the filter is rejected or finds nothing, the storage
+        system is found through an index kept for the connection.
+
         Args:
             ip_hostname: Storage system IP or hostname.
 
         Returns:
             dict
         """
-        resources = self._client.get_all()
-
-        resources_filtered = [x for x in resources if x['credentials']['ip_hostname'] == ip_hostname]
-
-        if resources_filtered:
-            return resources_filtered[0]
-        else:
-            return None
+        return self.__get_by_indexed_field('ip_hostname', ip_hostname)
 
     def get_by_hostname(self, hostname):
         """
@@ -235,21 +244,43 @@ class StorageSystems(object):
 
         Works only in API500 onwards.
 
+        The storage systems are filtered by the appliance. When the filter is rejected or finds nothing, the storage
+        system is found through an index kept for the connection.
+
         Args:
             hostname: Storage system hostname.
 
         Returns:
             dict
         """
-        resources = self._client.get_all()
+        return self.__get_by_indexed_field('hostname', hostname)
+
+    def __get_by_indexed_field(self, key, value):
+        field, get_value = INDEXED_FIELDS[key]
+        try:
+            resources = self._client.get_all(filter="\"{0}='{1}'\"".format(field, value))
+        except HPOneViewException as exception:
+            if not is_invalid_filter(exception):
+                raise
+            resources = []
 
-        resources_filtered = [x for x in resources if x['hostname'] == hostname]
+        resources_filtered = [x for x in resources if get_value(x) == value]
+
+        if not resources_filtered:
+            # Some appliances ignore the filter or do not find the hostnames with it
+            index = self._connection.get_collection_state(self.URI + ':hostname', self.__create_index)
+            resources = index.get_members(key, value, self._client.get)
+            resources_filtered = [x for x in resources if get_value(x) == value]
 
         if resources_filtered:
             return resources_filtered[0]
         else:
             return None
 
+    def __create_index(self):
+        client = ResourceClient(self._connection, self.URI)
+        return ResourceIndex(client.get_all, dict((key, INDEXED_FIELDS[key][1]) for key in INDEXED_FIELDS))
+
     def get_reachable_ports(self, id_or_uri, start=0, count=-1, filter='', query='', sort='', networks=[]):
         """
         Gets the storage ports that are connected on the specified networks
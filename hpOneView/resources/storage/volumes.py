@@ -26,10 +26,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
-
-standard_library.install_aliases()
-
 
 from hpOneView.resources.resource import ResourceClient
 
@@ -44,6 +40,9 @@ class Volumes(object):
 
     URI = '/rest/storage-volumes'
 
+    # Fields of the volumes indexed by get_by_index, by key name
+    INDEX_KEYS = {'name': 'name', 'uri': 'uri', 'wwn': 'wwn', 'storagePoolUri': 'storagePoolUri'}
+
     DEFAULT_VALUES_SNAPSHOT = {
         '200': {"type": "Snapshot"},
         '300': {"type": "Snapshot"},
@@ -106,6 +105,23 @@ class Volumes(object):
         """
         return self._client.get_by(field, value)
 
+    def get_by_index(self, key, value, refresh=True):
+        """
+        Gets the managed volumes with the given value of an indexed field, such as the WWN, without requesting them.
+
+        The volumes are indexed for the connection. The index is built on the first call and only the volumes
+        modified since are requested by the later calls. The search is case-insensitive.
+
+        Args:
+            key: Name of the indexed key, from INDEX_KEYS.
+            value: Value to find.
+            refresh: Requests the volumes modified since the last refresh, when the refresh interval has elapsed.
+
+        Returns:
+            list: A list of managed volumes.
+        """
+        return self._client.get_index(self.INDEX_KEYS).find(key, value, refresh=refresh)
+
     def create(self, resource, timeout=-1):
         """
         Creates or adds a volume.
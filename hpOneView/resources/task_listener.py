@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2026) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import json
+import logging
+import os
+import socket
+import ssl
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+
+from hpOneView.exceptions import HPOneViewException
+from hpOneView.resources.task_monitor import TASK_COMPLETED_STATES
+
+try:
+    import amqp
+except ImportError:
+    amqp = None
+
+MSG_AMQP_NOT_INSTALLED = 'The amqp package is required to receive the task notifications from the State-Change Message Bus'
+MSG_LISTENER_ALREADY_STARTED = 'The task listener is already started'
+
+logger = logging.getLogger(__name__)
+
+
+class TaskListener(object):
+    """
+    Keeps track of the tasks reported as completed and wakes up the threads waiting for them.
+
+    The notifications are fed through the notify method, so any source of task state changes can be plugged in.
+    """
+
+    # Number of completed tasks remembered for the waiters that arrive after the notification
+    DEFAULT_MAX_COMPLETED_TASKS = 1000
+
+    def __init__(self, max_completed_tasks=DEFAULT_MAX_COMPLETED_TASKS):
+        self._max_completed_tasks = max_completed_tasks
+        self._completed_tasks = OrderedDict()
+        self._condition = threading.Condition()
+
+    def is_listening(self):
+        """
+        Indicates whether the task notifications are being received.
+
+        Returns:
+            bool: True while the notifications can be trusted to wake up the waiters.
+        """
+        return True
+
+    def notify(self, task):
+        """
+        Records a task state change and wakes up the threads waiting for the task when it is completed.
+
+        Args:
+            task (dict): TaskResource with at least the uri and the taskState.
+        """
+        task_uri = task.get('uri')
+        if not task_uri or task.get('taskState') not in TASK_COMPLETED_STATES:
+            return
+
+        with self._condition:
+            self._completed_tasks.pop(task_uri, None)
+            self._completed_tasks[task_uri] = task
+            while len(self._completed_tasks) > self._max_completed_tasks:
+                self._completed_tasks.popitem(last=False)
+            self._condition.notify_all()
+
+    def wait_for_completion(self, task_uri, timeout):
+        """
+        Blocks until the task is reported as completed or the timeout expires.
+
+        Args:
+            task_uri (str): Task URI.
+            timeout (float): Maximum number of seconds to wait.
+
+        Returns:
+            dict: The last TaskResource notified for the task, or None when the timeout expires first.
+        """
+        deadline = time.time() + timeout
+
+        with self._condition:
+            while task_uri not in self._completed_tasks:
+                remaining = deadline - time.time()
+                if remaining <= 0 or not self.is_listening():
+                    return None
+                self._condition.wait(remaining)
+            return self._completed_tasks[task_uri]
+
+    def _wake_up_waiters(self):
+        with self._condition:
+            self._condition.notify_all()
+
+
+class ScmbTaskListener(TaskListener):
+    """
+    Receives the task state changes published on the HPE OneView State-Change Message Bus (SCMB).
+
+    The connection to the message bus is authenticated with the RabbitMQ client certificate of the appliance. The
+    messages are consumed by a daemon thread; when the connection is lost, is_listening returns False and the
+    waiters fall back to polling.
+    """
+
+    PORT = 5671
+    EXCHANGE = 'scmb'
+    ROUTING_KEY = 'scmb.tasks.#'
+
+    # Seconds to block on the message bus before checking whether the listener was stopped
+    DRAIN_TIMEOUT = 1
+
+    def __init__(self, host, ca_certificate=None, key_pair=None, port=PORT, connection_factory=None,
+                 max_completed_tasks=TaskListener.DEFAULT_MAX_COMPLETED_TASKS):
+        """
+        Args:
+            host (str): Appliance hostname or IP address.
+            ca_certificate (str): PEM certificate of the appliance internal CA, as returned by CertificateAuthority.get.
+            key_pair (dict): RabbitMQ client key pair, as returned by CertificateRabbitMQ.get_key_pair.
+            port (int): AMQP port of the message bus.
+            connection_factory: Callable receiving the host, the port and the SSL context and returning an AMQP
+                connection. Defaults to a connection of the amqp package with the EXTERNAL login method.
+            max_completed_tasks (int): Number of completed tasks remembered for the late waiters.
+        """
+        super(ScmbTaskListener, self).__init__(max_completed_tasks)
+        self._host = host
+        self._port = port
+        self._ca_certificate = ca_certificate
+        self._key_pair = key_pair
+        self._connection_factory = connection_factory or self.__create_amqp_connection
+        self._amqp_connection = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def is_listening(self):
+        return self._thread is not None and self._thread.is_alive() and not self._stopped.is_set()
+
+    def start(self):
+        """
+        Connects to the message bus, binds a private queue to the task notifications and starts consuming them.
+        """
+        if self.is_listening():
+            raise HPOneViewException(MSG_LISTENER_ALREADY_STARTED)
+
+        self._stopped.clear()
+        self._amqp_connection = self._connection_factory(self._host, self._port, self.get_ssl_context())
+
+        channel = self._amqp_connection.channel()
+        queue_name = channel.queue_declare(exclusive=True, auto_delete=True)[0]
+        channel.queue_bind(queue_name, exchange=self.EXCHANGE, routing_key=self.ROUTING_KEY)
+        channel.basic_consume(queue_name, callback=self._on_message, no_ack=True)
+
+        self._thread = threading.Thread(target=self.__consume, name='ScmbTaskListener')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops consuming the task notifications and closes the connection to the message bus.
+        """
+        self._stopped.set()
+        self._wake_up_waiters()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(self.DRAIN_TIMEOUT * 2)
+
+    def get_ssl_context(self):
+        """
+        Builds the SSL context used to connect to the message bus from the CA certificate and the client key pair.
+
+        Returns:
+            ssl.SSLContext: None when no client key pair was given.
+        """
+        if not self._key_pair:
+            return None
+
+        context = ssl.SSLContext(ssl.PROTOCOL_TLSv1_2)
+        if self._ca_certificate:
+            context.verify_mode = ssl.CERT_REQUIRED
+            context.load_verify_locations(cadata=self._ca_certificate)
+
+        # The certificate chain can only be loaded from files; they are removed as soon as the context has them
+        cert_file = self.__write_temp_file(self._key_pair['base64SSLCertData'])
+        key_file = self.__write_temp_file(self._key_pair['base64SSLKeyData'])
+        try:
+            context.load_cert_chain(cert_file, key_file)
+        finally:
+            os.remove(cert_file)
+            os.remove(key_file)
+
+        return context
+
+    def _on_message(self, message):
+        try:
+            body = message.body
+            if isinstance(body, bytes):
+                body = body.decode('utf-8')
+            change = json.loads(body)
+        except ValueError:
+            logger.debug('Ignoring a malformed SCMB message')
+            return
+
+        task = change.get('resource') or {}
+        if 'uri' not in task and change.get('resourceUri'):
+            task = dict(task, uri=change['resourceUri'])
+        self.notify(task)
+
+    def __consume(self):
+        try:
+            while not self._stopped.is_set():
+                try:
+                    self._amqp_connection.drain_events(timeout=self.DRAIN_TIMEOUT)
+                except socket.timeout:
+                    continue
+        except Exception as e:
+            if not self._stopped.is_set():
+                logger.warning('Lost the connection to the State-Change Message Bus, falling back to polling: %s', e)
+        finally:
+            self._stopped.set()
+            self._wake_up_waiters()
+            self.__close_amqp_connection()
+
+    def __close_amqp_connection(self):
+        try:
+            self._amqp_connection.close()
+        except Exception as e:
+            logger.debug('Failed to close the connection to the State-Change Message Bus: %s', e)
+
+    @staticmethod
+    def __write_temp_file(data):
+        file_descriptor, file_name = tempfile.mkstemp(suffix='.pem')
+        with os.fdopen(file_descriptor, 'w') as temp_file:
+            temp_file.write(data)
+        return file_name
+
+    @staticmethod
+    def __create_amqp_connection(host, port, ssl_context):
+        if amqp is None:
+            raise HPOneViewException(MSG_AMQP_NOT_INSTALLED)
+
+        amqp_connection = amqp.Connection('{}:{}'.format(host, port), login_method='EXTERNAL', ssl=ssl_context or True)
+        amqp_connection.connect()
+        return amqp_connection
@@ -26,16 +26,16 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-from future import standard_library
-
-standard_library.install_aliases()
-
 
 import logging
+import random
 import time
 
+from multiprocessing.pool import ThreadPool
+from urllib.parse import quote
 from errno import ECONNABORTED, ETIMEDOUT, ENOEXEC, EINVAL, ENETUNREACH, ECONNRESET, ENETDOWN, ECONNREFUSED
-from hpOneView.exceptions import HPOneViewInvalidResource, HPOneViewTimeout, HPOneViewTaskError, HPOneViewUnknownType
+from hpOneView.exceptions import HPOneViewException, HPOneViewInvalidResource, HPOneViewTimeout, HPOneViewTaskError, \
+    HPOneViewUnknownType
 
 TASK_PENDING_STATES = ['New', 'Starting', 'Pending', 'Running', 'Suspended', 'Stopping']
 TASK_ERROR_STATES = ['Error', 'Warning', 'Terminated', 'Killed']
@@ -52,6 +52,107 @@ UNLIMITED_TIMEOUT = -1
 logger = logging.getLogger(__name__)
 
 
+class PollPolicy(object):
+    """
+    Schedules the polls of a running task: the interval grows 1 second after each poll, up to 10 seconds.
+
+    Subclasses override get_interval to schedule the polls differently.
+    """
+
+    DEFAULT_MAX_INTERVAL = 10
+
+    def __init__(self, max_interval=DEFAULT_MAX_INTERVAL):
+        self.max_interval = max_interval
+
+    def get_interval(self, attempt, task=None, elapsed=0):
+        """
+        Gets how long to wait before the next poll.
+
+        Args:
+            attempt (int): Number of polls made so far, starting at 1.
+            task (dict): Last TaskResource retrieved, when available.
+            elapsed (float): Seconds elapsed since the wait started.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        return min(attempt, self.max_interval)
+
+
+class ExponentialPollPolicy(PollPolicy):
+    """
+    Polls quickly at first and backs off exponentially, with a random jitter so that many waiters do not poll the
+    appliance in lockstep.
+
+    Optionally, the progress reported by the task (computedPercentComplete and expectedDuration) is used to schedule
+    the next poll when the task is expected to complete.
+    """
+
+    DEFAULT_MIN_INTERVAL = 0.1
+    DEFAULT_MULTIPLIER = 2
+    DEFAULT_JITTER = 0.2
+
+    def __init__(self, min_interval=DEFAULT_MIN_INTERVAL, max_interval=PollPolicy.DEFAULT_MAX_INTERVAL,
+                 multiplier=DEFAULT_MULTIPLIER, jitter=DEFAULT_JITTER, use_task_progress=False):
+        """
+        Args:
+            min_interval (float): Seconds to wait before the first poll.
+            max_interval (float): Maximum number of seconds between two polls.
+            multiplier (float): Growth factor of the interval after each poll.
+            jitter (float): Fraction of the interval randomly added or removed, between 0 and 1.
+            use_task_progress (bool): Schedule the next poll from the progress reported by the task.
+        """
+        super(ExponentialPollPolicy, self).__init__(max_interval)
+        self.min_interval = min_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.use_task_progress = use_task_progress
+
+    @classmethod
+    def from_config(cls, polling_config):
+        """
+        Builds the policy from the task_polling entry of the client configuration.
+
+        Args:
+            polling_config: dict with the policy options, or True to use the default options.
+
+        Returns:
+            ExponentialPollPolicy:
+        """
+        if not isinstance(polling_config, dict):
+            polling_config = {}
+
+        return cls(min_interval=polling_config.get("min_interval", cls.DEFAULT_MIN_INTERVAL),
+                   max_interval=polling_config.get("max_interval", cls.DEFAULT_MAX_INTERVAL),
+                   multiplier=polling_config.get("multiplier", cls.DEFAULT_MULTIPLIER),
+                   jitter=polling_config.get("jitter", cls.DEFAULT_JITTER),
+                   use_task_progress=polling_config.get("use_task_progress", False))
+
+    def get_interval(self, attempt, task=None, elapsed=0):
+        interval = self.min_interval * self.multiplier ** max(attempt - 1, 0)
+
+        if self.use_task_progress and task:
+            remaining = self.__estimate_remaining_seconds(task, elapsed)
+            if remaining is not None:
+                interval = remaining
+
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        if self.jitter:
+            interval *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return interval
+
+    @staticmethod
+    def __estimate_remaining_seconds(task, elapsed):
+        percent_complete = task.get('computedPercentComplete') or 0
+        expected_duration = task.get('expectedDuration')
+
+        if 0 < percent_complete < 100 and elapsed > 0:
+            return elapsed * (100 - percent_complete) / percent_complete
+        if expected_duration:
+            return expected_duration * (100 - min(percent_complete, 100)) / 100
+        return None
+
+
 class TaskMonitor(object):
     # Seconds to wait when a network failure occurs
     CONNECTION_FAILURE_TIMEOUT = 90
@@ -60,12 +161,35 @@ class TaskMonitor(object):
     CONNECTION_FAILURE_ERROR_NUMBERS = [ENOEXEC, EINVAL, ENETUNREACH, ETIMEDOUT, ECONNRESET,
                                         ECONNABORTED, ENETUNREACH, ENETDOWN, ECONNREFUSED]
 
+    # Seconds to wait for a task notification before checking the task state again
+    TASK_NOTIFICATION_TIMEOUT = 30
+
+    TASKS_URI = '/rest/tasks'
+
+    # Maximum number of tasks retrieved by a single query of the tasks collection
+    TASKS_PER_QUERY = 50
+
+    # First API version filtering the tasks collection by many URIs, the older ones get the tasks one by one
+    MIN_TASKS_QUERY_API_VERSION = 300
+
+    # Default number of requests made at the same time when waiting for many tasks
+    DEFAULT_CONCURRENCY = 4
+
     def __init__(self, con):
         self._connection = con
 
     @staticmethod
     def get_current_seconds():
-        return int(time.time())
+        return time.time()
+
+    def get_poll_policy(self):
+        """
+        Gets the policy scheduling the polls of the running tasks, set on the connection or the default one.
+
+        Returns:
+            PollPolicy:
+        """
+        return self._connection.get_poll_policy() or PollPolicy()
 
     def wait_for_task(self, task, timeout=-1):
         """
@@ -104,6 +228,121 @@ class TaskMonitor(object):
 
         return self.get(task)
 
+    def wait_for_tasks(self, tasks, timeout=-1, concurrency=DEFAULT_CONCURRENCY):
+        """
+        Waits for the completion of many tasks at once and returns the result of each one.
+
+        On each polling cycle, the pending tasks are retrieved by a query of the tasks collection filtered by their
+        URIs, instead of a request per task, when the API version supports it. The tasks not returned by the query
+        are retrieved one by one. As in wait_for_task, a task is left pending after a connection failure until
+        CONNECTION_FAILURE_TIMEOUT seconds pass without retrieving it.
+
+        Args:
+            tasks (list): Task dicts, each one with the 'uri' key.
+            timeout: Timeout in seconds to wait for all the tasks.
+            concurrency (int): Maximum number of requests made at the same time.
+
+        Returns:
+            list: A dict per task, in the same order as the tasks, with the keys 'task' (last TaskResource retrieved),
+            'result' (associated resource, as returned by wait_for_task) and 'error' (exception raised for the task,
+            or None).
+        """
+        if not tasks:
+            return []
+
+        if not all(task and 'uri' in task for task in tasks):
+            raise HPOneViewUnknownType(MSG_INVALID_TASK)
+
+        logger.debug('Waiting for the completion of {} tasks...'.format(len(tasks)))
+
+        start_time = self.get_current_seconds()
+        states = dict((task['uri'], (task, None)) for task in tasks)
+        pending_uris = list(states)
+        last_successes = dict((uri, start_time) for uri in states)
+
+        pool = ThreadPool(max(min(concurrency, len(states)), 1))
+        try:
+            poll_policy = self.get_poll_policy()
+            i = 0
+            while True:
+                chunks = [pending_uris[index:index + self.TASKS_PER_QUERY]
+                          for index in range(0, len(pending_uris), self.TASKS_PER_QUERY)]
+                retrieved_uris = set()
+                for retrieved in pool.map(lambda chunk: self.__get_tasks(chunk, last_successes), chunks):
+                    states.update(retrieved)
+                    retrieved_uris.update(retrieved)
+
+                # The tasks not retrieved due to a connection failure are still pending
+                pending_uris = [uri for uri in pending_uris
+                                if uri not in retrieved_uris or self.__is_pending(states[uri])]
+                timed_out = (timeout != UNLIMITED_TIMEOUT) and (start_time + timeout < self.get_current_seconds())
+                if not pending_uris or timed_out:
+                    break
+
+                # the interval increases to avoid flooding server with requests
+                i += 1
+                time.sleep(poll_policy.get_interval(i, elapsed=self.get_current_seconds() - start_time))
+
+            return pool.map(lambda task: self.__get_tasks_result(states[task['uri']], timeout,
+                                                                 task['uri'] in pending_uris), tasks)
+        finally:
+            pool.close()
+            pool.join()
+
+    @staticmethod
+    def __is_pending(state):
+        task, error = state
+        return not error and task.get('taskState') in TASK_PENDING_STATES
+
+    def __get_tasks(self, task_uris, last_successes):
+        retrieved = {}
+        if self._connection._apiVersion >= self.MIN_TASKS_QUERY_API_VERSION:
+            retrieved = self.__query_tasks(task_uris)
+
+        for uri in task_uris:
+            if uri not in retrieved:
+                try:
+                    retrieved[uri] = (self.get({'uri': uri}), None)
+                except Exception as error:
+                    logger.error('; '.join(str(e) for e in error.args) + ' when waiting for the task: ' + uri)
+                    if self.__is_connection_failure(error) and \
+                            last_successes[uri] + self.CONNECTION_FAILURE_TIMEOUT >= self.get_current_seconds():
+                        # Leaves the task pending when network instability occurs
+                        continue
+                    retrieved[uri] = ({'uri': uri}, error)
+                    continue
+            last_successes[uri] = self.get_current_seconds()
+
+        return retrieved
+
+    def __query_tasks(self, task_uris):
+        task_filter = "\"{}\"".format(" OR ".join("uri='{}'".format(uri) for uri in task_uris))
+        query_uri = "{}?filter={}&count={}".format(self.TASKS_URI, quote(task_filter), len(task_uris))
+
+        retrieved = {}
+        try:
+            for task in self._connection.get(query_uri).get('members', []):
+                if task.get('uri') in task_uris:
+                    retrieved[task['uri']] = (task, None)
+        except HPOneViewException as error:
+            logger.debug('Failed to query the tasks collection, the tasks will be retrieved one by one: ' + str(error))
+
+        return retrieved
+
+    def __get_tasks_result(self, state, timeout, pending):
+        task, error = state
+        result = None
+        if not error:
+            if pending:
+                error = HPOneViewTimeout(MSG_TIMEOUT % str(timeout))
+            else:
+                try:
+                    result = self.__get_task_response(task)
+                except Exception as task_error:
+                    error = task_error
+
+        return dict(task=task, result=result, error=error)
+
     def __wait_task_completion(self, task, timeout):
         if not task:
             raise HPOneViewUnknownType(MSG_INVALID_TASK)
@@ -114,19 +353,31 @@ class TaskMonitor(object):
         start_time = self.get_current_seconds()
         connection_failure_control = dict(last_success=self.get_current_seconds())
 
+        poll_policy = self.get_poll_policy()
         i = 0
         while self.is_task_running(task, connection_failure_control):
-            # wait 1 to 10 seconds
-            # the value increases to avoid flooding server with requests
-            i = i + 1 if i < 10 else 10
-
-            logger.debug("Waiting for task. Percentage complete: " + str(task.get('computedPercentComplete')))
-            logger.debug("Waiting for task. Task state: " + str(task.get('taskState')))
+            last_task = connection_failure_control.get('last_task', task)
+            logger.debug("Waiting for task. Percentage complete: " + str(last_task.get('computedPercentComplete')))
+            logger.debug("Waiting for task. Task state: " + str(last_task.get('taskState')))
+
+            task_listener = self._connection.get_task_listener()
+            if task_listener and task_listener.is_listening():
+                # the task is checked again when notified, or after a while in case the notification was missed
+                task_listener.wait_for_completion(task['uri'], self.__get_notification_timeout(start_time, timeout))
+            else:
+                # the interval increases to avoid flooding server with requests
+                i += 1
+                time.sleep(poll_policy.get_interval(i, last_task, self.get_current_seconds() - start_time))
 
-            time.sleep(i)
             if (timeout != UNLIMITED_TIMEOUT) and (start_time + timeout < self.get_current_seconds()):
                 raise HPOneViewTimeout(MSG_TIMEOUT % str(timeout))
 
+    def __get_notification_timeout(self, start_time, timeout):
+        if timeout == UNLIMITED_TIMEOUT:
+            return self.TASK_NOTIFICATION_TIMEOUT
+        remaining = start_time + timeout - self.get_current_seconds()
+        return min(self.TASK_NOTIFICATION_TIMEOUT, max(remaining, 0))
+
     def __get_task_response(self, task):
         deleted_states = ['Delete',
                           'Remove',
@@ -169,11 +420,12 @@ class TaskMonitor(object):
         Args:
             task (dict): OneView Task resource.
             connection_failure_control (dict):
-                A dictionary instance that contains last_success for error tolerance control.
+                A dictionary instance that contains last_success for error tolerance control. The last task
+                retrieved is stored in it under the last_task key.
 
         Examples:
 
-            >>> connection_failure_control = dict(last_success=int(time.time()))
+            >>> connection_failure_control = dict(last_success=time.time())
             >>> while self.is_task_running(task, connection_failure_control):
             >>>     pass
 
@@ -186,6 +438,7 @@ class TaskMonitor(object):
                 if connection_failure_control:
                     # Updates last success
                     connection_failure_control['last_success'] = self.get_current_seconds()
+                    connection_failure_control['last_task'] = task
                 if 'taskState' in task and task['taskState'] in TASK_PENDING_STATES:
                     return True
 
@@ -195,7 +448,7 @@ class TaskMonitor(object):
                 if not connection_failure_control:
                     raise error
 
-                if hasattr(error, 'errno') and error.errno in self.CONNECTION_FAILURE_ERROR_NUMBERS:
+                if self.__is_connection_failure(error):
                     last_success = connection_failure_control['last_success']
                     if last_success + self.CONNECTION_FAILURE_TIMEOUT < self.get_current_seconds():
                         # Timeout reached
@@ -208,6 +461,9 @@ class TaskMonitor(object):
 
         return False
 
+    def __is_connection_failure(self, error):
+        return hasattr(error, 'errno') and error.errno in self.CONNECTION_FAILURE_ERROR_NUMBERS
+
     def get(self, task):
         """
         Retrieve a task by its uri.
@@ -22,9 +22,16 @@
 ###
 
 
+import sys
+
 from setuptools import find_packages
 from setuptools import setup
 
+# The asyncio client uses the Python 3.5 syntax
+excluded_packages = ['examples*', 'tests*']
+if sys.version_info < (3, 5):
+    excluded_packages.append('hpOneView.aio*')
+
 setup(name='hpOneView',
       version='5.0.0',
       description='HPE OneView Python Library',
@@ -33,6 +40,8 @@ setup(name='hpOneView',
       author='Hewlett Packard Enterprise Development LP',
       author_email='oneview-pythonsdk@hpe.com',
       license='MIT',
-      packages=find_packages(exclude=['examples*', 'tests*']),
+      packages=find_packages(exclude=excluded_packages),
       keywords=['oneview', 'hpe'],
-      install_requires=['future>=0.15.2'])
+      install_requires=['future>=0.15.2'],
+      # The task notifications of the State-Change Message Bus use amqp when it is installed
+      extras_require={'scmb': ['amqp']})
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2016-2026) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import asyncio
+import json
+
+
+class ApplianceProtocol(asyncio.Protocol):
+    """Parses the HTTP/1.1 requests received by the stand-in and writes the canned responses."""
+
+    def __init__(self, appliance):
+        self.appliance = appliance
+        self.buffer = b''
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.appliance.connections += 1
+
+    def data_received(self, data):
+        self.buffer += data
+        while True:
+            head, separator, rest = self.buffer.partition(b'\r\n\r\n')
+            if not separator:
+                return
+
+            lines = head.decode('latin-1').split('\r\n')
+            method, path, _ = lines[0].split(' ')
+            headers = dict((name.strip().lower(), value.strip())
+                           for name, _, value in (line.partition(':') for line in lines[1:]))
+            length = int(headers.get('content-length', 0))
+            if len(rest) < length:
+                return
+
+            body, self.buffer = rest[:length], rest[length:]
+            self.appliance.requests.append((method, path, headers, body.decode('utf-8')))
+            self.transport.write(self.appliance.respond(method, path))
+
+            if self.appliance.close_after_response:
+                self.transport.close()
+                return
+
+
+class ApplianceStandIn(object):
+    """
+    Local HTTP server answering the requests of the asyncio client with canned responses.
+
+    Each route is a list of (status, headers, body) tuples served in order; the last one is repeated.
+    """
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.routes = {}
+        self.requests = []
+        self.connections = 0
+        self.close_after_response = False
+        self.chunked = False
+        self.server = loop.run_until_complete(loop.create_server(lambda: ApplianceProtocol(self), '127.0.0.1', 0))
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    def add_route(self, method, path, *responses):
+        self.routes[(method, path)] = list(responses)
+
+    def respond(self, method, path):
+        responses = self.routes.get((method, path))
+        if not responses:
+            status, headers, body = 404, {}, {"errorCode": "RESOURCE_NOT_FOUND"}
+        elif len(responses) > 1:
+            status, headers, body = responses.pop(0)
+        else:
+            status, headers, body = responses[0]
+
+        data = (json.dumps(body) if isinstance(body, (dict, list)) else body).encode('utf-8')
+        header_lines = ['HTTP/1.1 {} Status'.format(status)]
+        header_lines.extend('{}: {}'.format(name, value) for name, value in headers.items())
+        if self.chunked:
+            header_lines.append('Transfer-Encoding: chunked')
+            middle = len(data) // 2
+            chunks = [data[:middle], data[middle:]]
+            payload = b''.join(('%x\r\n' % len(chunk)).encode('latin-1') + chunk + b'\r\n' for chunk in chunks if chunk)
+            payload += b'0\r\n\r\n'
+        else:
+            header_lines.append('Content-Length: {}'.format(len(data)))
+            payload = data
+
+        return ('\r\n'.join(header_lines) + '\r\n\r\n').encode('latin-1') + payload
+
+    def close(self):
+        self.server.close()
+        self.loop.run_until_complete(self.server.wait_closed())
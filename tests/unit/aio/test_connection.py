@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2016-2026) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import sys
+import unittest
+
+from mock import mock
+
+from hpOneView.exceptions import HPOneViewException
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from hpOneView.aio.connection import AsyncConnection
+    from tests.unit.aio.appliance_stand_in import ApplianceStandIn
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'The asyncio client requires Python 3.5 or later')
+class AsyncConnectionTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.appliance = ApplianceStandIn(self.loop)
+        self.connection = AsyncConnection('127.0.0.1', 800)
+        self.port_patcher = mock.patch.object(AsyncConnection, 'PORT', self.appliance.port)
+        self.ssl_patcher = mock.patch.object(AsyncConnection, 'get_ssl_context', return_value=None)
+        self.port_patcher.start()
+        self.ssl_patcher.start()
+
+    def tearDown(self):
+        self.port_patcher.stop()
+        self.ssl_patcher.stop()
+        self.loop.run_until_complete(self.connection.close())
+        self.appliance.close()
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def run_coroutine(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_get_sends_default_headers(self):
+        self.appliance.add_route('GET', '/rest/fc-networks/1', (200, {}, {"name": "net"}))
+        self.connection.set_session_id('session-id')
+
+        body = self.run_coroutine(self.connection.get('/rest/fc-networks/1'))
+
+        self.assertEqual(body, {"name": "net"})
+        method, path, headers, _ = self.appliance.requests[0]
+        self.assertEqual(headers['x-api-version'], '800')
+        self.assertEqual(headers['auth'], 'session-id')
+        self.assertEqual(headers['host'], '127.0.0.1')
+
+    def test_get_with_error_status_raises_exception(self):
+        try:
+            self.run_coroutine(self.connection.get('/rest/fc-networks/1'))
+        except HPOneViewException as e:
+            self.assertEqual(e.oneview_response, {"errorCode": "RESOURCE_NOT_FOUND"})
+        else:
+            self.fail()
+
+    def test_get_follows_redirect(self):
+        self.appliance.add_route('GET', '/rest/old', (302, {'Location': '/rest/new'}, ''))
+        self.appliance.add_route('GET', '/rest/new', (200, {}, {"name": "new"}))
+
+        self.assertEqual(self.run_coroutine(self.connection.get('/rest/old')), {"name": "new"})
+
+    def test_get_with_chunked_response(self):
+        self.appliance.chunked = True
+        self.appliance.add_route('GET', '/rest/fc-networks', (200, {}, {"members": [{"name": "net"}] * 10}))
+
+        body = self.run_coroutine(self.connection.get('/rest/fc-networks'))
+
+        self.assertEqual(body, {"members": [{"name": "net"}] * 10})
+
+    def test_get_with_text_response(self):
+        self.appliance.add_route('GET', '/rest/certificates/ca', (200, {}, 'certificate'))
+
+        self.assertEqual(self.run_coroutine(self.connection.get('/rest/certificates/ca')), 'certificate')
+
+    def test_requests_reuse_keep_alive_connection(self):
+        self.appliance.add_route('GET', '/rest/fc-networks/1', (200, {}, {"name": "net"}))
+
+        for _ in range(3):
+            self.run_coroutine(self.connection.get('/rest/fc-networks/1'))
+
+        self.assertEqual(self.appliance.connections, 1)
+
+    def test_request_retries_when_idle_connection_was_closed(self):
+        self.appliance.close_after_response = True
+        self.appliance.add_route('GET', '/rest/fc-networks/1', (200, {}, {"name": "net"}))
+
+        self.run_coroutine(self.connection.get('/rest/fc-networks/1'))
+        body = self.run_coroutine(self.connection.get('/rest/fc-networks/1'))
+
+        self.assertEqual(body, {"name": "net"})
+        self.assertEqual(self.appliance.connections, 2)
+
+    def test_concurrent_requests_are_bounded_by_max_connections(self):
+        connection = AsyncConnection('127.0.0.1', 800, max_connections=2)
+        self.appliance.add_route('GET', '/rest/fc-networks/1', (200, {}, {"name": "net"}))
+
+        bodies = self.run_coroutine(asyncio.gather(*[connection.get('/rest/fc-networks/1') for _ in range(10)]))
+        self.run_coroutine(connection.close())
+
+        self.assertEqual(bodies, [{"name": "net"}] * 10)
+        self.assertEqual(self.appliance.connections, 2)
+
+    def test_post_returns_task_from_location(self):
+        task = {"uri": "/rest/tasks/1", "category": "tasks", "taskState": "Running"}
+        self.appliance.add_route('POST', '/rest/fc-networks', (202, {'Location': '/rest/tasks/1'}, ''))
+        self.appliance.add_route('GET', '/rest/tasks/1', (200, {}, task))
+
+        result, body = self.run_coroutine(self.connection.post('/rest/fc-networks', {"name": "net"}))
+
+        self.assertEqual(result, task)
+        self.assertEqual(self.appliance.requests[0][3], '{"name": "net"}')
+
+    def test_put_returns_body_without_task(self):
+        self.appliance.add_route('PUT', '/rest/fc-networks/1', (200, {}, {"name": "updated"}))
+
+        task, body = self.run_coroutine(self.connection.put('/rest/fc-networks/1', {"name": "updated"}))
+
+        self.assertIsNone(task)
+        self.assertEqual(body, {"name": "updated"})
+
+    def test_login_and_logout(self):
+        self.appliance.add_route('GET', '/rest/version', (200, {}, {"minimumVersion": 120, "currentVersion": 800}))
+        self.appliance.add_route('POST', '/rest/login-sessions', (200, {}, {"sessionID": "session-id"}))
+        self.appliance.add_route('DELETE', '/rest/login-sessions', (204, {}, ''))
+
+        self.run_coroutine(self.connection.login({"userName": "admin", "password": "secret", "sessionID": ""}))
+        self.assertEqual(self.connection.get_session_id(), 'session-id')
+
+        self.run_coroutine(self.connection.logout())
+        self.assertIsNone(self.connection.get_session_id())
+        self.assertFalse(self.connection.get_session())
+
+    def test_login_with_unsupported_api_version(self):
+        self.appliance.add_route('GET', '/rest/version', (200, {}, {"minimumVersion": 120, "currentVersion": 600}))
+
+        self.assertRaises(HPOneViewException, self.run_coroutine, self.connection.login({"userName": "admin"}))
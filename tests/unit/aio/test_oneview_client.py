@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2016-2026) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import sys
+import unittest
+
+from mock import mock
+
+from hpOneView.resources.networking.fc_networks import FcNetworks
+from hpOneView.resources.task_monitor import ExponentialPollPolicy
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from hpOneView.aio.connection import AsyncConnection
+    from hpOneView.aio.oneview_client import AsyncOneViewClient
+    from tests.unit.aio.appliance_stand_in import ApplianceStandIn
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'The asyncio client requires Python 3.5 or later')
+class AsyncOneViewClientTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.appliance = ApplianceStandIn(self.loop)
+        self.patchers = [mock.patch.object(AsyncConnection, 'PORT', self.appliance.port),
+                         mock.patch.object(AsyncConnection, 'get_ssl_context', return_value=None)]
+        for patcher in self.patchers:
+            patcher.start()
+
+        self.config = {"ip": "127.0.0.1",
+                       "api_version": 800,
+                       "max_connections": 5,
+                       "credentials": {"userName": "administrator", "password": "password"}}
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        self.appliance.close()
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def test_connection_from_config(self):
+        client = AsyncOneViewClient(self.config)
+
+        self.assertEqual(client.api_version, 800)
+        self.assertEqual(client.connection.get_host(), "127.0.0.1")
+        self.assertEqual(client.connection.max_connections, 5)
+
+    def test_unsupported_options_raise_value_error(self):
+        self.config["proxy"] = "127.0.0.1:3128"
+        self.config["retry_policy"] = {"max_attempts": 3}
+
+        with self.assertRaises(ValueError) as context:
+            AsyncOneViewClient(self.config)
+
+        self.assertEqual(str(context.exception), 'The AsyncOneViewClient does not support the options: proxy, retry_policy')
+
+    def test_empty_unsupported_options_are_ignored(self):
+        self.config["proxy"] = ""
+        self.config["connection_pool"] = None
+
+        client = AsyncOneViewClient(self.config)
+
+        self.assertEqual(client.api_version, 800)
+
+    def test_task_polling_from_config(self):
+        self.config["task_polling"] = {"min_interval": 0.5}
+
+        client = AsyncOneViewClient(self.config)
+
+        self.assertIsInstance(client.task_monitor._poll_policy, ExponentialPollPolicy)
+        self.assertEqual(client.task_monitor._poll_policy.min_interval, 0.5)
+
+    def test_resource_helper_uses_resource_uri_and_default_values(self):
+        client = AsyncOneViewClient(self.config)
+
+        helper = client.resource_helper(FcNetworks)
+
+        self.assertEqual(helper._base_uri, FcNetworks.URI)
+        self.assertEqual(helper._default_values, FcNetworks.DEFAULT_VALUES)
+        self.assertIs(client.resource_helper(FcNetworks), helper)
+        self.assertEqual(client.resource_helper('/rest/racks')._base_uri, '/rest/racks')
+
+    def test_context_manager_logs_in_and_out(self):
+        self.appliance.add_route('GET', '/rest/version', (200, {}, {"minimumVersion": 120, "currentVersion": 800}))
+        self.appliance.add_route('POST', '/rest/login-sessions', (200, {}, {"sessionID": "session-id"}))
+        self.appliance.add_route('DELETE', '/rest/login-sessions', (204, {}, ''))
+        self.appliance.add_route('GET', '/rest/fc-networks?start=0&count=-1', (200, {}, {"members": [{"name": "net"}]}))
+        client = AsyncOneViewClient(self.config)
+
+        context = client.__aenter__()
+        self.assertIs(self.loop.run_until_complete(context), client)
+        networks = self.loop.run_until_complete(client.resource_helper(FcNetworks).get_all())
+        self.loop.run_until_complete(client.__aexit__(None, None, None))
+
+        self.assertEqual(networks, [{"name": "net"}])
+        self.assertEqual([request[:2] for request in self.appliance.requests],
+                         [('GET', '/rest/version'), ('POST', '/rest/login-sessions'),
+                          ('GET', '/rest/fc-networks?start=0&count=-1'), ('DELETE', '/rest/login-sessions')])
+        self.assertEqual(self.appliance.requests[2][2]['auth'], 'session-id')
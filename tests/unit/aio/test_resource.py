@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2016-2026) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import sys
+import unittest
+
+from mock import mock
+
+from hpOneView.exceptions import HPOneViewTaskError, HPOneViewTimeout, HPOneViewUnknownType
+from hpOneView.resources.task_monitor import ExponentialPollPolicy
+
+if sys.version_info >= (3, 5):
+    import asyncio
+    from builtins import StopAsyncIteration
+    from hpOneView.aio.connection import AsyncConnection
+    from hpOneView.aio.resource import AsyncResourceHelper
+    from hpOneView.aio.task_monitor import AsyncTaskMonitor
+    from tests.unit.aio.appliance_stand_in import ApplianceStandIn
+
+RUNNING_TASK = {"uri": "/rest/tasks/1", "category": "tasks", "type": "TaskResourceV2", "taskState": "Running",
+                "associatedResource": {"resourceUri": "/rest/fc-networks/1"}}
+COMPLETED_TASK = dict(RUNNING_TASK, taskState="Completed")
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'The asyncio client requires Python 3.5 or later')
+class AsyncResourceHelperTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.appliance = ApplianceStandIn(self.loop)
+        self.patchers = [mock.patch.object(AsyncConnection, 'PORT', self.appliance.port),
+                         mock.patch.object(AsyncConnection, 'get_ssl_context', return_value=None)]
+        for patcher in self.patchers:
+            patcher.start()
+
+        self.connection = AsyncConnection('127.0.0.1', 800)
+        poll_policy = ExponentialPollPolicy(min_interval=0.01, max_interval=0.01, jitter=0)
+        self.task_monitor = AsyncTaskMonitor(self.connection, poll_policy)
+        self.helper = AsyncResourceHelper('/rest/fc-networks', self.connection, self.task_monitor,
+                                          {"800": {"type": "FCNetworkV4"}})
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        self.loop.run_until_complete(self.connection.close())
+        self.appliance.close()
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def run_coroutine(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def consume(self, async_iterator):
+        members = []
+        while True:
+            try:
+                members.append(self.run_coroutine(async_iterator.__anext__()))
+            except StopAsyncIteration:
+                return members
+
+    def test_get_all_builds_query_uri(self):
+        self.appliance.add_route('GET', '/rest/fc-networks?start=0&count=-1&filter=%22name%3D%27net%27%22&sort=name%3Aascending',
+                                 (200, {}, {"members": [{"name": "net"}]}))
+
+        result = self.run_coroutine(self.helper.get_all(filter="\"name='net'\"", sort='name:ascending'))
+
+        self.assertEqual(result, [{"name": "net"}])
+
+    def test_get_all_requests_following_pages_concurrently(self):
+        self.appliance.add_route('GET', '/rest/fc-networks?start=0&count=-1',
+                                 (200, {}, {"members": [{"id": 1}, {"id": 2}], "total": 5,
+                                            "nextPageUri": "/rest/fc-networks?start=2&count=2"}))
+        self.appliance.add_route('GET', '/rest/fc-networks?start=2&count=2',
+                                 (200, {}, {"members": [{"id": 3}, {"id": 4}], "nextPageUri": "/rest/fc-networks?start=4&count=2"}))
+        self.appliance.add_route('GET', '/rest/fc-networks?start=4&count=1', (200, {}, {"members": [{"id": 5}]}))
+
+        result = self.run_coroutine(self.helper.get_all())
+
+        self.assertEqual(result, [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}, {"id": 5}])
+        self.assertEqual(len(self.appliance.requests), 3)
+
+    def test_iter_all_requests_one_page_at_a_time(self):
+        self.appliance.add_route('GET', '/rest/fc-networks?start=0&count=-1',
+                                 (200, {}, {"members": [{"id": 1}], "nextPageUri": "/rest/fc-networks?start=1&count=1",
+                                            "uri": "/rest/fc-networks?start=0&count=-1"}))
+        self.appliance.add_route('GET', '/rest/fc-networks?start=1&count=1',
+                                 (200, {}, {"members": [{"id": 2}], "uri": "/rest/fc-networks?start=1&count=1"}))
+
+        for prefetch in (False, True):
+            self.assertEqual(self.consume(self.helper.iter_all(prefetch=prefetch)), [{"id": 1}, {"id": 2}])
+
+    def test_iter_all_stops_when_response_is_not_a_collection(self):
+        self.appliance.add_route('GET', '/rest/fc-networks?start=0&count=-1', (200, {}, []))
+
+        self.assertEqual(self.consume(self.helper.iter_all()), [])
+
+    def test_do_get_if_modified_sends_etag(self):
+        self.appliance.add_route('GET', '/rest/fc-networks/1', (304, {}, ''), (200, {}, {"name": "net"}))
+
+        self.assertIsNone(self.run_coroutine(self.helper.do_get_if_modified('/rest/fc-networks/1', 'etag-1')))
+        self.assertEqual(self.run_coroutine(self.helper.do_get_if_modified('/rest/fc-networks/1', 'etag-1')),
+                         {"name": "net"})
+        self.assertEqual(self.appliance.requests[0][2]['if-none-match'], 'etag-1')
+
+    def test_add_new_fields_keeps_the_fields_already_set(self):
+        self.assertEqual(self.helper.add_new_fields({"name": "net"}, {"name": "other", "type": "FCNetworkV4"}),
+                         {"name": "net", "type": "FCNetworkV4"})
+
+    def test_get_by_filters_again_the_results(self):
+        self.appliance.add_route('GET', '/rest/fc-networks?start=0&count=-1&filter=%22name%3D%27Net%27%22',
+                                 (200, {}, {"members": [{"name": "net"}, {"name": "net2"}]}))
+
+        self.assertEqual(self.run_coroutine(self.helper.get_by('name', 'Net')), [{"name": "net"}])
+
+    def test_create_fills_default_values_and_waits_for_task(self):
+        self.appliance.add_route('POST', '/rest/fc-networks', (202, {'Location': '/rest/tasks/1'}, ''))
+        self.appliance.add_route('GET', '/rest/tasks/1', (200, {}, RUNNING_TASK), (200, {}, RUNNING_TASK),
+                                 (200, {}, COMPLETED_TASK))
+        self.appliance.add_route('GET', '/rest/fc-networks/1', (200, {}, {"name": "net", "uri": "/rest/fc-networks/1"}))
+
+        result = self.run_coroutine(self.helper.create({"name": "net"}))
+
+        self.assertEqual(result, {"name": "net", "uri": "/rest/fc-networks/1"})
+        self.assertEqual(self.appliance.requests[0][3], '{"name": "net", "type": "FCNetworkV4"}')
+
+    def test_update_with_force(self):
+        self.appliance.add_route('PUT', '/rest/fc-networks/1?force=True', (200, {}, {"name": "updated"}))
+
+        result = self.run_coroutine(self.helper.update({"name": "updated", "uri": "/rest/fc-networks/1"}, force=True))
+
+        self.assertEqual(result, {"name": "updated"})
+
+    def test_delete_without_task(self):
+        self.appliance.add_route('DELETE', '/rest/fc-networks/1', (204, {}, ''))
+
+        self.assertTrue(self.run_coroutine(self.helper.delete('/rest/fc-networks/1')))
+
+    def test_delete_with_task_error(self):
+        failed_task = dict(RUNNING_TASK, taskState="Error", taskErrors=[{"message": "In use", "errorCode": "IN_USE"}])
+        self.appliance.add_route('DELETE', '/rest/fc-networks/1', (202, {'Location': '/rest/tasks/1'}, ''))
+        self.appliance.add_route('GET', '/rest/tasks/1', (200, {}, failed_task))
+
+        try:
+            self.run_coroutine(self.helper.delete('/rest/fc-networks/1'))
+        except HPOneViewTaskError as e:
+            self.assertEqual(e.msg, "In use")
+            self.assertEqual(e.error_code, "IN_USE")
+        else:
+            self.fail()
+
+    def test_wait_for_task_with_timeout(self):
+        self.appliance.add_route('GET', '/rest/tasks/1', (200, {}, RUNNING_TASK))
+
+        self.assertRaises(HPOneViewTimeout, self.run_coroutine, self.helper.wait_for_task(RUNNING_TASK, timeout=0.05))
+
+    def test_do_get_validates_uri(self):
+        self.assertRaises(HPOneViewUnknownType, self.run_coroutine, self.helper.do_get('/rest/ethernet-networks/1'))
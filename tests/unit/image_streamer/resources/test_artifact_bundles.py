@@ -129,7 +129,7 @@ class ArtifactBundlesTest(TestCase):
         destination = '~/image.zip'
         self._client.download_artifact_bundle('0ABDE00534F', destination)
 
-        mock_download.assert_called_once_with('/rest/artifact-bundles/download/0ABDE00534F', destination)
+        mock_download.assert_called_once_with('/rest/artifact-bundles/download/0ABDE00534F', destination, resume=False)
 
     @mock.patch.object(ResourceClient, 'download')
     def test_download_called_once_by_uri(self, mock_download):
@@ -138,7 +138,14 @@ class ArtifactBundlesTest(TestCase):
 
         self._client.download_artifact_bundle(uri, destination)
 
-        mock_download.assert_called_once_with('/rest/artifact-bundles/download/0ABDE00534F', destination)
+        mock_download.assert_called_once_with('/rest/artifact-bundles/download/0ABDE00534F', destination, resume=False)
+
+    @mock.patch.object(ResourceClient, 'download')
+    def test_download_resumes_partial_download(self, mock_download):
+        destination = '~/image.zip'
+        self._client.download_artifact_bundle('0ABDE00534F', destination, resume=True)
+
+        mock_download.assert_called_once_with('/rest/artifact-bundles/download/0ABDE00534F', destination, resume=True)
 
     @mock.patch.object(ResourceClient, 'download')
     def test_download_archive_artifact_bundle_by_id_called_once(self, mock_download):
@@ -177,7 +184,16 @@ class ArtifactBundlesTest(TestCase):
 
         self._client.upload_bundle_from_file(filepath)
 
-        mock_upload.assert_called_once_with(filepath)
+        mock_upload.assert_called_once_with(filepath, progress_callback=None)
+
+    @mock.patch.object(ResourceClient, 'upload')
+    def test_upload_artifact_bundle_with_progress_callback(self, mock_upload):
+        filepath = "~/HPE-ImageStreamer-Developer-2016-09-12.zip"
+        progress_callback = mock.Mock()
+
+        self._client.upload_bundle_from_file(filepath, progress_callback=progress_callback)
+
+        mock_upload.assert_called_once_with(filepath, progress_callback=progress_callback)
 
     @mock.patch.object(ResourceClient, 'upload')
     def test_upload_backup_artifact_bundle_called_once(self, mock_upload):
@@ -188,7 +204,7 @@ class ArtifactBundlesTest(TestCase):
 
         expected_uri = '/rest/artifact-bundles/backups/archive?deploymentGrpUri=' + deployment_groups
 
-        mock_upload.assert_called_once_with(filepath, expected_uri)
+        mock_upload.assert_called_once_with(filepath, expected_uri, progress_callback=None)
 
     @mock.patch.object(ResourceClient, 'upload')
     def test_upload_backup_artifact_bundle_called_once_with_id(self, mock_upload):
@@ -199,7 +215,7 @@ class ArtifactBundlesTest(TestCase):
 
         expected_uri = '/rest/artifact-bundles/backups/archive?' \
                        'deploymentGrpUri=/rest/deployment-groups/00c1344d-e4dd-43c3-a733-1664e159a36f'
-        mock_upload.assert_called_once_with(filepath, expected_uri)
+        mock_upload.assert_called_once_with(filepath, expected_uri, progress_callback=None)
 
     @mock.patch.object(ResourceClient, 'update')
     def test_extract_called_once(self, mock_update):
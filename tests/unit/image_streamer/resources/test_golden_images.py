@@ -120,7 +120,18 @@ class GoldenImagesTest(TestCase):
 
         expected_uri = '/rest/golden-images?name=GoldenImageName&description=Description%20of%20this%20Golden%20Image'
 
-        mock_upload.assert_called_once_with(filepath, expected_uri)
+        mock_upload.assert_called_once_with(filepath, expected_uri, progress_callback=None)
+
+    @mock.patch.object(ResourceClient, 'upload')
+    def test_upload_with_progress_callback(self, mock_upload):
+        information = {"name": "GoldenImageName"}
+        filepath = "test/SPPgen9snap6.2015_0405.81.iso"
+        progress_callback = mock.Mock()
+
+        self._client.upload(filepath, information, progress_callback=progress_callback)
+
+        mock_upload.assert_called_once_with(filepath, '/rest/golden-images?name=GoldenImageName&description=',
+                                            progress_callback=progress_callback)
 
     @mock.patch.object(ResourceClient, 'upload')
     def test_upload_without_description(self, mock_upload):
@@ -134,7 +145,7 @@ class GoldenImagesTest(TestCase):
 
         expected_uri = '/rest/golden-images?name=GoldenImageName&description='
 
-        mock_upload.assert_called_once_with(filepath, expected_uri)
+        mock_upload.assert_called_once_with(filepath, expected_uri, progress_callback=None)
 
     @mock.patch.object(ResourceClient, 'upload')
     def test_upload_with_empty_information(self, mock_upload):
@@ -145,7 +156,7 @@ class GoldenImagesTest(TestCase):
 
         expected_uri = '/rest/golden-images?name=&description='
 
-        mock_upload.assert_called_once_with(filepath, expected_uri)
+        mock_upload.assert_called_once_with(filepath, expected_uri, progress_callback=None)
 
     @mock.patch.object(ResourceClient, 'download')
     def test_download_archive_called_once_with_id(self, mock_download):
@@ -175,7 +186,7 @@ class GoldenImagesTest(TestCase):
         self._client.download(uri, file_path)
 
         mock_download.assert_called_once_with('/rest/golden-images/download/3518be0e-17c1-4189-8f81-83f3724f6155',
-                                              file_path)
+                                              file_path, resume=False)
 
     @mock.patch.object(ResourceClient, 'download')
     def test_download_called_once_with_id(self, mock_download):
@@ -185,4 +196,14 @@ class GoldenImagesTest(TestCase):
         self._client.download(id, file_path)
 
         mock_download.assert_called_once_with('/rest/golden-images/download/3518be0e-17c1-4189-8f81-83f3724f6155',
-                                              file_path)
+                                              file_path, resume=False)
+
+    @mock.patch.object(ResourceClient, 'download')
+    def test_download_resumes_partial_download(self, mock_download):
+        id = '3518be0e-17c1-4189-8f81-83f3724f6155'
+        file_path = "~/archive.log"
+
+        self._client.download(id, file_path, resume=True)
+
+        mock_download.assert_called_once_with('/rest/golden-images/download/3518be0e-17c1-4189-8f81-83f3724f6155',
+                                              file_path, resume=True)
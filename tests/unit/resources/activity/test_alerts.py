@@ -45,6 +45,13 @@ class AlertsTest(TestCase):
                                          filter="name='name'",
                                          query='', sort='name:ascending', start=0, view='day')
 
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all(self, mock_iter_all):
+        self._client.iter_all(filter="name='name'", prefetch=True)
+        mock_iter_all.assert_called_once_with(count=-1,
+                                              filter="name='name'",
+                                              query='', sort='', start=0, view='', prefetch=True)
+
     @mock.patch.object(ResourceClient, 'get')
     def test_get_specific(self, mock_get):
         self._client.get('35323930-4936-4450-5531-303153474820')
@@ -48,6 +48,13 @@ class TasksTest(TestCase):
                                                 '.resourceCatgory=\'appliance\'"',
                                          query='', sort='name:ascending', start=0, view='day')
 
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_iter_all(self, mock_iter_all):
+        self._client.iter_all(fields='parentTaskUri,owner,name', prefetch=True)
+
+        mock_iter_all.assert_called_once_with(count=-1, fields='parentTaskUri,owner,name', filter='',
+                                              query='', sort='', start=0, view='', prefetch=True)
+
     @mock.patch.object(ResourceClient, 'get')
     def test_get_specific(self, mock_get):
         self._client.get('35323930-4936-4450-5531-303153474820')
@@ -26,6 +26,7 @@ import unittest
 import mock
 
 from hpOneView.connection import connection
+from hpOneView.exceptions import HPOneViewException, HPOneViewResourceNotFound
 from hpOneView.resources.networking.ethernet_networks import EthernetNetworks
 from hpOneView.resources.networking.uplink_sets import UplinkSets
 from hpOneView.resources.resource import Resource, ResourceHelper
@@ -108,12 +109,30 @@ class UplinkSetsTest(unittest.TestCase):
         ]
 
         self._uplink_sets.data = uplink
-        mock_get_enet.side_effect = result_get_enet
+        networks_by_uri = dict(zip(uplink['networkUris'], result_get_enet))
+        mock_get_enet.side_effect = lambda uri: networks_by_uri[uri]
         result = self._uplink_sets.get_ethernet_networks()
 
         self.assertEqual(mock_get_enet.call_count, 3)
         self.assertEqual(result_get_enet, result)
 
+    @mock.patch.object(EthernetNetworks, 'get_by_uri')
+    def test_get_ethernet_networks_raises_error_of_a_network(self, mock_get_enet):
+        self._uplink_sets.data = {
+            'name': 'UplinkName',
+            'networkUris': ['/rest/ethernet-networks/1', '/rest/ethernet-networks/2'],
+        }
+
+        def get_by_uri(uri):
+            if uri == '/rest/ethernet-networks/2':
+                raise HPOneViewException('Not found')
+            return {'uri': uri}
+
+        mock_get_enet.side_effect = get_by_uri
+
+        self.assertRaises(HPOneViewException, self._uplink_sets.get_ethernet_networks)
+        self.assertEqual(mock_get_enet.call_count, 2)
+
     @mock.patch.object(UplinkSets, 'get_by_uri')
     def test_get_ethernet_networks_with_empty_list(self, mock_uplink_get):
         uplink = {
@@ -196,6 +215,20 @@ class UplinkSetsTest(unittest.TestCase):
         self._uplink_sets.add_ethernet_networks(ethernet_to_add)
         mock_uplink_update.assert_called_once_with(uplink_to_update)
 
+    @mock.patch.object(UplinkSets, 'update')
+    @mock.patch.object(EthernetNetworks, 'get_by_name')
+    def test_add_ethernet_network_that_does_not_exist(self, mock_ethnet_get, mock_uplink_update):
+        self._uplink_sets.data = {'name': 'UplinkName'}
+        mock_ethnet_get.return_value = None
+
+        try:
+            self._uplink_sets.add_ethernet_networks(['eth1'])
+        except HPOneViewResourceNotFound as e:
+            self.assertEqual(e.msg, "Ethernet: eth1 does not exist")
+        else:
+            self.fail()
+        mock_uplink_update.assert_not_called()
+
     @mock.patch.object(UplinkSets, 'update')
     @mock.patch.object(EthernetNetworks, 'get_by_name')
     def test_not_add_ethernet_networks_already_associated(self, mock_uplink_get, mock_uplink_update):
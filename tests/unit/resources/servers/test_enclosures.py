@@ -26,6 +26,7 @@ from unittest import TestCase
 import mock
 
 from hpOneView.connection import connection
+from hpOneView.exceptions import HPOneViewException
 from hpOneView.resources.servers.enclosures import Enclosures
 from hpOneView.resources.resource import (Resource, ResourceHelper, ResourcePatchMixin,
                                           ResourceZeroBodyMixin, ResourceUtilizationMixin)
@@ -85,6 +86,47 @@ class EnclosuresTest(TestCase):
         expected_return = enclosure
         self.assertEqual(actual_return.data, expected_return)
 
+    @mock.patch.object(Enclosures, 'get_all')
+    def test_get_by_hostname_should_filter_on_server(self, mock_get_all):
+        mock_get_all.return_value = []
+        self._enclosures.get_by_hostname('1.1.1.1')
+        self.assertEqual(mock_get_all.call_args_list[0], mock.call(
+            filter="\"activeOaPreferredIP='1.1.1.1' OR standbyOaPreferredIP='1.1.1.1'\""))
+
+    @mock.patch.object(ResourceHelper, 'do_get')
+    @mock.patch.object(Enclosures, 'get_all')
+    def test_get_by_hostname_should_use_index_when_filter_finds_nothing(self, mock_get_all, mock_do_get):
+        enclosure = {'uri': '/rest/enclosures/1', 'activeOaPreferredIP': '1.1.1.1'}
+        mock_get_all.side_effect = [[], [enclosure]]
+        mock_do_get.return_value = enclosure
+
+        self.assertEqual(self._enclosures.get_by_hostname('1.1.1.1').data, enclosure)
+        self.assertEqual(mock_get_all.call_args_list[1], mock.call(filter=''))
+
+    @mock.patch.object(Enclosures, 'get_all')
+    def test_get_by_hostname_should_raise_errors_other_than_invalid_filter(self, mock_get_all):
+        mock_get_all.side_effect = HPOneViewException({'errorCode': 'AUTHORIZATION', 'message': 'not authorized'})
+
+        self.assertRaises(HPOneViewException, self._enclosures.get_by_hostname, '1.1.1.1')
+        mock_get_all.assert_called_once()
+
+    @mock.patch.object(ResourceHelper, 'do_get')
+    @mock.patch.object(Enclosures, 'get_all')
+    def test_get_by_hostname_should_use_index_when_filter_rejected(self, mock_get_all, mock_do_get):
+        enclosure = {'uri': '/rest/enclosures/1', 'standbyOaPreferredIP': '1.1.1.1', 'modified': '2019-01-01'}
+        filter_error = HPOneViewException({'errorCode': 'INVALID_FILTER', 'message': 'invalid filter'})
+        mock_get_all.side_effect = [filter_error, [enclosure], filter_error, []]
+        mock_do_get.return_value = enclosure
+
+        self.assertEqual(self._enclosures.get_by_hostname('1.1.1.1').data, enclosure)
+        self.assertEqual(self._enclosures.get_by_hostname('1.1.1.1').data, enclosure)
+
+        hostname_filter = "\"activeOaPreferredIP='1.1.1.1' OR standbyOaPreferredIP='1.1.1.1'\""
+        self.assertEqual(mock_get_all.call_args_list, [mock.call(filter=hostname_filter), mock.call(filter=''),
+                                                       mock.call(filter=hostname_filter),
+                                                       mock.call(filter="\"modified>='2019-01-01'\"")])
+        mock_do_get.assert_has_calls([mock.call('/rest/enclosures/1'), mock.call('/rest/enclosures/1')])
+
     @mock.patch.object(Resource, 'create')
     def test_add_called_once(self, mock_create):
         information = {
@@ -40,6 +40,20 @@ class ServerHardwareTest(TestCase):
         self.uri = "/rest/server-hardware/1224242424"
         self._server_hardware.data = {"uri": self.uri}
 
+    @mock.patch.object(ResourceHelper, 'iter_all')
+    def test_get_by_index_should_find_server_hardware_by_mac(self, mock_iter_all):
+        server_hardware = {
+            'uri': '/rest/server-hardware/1',
+            'serialNumber': 'VCGE9KB041',
+            'portMap': {'deviceSlots': [{'physicalPorts': [
+                {'mac': '9C:B6:54:7D:17:B0', 'virtualPorts': [{'mac': '2A:A6:E0:00:00:01', 'wwpn': '10:00:2A'}]}]}]}}
+        mock_iter_all.return_value = iter([server_hardware])
+
+        self.assertEqual(self._server_hardware.get_by_index('mac', '2a:a6:e0:00:00:01'), [server_hardware])
+        self.assertEqual(self._server_hardware.get_by_index('serialNumber', 'VCGE9KB041'), [server_hardware])
+        self.assertEqual(self._server_hardware.get_by_index('wwn', '10:00:2A'), [server_hardware])
+        mock_iter_all.assert_called_once_with(filter='')
+
     @mock.patch.object(ResourceUtilizationMixin, 'get_utilization')
     def test_get_utilization_with_all_args(self, mock_get_utilization):
         self._server_hardware.get_utilization(fields='AmbientTemperature,AveragePower,PeakPower',
@@ -71,7 +71,18 @@ class BackupsTest(TestCase):
 
         self._client.download(download_uri, destination)
 
-        mock_download.assert_called_once_with('/rest/backups/archive/appliance_backup_2017-04-20_182809', destination)
+        mock_download.assert_called_once_with('/rest/backups/archive/appliance_backup_2017-04-20_182809', destination,
+                                              resume=False)
+
+    @mock.patch.object(ResourceClient, 'download')
+    def test_download_resumes_partial_download(self, mock_download):
+        download_uri = '/rest/backups/archive/appliance_backup_2017-04-20_182809'
+        destination = 'appliance_backup_2017-04-20_182809.bkp'
+
+        self._client.download(download_uri, destination, resume=True)
+
+        mock_download.assert_called_once_with('/rest/backups/archive/appliance_backup_2017-04-20_182809', destination,
+                                              resume=True)
 
     @mock.patch.object(ResourceClient, 'upload')
     def test_upload_artifact_bundle_called_once(self, mock_upload):
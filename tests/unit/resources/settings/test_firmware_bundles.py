@@ -42,4 +42,13 @@ class FirmwareBundlesTest(unittest.TestCase):
 
         self._firmware_bundles.upload(firmware_path)
 
-        mock_upload.assert_called_once_with(firmware_path, timeout=-1)
+        mock_upload.assert_called_once_with(firmware_path, timeout=-1, progress_callback=None)
+
+    @mock.patch.object(ResourceClient, 'upload')
+    def test_upload_with_progress_callback(self, mock_upload):
+        firmware_path = "test/SPPgen9snap6.2015_0405.81.iso"
+        progress_callback = mock.Mock()
+
+        self._firmware_bundles.upload(firmware_path, progress_callback=progress_callback)
+
+        mock_upload.assert_called_once_with(firmware_path, timeout=-1, progress_callback=progress_callback)
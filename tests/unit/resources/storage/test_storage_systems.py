@@ -26,6 +26,7 @@ import unittest
 import mock
 
 from hpOneView.connection import connection
+from hpOneView.exceptions import HPOneViewException
 from hpOneView.resources.storage.storage_systems import StorageSystems
 from hpOneView.resources.resource import ResourceClient
 
@@ -208,6 +209,45 @@ class StorageSystemsTest(unittest.TestCase):
 
         mock_get_by.assert_called_once_with(name="test name")
 
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_get_by_ip_hostname_should_filter_on_server(self, get_all):
+        get_all.return_value = []
+        self._storage_systems.get_by_ip_hostname("20.0.0.0")
+        self.assertEqual(get_all.call_args_list[0], mock.call(filter="\"credentials.ip_hostname='20.0.0.0'\""))
+
+    @mock.patch.object(ResourceClient, 'get')
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_get_by_hostname_should_use_index_when_filter_finds_nothing(self, get_all, get):
+        storage_system = {"uri": "/rest/storage-systems/1", "hostname": "10.0.0.0"}
+        get_all.side_effect = [[], [storage_system]]
+        get.return_value = storage_system
+
+        result = self._storage_systems.get_by_hostname("10.0.0.0")
+
+        self.assertEqual(result, storage_system)
+        get_all.assert_called_with(filter='')
+
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_get_by_hostname_should_raise_errors_other_than_invalid_filter(self, get_all):
+        get_all.side_effect = HPOneViewException({"errorCode": "AUTHORIZATION", "message": "not authorized"})
+
+        self.assertRaises(HPOneViewException, self._storage_systems.get_by_hostname, "10.0.0.0")
+        get_all.assert_called_once()
+
+    @mock.patch.object(ResourceClient, 'get')
+    @mock.patch.object(ResourceClient, 'get_all')
+    def test_get_by_hostname_should_use_index_when_filter_rejected(self, get_all, get):
+        storage_system = {"uri": "/rest/storage-systems/1", "hostname": "10.0.0.0"}
+        get_all.side_effect = [HPOneViewException({"errorCode": "INVALID_FILTER", "message": "invalid filter"}),
+                               [storage_system, {"uri": "/rest/storage-systems/2", "hostname": "20.0.0.0"}]]
+        get.return_value = storage_system
+
+        result = self._storage_systems.get_by_hostname("10.0.0.0")
+
+        self.assertEqual(result, storage_system)
+        get_all.assert_called_with(filter='')
+        get.assert_called_once_with("/rest/storage-systems/1")
+
     @mock.patch.object(ResourceClient, 'get_all')
     def test_get_by_ip_hostname_find_value(self, get_all):
         get_all.return_value = [
@@ -238,7 +278,8 @@ class StorageSystemsTest(unittest.TestCase):
         ]
 
         result = self._storage_systems.get_by_ip_hostname("30.0.0.0")
-        get_all.assert_called_once()
+        self.assertEqual(get_all.call_args_list, [mock.call(filter="\"credentials.ip_hostname='30.0.0.0'\""),
+                                                  mock.call(filter='')])
         self.assertIsNone(result)
 
     @mock.patch.object(ResourceClient, 'get_all')
@@ -52,6 +52,16 @@ class VolumesTest(unittest.TestCase):
 
         mock_get_by.assert_called_once_with('name', 'Test Volume')
 
+    @mock.patch.object(ResourceClient, 'iter_all')
+    def test_get_by_index_should_find_volume_by_wwn(self, mock_iter_all):
+        volume = {'uri': '/rest/storage-volumes/1', 'name': 'Volume1', 'wwn': 'DC:00:00:00:00:00:00:01'}
+        mock_iter_all.return_value = iter([volume, {'uri': '/rest/storage-volumes/2', 'name': 'Volume2'}])
+
+        result = self._volumes.get_by_index('wwn', 'dc:00:00:00:00:00:00:01')
+
+        self.assertEqual(result, [volume])
+        mock_iter_all.assert_called_once_with(filter='')
+
     @mock.patch.object(ResourceClient, 'get')
     def test_get_by_id_called_once(self, mock_get):
         self._volumes.get('3518be0e-17c1-4189-8f81-83f3724f6155')
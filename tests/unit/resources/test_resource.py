@@ -20,12 +20,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 ###
-import io
+import threading
+import time
 import unittest
 import mock
 from mock import call
 
-from tests.test_utils import mock_builtin
 from hpOneView.connection import connection
 from hpOneView import exceptions
 from hpOneView.resources.resource import (ResourceClient, ResourceHelper, ResourceFileHandlerMixin,
@@ -34,7 +34,8 @@ from hpOneView.resources.resource import (ResourceClient, ResourceHelper, Resour
                                           RESOURCE_CLIENT_INVALID_ID, UNRECOGNIZED_URI, TaskMonitor,
                                           RESOURCE_CLIENT_TASK_EXPECTED, RESOURCE_ID_OR_URI_REQUIRED,
                                           transform_list_to_dict, extract_id_from_uri, merge_resources,
-                                          merge_default_values, unavailable_method)
+                                          merge_default_values, unavailable_method, build_page_uris,
+                                          fan_out, get_fan_out_results)
 
 
 class StubResourceFileHandler(ResourceFileHandlerMixin, Resource):
@@ -99,7 +100,8 @@ class ResourceFileHandlerMixinTest(BaseTest):
 
         self.resource_client.upload(filepath, uri)
 
-        mock_post_multipart.assert_called_once_with(uri, filepath, "SPPgen9snap6.2015_0405.81.iso")
+        mock_post_multipart.assert_called_once_with(uri, filepath, "SPPgen9snap6.2015_0405.81.iso",
+                                                    progress_callback=None)
 
     @mock.patch.object(connection, "post_multipart_with_response_handling")
     def test_upload_should_call_post_multipart_with_resource_uri_when_not_uri_provided(self, mock_post_multipart):
@@ -108,7 +110,7 @@ class ResourceFileHandlerMixinTest(BaseTest):
 
         self.resource_client.upload(filepath)
 
-        mock_post_multipart.assert_called_once_with("/rest/testuri", mock.ANY, mock.ANY)
+        mock_post_multipart.assert_called_once_with("/rest/testuri", mock.ANY, mock.ANY, progress_callback=None)
 
     @mock.patch.object(connection, "post_multipart_with_response_handling")
     @mock.patch.object(TaskMonitor, "wait_for_task")
@@ -160,49 +162,60 @@ class ResourceFileHandlerMixinTest(BaseTest):
 
         self.assertEqual(result, fake_response_body)
 
-    @mock.patch.object(connection, "download_to_stream")
-    @mock.patch(mock_builtin("open"))
-    def test_download_should_call_download_to_stream_with_given_uri(self, mock_open, mock_download_to_stream):
+    @mock.patch.object(connection, "download_to_file")
+    def test_download_should_call_download_to_file_with_given_uri(self, mock_download_to_file):
         file_path = "~/archive.log"
         uri = "/rest/testuri/3ec91dd2-0ebb-4484-8b2d-90d065114315"
-        mock_open.return_value = io.StringIO()
 
         self.resource_client.download(uri, file_path)
 
-        mock_download_to_stream.assert_called_once_with(mock.ANY, uri)
+        mock_download_to_file.assert_called_once_with(uri, file_path, resume=False, progress_callback=None)
 
-    @mock.patch.object(connection, "download_to_stream")
-    @mock.patch(mock_builtin("open"))
-    def test_download_should_call_download_to_stream_with_open_file(self, mock_open, mock_download_to_stream):
+    @mock.patch.object(connection, "download_to_file")
+    def test_download_should_resume_download_when_requested(self, mock_download_to_file):
         file_path = "~/archive.log"
         uri = "/rest/testuri/3ec91dd2-0ebb-4484-8b2d-90d065114315"
-        fake_file = io.StringIO()
-        mock_open.return_value = fake_file
 
-        self.resource_client.download(uri, file_path)
+        self.resource_client.download(uri, file_path, resume=True)
 
-        mock_open.assert_called_once_with(file_path, 'wb')
-        mock_download_to_stream.assert_called_once_with(fake_file, mock.ANY)
+        mock_download_to_file.assert_called_once_with(uri, file_path, resume=True, progress_callback=None)
 
-    @mock.patch.object(connection, "download_to_stream")
-    @mock.patch(mock_builtin("open"))
-    def test_download_should_return_true_when_success(self, mock_open, mock_download_to_stream):
+    @mock.patch.object(connection, "download_to_file")
+    def test_download_should_pass_progress_callback(self, mock_download_to_file):
         file_path = "~/archive.log"
         uri = "/rest/testuri/3ec91dd2-0ebb-4484-8b2d-90d065114315"
-        mock_download_to_stream.return_value = True
-        mock_open.return_value = io.StringIO()
+        progress_callback = mock.Mock()
+
+        self.resource_client.download(uri, file_path, progress_callback=progress_callback)
+
+        mock_download_to_file.assert_called_once_with(uri, file_path, resume=False, progress_callback=progress_callback)
+
+    @mock.patch.object(connection, "post_multipart_with_response_handling")
+    def test_upload_should_pass_progress_callback(self, mock_post_multipart):
+        filepath = "test/SPPgen9snap6.2015_0405.81.iso"
+        progress_callback = mock.Mock()
+        mock_post_multipart.return_value = None, mock.Mock()
+
+        self.resource_client.upload(filepath, progress_callback=progress_callback)
+
+        mock_post_multipart.assert_called_once_with(mock.ANY, filepath, "SPPgen9snap6.2015_0405.81.iso",
+                                                    progress_callback=progress_callback)
+
+    @mock.patch.object(connection, "download_to_file")
+    def test_download_should_return_true_when_success(self, mock_download_to_file):
+        file_path = "~/archive.log"
+        uri = "/rest/testuri/3ec91dd2-0ebb-4484-8b2d-90d065114315"
+        mock_download_to_file.return_value = True
 
         result = self.resource_client.download(uri, file_path)
 
         self.assertTrue(result)
 
-    @mock.patch.object(connection, "download_to_stream")
-    @mock.patch(mock_builtin("open"))
-    def test_download_should_return_false_when_error(self, mock_open, mock_download_to_stream):
+    @mock.patch.object(connection, "download_to_file")
+    def test_download_should_return_false_when_error(self, mock_download_to_file):
         file_path = "~/archive.log"
         uri = "/rest/testuri/3ec91dd2-0ebb-4484-8b2d-90d065114315"
-        mock_download_to_stream.return_value = False
-        mock_open.return_value = io.StringIO()
+        mock_download_to_file.return_value = False
 
         result = self.resource_client.download(uri, file_path)
 
@@ -322,6 +335,32 @@ class ResourcePatchMixinTest(BaseTest):
         self.resource_client = StubResourcePatch(self.connection)
         super(ResourcePatchMixinTest, self).setUp(self.resource_client)
 
+    @mock.patch.object(Resource, "ensure_resource_data")
+    @mock.patch.object(connection, "patch")
+    def test_patch_changes_should_replace_changed_fields(self, mock_patch, mock_ensure_resource):
+        self.resource_client.data = {"uri": "/rest/testuri", "name": "name", "description": "old", "state": "Normal"}
+        mock_patch.return_value = None, {"uri": "/rest/testuri", "name": "new_name", "description": "new"}
+
+        self.resource_client.patch_changes({"name": "new_name", "description": "new", "state": "Normal"})
+
+        mock_patch.assert_called_once_with(
+            "/rest/testuri",
+            [{"op": "replace", "path": "/description", "value": "new"},
+             {"op": "replace", "path": "/name", "value": "new_name"}],
+            custom_headers={"Content-Type": "application/json-patch+json"})
+        self.assertEqual(self.resource_client.data, {"uri": "/rest/testuri", "name": "new_name", "description": "new"})
+        mock_ensure_resource.assert_called_once_with(update_data=True)
+
+    @mock.patch.object(Resource, "ensure_resource_data")
+    @mock.patch.object(connection, "patch")
+    def test_patch_changes_without_changes_should_not_send_request(self, mock_patch, mock_ensure_resource):
+        self.resource_client.data = {"uri": "/rest/testuri", "name": "name"}
+
+        result = self.resource_client.patch_changes({"name": "name"})
+
+        mock_patch.assert_not_called()
+        self.assertIs(result, self.resource_client)
+
     @mock.patch.object(Resource, "ensure_resource_data")
     @mock.patch.object(connection, "patch")
     def test_patch_request_when_id_is_provided_v200(self, mock_patch, mock_ensure_resource):
@@ -533,6 +572,61 @@ class ResourceTest(BaseTest):
         mock_do_put.assert_called_once()
         mock_ensure_resource.assert_called_once()
 
+    @mock.patch.object(ResourceHelper, "do_get_if_modified")
+    @mock.patch.object(ResourceHelper, "do_get")
+    def test_ensure_resource_should_trust_recent_data_with_etag(self, mock_do_get, mock_do_get_if_modified):
+        self.connection.set_trusted_data_age(60)
+        self.resource_client.data = {"uri": "/rest/testuri/1", "name": "a name", "eTag": "1-abc"}
+
+        self.resource_client.ensure_resource_data(update_data=True)
+
+        mock_do_get.assert_not_called()
+        mock_do_get_if_modified.assert_not_called()
+        self.assertTrue(self.resource_client.is_data_trusted())
+
+    @mock.patch.object(ResourceHelper, "do_put")
+    @mock.patch.object(ResourceHelper, "do_get_if_modified")
+    def test_update_should_not_retrieve_trusted_data(self, mock_do_get_if_modified, mock_do_put):
+        self.connection.set_trusted_data_age(60)
+        self.resource_client.data = {"uri": "/rest/testuri/1", "name": "a name", "eTag": "1-abc"}
+        mock_do_put.return_value = {"uri": "/rest/testuri/1", "name": "renamed", "eTag": "2-def"}
+
+        self.resource_client.update({"name": "renamed"})
+
+        mock_do_get_if_modified.assert_not_called()
+        mock_do_put.assert_called_once_with("/rest/testuri/1", {"uri": "/rest/testuri/1", "name": "renamed",
+                                                                "eTag": "1-abc"}, -1, None)
+
+    @mock.patch("time.time")
+    @mock.patch.object(ResourceHelper, "do_get_if_modified")
+    def test_ensure_resource_should_retrieve_data_older_than_trusted_age(self, mock_do_get_if_modified, mock_time):
+        mock_time.return_value = 1000.0
+        self.connection.set_trusted_data_age(60)
+        self.resource_client.data = {"uri": "/rest/testuri/1", "name": "a name", "eTag": "1-abc"}
+        mock_do_get_if_modified.return_value = None
+
+        mock_time.return_value = 1061.0
+        self.assertFalse(self.resource_client.is_data_trusted())
+        self.resource_client.ensure_resource_data(update_data=True)
+
+        mock_do_get_if_modified.assert_called_once_with("/rest/testuri/1", "1-abc")
+        self.assertTrue(self.resource_client.is_data_trusted())
+
+    @mock.patch.object(ResourceHelper, "do_get")
+    def test_ensure_resource_should_retrieve_data_without_etag(self, mock_do_get):
+        self.connection.set_trusted_data_age(60)
+        self.resource_client.data = {"uri": "/rest/testuri/1", "name": "a name"}
+        mock_do_get.return_value = {"uri": "/rest/testuri/1", "name": "a name"}
+
+        self.resource_client.ensure_resource_data(update_data=True)
+
+        mock_do_get.assert_called_once_with("/rest/testuri/1")
+
+    def test_data_is_not_trusted_by_default(self):
+        self.resource_client.data = {"uri": "/rest/testuri/1", "name": "a name", "eTag": "1-abc"}
+
+        self.assertFalse(self.resource_client.is_data_trusted())
+
     def test_ensure_resource_raise_unique_identifier_exception(self):
         self.resource_client.data = []
         self.assertRaises(exceptions.HPOneViewMissingUniqueIdentifiers,
@@ -596,6 +690,132 @@ class ResourceTest(BaseTest):
 
         mock_get.assert_called_once_with(uri)
 
+    @mock.patch.object(connection, "get")
+    def test_get_all_with_fields_and_view(self, mock_get):
+        self.resource_client.get_all(fields="uri,name,status", view="expand")
+        uri = "{resource_uri}?start=0&count=-1&view=expand&fields=uri%2Cname%2Cstatus".format(resource_uri=self.URI)
+
+        mock_get.assert_called_once_with(uri)
+
+    @mock.patch.object(connection, "get")
+    def test_get_all_with_class_default_projection(self, mock_get):
+        self.resource_client.DEFAULT_FIELDS = "uri,name"
+        self.resource_client.DEFAULT_VIEW = "expand"
+        mock_get.return_value = {"members": []}
+
+        self.resource_client.get_all()
+        self.resource_client.get_all(fields="", view="")
+
+        mock_get.assert_has_calls([
+            mock.call("{resource_uri}?start=0&count=-1&view=expand&fields=uri%2Cname".format(resource_uri=self.URI)),
+            mock.call("{resource_uri}?start=0&count=-1".format(resource_uri=self.URI))])
+
+    @mock.patch.object(connection, "get")
+    def test_iter_all_with_fields(self, mock_get):
+        mock_get.return_value = {"members": [{"uri": "/rest/testuri/1"}]}
+
+        result = list(self.resource_client.iter_all(fields="uri"))
+
+        self.assertEqual(result, [{"uri": "/rest/testuri/1"}])
+        mock_get.assert_called_once_with("{resource_uri}?start=0&count=-1&fields=uri".format(resource_uri=self.URI))
+
+    @mock.patch.object(Resource, "get_all")
+    def test_get_by_with_fields_should_include_filtered_field(self, mock_get_all):
+        mock_get_all.return_value = [{"uri": "/rest/testuri/1", "status": "OK"}]
+
+        self.resource_client.get_by("status", "OK", fields="uri")
+
+        mock_get_all.assert_called_once_with(filter="\"status='OK'\"", fields="uri,status")
+
+    @mock.patch.object(Resource, "get_all")
+    def test_get_by_name_with_fields_should_discard_etag(self, mock_get_all):
+        mock_get_all.return_value = [{"uri": "/rest/testuri/1", "name": "a name", "eTag": "1-abc"}]
+
+        result = self.resource_client.get_by_name("a name", fields="status,eTag")
+
+        mock_get_all.assert_called_once_with(filter="\"name='a name'\"", fields="status,eTag,uri,name")
+        self.assertEqual(result.data, {"uri": "/rest/testuri/1", "name": "a name"})
+
+    @mock.patch.object(connection, "get")
+    def test_get_by_index_should_keep_index_for_connection(self, mock_get):
+        mock_get.side_effect = [
+            {"members": [{"uri": "/rest/testuri/1", "name": "Name1", "modified": "2019-01-01T10:00:00.000Z"},
+                         {"uri": "/rest/testuri/2", "name": "Name2", "modified": "2019-01-02T10:00:00.000Z"}]},
+            {"members": []},
+            {"members": [{"uri": "/rest/testuri/1"}]}]
+
+        result = self.resource_client.get_by_index("name", "name2")
+        self.resource_client.get_index().refresh_interval = 0
+        other_resource = StubResource(self.connection)
+
+        self.assertEqual(result, [{"uri": "/rest/testuri/2", "name": "Name2", "modified": "2019-01-02T10:00:00.000Z"}])
+        self.assertEqual(other_resource.get_by_index("uri", "/rest/testuri/1")[0]["name"], "Name1")
+        self.assertEqual(other_resource.get_by_index("name", "Name2", refresh=False), [])
+        self.assertEqual(mock_get.call_args_list, [
+            mock.call("/rest/testuri?start=0&count=-1"),
+            mock.call("/rest/testuri?start=0&count=-1&filter=%22modified%3E%3D%272019-01-02T10%3A00%3A00.000Z%27%22"),
+            mock.call("/rest/testuri?start=0&count=-1&fields=uri")])
+
+    @mock.patch.object(connection, "get")
+    def test_get_changes_should_return_changes_since_last_call(self, mock_get):
+        member = {"uri": "/rest/testuri/1", "modified": "2019-01-01T10:00:00.000Z"}
+        mock_get.side_effect = [{"members": [member]}, {"members": []}, {"members": []}]
+
+        self.assertEqual(self.resource_client.get_changes(), {"modified": [member], "deleted": []})
+        self.assertEqual(StubResource(self.connection).get_changes(), {"modified": [], "deleted": ["/rest/testuri/1"]})
+        mock_get.assert_called_with("/rest/testuri?start=0&count=-1&fields=uri")
+
+    @mock.patch.object(TaskMonitor, "wait_for_tasks")
+    @mock.patch.object(connection, "post")
+    def test_bulk_create_should_wait_for_all_tasks_together(self, mock_post, mock_wait_for_tasks):
+        task1 = {"uri": "/rest/tasks/1"}
+        task2 = {"uri": "/rest/tasks/2"}
+        mock_post.side_effect = [(task1, None), (None, {"uri": "/rest/testuri/2", "name": "Name2"}), (task2, None)]
+        error = exceptions.HPOneViewTaskError("Failed")
+        mock_wait_for_tasks.return_value = [dict(task=task1, result={"uri": "/rest/testuri/1", "name": "Name1"},
+                                                 error=None),
+                                            dict(task=task2, result=None, error=error)]
+
+        items = [{"name": "Name1"}, {"name": "Name2"}, {"name": "Name3"}]
+        result = self.resource_client.bulk_create(items, timeout=60, max_workers=1)
+
+        self.assertEqual([item["item"] for item in result], items)
+        self.assertEqual(result[0]["result"].data, {"uri": "/rest/testuri/1", "name": "Name1"})
+        self.assertEqual(result[1]["result"].data, {"uri": "/rest/testuri/2", "name": "Name2"})
+        self.assertIsNone(result[2]["result"])
+        self.assertEqual([item["error"] for item in result], [None, None, error])
+        mock_post.assert_has_calls([call(self.URI, {"name": "Name1", "type": "typeV300"}, custom_headers=None),
+                                    call(self.URI, {"name": "Name2", "type": "typeV300"}, custom_headers=None),
+                                    call(self.URI, {"name": "Name3", "type": "typeV300"}, custom_headers=None)])
+        mock_wait_for_tasks.assert_called_once_with([task1, task2], timeout=60, concurrency=1)
+
+    @mock.patch.object(TaskMonitor, "wait_for_tasks")
+    @mock.patch.object(connection, "put")
+    def test_bulk_update_should_report_invalid_uri(self, mock_put, mock_wait_for_tasks):
+        mock_put.return_value = None, {"uri": "/rest/testuri/1", "name": "New Name"}
+        mock_wait_for_tasks.return_value = []
+
+        result = self.resource_client.bulk_update([{"uri": "/rest/testuri/1", "name": "New Name"},
+                                                   {"uri": "/rest/other/2", "name": "Other"}], force=True)
+
+        self.assertEqual(result[0]["result"].data, {"uri": "/rest/testuri/1", "name": "New Name"})
+        self.assertIsInstance(result[1]["error"], exceptions.HPOneViewUnknownType)
+        mock_put.assert_called_once_with("/rest/testuri/1?force=True", {"uri": "/rest/testuri/1", "name": "New Name"},
+                                         custom_headers=None)
+
+    @mock.patch.object(TaskMonitor, "wait_for_tasks")
+    @mock.patch.object(connection, "delete")
+    def test_bulk_delete(self, mock_delete, mock_wait_for_tasks):
+        task = {"uri": "/rest/tasks/1"}
+        mock_delete.side_effect = [(task, None), (None, None)]
+        mock_wait_for_tasks.return_value = [dict(task=task, result=task, error=None)]
+
+        result = self.resource_client.bulk_delete(["/rest/testuri/1", {"uri": "/rest/testuri/2"}], max_workers=1)
+
+        self.assertEqual([item["result"] for item in result], [task, True])
+        mock_delete.assert_has_calls([call("/rest/testuri/1", custom_headers=None),
+                                      call("/rest/testuri/2", custom_headers=None)])
+
     @mock.patch.object(connection, "get")
     def test_get_all_with_custom_uri(self, mock_get):
         self.resource_helper.get_all(uri="/rest/testuri/12467836/subresources")
@@ -739,6 +959,171 @@ class ResourceTest(BaseTest):
 
         self.assertEqual(result, [])
 
+    @mock.patch.object(connection, "get")
+    def test_get_all_should_request_pages_in_parallel_when_enabled(self, mock_get):
+        self.connection.set_max_page_workers(4)
+        pages = {
+            "/rest/testuri?start=0&count=-1": {"nextPageUri": "/rest/testuri?start=3&count=3", "total": 8,
+                                               "members": [{"id": "1"}, {"id": "2"}, {"id": "3"}]},
+            "/rest/testuri?start=3&count=3": {"nextPageUri": "/rest/testuri?start=6&count=3", "total": 8,
+                                              "members": [{"id": "4"}, {"id": "5"}, {"id": "6"}]},
+            "/rest/testuri?start=6&count=2": {"nextPageUri": None, "total": 8,
+                                              "members": [{"id": "7"}, {"id": "8"}]}}
+        mock_get.side_effect = lambda uri: pages[uri]
+
+        result = self.resource_client.get_all()
+
+        self.assertEqual([item["id"] for item in result], ["1", "2", "3", "4", "5", "6", "7", "8"])
+        self.assertEqual(mock_get.call_count, 3)
+
+    @mock.patch.object(connection, "get")
+    def test_get_all_should_follow_next_page_after_parallel_pages(self, mock_get):
+        self.connection.set_max_page_workers(4)
+        pages = {
+            "/rest/testuri?start=0&count=-1": {"nextPageUri": "/rest/testuri?start=2&count=2", "total": 4,
+                                               "members": [{"id": "1"}, {"id": "2"}]},
+            "/rest/testuri?start=2&count=2": {"nextPageUri": "/rest/testuri?start=4&count=2", "total": 5,
+                                              "members": [{"id": "3"}, {"id": "4"}]},
+            "/rest/testuri?start=4&count=2": {"nextPageUri": None, "total": 5, "members": [{"id": "5"}]}}
+        mock_get.side_effect = lambda uri: pages[uri]
+
+        result = self.resource_client.get_all()
+
+        self.assertEqual([item["id"] for item in result], ["1", "2", "3", "4", "5"])
+
+    def test_build_page_uris(self):
+        first_page = {"total": 10, "members": [{}, {}, {}]}
+
+        result = build_page_uris("/rest/testuri?start=0&count=-1&filter=name%3D%27a%27", first_page, -1)
+
+        self.assertEqual(result, ["/rest/testuri?start=3&count=3&filter=name%3D%27a%27",
+                                  "/rest/testuri?start=6&count=3&filter=name%3D%27a%27",
+                                  "/rest/testuri?start=9&count=1&filter=name%3D%27a%27"])
+
+    def test_build_page_uris_with_requested_count(self):
+        first_page = {"total": 10, "members": [{}, {}]}
+
+        result = build_page_uris("/rest/testuri?param=value&start=1&count=5", first_page, 5)
+
+        self.assertEqual(result, ["/rest/testuri?param=value&start=3&count=2",
+                                  "/rest/testuri?param=value&start=5&count=1"])
+
+    def test_fan_out_keeps_order_and_collects_errors(self):
+        error = exceptions.HPOneViewException("Not found")
+
+        def function(item):
+            if item == 3:
+                raise error
+            return item * 10
+
+        result = fan_out(function, range(6), max_workers=4)
+
+        self.assertEqual([item["item"] for item in result], [0, 1, 2, 3, 4, 5])
+        self.assertEqual([item["result"] for item in result], [0, 10, 20, None, 40, 50])
+        self.assertEqual([item["error"] for item in result], [None, None, None, error, None, None])
+
+    def test_fan_out_runs_concurrently(self):
+        threads = set()
+
+        def function(item):
+            threads.add(threading.current_thread().ident)
+            time.sleep(0.01)
+            return item
+
+        fan_out(function, range(8), max_workers=4)
+
+        self.assertGreater(len(threads), 1)
+
+    def test_fan_out_with_one_worker_runs_in_caller_thread(self):
+        threads = set()
+
+        def function(item):
+            threads.add(threading.current_thread().ident)
+
+        fan_out(function, range(3), max_workers=1)
+
+        self.assertEqual(threads, set([threading.current_thread().ident]))
+
+    def test_get_fan_out_results_raises_first_error(self):
+        first, second = exceptions.HPOneViewException("first"), exceptions.HPOneViewException("second")
+        results = [dict(item=1, result=1, error=None), dict(item=2, result=None, error=first),
+                   dict(item=3, result=None, error=second)]
+
+        try:
+            get_fan_out_results(results)
+        except exceptions.HPOneViewException as e:
+            self.assertIs(e, first)
+        else:
+            self.fail()
+
+    def test_get_fan_out_results(self):
+        self.assertEqual(get_fan_out_results(fan_out(lambda item: item + 1, [1, 2])), [2, 3])
+
+    def test_build_page_uris_without_total(self):
+        self.assertEqual(build_page_uris("/rest/testuri?start=0&count=-1", {"members": [{}]}, -1), [])
+
+    @mock.patch.object(connection, "get")
+    def test_iter_all_should_yield_members_page_by_page(self, mock_get):
+        uri_list = ["/rest/testuri?start=0&count=-1",
+                    "/rest/testuri?start=3&count=3"]
+
+        mock_get.side_effect = [{"nextPageUri": uri_list[1], "members": [{"id": "1"}, {"id": "2"}, {"id": "3"}]},
+                                {"nextPageUri": None, "members": [{"id": "4"}]}]
+
+        result = self.resource_client.iter_all()
+
+        mock_get.assert_not_called()
+        self.assertEqual(next(result), {"id": "1"})
+        mock_get.assert_called_once_with(uri_list[0])
+        self.assertEqual(list(result), [{"id": "2"}, {"id": "3"}, {"id": "4"}])
+        self.assertEqual(mock_get.call_args_list, [call(uri_list[0]), call(uri_list[1])])
+
+    @mock.patch.object(connection, "get")
+    def test_iter_all_with_prefetch_should_request_next_page_in_advance(self, mock_get):
+        uri_list = ["/rest/testuri?start=0&count=-1",
+                    "/rest/testuri?start=2&count=2"]
+
+        mock_get.side_effect = [{"nextPageUri": uri_list[1], "members": [{"id": "1"}, {"id": "2"}]},
+                                {"nextPageUri": None, "members": [{"id": "3"}]}]
+
+        result = self.resource_client.iter_all(prefetch=True)
+
+        self.assertEqual(next(result), {"id": "1"})
+        self.assertEqual(list(result), [{"id": "2"}, {"id": "3"}])
+        self.assertEqual(mock_get.call_args_list, [call(uri_list[0]), call(uri_list[1])])
+
+    @mock.patch.object(connection, "get")
+    def test_iter_all_should_stop_requests_when_requested_count_reached(self, mock_get):
+        mock_get.return_value = {"nextPageUri": "/rest/testuri?start=3&count=3",
+                                 "members": [{"id": "1"}, {"id": "2"}, {"id": "3"}]}
+
+        result = list(self.resource_helper.iter_all(count=3))
+
+        self.assertEqual(len(result), 3)
+        mock_get.assert_called_once_with("/rest/testuri?start=0&count=3")
+
+    @mock.patch.object(connection, "get")
+    def test_iter_all_should_stop_requests_when_next_page_is_equal_to_current_page(self, mock_get):
+        uri = "/rest/testuri?start=0&count=-1"
+        mock_get.return_value = {"nextPageUri": uri, "uri": uri, "members": [{"id": "1"}]}
+
+        result = list(self.resource_helper.iter_all())
+
+        self.assertEqual(result, [{"id": "1"}])
+        mock_get.assert_called_once_with(uri)
+
+    @mock.patch.object(connection, "get")
+    def test_iter_all_should_yield_nothing_when_response_is_not_a_collection(self, mock_get):
+        for response in ["", [{"id": "1"}]]:
+            mock_get.return_value = response
+
+            self.assertEqual(list(self.resource_helper.iter_all()), [])
+
+    @mock.patch.object(connection, "get")
+    def test_iter_all_with_different_resource_uri_should_fail(self, mock_get):
+        self.assertRaises(exceptions.HPOneViewUnknownType, self.resource_helper.iter_all,
+                          uri="/rest/other/resource/12467836/subresources")
+
     @mock.patch.object(ResourceHelper, "do_get")
     def test_refresh(self, mock_do_get):
         updated_data = {"resource_name": "updated name"}
@@ -746,6 +1131,59 @@ class ResourceTest(BaseTest):
         self.resource_client.refresh()
         self.assertEqual(self.resource_client.data, updated_data)
 
+    @mock.patch.object(connection, "do_http")
+    def test_refresh_should_keep_data_when_not_modified(self, mock_do_http):
+        self.resource_client.data = {"uri": "/rest/testuri/1", "name": "a name", "eTag": "1-abc"}
+        mock_do_http.return_value = (mock.Mock(status=304), "")
+
+        self.resource_client.refresh()
+
+        self.assertEqual(self.resource_client.data, {"uri": "/rest/testuri/1", "name": "a name", "eTag": "1-abc"})
+        mock_do_http.assert_called_once_with("GET", "/rest/testuri/1", "", {"If-None-Match": "1-abc"})
+
+    @mock.patch.object(ResourceHelper, "do_get_if_modified")
+    def test_refresh_should_replace_modified_data(self, mock_do_get_if_modified):
+        self.resource_client.data = {"uri": "/rest/testuri/1", "name": "a name", "eTag": "1-abc"}
+        mock_do_get_if_modified.return_value = {"uri": "/rest/testuri/1", "name": "renamed", "eTag": "2-def"}
+
+        self.resource_client.refresh()
+
+        self.assertEqual(self.resource_client.data, {"uri": "/rest/testuri/1", "name": "renamed", "eTag": "2-def"})
+        mock_do_get_if_modified.assert_called_once_with("/rest/testuri/1", "1-abc")
+
+    @mock.patch.object(ResourceHelper, "do_get")
+    @mock.patch.object(ResourceHelper, "do_get_if_modified")
+    def test_ensure_resource_should_keep_data_when_not_modified(self, mock_do_get_if_modified, mock_do_get):
+        self.resource_client.data = {"uri": "/rest/testuri/1", "name": "a name", "eTag": "1-abc"}
+        mock_do_get_if_modified.return_value = None
+
+        self.resource_client.ensure_resource_data(update_data=True)
+
+        self.assertEqual(self.resource_client.data, {"uri": "/rest/testuri/1", "name": "a name", "eTag": "1-abc"})
+        mock_do_get.assert_not_called()
+
+    @mock.patch.object(ResourceHelper, "do_get_if_modified")
+    def test_ensure_resource_should_update_modified_data(self, mock_do_get_if_modified):
+        self.resource_client.data = {"uri": "/rest/testuri/1", "name": "a name", "eTag": "1-abc"}
+        mock_do_get_if_modified.return_value = {"uri": "/rest/testuri/1", "name": "renamed", "eTag": "2-def"}
+
+        self.resource_client.ensure_resource_data(update_data=True)
+
+        self.assertEqual(self.resource_client.data, {"uri": "/rest/testuri/1", "name": "renamed", "eTag": "2-def"})
+
+    @mock.patch.object(connection, "get_if_modified")
+    def test_do_get_if_modified(self, mock_get_if_modified):
+        mock_get_if_modified.return_value = None
+
+        result = self.resource_helper.do_get_if_modified("/rest/testuri/1", "1-abc")
+
+        self.assertIsNone(result)
+        mock_get_if_modified.assert_called_once_with("/rest/testuri/1", "1-abc")
+
+    def test_do_get_if_modified_with_different_resource_uri_should_fail(self):
+        self.assertRaises(exceptions.HPOneViewUnknownType, self.resource_helper.do_get_if_modified,
+                          "/rest/other/resource/1", "1-abc")
+
     @mock.patch.object(connection, "post")
     def test_create_uri(self, mock_post):
         dict_to_create = {"resource_name": "a name"}
@@ -1262,6 +1700,35 @@ class ResourceClientTest(unittest.TestCase):
         expected_items = [{'id': '1'}, {'id': '2'}, {'id': '3'}, {'id': '4'}, {'id': '5'}, {'id': '6'}, {'id': '7'}]
         self.assertSequenceEqual(result, expected_items)
 
+    @mock.patch.object(connection, 'get')
+    def test_get_all_should_request_pages_in_parallel_when_enabled(self, mock_get):
+        self.connection.set_max_page_workers(2)
+        pages = {
+            '/rest/testuri?start=0&count=-1': {'nextPageUri': '/rest/testuri?start=2&count=2', 'total': 5,
+                                               'members': [{'id': '1'}, {'id': '2'}]},
+            '/rest/testuri?start=2&count=2': {'nextPageUri': '/rest/testuri?start=4&count=2', 'total': 5,
+                                              'members': [{'id': '3'}, {'id': '4'}]},
+            '/rest/testuri?start=4&count=1': {'nextPageUri': None, 'total': 5, 'members': [{'id': '5'}]}}
+        mock_get.side_effect = lambda uri: pages[uri]
+
+        result = self.resource_client.get_all()
+
+        self.assertEqual([item['id'] for item in result], ['1', '2', '3', '4', '5'])
+        self.assertEqual(mock_get.call_count, 3)
+
+    @mock.patch.object(connection, 'get')
+    def test_iter_all_should_yield_members_page_by_page(self, mock_get):
+        uri_list = ['/rest/testuri?start=0&count=-1&filter=name%3D%27a%27',
+                    '/rest/testuri?start=2&count=2&filter=name%3D%27a%27']
+
+        mock_get.side_effect = [{'nextPageUri': uri_list[1], 'members': [{'id': '1'}, {'id': '2'}]},
+                                {'nextPageUri': None, 'members': [{'id': '3'}]}]
+
+        result = list(self.resource_client.iter_all(filter="name='a'", prefetch=True))
+
+        self.assertEqual(result, [{'id': '1'}, {'id': '2'}, {'id': '3'}])
+        self.assertEqual(mock_get.call_args_list, [call(uri_list[0]), call(uri_list[1])])
+
     @mock.patch.object(connection, 'get')
     def test_get_all_should_limit_results_to_requested_count_when_response_is_paginated(self, mock_get):
         uri_list = ['/rest/testuri?start=0&count=15',
@@ -1419,6 +1886,64 @@ class ResourceClientTest(unittest.TestCase):
         self.assertIsNone(response)
         mock_get_by.assert_called_once_with("name", 'Resource Name,')
 
+    @mock.patch.object(connection, 'get')
+    def test_get_index_should_index_collection(self, mock_get):
+        mock_get.return_value = {"members": [{"uri": "/rest/testuri/1", "wwn": "10:00:00:00"}]}
+
+        index = self.resource_client.get_index({'wwn': 'wwn'})
+
+        self.assertIs(self.resource_client.get_index({'wwn': 'wwn'}), index)
+        self.assertEqual(index.lookup('wwn', '10:00:00:00'), ['/rest/testuri/1'])
+        mock_get.assert_called_once_with('/rest/testuri?start=0&count=-1')
+
+    @mock.patch.object(connection, 'get')
+    def test_get_changes_should_keep_sync_for_connection(self, mock_get):
+        mock_get.return_value = {"members": [{"uri": "/rest/testuri/1", "modified": "2019-01-01T10:00:00.000Z"}]}
+
+        self.resource_client.get_changes()
+
+        self.assertEqual(ResourceClient(self.connection, self.URI).get_collection_sync().state,
+                         {"lastModified": "2019-01-01T10:00:00.000Z",
+                          "versions": {"/rest/testuri/1": "2019-01-01T10:00:00.000Z"}})
+
+    @mock.patch.object(TaskMonitor, 'wait_for_tasks')
+    @mock.patch.object(connection, 'post')
+    def test_bulk_create_should_merge_default_values(self, mock_post, mock_wait_for_tasks):
+        mock_post.side_effect = [({"uri": "/rest/tasks/1"}, None), exceptions.HPOneViewException("Invalid")]
+        mock_wait_for_tasks.return_value = [dict(task={"uri": "/rest/tasks/1"}, result={"name": "Name1"}, error=None)]
+
+        result = self.resource_client.bulk_create([{"name": "Name1"}, {"name": "Name2"}],
+                                                  default_values=self.DEFAULT_VALUES, max_workers=1)
+
+        self.assertEqual(result[0], dict(item={"name": "Name1"}, result={"name": "Name1"}, error=None))
+        self.assertIsInstance(result[1]["error"], exceptions.HPOneViewException)
+        mock_post.assert_any_call(self.URI, {"name": "Name1", "type": self.TYPE_V300}, custom_headers=None)
+
+    @mock.patch.object(TaskMonitor, 'wait_for_tasks')
+    @mock.patch.object(connection, 'put')
+    def test_bulk_update(self, mock_put, mock_wait_for_tasks):
+        mock_put.return_value = {"uri": "/rest/tasks/1"}, None
+        mock_wait_for_tasks.return_value = [dict(task={"uri": "/rest/tasks/1"}, result={"name": "Name1"}, error=None)]
+
+        result = self.resource_client.bulk_update([{"uri": "/rest/testuri/1", "name": "Name1"}], timeout=30)
+
+        self.assertEqual(result[0]["result"], {"name": "Name1"})
+        mock_put.assert_called_once_with("/rest/testuri/1", {"uri": "/rest/testuri/1", "name": "Name1"},
+                                         custom_headers=None)
+        mock_wait_for_tasks.assert_called_once_with([{"uri": "/rest/tasks/1"}], timeout=30, concurrency=8)
+
+    @mock.patch.object(TaskMonitor, 'wait_for_tasks')
+    @mock.patch.object(connection, 'delete')
+    def test_bulk_delete_by_id(self, mock_delete, mock_wait_for_tasks):
+        mock_delete.return_value = None, None
+        mock_wait_for_tasks.return_value = []
+
+        result = self.resource_client.bulk_delete(["1", {"name": "without uri"}], force=True, max_workers=1)
+
+        self.assertTrue(result[0]["result"])
+        self.assertIsInstance(result[1]["error"], exceptions.HPOneViewUnknownType)
+        mock_delete.assert_called_once_with("/rest/testuri/1?force=True", custom_headers=None)
+
     @mock.patch.object(connection, 'get')
     def test_get_collection_uri(self, mock_get):
         mock_get.return_value = {"members": [{"key": "value"}, {"key": "value"}]}
@@ -2285,7 +2810,8 @@ class ResourceClientTest(unittest.TestCase):
 
         self.resource_client.upload(filepath, uri)
 
-        mock_post_multipart.assert_called_once_with(uri, filepath, 'SPPgen9snap6.2015_0405.81.iso')
+        mock_post_multipart.assert_called_once_with(uri, filepath, 'SPPgen9snap6.2015_0405.81.iso',
+                                                    progress_callback=None)
 
     @mock.patch.object(connection, 'post_multipart_with_response_handling')
     def test_upload_should_call_post_multipart_with_resource_uri_when_not_uri_provided(self, mock_post_multipart):
@@ -2294,7 +2820,7 @@ class ResourceClientTest(unittest.TestCase):
 
         self.resource_client.upload(filepath)
 
-        mock_post_multipart.assert_called_once_with('/rest/testuri', mock.ANY, mock.ANY)
+        mock_post_multipart.assert_called_once_with('/rest/testuri', mock.ANY, mock.ANY, progress_callback=None)
 
     @mock.patch.object(connection, 'post_multipart_with_response_handling')
     @mock.patch.object(TaskMonitor, 'wait_for_task')
@@ -2346,49 +2872,60 @@ class ResourceClientTest(unittest.TestCase):
 
         self.assertEqual(result, fake_response_body)
 
-    @mock.patch.object(connection, 'download_to_stream')
-    @mock.patch(mock_builtin('open'))
-    def test_download_should_call_download_to_stream_with_given_uri(self, mock_open, mock_download_to_stream):
+    @mock.patch.object(connection, 'download_to_file')
+    def test_download_should_call_download_to_file_with_given_uri(self, mock_download_to_file):
         file_path = "~/archive.log"
         uri = '/rest/testuri/3ec91dd2-0ebb-4484-8b2d-90d065114315'
-        mock_open.return_value = io.StringIO()
 
         self.resource_client.download(uri, file_path)
 
-        mock_download_to_stream.assert_called_once_with(mock.ANY, uri)
+        mock_download_to_file.assert_called_once_with(uri, file_path, resume=False, progress_callback=None)
 
-    @mock.patch.object(connection, 'download_to_stream')
-    @mock.patch(mock_builtin('open'))
-    def test_download_should_call_download_to_stream_with_open_file(self, mock_open, mock_download_to_stream):
+    @mock.patch.object(connection, 'download_to_file')
+    def test_download_should_resume_download_when_requested(self, mock_download_to_file):
         file_path = "~/archive.log"
         uri = '/rest/testuri/3ec91dd2-0ebb-4484-8b2d-90d065114315'
-        fake_file = io.StringIO()
-        mock_open.return_value = fake_file
 
-        self.resource_client.download(uri, file_path)
+        self.resource_client.download(uri, file_path, resume=True)
+
+        mock_download_to_file.assert_called_once_with(uri, file_path, resume=True, progress_callback=None)
+
+    @mock.patch.object(connection, 'download_to_file')
+    def test_download_should_pass_progress_callback(self, mock_download_to_file):
+        file_path = "~/archive.log"
+        uri = '/rest/testuri/3ec91dd2-0ebb-4484-8b2d-90d065114315'
+        progress_callback = mock.Mock()
+
+        self.resource_client.download(uri, file_path, progress_callback=progress_callback)
+
+        mock_download_to_file.assert_called_once_with(uri, file_path, resume=False, progress_callback=progress_callback)
+
+    @mock.patch.object(connection, 'post_multipart_with_response_handling')
+    def test_upload_should_pass_progress_callback(self, mock_post_multipart):
+        filepath = "test/SPPgen9snap6.2015_0405.81.iso"
+        progress_callback = mock.Mock()
+        mock_post_multipart.return_value = None, mock.Mock()
+
+        self.resource_client.upload(filepath, progress_callback=progress_callback)
 
-        mock_open.assert_called_once_with(file_path, 'wb')
-        mock_download_to_stream.assert_called_once_with(fake_file, mock.ANY)
+        mock_post_multipart.assert_called_once_with(mock.ANY, filepath, "SPPgen9snap6.2015_0405.81.iso",
+                                                    progress_callback=progress_callback)
 
-    @mock.patch.object(connection, 'download_to_stream')
-    @mock.patch(mock_builtin('open'))
-    def test_download_should_return_true_when_success(self, mock_open, mock_download_to_stream):
+    @mock.patch.object(connection, 'download_to_file')
+    def test_download_should_return_true_when_success(self, mock_download_to_file):
         file_path = "~/archive.log"
         uri = '/rest/testuri/3ec91dd2-0ebb-4484-8b2d-90d065114315'
-        mock_download_to_stream.return_value = True
-        mock_open.return_value = io.StringIO()
+        mock_download_to_file.return_value = True
 
         result = self.resource_client.download(uri, file_path)
 
         self.assertTrue(result)
 
-    @mock.patch.object(connection, 'download_to_stream')
-    @mock.patch(mock_builtin('open'))
-    def test_download_should_return_false_when_error(self, mock_open, mock_download_to_stream):
+    @mock.patch.object(connection, 'download_to_file')
+    def test_download_should_return_false_when_error(self, mock_download_to_file):
         file_path = "~/archive.log"
         uri = '/rest/testuri/3ec91dd2-0ebb-4484-8b2d-90d065114315'
-        mock_download_to_stream.return_value = False
-        mock_open.return_value = io.StringIO()
+        mock_download_to_file.return_value = False
 
         result = self.resource_client.download(uri, file_path)
 
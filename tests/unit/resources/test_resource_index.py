@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2017) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+from unittest import TestCase
+
+import mock
+
+from hpOneView.exceptions import HPOneViewException
+from hpOneView.resources.resource_index import ResourceIndex, is_invalid_filter
+
+
+def get_name(member):
+    return member.get('name')
+
+
+def get_macs(member):
+    return member.get('macs')
+
+
+class ResourceIndexTest(TestCase):
+    def setUp(self):
+        self.get_all = mock.Mock()
+        self.get_all.return_value = [
+            {'uri': '/rest/servers/1', 'name': 'server1', 'macs': ['aa', 'bb'], 'modified': '2019-01-01T10:00:00.000Z'},
+            {'uri': '/rest/servers/2', 'name': 'server2', 'macs': ['cc'], 'modified': '2019-01-02T10:00:00.000Z'},
+        ]
+        self.index = ResourceIndex(self.get_all, {'name': get_name, 'mac': get_macs})
+
+    def test_lookup_should_build_index_from_whole_collection(self):
+        self.assertEqual(self.index.lookup('name', 'server2'), ['/rest/servers/2'])
+        self.assertEqual(self.index.lookup('mac', 'bb', refresh=False), ['/rest/servers/1'])
+        self.assertEqual(self.index.lookup('mac', 'dd', refresh=False), [])
+        self.get_all.assert_called_once_with(filter='')
+
+    def test_refresh_should_request_members_modified_since_last_refresh(self):
+        self.index.refresh()
+        self.get_all.return_value = [
+            {'uri': '/rest/servers/1', 'name': 'renamed', 'macs': ['aa'], 'modified': '2019-01-03T10:00:00.000Z'}]
+
+        self.index.refresh()
+
+        self.get_all.assert_called_with(filter="\"modified>='2019-01-02T10:00:00.000Z'\"")
+        self.assertEqual(self.index.lookup('name', 'renamed', refresh=False), ['/rest/servers/1'])
+        self.assertEqual(self.index.lookup('name', 'server1', refresh=False), [])
+        self.assertEqual(self.index.lookup('mac', 'bb', refresh=False), [])
+        self.assertEqual(self.index.lookup('mac', 'aa', refresh=False), ['/rest/servers/1'])
+
+    def test_refresh_should_request_whole_collection_without_modified_dates(self):
+        self.get_all.return_value = [{'uri': '/rest/servers/1', 'name': 'server1'}]
+
+        self.index.refresh()
+        self.index.refresh()
+
+        self.get_all.assert_has_calls([mock.call(filter=''), mock.call(filter='')])
+
+    def test_clear_should_rebuild_index(self):
+        self.index.refresh()
+        self.index.clear()
+        self.index.refresh()
+
+        self.get_all.assert_has_calls([mock.call(filter=''), mock.call(filter='')])
+
+    def test_discard_should_remove_member(self):
+        self.index.refresh()
+
+        self.index.discard('/rest/servers/1')
+
+        self.assertEqual(self.index.lookup('name', 'server1', refresh=False), [])
+        self.assertEqual(self.index.lookup('name', 'server2', refresh=False), ['/rest/servers/2'])
+
+    def test_get_members_should_get_indexed_members(self):
+        get = mock.Mock(return_value={'uri': '/rest/servers/2', 'name': 'server2'})
+
+        result = self.index.get_members('name', 'server2', get)
+
+        self.assertEqual(result, [{'uri': '/rest/servers/2', 'name': 'server2'}])
+        get.assert_called_once_with('/rest/servers/2')
+
+    def test_get_members_should_discard_members_not_found(self):
+        get = mock.Mock(side_effect=HPOneViewException({'errorCode': 'RESOURCE_NOT_FOUND', 'message': 'not found'}))
+
+        result = self.index.get_members('name', 'server2', get)
+
+        self.assertEqual(result, [])
+        self.assertEqual(self.index.lookup('name', 'server2', refresh=False), [])
+
+    def test_get_members_should_raise_other_errors(self):
+        get = mock.Mock(side_effect=HPOneViewException({'errorCode': 'INTERNAL_ERROR', 'message': 'error'}))
+
+        self.assertRaises(HPOneViewException, self.index.get_members, 'name', 'server2', get)
+        self.assertEqual(self.index.lookup('name', 'server2', refresh=False), ['/rest/servers/2'])
+
+    def test_find_should_return_copies_of_members(self):
+        result = self.index.find('name', 'server1')
+        result[0]['name'] = 'changed'
+
+        self.assertEqual(self.index.find('name', 'server1', refresh=False)[0]['name'], 'server1')
+
+    def test_find_should_ignore_case(self):
+        self.assertEqual(self.index.find('mac', 'AA')[0]['uri'], '/rest/servers/1')
+
+    @mock.patch('time.time')
+    def test_lookup_should_refresh_after_refresh_interval(self, mock_time):
+        mock_time.return_value = 1000.0
+        self.index.refresh_interval = 10
+        self.index.lookup('name', 'server1')
+
+        mock_time.return_value = 1009.0
+        self.index.lookup('name', 'server1')
+        self.assertEqual(self.get_all.call_count, 1)
+
+        mock_time.return_value = 1010.0
+        self.index.lookup('name', 'server1')
+        self.assertEqual(self.get_all.call_count, 2)
+
+    def test_keys_should_accept_field_paths(self):
+        self.get_all.return_value = [{
+            'uri': '/rest/server-profiles/1',
+            'connectionSettings': {'connections': [{'mac': '00:01', 'wwpn': '10:00'}, {'mac': '00:02'}]}}]
+        index = ResourceIndex(self.get_all, {'mac': 'connectionSettings.connections.mac',
+                                             'wwn': ['connections.wwpn', 'connectionSettings.connections.wwpn']})
+
+        self.assertEqual(index.lookup('mac', '00:02'), ['/rest/server-profiles/1'])
+        self.assertEqual(index.lookup('wwn', '10:00', refresh=False), ['/rest/server-profiles/1'])
+        self.assertEqual(index.lookup('wwn', '00:01', refresh=False), [])
+
+    def test_refresh_should_remove_deleted_members_when_detecting_deletions(self):
+        self.index.detect_deletions = True
+        self.index.refresh()
+        self.get_all.side_effect = [[], [{'uri': '/rest/servers/2'}]]
+
+        self.index.refresh()
+
+        self.get_all.assert_called_with(filter='', fields='uri')
+        self.assertEqual(self.index.lookup('name', 'server1', refresh=False), [])
+        self.assertEqual(self.index.lookup('name', 'server2', refresh=False), ['/rest/servers/2'])
+
+    def test_is_invalid_filter(self):
+        self.assertTrue(is_invalid_filter(HPOneViewException({'errorCode': 'INVALID_FILTER', 'message': 'invalid'})))
+        self.assertFalse(is_invalid_filter(HPOneViewException({'errorCode': 'AUTHORIZATION', 'message': 'denied'})))
+        self.assertFalse(is_invalid_filter(HPOneViewException('Unexpected response')))
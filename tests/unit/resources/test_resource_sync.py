@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2017) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+
+from unittest import TestCase
+
+import mock
+
+from hpOneView.resources.resource_sync import CollectionSync
+
+SERVER1 = {'uri': '/rest/servers/1', 'name': 'server1', 'modified': '2019-01-01T10:00:00.000Z'}
+SERVER2 = {'uri': '/rest/servers/2', 'name': 'server2', 'modified': '2019-01-02T10:00:00.000Z'}
+MODIFIED_FILTER = "\"modified>='2019-01-02T10:00:00.000Z'\""
+
+
+class CollectionSyncTest(TestCase):
+    def setUp(self):
+        self.get_all = mock.Mock()
+        self.get_all.return_value = [SERVER1, SERVER2]
+        self.sync = CollectionSync(self.get_all)
+
+    def test_first_sync_should_return_whole_collection(self):
+        self.assertEqual(self.sync.sync(), {'modified': [SERVER1, SERVER2], 'deleted': []})
+        self.get_all.assert_called_once_with(filter='')
+
+    def test_sync_should_return_modified_and_deleted_members(self):
+        self.sync.sync()
+        server2 = dict(SERVER2, name='renamed', modified='2019-01-03T10:00:00.000Z')
+        server3 = {'uri': '/rest/servers/3', 'modified': '2019-01-03T10:00:00.000Z'}
+        self.get_all.side_effect = [[server2, server3], [{'uri': '/rest/servers/2'}, {'uri': '/rest/servers/3'}]]
+
+        changes = self.sync.sync()
+
+        self.assertEqual(changes, {'modified': [server2, server3], 'deleted': ['/rest/servers/1']})
+        self.assertEqual(self.get_all.call_args_list, [mock.call(filter=''), mock.call(filter=MODIFIED_FILTER),
+                                                       mock.call(filter='', fields='uri')])
+        self.assertEqual(self.sync.state['lastModified'], '2019-01-03T10:00:00.000Z')
+
+    def test_sync_should_skip_members_already_seen(self):
+        self.sync.sync()
+        self.get_all.return_value = [SERVER2]
+
+        self.assertEqual(self.sync.sync(detect_deletions=False), {'modified': [], 'deleted': []})
+        self.get_all.assert_called_with(filter=MODIFIED_FILTER)
+
+    def test_sync_without_modified_dates_should_compare_etags(self):
+        self.get_all.return_value = [{'uri': '/rest/servers/1', 'eTag': '1'}, {'uri': '/rest/servers/2', 'eTag': '1'}]
+        self.sync.sync()
+        self.get_all.return_value = [{'uri': '/rest/servers/1', 'eTag': '2'}]
+
+        changes = self.sync.sync()
+
+        self.assertEqual(changes, {'modified': [{'uri': '/rest/servers/1', 'eTag': '2'}], 'deleted': ['/rest/servers/2']})
+        self.assertEqual(self.get_all.call_args_list, [mock.call(filter=''), mock.call(filter='')])
+
+    def test_state_should_resume_synchronization(self):
+        self.sync.sync()
+        self.get_all.reset_mock()
+        self.get_all.side_effect = [[], [{'uri': '/rest/servers/1'}, {'uri': '/rest/servers/2'}]]
+
+        resumed = CollectionSync(self.get_all, state=self.sync.state)
+
+        self.assertEqual(resumed.sync(), {'modified': [], 'deleted': []})
+        self.get_all.assert_has_calls([mock.call(filter=MODIFIED_FILTER)])
+
+    def test_reset_should_request_whole_collection(self):
+        self.sync.sync()
+        self.sync.reset()
+
+        self.assertEqual(self.sync.sync(), {'modified': [SERVER1, SERVER2], 'deleted': []})
+        self.assertEqual(self.get_all.call_args_list, [mock.call(filter=''), mock.call(filter='')])
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2026) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import json
+import os
+import socket
+import threading
+import unittest
+from queue import Queue, Empty
+
+from mock import mock
+
+from hpOneView.exceptions import HPOneViewException
+from hpOneView.resources import task_listener
+from hpOneView.resources.task_listener import TaskListener, ScmbTaskListener, MSG_AMQP_NOT_INSTALLED
+
+
+class FakeAmqpMessage(object):
+    def __init__(self, body):
+        self.body = body
+
+
+class FakeAmqpChannel(object):
+    def __init__(self):
+        self.bindings = []
+        self.callback = None
+
+    def queue_declare(self, exclusive=False, auto_delete=False):
+        return 'amq.gen-queue', 0, 0
+
+    def queue_bind(self, queue, exchange, routing_key):
+        self.bindings.append((queue, exchange, routing_key))
+
+    def basic_consume(self, queue, callback, no_ack):
+        self.callback = callback
+
+
+class FakeAmqpConnection(object):
+    """Local stand-in of an AMQP connection; the published messages are delivered by drain_events."""
+
+    def __init__(self):
+        self.channel_instance = FakeAmqpChannel()
+        self.messages = Queue()
+        self.closed = threading.Event()
+
+    def channel(self):
+        return self.channel_instance
+
+    def drain_events(self, timeout):
+        try:
+            message = self.messages.get(timeout=timeout)
+        except Empty:
+            raise socket.timeout()
+        if isinstance(message, Exception):
+            raise message
+        self.channel_instance.callback(message)
+
+    def close(self):
+        self.closed.set()
+
+    def publish(self, change):
+        self.messages.put(FakeAmqpMessage(json.dumps(change).encode('utf-8')))
+
+
+class TaskListenerTest(unittest.TestCase):
+    def setUp(self):
+        self.task_listener = TaskListener()
+
+    def test_wait_for_completion_returns_task_notified_before(self):
+        task = {"uri": "/rest/tasks/1", "taskState": "Completed"}
+        self.task_listener.notify(task)
+
+        self.assertEqual(self.task_listener.wait_for_completion("/rest/tasks/1", 0), task)
+
+    def test_wait_for_completion_returns_none_on_timeout(self):
+        self.task_listener.notify({"uri": "/rest/tasks/1", "taskState": "Running"})
+
+        self.assertIsNone(self.task_listener.wait_for_completion("/rest/tasks/1", 0.01))
+
+    def test_wait_for_completion_is_woken_up_by_notify(self):
+        task = {"uri": "/rest/tasks/1", "taskState": "Error"}
+        timer = threading.Timer(0.05, self.task_listener.notify, [task])
+        timer.start()
+
+        self.assertEqual(self.task_listener.wait_for_completion("/rest/tasks/1", 10), task)
+        timer.join()
+
+    def test_notify_forgets_oldest_completed_tasks(self):
+        task_listener = TaskListener(max_completed_tasks=2)
+        for index in range(3):
+            task_listener.notify({"uri": "/rest/tasks/%d" % index, "taskState": "Completed"})
+
+        self.assertIsNone(task_listener.wait_for_completion("/rest/tasks/0", 0))
+        self.assertIsNotNone(task_listener.wait_for_completion("/rest/tasks/2", 0))
+
+
+class ScmbTaskListenerTest(unittest.TestCase):
+    def setUp(self):
+        self.amqp_connection = FakeAmqpConnection()
+        self.connection_factory = mock.Mock(return_value=self.amqp_connection)
+        self.task_listener = ScmbTaskListener('172.16.102.59', connection_factory=self.connection_factory)
+
+    def tearDown(self):
+        self.task_listener.stop()
+
+    def test_start_binds_queue_to_task_notifications(self):
+        self.task_listener.start()
+
+        self.connection_factory.assert_called_once_with('172.16.102.59', 5671, None)
+        self.assertEqual(self.amqp_connection.channel_instance.bindings, [('amq.gen-queue', 'scmb', 'scmb.tasks.#')])
+        self.assertTrue(self.task_listener.is_listening())
+
+    def test_start_twice_raises_exception(self):
+        self.task_listener.start()
+
+        self.assertRaises(HPOneViewException, self.task_listener.start)
+
+    def test_wait_for_completion_with_notification_from_message_bus(self):
+        self.task_listener.start()
+        self.amqp_connection.publish({"resourceUri": "/rest/tasks/1", "changeType": "Updated",
+                                      "resource": {"uri": "/rest/tasks/1", "taskState": "Running"}})
+        self.amqp_connection.publish({"resourceUri": "/rest/tasks/1", "changeType": "Updated",
+                                      "resource": {"uri": "/rest/tasks/1", "taskState": "Completed"}})
+
+        task = self.task_listener.wait_for_completion("/rest/tasks/1", 10)
+
+        self.assertEqual(task, {"uri": "/rest/tasks/1", "taskState": "Completed"})
+
+    def test_malformed_messages_are_ignored(self):
+        self.task_listener.start()
+        self.amqp_connection.messages.put(FakeAmqpMessage(b'not json'))
+        self.amqp_connection.publish({"resourceUri": "/rest/tasks/1", "resource": {"taskState": "Completed"}})
+
+        task = self.task_listener.wait_for_completion("/rest/tasks/1", 10)
+
+        self.assertEqual(task, {"uri": "/rest/tasks/1", "taskState": "Completed"})
+
+    def test_connection_failure_stops_listening_and_wakes_up_waiters(self):
+        self.task_listener.start()
+        self.amqp_connection.messages.put(socket.error('connection reset'))
+
+        self.assertIsNone(self.task_listener.wait_for_completion("/rest/tasks/1", 10))
+        self.assertTrue(self.amqp_connection.closed.wait(10))
+        self.assertFalse(self.task_listener.is_listening())
+
+    def test_stop_closes_the_connection(self):
+        self.task_listener.start()
+        self.task_listener.stop()
+
+        self.assertTrue(self.amqp_connection.closed.is_set())
+        self.assertFalse(self.task_listener.is_listening())
+
+    @mock.patch.object(task_listener, 'amqp', None)
+    def test_start_without_amqp_package_raises_exception(self):
+        task_listener = ScmbTaskListener('172.16.102.59')
+
+        try:
+            task_listener.start()
+        except HPOneViewException as e:
+            self.assertEqual(e.msg, MSG_AMQP_NOT_INSTALLED)
+        else:
+            self.fail()
+
+    def test_get_ssl_context_without_key_pair(self):
+        self.assertIsNone(self.task_listener.get_ssl_context())
+
+    @mock.patch('ssl.SSLContext')
+    def test_get_ssl_context_loads_key_pair_and_removes_temp_files(self, mock_ssl_context):
+        loaded = {}
+
+        def load_cert_chain(cert_file, key_file):
+            with open(cert_file) as cert, open(key_file) as key:
+                loaded.update(cert=cert.read(), key=key.read(), files=[cert_file, key_file])
+
+        mock_ssl_context.return_value.load_cert_chain.side_effect = load_cert_chain
+        task_listener = ScmbTaskListener('172.16.102.59', ca_certificate='ca data',
+                                         key_pair={"base64SSLCertData": "cert data", "base64SSLKeyData": "key data"})
+
+        task_listener.get_ssl_context()
+
+        mock_ssl_context.return_value.load_verify_locations.assert_called_once_with(cadata='ca data')
+        self.assertEqual(loaded['cert'], 'cert data')
+        self.assertEqual(loaded['key'], 'key data')
+        self.assertFalse(any(os.path.exists(file_name) for file_name in loaded['files']))
@@ -21,14 +21,16 @@
 # THE SOFTWARE.
 ###
 
+import itertools
 import unittest
 from mock import mock, call
 from errno import ETIMEDOUT, ECONNABORTED
 
 from hpOneView.connection import connection
-from hpOneView.resources.task_monitor import TaskMonitor, MSG_UNKNOWN_OBJECT_TYPE, MSG_TASK_TYPE_UNRECONIZED, \
+from hpOneView.resources.task_listener import TaskListener
+from hpOneView.resources.task_monitor import TaskMonitor, PollPolicy, ExponentialPollPolicy, MSG_UNKNOWN_OBJECT_TYPE, MSG_TASK_TYPE_UNRECONIZED, \
     MSG_TIMEOUT, MSG_UNKNOWN_EXCEPTION, MSG_INVALID_TASK
-from hpOneView.exceptions import HPOneViewUnknownType, HPOneViewInvalidResource, HPOneViewTimeout, HPOneViewTaskError
+from hpOneView.exceptions import HPOneViewException, HPOneViewUnknownType, HPOneViewInvalidResource, HPOneViewTimeout, HPOneViewTaskError
 
 ERR_MSG = "Message error"
 
@@ -242,6 +244,210 @@ class TaskMonitorTest(unittest.TestCase):
         else:
             self.fail()
 
+    @mock.patch.object(TaskMonitor, 'get')
+    @mock.patch.object(TaskMonitor, 'is_task_running')
+    @mock.patch('time.sleep')
+    def test_wait_for_task_with_task_listener(self, mock_sleep, mock_is_running, mock_get):
+        task_listener = TaskListener()
+        task_listener.wait_for_completion = mock.Mock(return_value=None)
+        self.connection.set_task_listener(task_listener)
+        mock_is_running.side_effect = [True, True, False]
+
+        self.task_monitor.get_completed_task({"uri": "/rest/tasks/1"}, timeout=-1)
+
+        task_listener.wait_for_completion.assert_has_calls([call("/rest/tasks/1", TaskMonitor.TASK_NOTIFICATION_TIMEOUT),
+                                                            call("/rest/tasks/1", TaskMonitor.TASK_NOTIFICATION_TIMEOUT)])
+        mock_sleep.assert_not_called()
+
+    @mock.patch.object(TaskMonitor, 'get')
+    @mock.patch.object(TaskMonitor, 'is_task_running')
+    def test_wait_for_task_with_task_listener_is_limited_by_the_timeout(self, mock_is_running, mock_get):
+        task_listener = TaskListener()
+        task_listener.wait_for_completion = mock.Mock(return_value=None)
+        self.connection.set_task_listener(task_listener)
+        mock_is_running.side_effect = [True, False]
+
+        self.task_monitor.get_completed_task({"uri": "/rest/tasks/1"}, timeout=5)
+
+        timeout_used = task_listener.wait_for_completion.call_args[0][1]
+        self.assertLessEqual(timeout_used, 6)
+
+    @mock.patch.object(TaskMonitor, 'get')
+    @mock.patch.object(TaskMonitor, 'is_task_running')
+    @mock.patch('time.sleep')
+    def test_wait_for_task_polls_when_task_listener_is_not_listening(self, mock_sleep, mock_is_running, mock_get):
+        task_listener = TaskListener()
+        task_listener.is_listening = mock.Mock(return_value=False)
+        task_listener.wait_for_completion = mock.Mock()
+        self.connection.set_task_listener(task_listener)
+        mock_is_running.side_effect = [True, True, False]
+
+        self.task_monitor.get_completed_task({"uri": "/rest/tasks/1"}, timeout=-1)
+
+        mock_sleep.assert_has_calls([call(1), call(2)])
+        task_listener.wait_for_completion.assert_not_called()
+
+    @mock.patch.object(connection, 'get')
+    @mock.patch('time.sleep')
+    def test_wait_for_tasks_queries_tasks_collection_once_per_cycle(self, mock_sleep, mock_get):
+        tasks = [{"uri": "/rest/tasks/1"}, {"uri": "/rest/tasks/2"}]
+        running = {"members": [{"uri": "/rest/tasks/1", "taskState": "Running"},
+                               {"uri": "/rest/tasks/2", "taskState": "Completed", "name": "Delete"}]}
+        completed = {"members": [{"uri": "/rest/tasks/1", "taskState": "Completed", "name": "Remove"}]}
+        mock_get.side_effect = [running, completed]
+
+        results = self.task_monitor.wait_for_tasks(tasks)
+
+        self.assertEqual([result["result"] for result in results], [True, True])
+        self.assertEqual([result["error"] for result in results], [None, None])
+        self.assertEqual(mock_get.call_count, 2)
+        first_query, second_query = [args[0][0] for args in mock_get.call_args_list]
+        self.assertEqual(first_query, "/rest/tasks?filter=%22uri%3D%27/rest/tasks/1%27%20OR%20uri%3D%27/rest/tasks/2%27%22&count=2")
+        self.assertEqual(second_query, "/rest/tasks?filter=%22uri%3D%27/rest/tasks/1%27%22&count=1")
+        mock_sleep.assert_called_once_with(1)
+
+    @mock.patch.object(connection, 'get')
+    def test_wait_for_tasks_returns_error_per_task(self, mock_get):
+        tasks = [{"uri": "/rest/tasks/1"}, {"uri": "/rest/tasks/2"}]
+        mock_get.return_value = {"members": [
+            {"uri": "/rest/tasks/1", "taskState": "Error", "taskErrors": [{"message": "Error Message"}]},
+            {"uri": "/rest/tasks/2", "taskState": "Completed", "name": "Delete"}]}
+
+        results = self.task_monitor.wait_for_tasks(tasks)
+
+        self.assertIsInstance(results[0]["error"], HPOneViewTaskError)
+        self.assertEqual(results[0]["error"].msg, "Error Message")
+        self.assertIsNone(results[0]["result"])
+        self.assertEqual(results[1]["result"], True)
+        self.assertIsNone(results[1]["error"])
+
+    @mock.patch.object(connection, 'get')
+    def test_wait_for_tasks_gets_tasks_one_by_one_when_query_fails(self, mock_get):
+        def get(uri):
+            if uri.startswith("/rest/tasks?"):
+                raise HPOneViewException("Invalid filter")
+            if uri == "/rest/tasks/2":
+                raise HPOneViewException("Not found")
+            return {"uri": uri, "taskState": "Completed", "name": "Delete"}
+
+        mock_get.side_effect = get
+
+        results = self.task_monitor.wait_for_tasks([{"uri": "/rest/tasks/1"}, {"uri": "/rest/tasks/2"}], concurrency=1)
+
+        self.assertEqual(results[0]["result"], True)
+        self.assertEqual(results[1]["error"].msg, "Not found")
+        self.assertEqual(results[1]["task"], {"uri": "/rest/tasks/2"})
+
+    @mock.patch.object(connection, 'get')
+    def test_wait_for_tasks_gets_tasks_one_by_one_before_supported_api_version(self, mock_get):
+        self.connection._apiVersion = 200
+        mock_get.side_effect = lambda uri: {"uri": uri, "taskState": "Completed", "name": "Delete"}
+
+        results = self.task_monitor.wait_for_tasks([{"uri": "/rest/tasks/1"}, {"uri": "/rest/tasks/2"}], concurrency=1)
+
+        self.assertEqual([result["result"] for result in results], [True, True])
+        self.assertEqual(sorted(args[0][0] for args in mock_get.call_args_list), ["/rest/tasks/1", "/rest/tasks/2"])
+
+    @mock.patch.object(connection, 'get')
+    @mock.patch('time.sleep')
+    def test_wait_for_tasks_leaves_task_pending_after_connection_failure(self, mock_sleep, mock_get):
+        self.connection._apiVersion = 200
+        mock_get.side_effect = [IOError(ETIMEDOUT, "Timed out"),
+                                {"uri": "/rest/tasks/1", "taskState": "Completed", "name": "Delete"}]
+
+        results = self.task_monitor.wait_for_tasks([{"uri": "/rest/tasks/1"}])
+
+        self.assertEqual(results[0]["result"], True)
+        self.assertIsNone(results[0]["error"])
+        self.assertEqual(mock_get.call_count, 2)
+        mock_sleep.assert_called_once_with(1)
+
+    @mock.patch.object(TaskMonitor, 'get_current_seconds')
+    @mock.patch.object(connection, 'get')
+    @mock.patch('time.sleep')
+    def test_wait_for_tasks_returns_connection_failure_after_timeout(self, mock_sleep, mock_get, mock_seconds):
+        self.connection._apiVersion = 200
+        error = IOError(ETIMEDOUT, "Timed out")
+        mock_get.side_effect = error
+        mock_seconds.side_effect = itertools.count(0, 40)
+
+        results = self.task_monitor.wait_for_tasks([{"uri": "/rest/tasks/1", "taskState": "Running"}])
+
+        self.assertIs(results[0]["error"], error)
+        self.assertEqual(results[0]["task"], {"uri": "/rest/tasks/1"})
+        self.assertEqual(mock_get.call_count, 2)
+
+    @mock.patch.object(connection, 'get')
+    @mock.patch('time.sleep')
+    def test_wait_for_tasks_with_timeout(self, mock_sleep, mock_get):
+        mock_get.return_value = {"members": [{"uri": "/rest/tasks/1", "taskState": "Running"}]}
+
+        results = self.task_monitor.wait_for_tasks([{"uri": "/rest/tasks/1"}], timeout=-2)
+
+        self.assertIsInstance(results[0]["error"], HPOneViewTimeout)
+        self.assertEqual(results[0]["error"].msg, MSG_TIMEOUT % -2)
+        mock_sleep.assert_not_called()
+
+    def test_wait_for_tasks_without_tasks(self):
+        self.assertEqual(self.task_monitor.wait_for_tasks([]), [])
+
+    def test_wait_for_tasks_with_invalid_task(self):
+        self.assertRaises(HPOneViewUnknownType, self.task_monitor.wait_for_tasks, [{"uri": "/rest/tasks/1"}, {}])
+
+    @mock.patch.object(TaskMonitor, 'get')
+    @mock.patch('time.sleep')
+    def test_wait_for_task_with_poll_policy_from_connection(self, mock_sleep, mock_get):
+        self.connection.set_poll_policy(ExponentialPollPolicy(min_interval=0.1, multiplier=2, jitter=0))
+        mock_get.side_effect = [{"uri": "uri", "taskState": "Running"}, {"uri": "uri", "taskState": "Running"},
+                                {"uri": "uri", "taskState": "Completed"}, {"uri": "uri", "taskState": "Completed"}]
+
+        self.task_monitor.get_completed_task({"uri": "uri"})
+
+        mock_sleep.assert_has_calls([call(0.1), call(0.2)])
+
+    @mock.patch.object(TaskMonitor, 'get')
+    @mock.patch('time.sleep')
+    def test_wait_for_task_passes_last_task_to_poll_policy(self, mock_sleep, mock_get):
+        poll_policy = PollPolicy()
+        poll_policy.get_interval = mock.Mock(return_value=0)
+        self.connection.set_poll_policy(poll_policy)
+        running = {"uri": "uri", "taskState": "Running", "computedPercentComplete": 50}
+        mock_get.side_effect = [running, {"uri": "uri", "taskState": "Completed"}, {"uri": "uri", "taskState": "Completed"}]
+
+        self.task_monitor.get_completed_task({"uri": "uri"})
+
+        attempt, task, elapsed = poll_policy.get_interval.call_args[0]
+        self.assertEqual(attempt, 1)
+        self.assertEqual(task, running)
+        self.assertGreaterEqual(elapsed, 0)
+
+    def test_poll_policy_is_linear_by_default(self):
+        poll_policy = self.task_monitor.get_poll_policy()
+
+        self.assertEqual([poll_policy.get_interval(attempt) for attempt in range(1, 13)],
+                         [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10])
+
+    def test_exponential_poll_policy_is_bounded(self):
+        poll_policy = ExponentialPollPolicy(min_interval=0.1, max_interval=1, multiplier=2, jitter=0)
+
+        self.assertEqual([poll_policy.get_interval(attempt) for attempt in range(1, 7)], [0.1, 0.2, 0.4, 0.8, 1, 1])
+
+    def test_exponential_poll_policy_with_jitter(self):
+        poll_policy = ExponentialPollPolicy(min_interval=1, max_interval=10, multiplier=2, jitter=0.5)
+
+        intervals = [poll_policy.get_interval(3) for _ in range(50)]
+
+        self.assertTrue(all(2 <= interval <= 6 for interval in intervals))
+        self.assertGreater(len(set(intervals)), 1)
+
+    def test_exponential_poll_policy_with_task_progress(self):
+        poll_policy = ExponentialPollPolicy(min_interval=0.1, max_interval=10, jitter=0, use_task_progress=True)
+
+        self.assertEqual(poll_policy.get_interval(1, {"computedPercentComplete": 80}, elapsed=8), 2)
+        self.assertEqual(poll_policy.get_interval(1, {"computedPercentComplete": 0, "expectedDuration": 4}), 4)
+        self.assertEqual(poll_policy.get_interval(1, {"computedPercentComplete": 10}, elapsed=9), 10)
+        self.assertEqual(poll_policy.get_interval(2, {"computedPercentComplete": 0}), 0.2)
+
     @mock.patch.object(TaskMonitor, 'is_task_running')
     @mock.patch.object(TaskMonitor, 'get')
     def test_wait_for_task_with_error_message(self, mock_get, mock_is_running):
@@ -23,19 +23,26 @@
 import json
 import ssl
 import unittest
-import mmap
 import os
 import shutil
+import socket
+import tempfile
+import threading
+import warnings
 import os.path
 
-from mock import patch, call, Mock, ANY
-from http.client import HTTPSConnection, BadStatusLine, HTTPException
-from hpOneView.connection import connection
-from hpOneView.exceptions import HPOneViewException
+from mock import patch, call, Mock, MagicMock, ANY
+from http.client import HTTPSConnection, BadStatusLine, HTTPException, IncompleteRead
+from hpOneView.connection import connection, ConnectionPool, get_ssl_context, clear_ssl_context_cache, \
+    get_content_range_size, TransferProgress, ResponseCache, ETagCache, get_collection_uri, \
+    SessionCache, TokenBucket, RequestLimiter, get_request_limiter, RetryPolicy, CircuitBreaker, \
+    get_circuit_breaker, get_retry_after, is_dropped_connection
+from hpOneView.exceptions import HPOneViewException, HPOneViewCircuitOpen
 
 
 class ConnectionTest(unittest.TestCase):
     def setUp(self):
+        clear_ssl_context_cache()
         self.host = '127.0.0.1'
         self.connection = connection(self.host)
         self.accept_language_header = {
@@ -71,12 +78,10 @@ class ConnectionTest(unittest.TestCase):
             mock_response.getheader.return_value = '/task/uri'
         return mock_response
 
-    def __create_fake_mapped_file(self):
-        mock_mapped_file = Mock()
-        mock_mapped_file.tell.side_effect = [0, 1048576, 2097152, 2621440]  # 0, 1MB, 2MB 2.5MB
-        mock_mapped_file.size.return_value = 2621440  # 2.5MB
-        mock_mapped_file.read.side_effect = ['data chunck 1', 'data chunck 2', 'data chunck 3']
-        return mock_mapped_file
+    def __create_fake_input_file(self):
+        mock_input_file = Mock()
+        mock_input_file.read.side_effect = [b'data chunck 1', b'data chunck 2', b'data chunck 3', b'']
+        return mock_input_file
 
     def __prepare_connection_to_post_multipart(self, response_status=200):
         fake_connection = Mock()
@@ -87,13 +92,10 @@ class ConnectionTest(unittest.TestCase):
         self.connection.get_connection.return_value = fake_connection
 
         self.connection._open = Mock()
+        self.connection._open.return_value = self.__create_fake_input_file()
 
         self.connection._headers['auth'] = 'LTIxNjUzMjc0OTUzzHoF7eEkZLEUWVA-fuOZP4VGA3U8e67E'
 
-        encode_multipart = "multipart/form-data; boundary=----------ThIs_Is_tHe_bouNdaRY_$"
-        self.connection.encode_multipart_formdata = Mock()
-        self.connection.encode_multipart_formdata.return_value = encode_multipart
-
     def test_default_headers(self):
         self.assertEqual(self.default_headers, self.connection._headers)
 
@@ -610,6 +612,7 @@ class ConnectionTest(unittest.TestCase):
         mock_conn = mock_get_connection.return_value = Mock()
         mock_response = Mock()
         mock_conn.getresponse.side_effect = [HTTPException('timed out'), mock_response]
+        self.connection.set_retry_policy(RetryPolicy(max_attempts=1))
 
         mock_stream = Mock()
 
@@ -618,13 +621,10 @@ class ConnectionTest(unittest.TestCase):
 
         self.assertTrue('timed out' in context.exception.msg)
 
-    @patch.object(mmap, 'mmap')
-    @patch.object(shutil, 'copyfileobj')
     @patch.object(os.path, 'getsize')
-    @patch.object(os, 'remove')
-    def test_post_multipart_should_put_request(self, mock_rm, mock_path_size, mock_copy, mock_mmap):
+    def test_post_multipart_should_put_request(self, mock_path_size):
         self.__prepare_connection_to_post_multipart()
-        mock_mmap.return_value = self.__create_fake_mapped_file()
+        mock_path_size.return_value = 2621440
 
         self.connection.post_multipart(uri='/rest/resources/',
                                        fields=None,
@@ -634,13 +634,9 @@ class ConnectionTest(unittest.TestCase):
         internal_conn = self.connection.get_connection.return_value
         internal_conn.putrequest.assert_called_once_with('POST', '/rest/resources/')
 
-    @patch.object(mmap, 'mmap')
-    @patch.object(shutil, 'copyfileobj')
     @patch.object(os.path, 'getsize')
-    @patch.object(os, 'remove')
-    def test_post_multipart_should_put_headers(self, mock_rm, mock_path_size, mock_copy, mock_mmap):
+    def test_post_multipart_should_put_headers(self, mock_path_size):
         self.__prepare_connection_to_post_multipart()
-        mock_mmap.return_value = self.__create_fake_mapped_file()
         mock_path_size.return_value = 2621440  # 2.5 MB
 
         self.connection.post_multipart(uri='/rest/resources/',
@@ -648,43 +644,55 @@ class ConnectionTest(unittest.TestCase):
                                        files="/a/path/filename.zip",
                                        baseName="archive.zip")
 
+        preamble_size = len(b'------------ThIs_Is_tHe_bouNdaRY_$\r\n'
+                            b'Content-Disposition: form-data; name="file"; filename="archive.zip"\r\n'
+                            b'Content-Type: application/octet-stream\r\n\r\n')
+        epilogue_size = len(b'\r\n------------ThIs_Is_tHe_bouNdaRY_$--\r\n\r\n')
         expected_putheader_calls = [
             call('uploadfilename', 'archive.zip'),
             call('auth', 'LTIxNjUzMjc0OTUzzHoF7eEkZLEUWVA-fuOZP4VGA3U8e67E'),
             call('Content-Type', 'multipart/form-data; boundary=----------ThIs_Is_tHe_bouNdaRY_$'),
-            call('Content-Length', 2621440),
+            call('Content-Length', preamble_size + 2621440 + epilogue_size),
             call('X-API-Version', 300)]
 
         internal_conn = self.connection.get_connection.return_value
         internal_conn.putheader.assert_has_calls(expected_putheader_calls)
 
-    @patch.object(mmap, 'mmap')
-    @patch.object(shutil, 'copyfileobj')
     @patch.object(os.path, 'getsize')
-    @patch.object(os, 'remove')
-    def test_post_multipart_should_read_file_in_chunks_of_1mb(self, mock_rm, mock_path_size, mock_copy, mock_mmap):
+    def test_post_multipart_should_read_file_in_chunks_of_upload_chunk_size(self, mock_path_size):
         self.__prepare_connection_to_post_multipart()
-        mock_mmap.return_value = self.__create_fake_mapped_file()
 
         self.connection.post_multipart(uri='/rest/resources/',
                                        fields=None,
                                        files="/a/path/filename.zip",
                                        baseName="archive.zip")
 
-        expected_mmap_read_calls = [
-            call(1048576),
-            call(1048576),
-            call(1048576)]
+        self.connection._open.assert_called_once_with("/a/path/filename.zip", 'rb')
+        self.connection._open.return_value.read.assert_has_calls([call(4194304)] * 4)
+        self.connection._open.return_value.close.assert_called_once_with()
 
-        mock_mmap.return_value.read.assert_has_calls(expected_mmap_read_calls)
+    @patch.object(os.path, 'getsize')
+    def test_post_multipart_should_read_file_in_chunks_of_given_size(self, mock_path_size):
+        self.__prepare_connection_to_post_multipart()
+        self.connection.set_upload_chunk_size(65536)
+
+        self.connection.post_multipart(uri='/rest/resources/',
+                                       fields=None,
+                                       files="/a/path/filename.zip",
+                                       baseName="archive.zip")
+        self.connection._open.return_value.read.assert_has_calls([call(65536)] * 4)
+
+        self.__prepare_connection_to_post_multipart()
+        self.connection.post_multipart(uri='/rest/resources/',
+                                       fields=None,
+                                       files="/a/path/filename.zip",
+                                       baseName="archive.zip",
+                                       chunk_size=1024)
+        self.connection._open.return_value.read.assert_has_calls([call(1024)] * 4)
 
-    @patch.object(mmap, 'mmap')
-    @patch.object(shutil, 'copyfileobj')
     @patch.object(os.path, 'getsize')
-    @patch.object(os, 'remove')
-    def test_post_multipart_should_send_file_in_chuncks_of_1mb(self, mock_rm, mock_path_size, mock_copy, mock_mmap):
+    def test_post_multipart_should_send_envelope_and_file_in_chunks(self, mock_path_size):
         self.__prepare_connection_to_post_multipart()
-        mock_mmap.return_value = self.__create_fake_mapped_file()
 
         self.connection.post_multipart(uri='/rest/resources/',
                                        fields=None,
@@ -692,36 +700,182 @@ class ConnectionTest(unittest.TestCase):
                                        baseName="archive.zip")
 
         expected_conn_send_calls = [
-            call('data chunck 1'),
-            call('data chunck 2'),
-            call('data chunck 3')]
+            call(b'------------ThIs_Is_tHe_bouNdaRY_$\r\n'
+                 b'Content-Disposition: form-data; name="file"; filename="archive.zip"\r\n'
+                 b'Content-Type: application/octet-stream\r\n\r\n'),
+            call(b'data chunck 1'),
+            call(b'data chunck 2'),
+            call(b'data chunck 3'),
+            call(b'\r\n------------ThIs_Is_tHe_bouNdaRY_$--\r\n\r\n')]
 
         internal_conn = self.connection.get_connection.return_value
-        internal_conn.send.assert_has_calls(expected_conn_send_calls)
+        self.assertEqual(internal_conn.send.call_args_list, expected_conn_send_calls)
 
-    @patch.object(mmap, 'mmap')
-    @patch.object(shutil, 'copyfileobj')
     @patch.object(os.path, 'getsize')
     @patch.object(os, 'remove')
-    def test_post_multipart_should_remove_temp_encoded_file(self, mock_rm, mock_path_size, mock_copy, mock_mmap):
+    @patch.object(connection, 'encode_multipart_formdata')
+    def test_post_multipart_should_not_write_temp_encoded_file(self, mock_encode, mock_rm, mock_path_size):
         self.__prepare_connection_to_post_multipart()
-        mock_mmap.return_value = self.__create_fake_mapped_file()
 
         self.connection.post_multipart(uri='/rest/resources/',
                                        fields=None,
                                        files="/a/path/filename.zip",
                                        baseName="archive.zip")
 
-        mock_rm.assert_called_once_with('/a/path/filename.zip.b64')
+        mock_encode.assert_not_called()
+        mock_rm.assert_not_called()
+        self.connection._open.assert_called_once_with("/a/path/filename.zip", 'rb')
 
-    @patch.object(mmap, 'mmap')
-    @patch.object(shutil, 'copyfileobj')
     @patch.object(os.path, 'getsize')
-    @patch.object(os, 'remove')
-    def test_post_multipart_should_raise_exception_when_response_status_400(self, mock_rm, mock_path_size, mock_copy,
-                                                                            mock_mmap):
+    def test_post_multipart_should_close_file_when_send_fails(self, mock_path_size):
+        self.__prepare_connection_to_post_multipart()
+        internal_conn = self.connection.get_connection.return_value
+        internal_conn.send.side_effect = [None, socket.error('connection reset')]
+
+        self.assertRaises(socket.error, self.connection.post_multipart, '/rest/resources/', None, "/a/path/filename.zip",
+                          "archive.zip")
+        self.connection._open.return_value.close.assert_called_once_with()
+
+    @patch.object(os.path, 'getsize')
+    def test_post_multipart_should_keep_body_which_is_not_json(self, mock_path_size):
+        self.__prepare_connection_to_post_multipart()
+        self.connection.get_connection.return_value.getresponse.return_value.read.return_value = b'uploaded'
+
+        _, body = self.connection.post_multipart('/rest/resources/', None, "/a/path/filename.zip", "archive.zip")
+
+        self.assertEqual(body, 'uploaded')
+
+    @patch.object(os.path, 'getsize')
+    def test_post_multipart_should_fail_fast_while_circuit_is_open(self, mock_path_size):
+        self.__prepare_connection_to_post_multipart()
+        circuit_breaker = Mock()
+        circuit_breaker.before_request.side_effect = HPOneViewCircuitOpen('open')
+        self.connection.set_circuit_breaker(circuit_breaker)
+
+        self.assertRaises(HPOneViewCircuitOpen, self.connection.post_multipart, '/rest/resources/', None,
+                          "/a/path/filename.zip", "archive.zip")
+        self.connection.get_connection.assert_not_called()
+
+    @patch.object(os.path, 'getsize')
+    def test_post_multipart_should_record_result_in_circuit_breaker(self, mock_path_size):
+        self.__prepare_connection_to_post_multipart()
+        circuit_breaker = Mock()
+        self.connection.set_circuit_breaker(circuit_breaker)
+
+        self.connection.post_multipart('/rest/resources/', None, "/a/path/filename.zip", "archive.zip")
+
+        circuit_breaker.record_success.assert_called_once_with()
+        circuit_breaker.record_failure.assert_not_called()
+
+    @patch.object(os.path, 'getsize')
+    def test_post_multipart_should_not_retry_failed_upload(self, mock_path_size):
+        self.__prepare_connection_to_post_multipart()
+        self.connection.get_connection.return_value.getresponse.side_effect = socket.error('connection reset')
+        circuit_breaker = Mock()
+        self.connection.set_circuit_breaker(circuit_breaker)
+
+        self.assertRaises(socket.error, self.connection.post_multipart, '/rest/resources/', None,
+                          "/a/path/filename.zip", "archive.zip")
+        self.connection.get_connection.assert_called_once_with()
+        circuit_breaker.record_failure.assert_called_once_with()
+
+    @patch.object(os.path, 'getsize')
+    def test_post_multipart_should_count_as_write_request(self, mock_path_size):
+        self.__prepare_connection_to_post_multipart()
+        request_limiter = MagicMock()
+        self.connection.set_request_limiter(request_limiter)
+
+        self.connection.post_multipart('/rest/resources/', None, "/a/path/filename.zip", "archive.zip")
+
+        request_limiter.limit.assert_called_once_with('POST', '/rest/resources/')
+
+    @patch.object(os.path, 'getsize')
+    def test_post_multipart_should_use_new_connection_when_pooled_connection_was_dropped(self, mock_path_size):
+        self.__prepare_connection_to_post_multipart()
+        new_conn = self.connection.get_connection.return_value
+        stale_conn = Mock()
+        stale_conn.endheaders.side_effect = socket.error('Connection reset by peer')
+        pool = ConnectionPool()
+        pool.release(('127.0.0.1', None, None), stale_conn)
+        self.connection.set_connection_pool(pool)
+
+        self.connection.post_multipart('/rest/resources/', None, "/a/path/filename.zip", "archive.zip")
+
+        stale_conn.close.assert_called_once_with()
+        stale_conn.connect.assert_not_called()
+        new_conn.connect.assert_called_once_with()
+        self.assertEqual(pool.acquire(('127.0.0.1', None, None)), new_conn)
+
+    @patch.object(os.path, 'getsize')
+    def test_post_multipart_should_not_send_again_when_pooled_connection_times_out(self, mock_path_size):
+        self.__prepare_connection_to_post_multipart()
+        stale_conn = Mock()
+        stale_conn.getresponse.side_effect = socket.timeout('timed out')
+        pool = ConnectionPool()
+        pool.release(('127.0.0.1', None, None), stale_conn)
+        self.connection.set_connection_pool(pool)
+
+        self.assertRaises(socket.timeout, self.connection.post_multipart, '/rest/resources/', None,
+                          "/a/path/filename.zip", "archive.zip")
+
+        stale_conn.putrequest.assert_called_once_with('POST', '/rest/resources/')
+        stale_conn.close.assert_called_once_with()
+        self.connection.get_connection.assert_not_called()
+
+    @patch.object(os.path, 'getsize')
+    def test_post_multipart_should_send_again_when_pooled_connection_closed_without_response(self, mock_path_size):
+        self.__prepare_connection_to_post_multipart()
+        new_conn = self.connection.get_connection.return_value
+        stale_conn = Mock()
+        stale_conn.getresponse.side_effect = BadStatusLine('')
+        pool = ConnectionPool()
+        pool.release(('127.0.0.1', None, None), stale_conn)
+        self.connection.set_connection_pool(pool)
+        self.connection._open.side_effect = [self.__create_fake_input_file(), self.__create_fake_input_file()]
+        progress_callback = Mock()
+
+        self.connection.post_multipart('/rest/resources/', None, "/a/path/filename.zip", "archive.zip",
+                                       progress_callback=progress_callback)
+
+        new_conn.putrequest.assert_called_once_with('POST', '/rest/resources/')
+        self.assertEqual(self.connection._open.call_count, 2)
+        self.assertEqual(progress_callback.call_args[0][0]['bytes_transferred'],
+                         sum(len(c[0][0]) for c in new_conn.send.call_args_list[1:-1]))
+
+    @patch.object(os.path, 'getsize')
+    def test_post_multipart_should_report_progress(self, mock_path_size):
+        self.__prepare_connection_to_post_multipart()
+        mock_path_size.return_value = 39
+        progress_callback = Mock()
+        transfer_callback = Mock()
+        self.connection.set_transfer_callback(transfer_callback)
+
+        self.connection.post_multipart(uri='/rest/resources/',
+                                       fields=None,
+                                       files="/a/path/filename.zip",
+                                       baseName="archive.zip",
+                                       progress_callback=progress_callback)
+
+        reported = [c[0][0] for c in progress_callback.call_args_list]
+        self.assertEqual([p['bytes_transferred'] for p in reported], [13, 26, 39])
+        self.assertTrue(all(p['total_bytes'] == 39 for p in reported))
+        self.assertTrue(all(p['direction'] == 'upload' for p in reported))
+        self.assertEqual(transfer_callback.call_args_list, progress_callback.call_args_list)
+
+    @patch.object(connection, 'post_multipart')
+    def test_post_multipart_with_response_handling_should_pass_progress_callback(self, mock_post_multipart):
+        mock_post_multipart.return_value = self.__make_http_response(status=200), None
+        progress_callback = Mock()
+
+        self.connection.post_multipart_with_response_handling('/rest/resources/', '/a/path/filename.zip',
+                                                              'archive.zip', progress_callback=progress_callback)
+
+        mock_post_multipart.assert_called_once_with('/rest/resources/', None, '/a/path/filename.zip', 'archive.zip',
+                                                    progress_callback=progress_callback)
+
+    @patch.object(os.path, 'getsize')
+    def test_post_multipart_should_raise_exception_when_response_status_400(self, mock_path_size):
         self.__prepare_connection_to_post_multipart(response_status=400)
-        mock_mmap.return_value = self.__create_fake_mapped_file()
 
         try:
             self.connection.post_multipart(uri='/rest/resources/',
@@ -733,14 +887,9 @@ class ConnectionTest(unittest.TestCase):
         else:
             self.fail()
 
-    @patch.object(mmap, 'mmap')
-    @patch.object(shutil, 'copyfileobj')
     @patch.object(os.path, 'getsize')
-    @patch.object(os, 'remove')
-    def test_post_multipart_should_return_response_and_body_when_response_status_200(self, mock_rm, mock_path_size,
-                                                                                     mock_copy, mock_mmap):
+    def test_post_multipart_should_return_response_and_body_when_response_status_200(self, mock_path_size):
         self.__prepare_connection_to_post_multipart()
-        mock_mmap.return_value = self.__create_fake_mapped_file()
 
         response, body = self.connection.post_multipart(uri='/rest/resources/',
                                                         fields=None,
@@ -750,15 +899,10 @@ class ConnectionTest(unittest.TestCase):
         self.assertEqual(body, self.expected_response_body)
         self.assertEqual(response.status, 200)
 
-    @patch.object(mmap, 'mmap')
-    @patch.object(shutil, 'copyfileobj')
     @patch.object(os.path, 'getsize')
-    @patch.object(os, 'remove')
     @patch.object(json, 'loads')
-    def test_post_multipart_should_handle_json_load_exception(self, mock_json_loads, mock_rm, mock_path_size, mock_copy,
-                                                              mock_mmap):
+    def test_post_multipart_should_handle_json_load_exception(self, mock_json_loads, mock_path_size):
         self.__prepare_connection_to_post_multipart()
-        mock_mmap.return_value = self.__create_fake_mapped_file()
         mock_json_loads.side_effect = ValueError("Invalid JSON")
 
         response, body = self.connection.post_multipart(uri='/rest/resources/',
@@ -861,11 +1005,11 @@ class ConnectionTest(unittest.TestCase):
         mock_response.status = 200
 
         with patch('time.sleep'):
-            resp, body = self.connection.do_http('POST', '/rest/test', 'body')
+            resp, body = self.connection.do_http('GET', '/rest/test', 'body')
 
         self.assertEqual(body, 'response data')
 
-        mock_conn.request.assert_called_with('POST', '/rest/test', 'body',
+        mock_conn.request.assert_called_with('GET', '/rest/test', 'body',
                                              {'Content-Type': 'application/json',
                                               'X-API-Version': 300,
                                               'Accept': 'application/json'})
@@ -884,6 +1028,289 @@ class ConnectionTest(unittest.TestCase):
 
         self.assertTrue('timed out' in context.exception.msg)
 
+    @patch.object(connection, 'get_connection')
+    def test_do_http_should_reuse_pooled_connection(self, mock_get_connection):
+        mock_conn = mock_get_connection.return_value = Mock()
+        mock_conn.getresponse.return_value.read.return_value = b"response data"
+        self.connection.set_connection_pool(ConnectionPool())
+
+        self.connection.do_http('GET', '/rest/test', '')
+        self.connection.do_http('GET', '/rest/test', '')
+
+        mock_get_connection.assert_called_once_with()
+        self.assertEqual(mock_conn.request.call_count, 2)
+        mock_conn.close.assert_not_called()
+
+    @patch.object(connection, 'get_connection')
+    def test_do_http_should_retry_without_sleep_when_pooled_connection_was_dropped(self, mock_get_connection):
+        stale_conn = Mock()
+        stale_conn.request.side_effect = socket.error('Connection reset by peer')
+        new_conn = Mock()
+        new_conn.getresponse.return_value.read.return_value = b"response data"
+        mock_get_connection.return_value = new_conn
+
+        pool = ConnectionPool()
+        pool.release(('127.0.0.1', None, None), stale_conn)
+        self.connection.set_connection_pool(pool)
+
+        with patch('time.sleep') as mock_sleep:
+            _, body = self.connection.do_http('GET', '/rest/test', '')
+
+        self.assertEqual(body, 'response data')
+        stale_conn.close.assert_called_once_with()
+        mock_sleep.assert_not_called()
+
+    @patch.object(connection, 'get_connection')
+    def test_do_http_should_send_again_when_pooled_connection_closed_without_response(self, mock_get_connection):
+        stale_conn = Mock()
+        stale_conn.getresponse.side_effect = BadStatusLine('')
+        new_conn = mock_get_connection.return_value = Mock()
+        new_conn.getresponse.return_value.read.return_value = b'{"name": "profile"}'
+        new_conn.getresponse.return_value.status = 200
+
+        pool = ConnectionPool()
+        pool.release(('127.0.0.1', None, None), stale_conn)
+        self.connection.set_connection_pool(pool)
+
+        _, body = self.connection.do_http('POST', '/rest/server-profiles', '{}')
+
+        self.assertEqual(body, {'name': 'profile'})
+        stale_conn.request.assert_called_once_with('POST', '/rest/server-profiles', '{}', ANY)
+        new_conn.request.assert_called_once_with('POST', '/rest/server-profiles', '{}', ANY)
+
+    @patch.object(connection, 'get_connection')
+    def test_do_http_should_not_send_post_again_when_pooled_connection_times_out(self, mock_get_connection):
+        stale_conn = Mock()
+        stale_conn.getresponse.side_effect = socket.timeout('timed out')
+
+        pool = ConnectionPool()
+        pool.release(('127.0.0.1', None, None), stale_conn)
+        self.connection.set_connection_pool(pool)
+
+        with patch('time.sleep') as mock_sleep:
+            self.assertRaises(socket.timeout, self.connection.do_http, 'POST', '/rest/server-profiles', '{}')
+
+        stale_conn.request.assert_called_once_with('POST', '/rest/server-profiles', '{}', ANY)
+        mock_get_connection.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    @patch.object(connection, 'get_connection')
+    def test_do_http_should_leave_get_timing_out_on_pooled_connection_to_retry_policy(self, mock_get_connection):
+        stale_conn = Mock()
+        stale_conn.getresponse.side_effect = socket.timeout('timed out')
+        new_conn = mock_get_connection.return_value = Mock()
+        new_conn.getresponse.return_value.read.return_value = b'response data'
+        new_conn.getresponse.return_value.status = 200
+
+        pool = ConnectionPool()
+        pool.release(('127.0.0.1', None, None), stale_conn)
+        self.connection.set_connection_pool(pool)
+
+        with patch('time.sleep') as mock_sleep:
+            _, body = self.connection.do_http('GET', '/rest/test', '')
+
+        self.assertEqual(body, 'response data')
+        mock_sleep.assert_called_once_with(ANY)
+
+    def test_is_dropped_connection(self):
+        self.assertTrue(is_dropped_connection(socket.error('Broken pipe'), request_sent=False))
+        self.assertTrue(is_dropped_connection(BadStatusLine(''), request_sent=True))
+        self.assertFalse(is_dropped_connection(BadStatusLine('HTTP/1.1 2'), request_sent=True))
+        self.assertFalse(is_dropped_connection(socket.error('Connection reset by peer'), request_sent=True))
+        self.assertFalse(is_dropped_connection(socket.timeout('timed out'), request_sent=False))
+        self.assertFalse(is_dropped_connection(socket.timeout('timed out'), request_sent=True))
+
+    @patch.object(connection, 'get_connection')
+    def test_do_http_should_raise_socket_error_when_connection_is_new(self, mock_get_connection):
+        mock_conn = mock_get_connection.return_value = Mock()
+        mock_conn.request.side_effect = socket.error('Connection refused')
+        self.connection.set_connection_pool(ConnectionPool())
+
+        with patch('time.sleep') as mock_sleep:
+            self.assertRaises(socket.error, self.connection.do_http, 'GET', '/rest/test', '')
+
+        self.assertEqual(mock_conn.close.call_count, RetryPolicy.DEFAULT_MAX_ATTEMPTS)
+        self.assertEqual(mock_sleep.call_count, RetryPolicy.DEFAULT_MAX_ATTEMPTS - 1)
+
+    @patch.object(connection, 'get_connection')
+    def test_download_to_stream_should_release_connection_to_pool(self, mock_get_connection):
+        mock_conn = mock_get_connection.return_value = Mock()
+        mock_response = mock_conn.getresponse.return_value
+        mock_response.read.side_effect = ['111', None]
+        mock_response.status = 200
+        pool = ConnectionPool()
+        self.connection.set_connection_pool(pool)
+
+        self.connection.download_to_stream(Mock(), '/rest/download.zip')
+
+        mock_conn.close.assert_not_called()
+        self.assertEqual(pool.acquire(('127.0.0.1', None, None)), mock_conn)
+
+    @patch.object(connection, 'delete')
+    def test_logout_should_clear_connection_pool(self, mock_delete):
+        mock_pool = Mock()
+        self.connection.set_connection_pool(mock_pool)
+        self.connection.set_session_id('123')
+
+        self.connection.logout()
+
+        mock_pool.clear.assert_called_once_with()
+
+    @patch.object(connection, 'delete')
+    def test_logout_should_clear_response_cache(self, mock_delete):
+        response_cache = ResponseCache()
+        response_cache.put('/rest/version', {'currentVersion': 800})
+        self.connection.set_response_cache(response_cache)
+        self.connection.set_session_id('123')
+
+        self.connection.logout()
+
+        self.assertIsNone(response_cache.get('/rest/version'))
+
+    @patch.object(connection, 'do_http')
+    def test_get_should_use_response_cache(self, mock_do_http):
+        mock_do_http.return_value = (Mock(status=200), {'members': [{'name': 'SY 480 Gen9'}], 'total': 1})
+        self.connection.set_response_cache(ResponseCache())
+
+        self.connection.get('/rest/server-hardware-types')
+        body = self.connection.get('/rest/server-hardware-types')
+
+        mock_do_http.assert_called_once_with('GET', '/rest/server-hardware-types', '')
+        self.assertEqual(body, {'members': [{'name': 'SY 480 Gen9'}], 'total': 1})
+        self.assertEqual(self.connection._numTotalRecords, 1)
+
+    @patch.object(connection, 'do_http')
+    def test_get_should_not_cache_uri_without_policy(self, mock_do_http):
+        mock_do_http.return_value = (Mock(status=200), {'name': 'network'})
+        self.connection.set_response_cache(ResponseCache())
+
+        self.connection.get('/rest/fc-networks/1')
+        self.connection.get('/rest/fc-networks/1')
+
+        self.assertEqual(mock_do_http.call_count, 2)
+
+    @patch.object(connection, 'do_http')
+    def test_get_should_not_cache_error_response(self, mock_do_http):
+        mock_do_http.side_effect = [(Mock(status=500), {'message': 'error'}), (Mock(status=200), {'name': 'type'})]
+        self.connection.set_response_cache(ResponseCache())
+
+        self.assertRaises(HPOneViewException, self.connection.get, '/rest/switch-types/1')
+        body = self.connection.get('/rest/switch-types/1')
+
+        self.assertEqual(body, {'name': 'type'})
+
+    @patch.object(connection, 'do_http')
+    def test_get_should_send_etag_of_previous_response(self, mock_do_http):
+        first_response = Mock(status=200)
+        first_response.getheader.return_value = '"1-abc"'
+        mock_do_http.side_effect = [(first_response, {'name': 'profile', 'eTag': '1-abc'}),
+                                    (Mock(status=304), '')]
+        self.connection.set_etag_cache(ETagCache())
+
+        self.connection.get('/rest/server-profiles/1')
+        body = self.connection.get('/rest/server-profiles/1')
+
+        self.assertEqual(body, {'name': 'profile', 'eTag': '1-abc'})
+        mock_do_http.assert_has_calls([call('GET', '/rest/server-profiles/1', ''),
+                                       call('GET', '/rest/server-profiles/1', '', {'If-None-Match': '"1-abc"'})])
+
+    @patch.object(connection, 'do_http')
+    def test_get_should_keep_etag_of_modified_resource(self, mock_do_http):
+        etag_cache = ETagCache()
+        etag_cache.put('/rest/server-profiles/1', '1-abc', {'name': 'profile', 'eTag': '1-abc'})
+        modified_response = Mock(status=200)
+        modified_response.getheader.return_value = None
+        mock_do_http.return_value = (modified_response, {'name': 'renamed', 'eTag': '2-def'})
+        self.connection.set_etag_cache(etag_cache)
+
+        body = self.connection.get('/rest/server-profiles/1')
+
+        self.assertEqual(body, {'name': 'renamed', 'eTag': '2-def'})
+        self.assertEqual(etag_cache.get('/rest/server-profiles/1'), ('2-def', {'name': 'renamed', 'eTag': '2-def'}))
+
+    @patch.object(connection, 'do_http')
+    def test_get_should_not_keep_response_without_etag(self, mock_do_http):
+        etag_cache = ETagCache()
+        response = Mock(status=200)
+        response.getheader.return_value = None
+        mock_do_http.return_value = (response, {'members': []})
+        self.connection.set_etag_cache(etag_cache)
+
+        self.connection.get('/rest/server-profiles')
+
+        self.assertIsNone(etag_cache.get('/rest/server-profiles'))
+
+    @patch.object(connection, 'do_http')
+    def test_get_if_modified_should_return_none_when_not_modified(self, mock_do_http):
+        mock_do_http.return_value = (Mock(status=304), '')
+
+        body = self.connection.get_if_modified('/rest/server-profiles/1', '1-abc')
+
+        self.assertIsNone(body)
+        mock_do_http.assert_called_once_with('GET', '/rest/server-profiles/1', '', {'If-None-Match': '1-abc'})
+
+    @patch.object(connection, 'do_http')
+    def test_get_if_modified_should_return_modified_resource(self, mock_do_http):
+        mock_do_http.return_value = (Mock(status=200), {'name': 'renamed', 'eTag': '2-def'})
+
+        body = self.connection.get_if_modified('/rest/server-profiles/1', '1-abc')
+
+        self.assertEqual(body, {'name': 'renamed', 'eTag': '2-def'})
+
+    @patch.object(connection, 'do_http')
+    def test_get_if_modified_should_raise_exception_when_status_400(self, mock_do_http):
+        mock_do_http.return_value = (Mock(status=404), {'message': 'Not found'})
+
+        self.assertRaises(HPOneViewException, self.connection.get_if_modified, '/rest/server-profiles/1', '1-abc')
+
+    @patch.object(connection, 'delete')
+    def test_logout_should_clear_etag_cache(self, mock_delete):
+        etag_cache = ETagCache()
+        etag_cache.put('/rest/server-profiles/1', '1-abc', {'name': 'profile'})
+        self.connection.set_etag_cache(etag_cache)
+        self.connection.set_session_id('123')
+
+        self.connection.logout()
+
+        self.assertIsNone(etag_cache.get('/rest/server-profiles/1'))
+
+    def test_get_collection_state_should_create_state_once(self):
+        factory = Mock(side_effect=[{'name': 'index'}, {'name': 'other index'}])
+
+        index = self.connection.get_collection_state('/rest/enclosures:hostname', factory)
+
+        self.assertIs(self.connection.get_collection_state('/rest/enclosures:hostname', factory), index)
+        factory.assert_called_once_with()
+
+    @patch.object(connection, 'do_http')
+    def test_mutating_requests_should_invalidate_cached_collection(self, mock_do_http):
+        response_cache = ResponseCache()
+        self.connection.set_response_cache(response_cache)
+        mock_do_http.return_value = (Mock(status=200), {})
+
+        for method in (self.connection.delete, self.connection.post, self.connection.put, self.connection.patch):
+            response_cache.put('/rest/server-hardware-types?start=0&count=-1', {'members': []})
+            response_cache.put('/rest/interconnect-types', {'members': []})
+
+            if method == self.connection.delete:
+                method('/rest/server-hardware-types/1')
+            else:
+                method('/rest/server-hardware-types/1', {})
+
+            self.assertIsNone(response_cache.get('/rest/server-hardware-types?start=0&count=-1'))
+            self.assertEqual(response_cache.get('/rest/interconnect-types'), {'members': []})
+
+    @patch.object(connection, 'do_http')
+    def test_failed_mutating_request_should_invalidate_cached_collection(self, mock_do_http):
+        response_cache = ResponseCache()
+        response_cache.put('/rest/server-hardware-types/1', {'name': 'SY 480 Gen9'})
+        self.connection.set_response_cache(response_cache)
+        mock_do_http.side_effect = socket.error('Connection reset by peer')
+
+        self.assertRaises(socket.error, self.connection.put, '/rest/server-hardware-types/1', {})
+
+        self.assertIsNone(response_cache.get('/rest/server-hardware-types/1'))
+
     @patch.object(connection, 'get')
     @patch.object(connection, 'post')
     def test_login(self, mock_post, mock_get):
@@ -948,6 +1375,200 @@ class ConnectionTest(unittest.TestCase):
 
         self.assertRaises(HPOneViewException, self.connection.login, {"userName": "administrator", "password": "", "sessionID": "123"})
 
+    @patch.object(connection, 'get')
+    @patch.object(connection, 'post')
+    def test_login_reuses_cached_session(self, mock_post, mock_get):
+        session_cache = SessionCache(path=tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, session_cache.path)
+        mock_get.return_value = {'minimumVersion': 300, 'currentVersion': 400}
+        mock_post.return_value = None, {'sessionID': '123'}
+        self.connection.set_session_cache(session_cache)
+        self.connection.login({'userName': 'administrator', 'password': 'secret'})
+
+        other_connection = connection(self.host)
+        other_connection.set_session_cache(session_cache)
+        other_connection.login({'userName': 'administrator', 'password': 'secret'})
+
+        self.assertEqual(other_connection.get_session_id(), '123')
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch.object(connection, 'get')
+    @patch.object(connection, 'post')
+    def test_login_with_other_credentials_reuses_cached_version_only(self, mock_post, mock_get):
+        session_cache = SessionCache(path=tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, session_cache.path)
+        mock_get.return_value = {'minimumVersion': 300, 'currentVersion': 400}
+        mock_post.side_effect = [(None, {'sessionID': '123'}), (None, {'sessionID': '456'})]
+        self.connection.set_session_cache(session_cache)
+        self.connection.login({'userName': 'administrator', 'password': 'secret'})
+
+        other_connection = connection(self.host)
+        other_connection.set_session_cache(session_cache)
+        other_connection.login({'userName': 'administrator', 'password': 'other'})
+
+        self.assertEqual(other_connection.get_session_id(), '456')
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch.object(connection, 'get')
+    @patch.object(connection, 'delete')
+    @patch.object(connection, 'post')
+    def test_logout_discards_cached_session(self, mock_post, mock_delete, mock_get):
+        session_cache = SessionCache(path=tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, session_cache.path)
+        mock_get.return_value = {'minimumVersion': 300, 'currentVersion': 400}
+        mock_post.side_effect = [(None, {'sessionID': '123'}), (None, {'sessionID': '456'})]
+        mock_delete.return_value = None, None
+        self.connection.set_session_cache(session_cache)
+        self.connection.login({'userName': 'administrator', 'password': 'secret'})
+
+        self.connection.logout()
+        self.connection.login({'userName': 'administrator', 'password': 'secret'})
+
+        self.assertEqual(self.connection.get_session_id(), '456')
+
+    @patch.object(connection, 'post')
+    @patch.object(connection, 'get_connection')
+    def test_do_http_logs_in_again_when_session_is_rejected(self, mock_get_conn, mock_post):
+        mock_conn = Mock()
+        mock_get_conn.return_value = mock_conn
+        mock_conn.getresponse.side_effect = [self.__make_http_response(401), self.__make_http_response(200)]
+        mock_post.return_value = None, {'sessionID': '456'}
+        self.connection._cred = {'userName': 'administrator', 'password': 'secret'}
+        self.connection.set_session_id('123')
+
+        resp, body = self.connection.do_http('GET', '/rest/fc-networks', '')
+
+        self.assertEqual(resp.status, 200)
+        mock_post.assert_called_once_with('/rest/login-sessions', {'userName': 'administrator', 'password': 'secret'})
+        self.assertEqual(mock_conn.request.call_args_list[1][0][3]['auth'], '456')
+        self.assertEqual(self.connection.get_session_id(), '456')
+
+    @patch.object(connection, 'post')
+    @patch.object(connection, 'get_connection')
+    def test_do_http_does_not_log_in_again_with_session_id_credentials(self, mock_get_conn, mock_post):
+        mock_conn = Mock()
+        mock_get_conn.return_value = mock_conn
+        mock_conn.getresponse.return_value = self.__make_http_response(401)
+        self.connection._cred = {'sessionID': '123'}
+        self.connection.set_session_id('123')
+
+        resp, body = self.connection.do_http('GET', '/rest/fc-networks', '')
+
+        self.assertEqual(resp.status, 401)
+        mock_post.assert_not_called()
+        self.assertEqual(mock_conn.request.call_count, 1)
+
+    @patch.object(connection, 'post')
+    @patch.object(connection, 'get_connection')
+    def test_do_http_does_not_log_in_again_when_login_is_rejected(self, mock_get_conn, mock_post):
+        mock_conn = Mock()
+        mock_get_conn.return_value = mock_conn
+        mock_conn.getresponse.return_value = self.__make_http_response(401)
+        self.connection._cred = {'userName': 'administrator', 'password': 'wrong'}
+
+        resp, body = self.connection.do_http('POST', '/rest/login-sessions', '{}')
+
+        self.assertEqual(resp.status, 401)
+        mock_post.assert_not_called()
+
+    @patch.object(connection, 'get_connection')
+    def test_do_http_is_limited_by_request_limiter(self, mock_get_conn):
+        mock_get_conn.return_value.getresponse.return_value = self.__make_http_response(200)
+        request_limiter = MagicMock()
+        self.connection.set_request_limiter(request_limiter)
+
+        self.connection.do_http('GET', '/rest/fc-networks', '')
+
+        request_limiter.limit.assert_called_once_with('GET', '/rest/fc-networks')
+        request_limiter.limit.return_value.__exit__.assert_called_once_with(None, None, None)
+
+    @patch.object(connection, 'get_connection')
+    def test_download_to_stream_is_limited_by_request_limiter(self, mock_get_conn):
+        mock_response = mock_get_conn.return_value.getresponse.return_value
+        mock_response.read.side_effect = ['111', None]
+        mock_response.status = 200
+        request_limiter = MagicMock()
+        self.connection.set_request_limiter(request_limiter)
+
+        self.connection.download_to_stream(Mock(), '/rest/download.zip')
+
+        request_limiter.limit.assert_called_once_with('GET', '/rest/download.zip')
+
+    @patch('time.sleep')
+    @patch.object(connection, 'get_connection')
+    def test_do_http_retries_unavailable_idempotent_request(self, mock_get_conn, mock_sleep):
+        unavailable = self.__make_http_response(503)
+        unavailable.getheader.return_value = '7'
+        mock_get_conn.return_value.getresponse.side_effect = [unavailable, self.__make_http_response(200)]
+        self.connection.set_retry_policy(RetryPolicy(jitter=0))
+
+        resp, body = self.connection.do_http('GET', '/rest/fc-networks', '')
+
+        self.assertEqual(resp.status, 200)
+        mock_sleep.assert_called_once_with(7)
+
+    @patch('time.sleep')
+    @patch.object(connection, 'get_connection')
+    def test_do_http_returns_unavailable_response_after_max_attempts(self, mock_get_conn, mock_sleep):
+        unavailable = self.__make_http_response(503)
+        unavailable.getheader.return_value = None
+        mock_get_conn.return_value.getresponse.return_value = unavailable
+        self.connection.set_retry_policy(RetryPolicy(max_attempts=3, min_delay=1, jitter=0))
+
+        resp, body = self.connection.do_http('GET', '/rest/fc-networks', '')
+
+        self.assertEqual(resp.status, 503)
+        mock_sleep.assert_has_calls([call(1), call(2)])
+        self.assertEqual(mock_get_conn.return_value.request.call_count, 3)
+
+    @patch('time.sleep')
+    @patch.object(connection, 'get_connection')
+    def test_do_http_does_not_retry_post(self, mock_get_conn, mock_sleep):
+        mock_get_conn.return_value.getresponse.return_value = self.__make_http_response(503)
+
+        resp, body = self.connection.do_http('POST', '/rest/fc-networks', '{}')
+
+        self.assertEqual(resp.status, 503)
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    @patch.object(connection, 'get_connection')
+    def test_do_http_does_not_retry_post_after_bad_status_line(self, mock_get_conn, mock_sleep):
+        mock_get_conn.return_value.getresponse.side_effect = BadStatusLine(0)
+
+        self.assertRaises(HPOneViewException, self.connection.do_http, 'POST', '/rest/fc-networks', '{}')
+        mock_sleep.assert_not_called()
+
+    @patch('time.sleep')
+    @patch.object(connection, 'get_connection')
+    def test_do_http_fails_fast_while_circuit_is_open(self, mock_get_conn, mock_sleep):
+        mock_get_conn.return_value.request.side_effect = socket.error('Connection refused')
+        self.connection.set_retry_policy(RetryPolicy(max_attempts=1))
+        self.connection.set_circuit_breaker(CircuitBreaker(failure_threshold=2))
+
+        self.assertRaises(socket.error, self.connection.do_http, 'GET', '/rest/fc-networks', '')
+        self.assertRaises(socket.error, self.connection.do_http, 'GET', '/rest/fc-networks', '')
+        self.assertRaises(HPOneViewCircuitOpen, self.connection.do_http, 'GET', '/rest/fc-networks', '')
+
+        self.assertEqual(mock_get_conn.return_value.request.call_count, 2)
+
+    @patch('time.sleep')
+    @patch.object(connection, 'get_connection')
+    def test_download_to_stream_retries_unavailable_response(self, mock_get_conn, mock_sleep):
+        unavailable = Mock(status=503)
+        unavailable.getheader.return_value = None
+        available = Mock(status=200)
+        available.read.side_effect = [b'111', None]
+        mock_get_conn.return_value.getresponse.side_effect = [unavailable, available]
+        mock_stream = Mock()
+
+        self.connection.download_to_stream(mock_stream, '/rest/download.zip')
+
+        mock_stream.write.assert_called_once_with(b'111')
+        mock_sleep.assert_called_once_with(ANY)
+
     @patch.object(connection, 'get')
     def test_validate_version_exceeding_minimum(self, mock_get):
         self.connection._apiVersion = 300
@@ -962,31 +1583,15 @@ class ConnectionTest(unittest.TestCase):
 
         self.assertRaises(HPOneViewException, self.connection.validateVersion)
 
-    @patch.object(shutil, 'copyfileobj')
     @patch.object(connection, '_open')
-    def test_encode_multipart_formdata(self, mock_open, mock_copyfileobj):
-        mock_in = Mock()
-        mock_out = Mock()
+    def test_encode_multipart_formdata_is_deprecated_and_writes_no_file(self, mock_open):
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            warnings.simplefilter('always')
+            content_type = self.connection.encode_multipart_formdata('', "/a/path/filename.zip", 'filename.zip')
 
-        mock_open.side_effect = [mock_in, mock_out]
-
-        self.connection.encode_multipart_formdata('', "/a/path/filename.zip", 'filename.zip')
-
-        mock_open.assert_has_calls([call('/a/path/filename.zip', 'rb'),
-                                    call('/a/path/filename.zip.b64', 'wb')])
-
-        mock_out.write.assert_has_calls(
-            [call(bytearray(b'------------ThIs_Is_tHe_bouNdaRY_$\r\n')),
-             call(bytearray(
-                 b'Content-Disposition: form-data; name="file"; filename="filename.zip"\r\n')),
-             call(bytearray(b'Content-Type: application/octet-stream\r\n')),
-             call(bytearray(b'\r\n')),
-             call(bytearray(b'\r\n')),
-             call(bytearray(b'------------ThIs_Is_tHe_bouNdaRY_$--\r\n')),
-             call(bytearray(b'\r\n'))])
-
-        mock_in.close.assert_called_once()
-        mock_out.close.assert_called_once()
+        self.assertEqual(content_type, 'multipart/form-data; boundary=----------ThIs_Is_tHe_bouNdaRY_$')
+        self.assertEqual([warning.category for warning in caught_warnings], [DeprecationWarning])
+        mock_open.assert_not_called()
 
     def test_get_connection_ssl_trust_all(self):
 
@@ -1029,6 +1634,835 @@ class ConnectionTest(unittest.TestCase):
         self.assertEqual(conn.port, 443)
         self.assertEqual(conn._context.protocol, ssl.PROTOCOL_TLSv1_2)
 
+    def test_get_connection_should_share_ssl_context(self):
+        other_connection = connection('127.0.0.2')
+
+        self.assertIs(self.connection.get_connection()._context, other_connection.get_connection()._context)
+        self.assertEqual(self.connection.get_connection()._context.verify_mode, ssl.CERT_NONE)
+
+    @patch.object(ssl.SSLContext, 'load_verify_locations')
+    def test_get_connection_should_load_trusted_ssl_bundle_once(self, mock_lvl):
+        self.connection = connection(self.host, sslBundle='/test')
+        other_connection = connection('127.0.0.2', sslBundle='/test')
+
+        context = self.connection.get_connection()._context
+
+        self.assertIs(context, other_connection.get_connection()._context)
+        self.assertEqual(context.verify_mode, ssl.CERT_REQUIRED)
+        mock_lvl.assert_called_once_with('/test')
+
+    @patch.object(ssl.SSLContext, 'load_verify_locations')
+    def test_get_ssl_context_is_keyed_by_bundle_and_verify_mode(self, mock_lvl):
+        context = get_ssl_context('/test', ssl.CERT_REQUIRED)
+
+        self.assertIsNot(context, get_ssl_context('/other', ssl.CERT_REQUIRED))
+        self.assertIsNot(context, get_ssl_context(verify_mode=ssl.CERT_NONE))
+        self.assertIs(context, get_ssl_context('/test', ssl.CERT_REQUIRED))
+
+    @patch.object(ssl.SSLContext, 'wrap_socket')
+    def test_ssl_context_should_resume_tls_session(self, mock_wrap_socket):
+        context = get_ssl_context()
+        first_session = Mock()
+        mock_wrap_socket.side_effect = [Mock(session=first_session), Mock(session=Mock())]
+
+        context.wrap_socket(Mock(), server_hostname='127.0.0.1')
+        context.wrap_socket(Mock(), server_hostname='127.0.0.1')
+
+        self.assertIsNone(mock_wrap_socket.call_args_list[0][1]['session'])
+        self.assertIs(mock_wrap_socket.call_args_list[1][1]['session'], first_session)
+
+
+class FakeRangeResponse(object):
+    def __init__(self, status, content, headers=None, fail_after=None):
+        self.status = status
+        self._content = content
+        self._headers = headers or {}
+        self._fail_after = fail_after
+        self._sent = 0
+
+    def getheader(self, name, default=None):
+        return self._headers.get(name, default)
+
+    def read(self, size=None):
+        if self._fail_after is not None and self._sent >= self._fail_after:
+            raise socket.error('Connection reset by peer')
+        size = len(self._content) if size is None else size
+        if self._fail_after is not None:
+            size = min(size, self._fail_after - self._sent)
+        data = self._content[self._sent:self._sent + size]
+        self._sent += len(data)
+        return data
+
+
+class FakeRangeAppliance(object):
+    """Serves a content, honouring the Range headers when accept_ranges is True."""
+
+    def __init__(self, content, accept_ranges=True):
+        self.content = content
+        self.accept_ranges = accept_ranges
+        self.requested_ranges = []
+        self.failures = {}
+        self._lock = threading.Lock()
+
+    def get_connection(self):
+        appliance = self
+        conn = Mock()
+
+        def request(method, url, body, headers):
+            conn.range = headers.get('Range')
+            with appliance._lock:
+                appliance.requested_ranges.append(conn.range)
+
+        def getresponse():
+            return appliance.respond(conn.range)
+
+        conn.request.side_effect = request
+        conn.getresponse.side_effect = getresponse
+        return conn
+
+    def respond(self, range_header):
+        with self._lock:
+            fail_after = self.failures.pop(range_header, None)
+        if not self.accept_ranges or not range_header:
+            return FakeRangeResponse(200, self.content, {'Content-Length': str(len(self.content))}, fail_after=fail_after)
+
+        start, end = range_header[len('bytes='):].split('-')
+        start = int(start)
+        end = int(end) if end else len(self.content) - 1
+        if start >= len(self.content):
+            return FakeRangeResponse(416, b'', {'Content-Range': 'bytes */%d' % len(self.content)})
+
+        end = min(end, len(self.content) - 1)
+        return FakeRangeResponse(206, self.content[start:end + 1],
+                                 {'Content-Range': 'bytes %d-%d/%d' % (start, end, len(self.content))},
+                                 fail_after=fail_after)
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache()
+
+    def test_get_ttl_of_default_policies(self):
+        self.assertEqual(self.cache.get_ttl('/rest/server-hardware-types?start=0&count=-1'), ResponseCache.DEFAULT_TTL)
+        self.assertEqual(self.cache.get_ttl('/rest/interconnect-types/1'), ResponseCache.DEFAULT_TTL)
+        self.assertEqual(self.cache.get_ttl('/rest/fc-networks/schema'), ResponseCache.DEFAULT_TTL)
+        self.assertIsNone(self.cache.get_ttl('/rest/fc-networks'))
+        self.assertIsNone(self.cache.get_ttl('/rest/tasks/1'))
+
+    def test_get_ttl_of_longest_matching_prefix(self):
+        cache = ResponseCache(policies={'/rest/appliance': 60, '/rest/appliance/nodeinfo/version': 0,
+                                        '/rest/appliance/nodeinfo': 600})
+
+        self.assertEqual(cache.get_ttl('/rest/appliance/network-interfaces'), 60)
+        self.assertEqual(cache.get_ttl('/rest/appliance/nodeinfo/status'), 600)
+        self.assertIsNone(cache.get_ttl('/rest/appliance/nodeinfo/version'))
+
+    def test_get_returns_copy_of_cached_response(self):
+        self.cache.put('/rest/switch-types', {'members': [{'name': 'Cisco Nexus 55xx'}]})
+
+        self.cache.get('/rest/switch-types')['members'].append({'name': 'other'})
+
+        self.assertEqual(self.cache.get('/rest/switch-types'), {'members': [{'name': 'Cisco Nexus 55xx'}]})
+
+    def test_put_ignores_uri_without_policy_and_non_json_body(self):
+        self.cache.put('/rest/fc-networks', {'members': []})
+        self.cache.put('/rest/switch-types', 'error page')
+
+        self.assertIsNone(self.cache.get('/rest/fc-networks'))
+        self.assertIsNone(self.cache.get('/rest/switch-types'))
+
+    @patch('time.time')
+    def test_get_discards_expired_response(self, mock_time):
+        mock_time.return_value = 1000.0
+        self.cache.put('/rest/switch-types', {'members': []})
+
+        mock_time.return_value = 1000.0 + ResponseCache.DEFAULT_TTL
+        self.assertEqual(self.cache.get('/rest/switch-types'), {'members': []})
+
+        mock_time.return_value = 1001.0 + ResponseCache.DEFAULT_TTL
+        self.assertIsNone(self.cache.get('/rest/switch-types'))
+
+    def test_put_discards_least_recently_used_response(self):
+        cache = ResponseCache(max_size=2)
+        cache.put('/rest/switch-types/1', {'id': 1})
+        cache.put('/rest/switch-types/2', {'id': 2})
+        cache.get('/rest/switch-types/1')
+
+        cache.put('/rest/switch-types/3', {'id': 3})
+
+        self.assertEqual(cache.get('/rest/switch-types/1'), {'id': 1})
+        self.assertIsNone(cache.get('/rest/switch-types/2'))
+        self.assertEqual(cache.get('/rest/switch-types/3'), {'id': 3})
+
+    def test_invalidate_prefix(self):
+        self.cache.put('/rest/switch-types/1', {'id': 1})
+        self.cache.put('/rest/interconnect-types/1', {'id': 1})
+
+        self.cache.invalidate('/rest/switch-types')
+
+        self.assertIsNone(self.cache.get('/rest/switch-types/1'))
+        self.assertEqual(self.cache.get('/rest/interconnect-types/1'), {'id': 1})
+
+    def test_clear(self):
+        self.cache.put('/rest/switch-types/1', {'id': 1})
+        self.cache.put('/rest/interconnect-types/1', {'id': 1})
+
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get('/rest/switch-types/1'))
+        self.assertIsNone(self.cache.get('/rest/interconnect-types/1'))
+
+    def test_get_collection_uri(self):
+        self.assertEqual(get_collection_uri('/rest/fc-networks/1?force=true'), '/rest/fc-networks')
+        self.assertEqual(get_collection_uri('/rest/fc-networks'), '/rest/fc-networks')
+        self.assertEqual(get_collection_uri('/rest/fc-networks?filter=name=a/b'), '/rest/fc-networks')
+
+
+class TokenBucketTest(unittest.TestCase):
+    @patch.object(TokenBucket, '_clock')
+    def test_reserve_lets_burst_through(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        bucket = TokenBucket(rate=2, capacity=3)
+
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0])
+        self.assertEqual(bucket.reserve(), 0.5)
+        self.assertEqual(bucket.reserve(), 1)
+
+    @patch.object(TokenBucket, '_clock')
+    def test_reserve_refills_tokens_up_to_capacity(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        bucket = TokenBucket(rate=2, capacity=2)
+        bucket.reserve()
+        bucket.reserve()
+
+        mock_monotonic.return_value = 110
+
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0, 0, 0.5])
+
+    def test_capacity_defaults_to_rate(self):
+        self.assertEqual(TokenBucket(rate=5).capacity, 5)
+        self.assertEqual(TokenBucket(rate=0.5).capacity, 1)
+
+    @patch('time.sleep')
+    @patch.object(TokenBucket, '_clock')
+    def test_acquire_waits_for_token(self, mock_monotonic, mock_sleep):
+        mock_monotonic.return_value = 100
+        bucket = TokenBucket(rate=4, capacity=1)
+
+        bucket.acquire()
+        bucket.acquire()
+
+        mock_sleep.assert_called_once_with(0.25)
+
+
+class RequestLimiterTest(unittest.TestCase):
+    def test_get_budget(self):
+        self.assertEqual(RequestLimiter.get_budget('GET', '/rest/fc-networks'), 'read')
+        self.assertEqual(RequestLimiter.get_budget('GET', '/rest/tasks/123'), 'task')
+        self.assertEqual(RequestLimiter.get_budget('POST', '/rest/fc-networks'), 'write')
+        self.assertEqual(RequestLimiter.get_budget('DELETE', '/rest/tasks/123'), 'write')
+
+    def test_unknown_budget_raises_value_error(self):
+        self.assertRaises(ValueError, RequestLimiter, {'reads': {'rate': 1}})
+
+    @patch.object(TokenBucket, 'acquire')
+    def test_limit_waits_for_token_of_budget(self, mock_acquire):
+        limiter = RequestLimiter({'write': {'rate': 1}})
+
+        with limiter.limit('GET', '/rest/fc-networks'):
+            pass
+        mock_acquire.assert_not_called()
+
+        with limiter.limit('POST', '/rest/fc-networks'):
+            pass
+        mock_acquire.assert_called_once_with()
+
+    def test_limit_holds_requests_in_flight(self):
+        limiter = RequestLimiter({'read': {'max_in_flight': 2}})
+        in_flight = []
+        max_in_flight = []
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def request():
+            with limiter.limit('GET', '/rest/fc-networks'):
+                with lock:
+                    in_flight.append(1)
+                    max_in_flight.append(len(in_flight))
+                release.wait(1)
+                with lock:
+                    in_flight.pop()
+
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(max(max_in_flight), 2)
+
+    def test_limit_releases_request_on_error(self):
+        limiter = RequestLimiter({'read': {'max_in_flight': 1}})
+
+        with self.assertRaises(socket.error):
+            with limiter.limit('GET', '/rest/fc-networks'):
+                raise socket.error()
+
+        with limiter.limit('GET', '/rest/fc-networks'):
+            pass
+
+    def test_get_request_limiter_is_shared_by_host_and_limits(self):
+        limiter = get_request_limiter('10.0.0.1', {'read': {'rate': 10}})
+
+        self.assertIs(get_request_limiter('10.0.0.1', {'read': {'rate': 10}}), limiter)
+        self.assertIsNot(get_request_limiter('10.0.0.2', {'read': {'rate': 10}}), limiter)
+        self.assertIsNot(get_request_limiter('10.0.0.1', {'read': {'rate': 5}}), limiter)
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def test_can_retry_idempotent_methods_only(self):
+        policy = RetryPolicy(max_attempts=3)
+
+        self.assertTrue(policy.can_retry('GET', 1))
+        self.assertTrue(policy.can_retry('put', 2))
+        self.assertTrue(policy.can_retry('DELETE', 1))
+        self.assertFalse(policy.can_retry('POST', 1))
+        self.assertFalse(policy.can_retry('PATCH', 1))
+        self.assertFalse(policy.can_retry('GET', 3))
+
+    def test_get_delay_backs_off_exponentially_up_to_max_delay(self):
+        policy = RetryPolicy(min_delay=1, max_delay=5, multiplier=2, jitter=0)
+
+        self.assertEqual([policy.get_delay(attempt) for attempt in range(1, 5)], [1, 2, 4, 5])
+
+    @patch('random.uniform')
+    def test_get_delay_adds_jitter(self, mock_uniform):
+        mock_uniform.return_value = 1.1
+        policy = RetryPolicy(min_delay=2, jitter=0.2)
+
+        self.assertAlmostEqual(policy.get_delay(1), 2.2)
+        mock_uniform.assert_called_once_with(0.8, 1.2)
+
+    def test_get_delay_waits_for_retry_after_up_to_max_delay(self):
+        policy = RetryPolicy(min_delay=1, max_delay=30, jitter=0)
+
+        self.assertEqual(policy.get_delay(1, retry_after=10), 10)
+        self.assertEqual(policy.get_delay(1, retry_after=120), 30)
+        self.assertEqual(policy.get_delay(3, retry_after=0), 4)
+
+    def test_from_config(self):
+        policy = RetryPolicy.from_config({'max_attempts': 3, 'retry_statuses': [503]})
+
+        self.assertEqual(policy.max_attempts, 3)
+        self.assertEqual(policy.retry_statuses, (503,))
+        self.assertEqual(policy.min_delay, RetryPolicy.DEFAULT_MIN_DELAY)
+
+    def test_from_config_with_defaults(self):
+        policy = RetryPolicy.from_config(True)
+
+        self.assertEqual(policy.max_attempts, RetryPolicy.DEFAULT_MAX_ATTEMPTS)
+        self.assertEqual(policy.retry_statuses, RetryPolicy.DEFAULT_RETRY_STATUSES)
+
+    def test_get_retry_after(self):
+        response = Mock()
+
+        response.getheader.return_value = '120'
+        self.assertEqual(get_retry_after(response), 120)
+
+        response.getheader.return_value = None
+        self.assertIsNone(get_retry_after(response))
+
+        response.getheader.return_value = 'soon'
+        self.assertIsNone(get_retry_after(response))
+
+    @patch('time.time')
+    def test_get_retry_after_with_http_date(self, mock_time):
+        mock_time.return_value = 784111717
+        response = Mock()
+        response.getheader.return_value = 'Sun, 06 Nov 1994 08:49:37 GMT'
+
+        self.assertEqual(get_retry_after(response), 60)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(CircuitBreaker, '_clock')
+        self.mock_clock = patcher.start()
+        self.mock_clock.return_value = 100
+        self.addCleanup(patcher.stop)
+        self.circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    def test_opens_after_consecutive_failures(self):
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.before_request()
+        self.circuit_breaker.record_failure()
+
+        self.assertTrue(self.circuit_breaker.is_open)
+        self.assertRaises(HPOneViewCircuitOpen, self.circuit_breaker.before_request)
+
+    def test_success_resets_failures(self):
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_success()
+        self.circuit_breaker.record_failure()
+
+        self.assertFalse(self.circuit_breaker.is_open)
+
+    def test_lets_one_probe_through_after_reset_timeout(self):
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+
+        self.mock_clock.return_value = 130
+        self.circuit_breaker.before_request()
+
+        self.assertRaises(HPOneViewCircuitOpen, self.circuit_breaker.before_request)
+
+    def test_successful_probe_closes_circuit(self):
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+        self.mock_clock.return_value = 130
+        self.circuit_breaker.before_request()
+
+        self.circuit_breaker.record_success()
+
+        self.assertFalse(self.circuit_breaker.is_open)
+        self.circuit_breaker.before_request()
+
+    def test_failed_probe_opens_circuit_again(self):
+        self.circuit_breaker.record_failure()
+        self.circuit_breaker.record_failure()
+        self.mock_clock.return_value = 130
+        self.circuit_breaker.before_request()
+
+        self.circuit_breaker.record_failure()
+
+        self.mock_clock.return_value = 159
+        self.assertRaises(HPOneViewCircuitOpen, self.circuit_breaker.before_request)
+        self.mock_clock.return_value = 160
+        self.circuit_breaker.before_request()
+
+    def test_get_circuit_breaker_is_shared_by_host_and_options(self):
+        circuit_breaker = get_circuit_breaker('10.0.0.1', 5, 30)
+
+        self.assertIs(get_circuit_breaker('10.0.0.1', 5, 30), circuit_breaker)
+        self.assertIsNot(get_circuit_breaker('10.0.0.2', 5, 30), circuit_breaker)
+        self.assertIsNot(get_circuit_breaker('10.0.0.1', 3, 30), circuit_breaker)
+
+
+class SessionCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'sessions')
+        self.addCleanup(shutil.rmtree, os.path.dirname(self.path))
+        self.cache = SessionCache(path=self.path, ttl=60)
+
+    def get_entry_names(self):
+        return [name for name in os.listdir(self.path) if name.endswith('.json')]
+
+    def test_get_returns_value_put(self):
+        self.cache.put('key', {'sessionID': '123'})
+
+        self.assertEqual(self.cache.get('key'), {'sessionID': '123'})
+        self.assertEqual(SessionCache(path=self.path).get('key'), {'sessionID': '123'})
+
+    def test_get_without_entry_returns_none(self):
+        self.assertIsNone(self.cache.get('key'))
+
+    @patch('time.time')
+    def test_get_discards_expired_entry(self, mock_time):
+        mock_time.return_value = 1000
+        self.cache.put('key', '123')
+
+        mock_time.return_value = 1061
+
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual(self.get_entry_names(), [])
+
+    def test_get_ignores_invalid_entry(self):
+        self.cache.put('key', '123')
+        with open(os.path.join(self.path, self.get_entry_names()[0]), 'w') as entry_file:
+            entry_file.write('{')
+
+        self.assertIsNone(self.cache.get('key'))
+
+    def test_discard_removes_entry(self):
+        self.cache.put('key', '123')
+        self.cache.put('other key', '456')
+
+        self.cache.discard('key')
+
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual(self.cache.get('other key'), '456')
+
+    def test_entries_are_readable_by_owner_only(self):
+        self.cache.put('key', '123')
+
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o700)
+        for name in os.listdir(self.path):
+            self.assertEqual(os.stat(os.path.join(self.path, name)).st_mode & 0o777, 0o600)
+
+    def test_file_names_do_not_contain_key(self):
+        self.cache.put('key', '123')
+
+        self.assertNotIn('key', self.get_entry_names()[0])
+
+    def test_file_names_are_keyed_with_the_secret_of_the_cache(self):
+        other_path = os.path.join(os.path.dirname(self.path), 'other')
+        other_cache = SessionCache(path=other_path)
+
+        self.cache.put('key', '123')
+        other_cache.put('key', '123')
+
+        self.assertEqual(len(self.get_entry_names()), 1)
+        self.assertNotIn(self.get_entry_names()[0], os.listdir(other_path))
+        with open(os.path.join(self.path, SessionCache.SECRET_FILE_NAME), 'rb') as secret_file:
+            self.assertEqual(len(secret_file.read()), SessionCache.SECRET_SIZE)
+
+    def test_get_without_secret_does_not_create_directory(self):
+        self.assertIsNone(self.cache.get('key'))
+        self.cache.discard('key')
+
+        self.assertFalse(os.path.exists(self.path))
+
+
+class ETagCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = ETagCache(max_size=2)
+
+    def test_get_returns_etag_and_copy_of_body(self):
+        self.cache.put('/rest/server-profiles/1', '1-abc', {'connections': []})
+
+        self.cache.get('/rest/server-profiles/1')[1]['connections'].append({'id': 1})
+
+        self.assertEqual(self.cache.get('/rest/server-profiles/1'), ('1-abc', {'connections': []}))
+
+    def test_put_without_etag_discards_previous_response(self):
+        self.cache.put('/rest/server-profiles/1', '1-abc', {'name': 'profile'})
+        self.cache.put('/rest/server-profiles/10', '1-abc', {'name': 'profile'})
+
+        self.cache.put('/rest/server-profiles/1', None, {'name': 'profile'})
+
+        self.assertIsNone(self.cache.get('/rest/server-profiles/1'))
+        self.assertIsNotNone(self.cache.get('/rest/server-profiles/10'))
+
+    def test_put_discards_least_recently_used_response(self):
+        self.cache.put('/rest/server-profiles/1', '1', {'id': 1})
+        self.cache.put('/rest/server-profiles/2', '2', {'id': 2})
+        self.cache.get('/rest/server-profiles/1')
+
+        self.cache.put('/rest/server-profiles/3', '3', {'id': 3})
+
+        self.assertIsNotNone(self.cache.get('/rest/server-profiles/1'))
+        self.assertIsNone(self.cache.get('/rest/server-profiles/2'))
+
+
+class TransferProgressTest(unittest.TestCase):
+    @patch('time.time')
+    def test_update_reports_throughputs(self, mock_time):
+        mock_time.side_effect = [100.0, 102.0, 103.0]
+        callback = Mock()
+        transfer_progress = TransferProgress([callback], '/rest/download.zip', 'download', total_bytes=1000,
+                                             bytes_transferred=100)
+
+        transfer_progress.update(200)
+        transfer_progress.update(300)
+
+        callback.assert_has_calls([
+            call(dict(uri='/rest/download.zip', direction='download', bytes_transferred=300, total_bytes=1000,
+                      elapsed=2.0, throughput=100.0, average_throughput=100.0)),
+            call(dict(uri='/rest/download.zip', direction='download', bytes_transferred=600, total_bytes=1000,
+                      elapsed=3.0, throughput=300.0, average_throughput=500 / 3.0))])
+
+    @patch('time.time')
+    def test_update_without_elapsed_time(self, mock_time):
+        mock_time.return_value = 100.0
+        callback = Mock()
+        transfer_progress = TransferProgress([callback], '/rest/resources/', 'upload')
+
+        transfer_progress.update(200)
+
+        progress = callback.call_args[0][0]
+        self.assertIsNone(progress['throughput'])
+        self.assertIsNone(progress['average_throughput'])
+
+    def test_set_total_bytes_keeps_known_size(self):
+        transfer_progress = TransferProgress([], '/rest/download.zip', 'download')
+
+        transfer_progress.set_total_bytes(1000)
+        transfer_progress.set_total_bytes(10)
+
+        self.assertEqual(transfer_progress.total_bytes, 1000)
+
+
+class DownloadTest(unittest.TestCase):
+    def setUp(self):
+        self.connection = connection('127.0.0.1')
+        self.appliance = FakeRangeAppliance(b'0123456789abcdefghij')
+        self.connection.get_connection = self.appliance.get_connection
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, 'backup.bkp')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def __read_file(self):
+        with open(self.file_path, 'rb') as file:
+            return file.read()
+
+    def test_download_to_stream_resumes_from_last_byte_written(self):
+        self.appliance.failures[None] = 7
+        stream = Mock()
+
+        result = self.connection.download_to_stream(stream, '/rest/backups/archive/backup')
+
+        self.assertTrue(result)
+        self.assertEqual(self.appliance.requested_ranges, [None, 'bytes=7-'])
+        self.assertEqual(b''.join(c[0][0] for c in stream.write.call_args_list), b'0123456789abcdefghij')
+
+    def test_download_to_stream_resumes_after_incomplete_read(self):
+        responses = [FakeRangeResponse(200, b'01234'), FakeRangeResponse(206, b'56789')]
+        responses[0].read = Mock(side_effect=[b'01234', IncompleteRead(b'')])
+        mock_conn = Mock()
+        mock_conn.getresponse.side_effect = responses
+        self.connection.get_connection = Mock(return_value=mock_conn)
+        stream = Mock()
+
+        self.connection.download_to_stream(stream, '/rest/download.zip')
+
+        stream.write.assert_has_calls([call(b'01234'), call(b'56789')])
+        self.assertEqual(mock_conn.request.call_args_list[1][0][3]['Range'], 'bytes=5-')
+
+    def test_download_to_stream_resume_is_not_checked_again_by_circuit_breaker(self):
+        stale_conn = Mock()
+        stale_conn.request.side_effect = socket.error('Connection reset by peer')
+        pool = ConnectionPool()
+        pool.release(('127.0.0.1', None, None), stale_conn)
+        self.connection.set_connection_pool(pool)
+        circuit_breaker = Mock()
+        self.connection.set_circuit_breaker(circuit_breaker)
+        stream = Mock()
+
+        self.connection.download_to_stream(stream, '/rest/backups/archive/backup')
+
+        circuit_breaker.before_request.assert_called_once_with()
+        circuit_breaker.record_success.assert_called_once_with()
+        circuit_breaker.record_failure.assert_not_called()
+        self.assertEqual(b''.join(c[0][0] for c in stream.write.call_args_list), b'0123456789abcdefghij')
+
+    def test_download_to_stream_skips_bytes_written_when_range_is_not_accepted(self):
+        self.appliance.accept_ranges = False
+        self.appliance.failures[None] = 7
+        stream = Mock()
+
+        self.connection.download_to_stream(stream, '/rest/backups/archive/backup')
+
+        self.assertEqual(b''.join(c[0][0] for c in stream.write.call_args_list), b'0123456789abcdefghij')
+
+    def test_download_to_stream_from_offset(self):
+        stream = Mock()
+
+        self.connection.download_to_stream(stream, '/rest/backups/archive/backup', offset=10)
+
+        self.assertEqual(self.appliance.requested_ranges, ['bytes=10-'])
+        self.assertEqual(b''.join(c[0][0] for c in stream.write.call_args_list), b'abcdefghij')
+
+    def test_download_to_stream_reads_chunks_of_download_chunk_size(self):
+        self.connection.set_download_chunk_size(8)
+        stream = Mock()
+
+        self.connection.download_to_stream(stream, '/rest/download.zip')
+        stream.write.assert_has_calls([call(b'01234567'), call(b'89abcdef'), call(b'ghij')])
+
+        stream = Mock()
+        self.connection.download_to_stream(stream, '/rest/download.zip', chunk_size=16)
+        stream.write.assert_has_calls([call(b'0123456789abcdef'), call(b'ghij')])
+
+    def test_download_to_stream_raises_socket_error_when_nothing_was_received(self):
+        self.appliance.failures[None] = 0
+        self.connection.set_retry_policy(RetryPolicy(max_attempts=1))
+
+        self.assertRaises(socket.error, self.connection.download_to_stream, Mock(), '/rest/download.zip')
+
+    def test_download_to_file(self):
+        result = self.connection.download_to_file('/rest/backups/archive/backup', self.file_path)
+
+        self.assertTrue(result)
+        self.assertEqual(self.__read_file(), b'0123456789abcdefghij')
+        self.assertEqual(self.appliance.requested_ranges, [None])
+
+    def test_download_to_file_overwrites_existing_file(self):
+        with open(self.file_path, 'wb') as file:
+            file.write(b'previous backup')
+
+        self.connection.download_to_file('/rest/backups/archive/backup', self.file_path)
+
+        self.assertEqual(self.__read_file(), b'0123456789abcdefghij')
+
+    def test_download_to_file_resumes_partial_file(self):
+        with open(self.file_path, 'wb') as file:
+            file.write(b'012345')
+
+        self.connection.download_to_file('/rest/backups/archive/backup', self.file_path, resume=True)
+
+        self.assertEqual(self.__read_file(), b'0123456789abcdefghij')
+        self.assertEqual(self.appliance.requested_ranges, ['bytes=6-'])
+
+    def test_download_to_file_resume_of_complete_file(self):
+        with open(self.file_path, 'wb') as file:
+            file.write(b'0123456789abcdefghij')
+
+        result = self.connection.download_to_file('/rest/backups/archive/backup', self.file_path, resume=True)
+
+        self.assertTrue(result)
+        self.assertEqual(self.__read_file(), b'0123456789abcdefghij')
+
+    def test_download_to_file_in_parallel_segments(self):
+        self.connection.set_download_segment_size(6)
+
+        self.connection.download_to_file('/rest/backups/archive/backup', self.file_path, max_workers=3)
+
+        self.assertEqual(self.__read_file(), b'0123456789abcdefghij')
+        self.assertEqual(self.appliance.requested_ranges[0], 'bytes=0-5')
+        self.assertEqual(sorted(self.appliance.requested_ranges[1:]), ['bytes=12-17', 'bytes=18-19', 'bytes=6-11'])
+
+    def test_download_to_file_in_parallel_segments_from_connection_settings(self):
+        self.connection.set_max_download_workers(2)
+        self.connection.set_download_segment_size(8)
+        with open(self.file_path, 'wb') as file:
+            file.write(b'0123')
+
+        self.connection.download_to_file('/rest/backups/archive/backup', self.file_path, resume=True)
+
+        self.assertEqual(self.__read_file(), b'0123456789abcdefghij')
+        self.assertEqual(self.appliance.requested_ranges[0], 'bytes=4-11')
+        self.assertEqual(sorted(self.appliance.requested_ranges[1:]), ['bytes=12-19'])
+
+    def test_download_to_file_in_one_request_when_range_is_not_accepted(self):
+        self.appliance.accept_ranges = False
+        self.connection.set_download_segment_size(6)
+
+        self.connection.download_to_file('/rest/backups/archive/backup', self.file_path, max_workers=3)
+
+        self.assertEqual(self.__read_file(), b'0123456789abcdefghij')
+        self.assertEqual(self.appliance.requested_ranges, ['bytes=0-5'])
+
+    def test_download_to_file_resumes_interrupted_segment(self):
+        self.connection.set_download_segment_size(6)
+        self.appliance.failures['bytes=6-11'] = 2
+
+        self.connection.download_to_file('/rest/backups/archive/backup', self.file_path, max_workers=3)
+
+        self.assertEqual(self.__read_file(), b'0123456789abcdefghij')
+        self.assertIn('bytes=8-11', self.appliance.requested_ranges)
+
+    def test_download_to_file_keeps_bytes_in_sequence_when_segment_fails(self):
+        self.connection.set_download_segment_size(6)
+        self.appliance.failures['bytes=12-17'] = 0
+        self.connection.set_retry_policy(RetryPolicy(max_attempts=1))
+
+        self.assertRaises(socket.error, self.connection.download_to_file, '/rest/backups/archive/backup',
+                          self.file_path, max_workers=3)
+
+        self.assertEqual(self.__read_file(), b'0123456789ab')
+
+    def test_download_to_stream_reports_progress(self):
+        self.connection.set_download_chunk_size(8)
+        progress_callback = Mock()
+
+        self.connection.download_to_stream(Mock(), '/rest/download.zip', progress_callback=progress_callback)
+
+        reported = [c[0][0] for c in progress_callback.call_args_list]
+        self.assertEqual([p['bytes_transferred'] for p in reported], [8, 16, 20])
+        self.assertEqual(reported[-1]['total_bytes'], 20)
+        self.assertEqual(reported[-1]['direction'], 'download')
+        self.assertEqual(reported[-1]['uri'], '/rest/download.zip')
+
+    def test_download_to_file_reports_progress_of_resumed_download(self):
+        with open(self.file_path, 'wb') as file:
+            file.write(b'012345')
+        progress_callback = Mock()
+
+        self.connection.download_to_file('/rest/backups/archive/backup', self.file_path, resume=True,
+                                         progress_callback=progress_callback)
+
+        progress = progress_callback.call_args[0][0]
+        self.assertEqual(progress['bytes_transferred'], 20)
+        self.assertEqual(progress['total_bytes'], 20)
+
+    def test_download_to_file_in_parallel_segments_reports_progress_of_all_segments(self):
+        self.connection.set_download_segment_size(6)
+        progress_callback = Mock()
+
+        self.connection.download_to_file('/rest/backups/archive/backup', self.file_path, max_workers=3,
+                                         progress_callback=progress_callback)
+
+        reported = [c[0][0] for c in progress_callback.call_args_list]
+        self.assertEqual(len(reported), 4)
+        self.assertEqual(max(p['bytes_transferred'] for p in reported), 20)
+        self.assertTrue(all(p['total_bytes'] == 20 for p in reported))
+
+    def test_download_reports_progress_to_transfer_callback_of_connection(self):
+        transfer_callback = Mock()
+        self.connection.set_transfer_callback(transfer_callback)
+
+        self.connection.download_to_file('/rest/backups/archive/backup', self.file_path)
+
+        self.assertEqual(transfer_callback.call_args[0][0]['bytes_transferred'], 20)
+
+    def test_get_content_range_size(self):
+        self.assertEqual(get_content_range_size('bytes 0-99/1000'), 1000)
+        self.assertEqual(get_content_range_size('bytes */1000'), 1000)
+        self.assertIsNone(get_content_range_size('bytes 0-99/*'))
+        self.assertIsNone(get_content_range_size(None))
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = ConnectionPool(max_size=2, idle_timeout=30)
+        self.key = ('127.0.0.1', None, None)
+
+    def test_acquire_when_pool_is_empty(self):
+        self.assertIsNone(self.pool.acquire(self.key))
+
+    def test_acquire_returns_released_connection(self):
+        conn = Mock()
+        self.pool.release(self.key, conn)
+
+        self.assertEqual(self.pool.acquire(self.key), conn)
+        self.assertIsNone(self.pool.acquire(self.key))
+
+    def test_acquire_is_keyed_by_host_and_proxy(self):
+        self.pool.release(self.key, Mock())
+
+        self.assertIsNone(self.pool.acquire(('127.0.0.1', '10.0.0.1', 3128)))
+
+    @patch('time.time')
+    def test_acquire_discards_expired_connections(self, mock_time):
+        conn = Mock()
+        mock_time.return_value = 100
+        self.pool.release(self.key, conn)
+
+        mock_time.return_value = 131
+        self.assertIsNone(self.pool.acquire(self.key))
+        conn.close.assert_called_once_with()
+
+    def test_release_closes_connection_when_pool_is_full(self):
+        connections = [Mock(), Mock(), Mock()]
+        for conn in connections:
+            self.pool.release(self.key, conn)
+
+        connections[0].close.assert_not_called()
+        connections[1].close.assert_not_called()
+        connections[2].close.assert_called_once_with()
+
+    def test_clear_closes_idle_connections(self):
+        conn = Mock()
+        self.pool.release(self.key, conn)
+
+        self.pool.clear()
+
+        conn.close.assert_called_once_with()
+        self.assertIsNone(self.pool.acquire(self.key))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+###
+# (C) Copyright (2012-2019) Hewlett Packard Enterprise Development LP
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+###
+
+import unittest
+
+import mock
+
+from hpOneView.connection import connection
+from hpOneView.exceptions import HPOneViewException
+from hpOneView.federated_client import FederatedOneViewClient
+from hpOneView.oneview_client import OneViewClient
+
+
+class FederatedOneViewClientTest(unittest.TestCase):
+    def setUp(self):
+        self.client_a = mock.Mock()
+        self.client_b = mock.Mock()
+        self.federated_client = FederatedOneViewClient({'oneview-b': self.client_b, 'oneview-a': self.client_a})
+
+    def test_get_all_merges_members_tagged_with_appliance(self):
+        self.client_a.server_hardware.get_all.return_value = [{'name': 'server 1'}]
+        self.client_b.server_hardware.get_all.return_value = [{'name': 'server 2'}, {'name': 'server 3'}]
+
+        result = self.federated_client.get_all('server_hardware', filter="powerState='On'")
+
+        self.assertEqual(result.members, [{'name': 'server 1', 'appliance': 'oneview-a'},
+                                          {'name': 'server 2', 'appliance': 'oneview-b'},
+                                          {'name': 'server 3', 'appliance': 'oneview-b'}])
+        self.assertTrue(result.succeeded)
+        self.client_a.server_hardware.get_all.assert_called_once_with(filter="powerState='On'")
+        self.client_b.server_hardware.get_all.assert_called_once_with(filter="powerState='On'")
+
+    def test_get_all_does_not_change_members_of_clients(self):
+        members = [{'name': 'server 1'}]
+        self.client_a.server_hardware.get_all.return_value = members
+        self.client_b.server_hardware.get_all.return_value = []
+
+        self.federated_client.get_all('server_hardware')
+
+        self.assertEqual(members, [{'name': 'server 1'}])
+
+    def test_get_all_tolerates_failed_appliance(self):
+        error = HPOneViewException('Service unavailable')
+        self.client_a.server_hardware.get_all.side_effect = error
+        self.client_b.server_hardware.get_all.return_value = [{'name': 'server 2'}]
+
+        result = self.federated_client.get_all('server_hardware')
+
+        self.assertEqual(result.members, [{'name': 'server 2', 'appliance': 'oneview-b'}])
+        self.assertEqual(result.errors, {'oneview-a': error})
+        self.assertEqual(list(result.results), ['oneview-b'])
+        self.assertFalse(result.succeeded)
+
+    @mock.patch('hpOneView.federated_client.logger')
+    def test_query_logs_failed_appliance(self, mock_logger):
+        error = HPOneViewException('Service unavailable')
+        self.client_a.server_hardware.get_all.side_effect = error
+        self.client_b.server_hardware.get_all.return_value = []
+
+        self.federated_client.get_all('server_hardware')
+
+        mock_logger.warning.assert_called_once_with('Query of the appliance %s failed: %s', 'oneview-a', error)
+
+    def test_get_by(self):
+        self.client_a.server_profiles.get_by.return_value = [{'name': 'profile'}]
+        self.client_b.server_profiles.get_by.return_value = []
+
+        result = self.federated_client.get_by('server_profiles', 'name', 'profile')
+
+        self.assertEqual(result.members, [{'name': 'profile', 'appliance': 'oneview-a'}])
+        self.client_a.server_profiles.get_by.assert_called_once_with('name', 'profile')
+
+    def test_search(self):
+        self.client_a.index_resources.get_all.return_value = [{'uri': '/rest/server-hardware/1'}]
+        self.client_b.index_resources.get_all.return_value = [{'uri': '/rest/server-hardware/1'}]
+
+        result = self.federated_client.search(category='server-hardware', query='ProLiant')
+
+        self.assertEqual(result.members, [{'uri': '/rest/server-hardware/1', 'appliance': 'oneview-a'},
+                                          {'uri': '/rest/server-hardware/1', 'appliance': 'oneview-b'}])
+        self.client_a.index_resources.get_all.assert_called_once_with(category='server-hardware', query='ProLiant')
+
+    def test_query_returns_result_of_each_appliance(self):
+        self.client_a.connection.get.return_value = {'currentVersion': 800}
+        self.client_b.connection.get.return_value = {'currentVersion': 1000}
+
+        result = self.federated_client.query(lambda client: client.connection.get('/rest/version'))
+
+        self.assertEqual(dict(result.results), {'oneview-a': {'currentVersion': 800},
+                                                'oneview-b': {'currentVersion': 1000}})
+        self.assertEqual(result.members, [])
+
+    def test_logout(self):
+        self.federated_client.logout()
+
+        self.client_a.connection.logout.assert_called_once_with()
+        self.client_b.connection.logout.assert_called_once_with()
+
+    def test_clients(self):
+        self.assertEqual(self.federated_client.clients, {'oneview-a': self.client_a, 'oneview-b': self.client_b})
+        self.assertEqual(self.federated_client.login_errors, {})
+
+    @mock.patch.object(connection, 'login')
+    def test_from_configs_names_appliances_after_ip(self, mock_login):
+        configs = [{"ip": "172.16.102.59", "credentials": {"userName": "administrator", "password": ""}},
+                   {"ip": "172.16.102.60", "credentials": {"userName": "administrator", "password": ""}}]
+
+        federated_client = FederatedOneViewClient.from_configs(configs)
+
+        clients = federated_client.clients
+        self.assertEqual(sorted(clients), ["172.16.102.59", "172.16.102.60"])
+        self.assertIsInstance(clients["172.16.102.59"], OneViewClient)
+        self.assertEqual(clients["172.16.102.60"].connection.get_host(), "172.16.102.60")
+
+    @mock.patch.object(connection, 'login')
+    def test_from_configs_with_duplicated_ip_raises_value_error(self, mock_login):
+        configs = [{"ip": "172.16.102.59", "credentials": {"userName": "administrator", "password": ""}},
+                   {"ip": "172.16.102.59", "credentials": {"userName": "other", "password": ""}}]
+
+        self.assertRaises(ValueError, FederatedOneViewClient.from_configs, configs)
+        mock_login.assert_not_called()
+
+    @mock.patch.object(connection, 'login')
+    def test_from_configs_leaves_out_appliances_failing_to_log_in(self, mock_login):
+        error = HPOneViewException('Invalid credentials')
+        mock_login.side_effect = [None, error]
+        configs = {"oneview-a": {"ip": "172.16.102.59", "credentials": {"userName": "administrator"}},
+                   "oneview-b": {"ip": "172.16.102.60", "credentials": {"userName": "administrator"}}}
+
+        federated_client = FederatedOneViewClient.from_configs(configs, max_workers=1)
+
+        self.assertEqual(list(federated_client.clients), ["oneview-a"])
+        self.assertEqual(federated_client.login_errors, {"oneview-b": error})
@@ -25,8 +25,10 @@ import io
 import unittest
 import mock
 
-from hpOneView.connection import connection
-from hpOneView.oneview_client import OneViewClient
+from hpOneView.connection import connection, ConnectionPool, ResponseCache, ETagCache, SessionCache, \
+    RequestLimiter, RetryPolicy, CircuitBreaker
+from hpOneView.exceptions import HPOneViewException
+from hpOneView.oneview_client import OneViewClient, RESOURCE_CLIENTS, NEW_RESOURCE_CLIENTS
 from hpOneView.resources.security.certificate_authority import CertificateAuthority
 from hpOneView.resources.data_services.metric_streaming import MetricStreaming
 from hpOneView.resources.facilities.power_devices import PowerDevices
@@ -74,6 +76,8 @@ from hpOneView.resources.uncategorized.os_deployment_servers import OsDeployment
 from hpOneView.resources.activity.alerts import Alerts
 from hpOneView.resources.activity.events import Events
 from hpOneView.resources.security.certificate_rabbitmq import CertificateRabbitMQ
+from hpOneView.resources.task_listener import ScmbTaskListener
+from hpOneView.resources.task_monitor import ExponentialPollPolicy
 from hpOneView.resources.security.roles import Roles
 from hpOneView.resources.security.users import Users
 from hpOneView.resources.settings.appliance_device_read_community import ApplianceDeviceReadCommunity
@@ -385,6 +389,349 @@ class OneViewClientTest(unittest.TestCase):
         self.assertEqual(i3s.connection.get_host(), "172.16.102.50")
         self.assertEqual(client.connection.get_host(), "172.16.102.59")
 
+    def test_connection_pool_is_disabled_by_default(self):
+        self.assertIsNone(self._oneview.connection.get_connection_pool())
+
+    @mock.patch.object(connection, 'login')
+    def test_connection_pool_from_config(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "connection_pool": {"max_size": 5, "idle_timeout": 60},
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+        pool = client.connection.get_connection_pool()
+
+        self.assertIsInstance(pool, ConnectionPool)
+        self.assertEqual(pool.max_size, 5)
+        self.assertEqual(pool.idle_timeout, 60)
+
+    @mock.patch.object(connection, 'login')
+    def test_connection_pool_is_shared_with_image_streamer_client(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "image_streamer_ip": "172.16.102.50",
+                  "connection_pool": True,
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+        i3s = client.create_image_streamer_client()
+
+        self.assertEqual(client.connection.get_connection_pool().max_size, ConnectionPool.DEFAULT_MAX_SIZE)
+        self.assertIs(i3s.connection.get_connection_pool(), client.connection.get_connection_pool())
+
+    @mock.patch.object(connection, 'login')
+    def test_ssl_context_is_shared_with_image_streamer_client(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "image_streamer_ip": "172.16.102.50",
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+        i3s = client.create_image_streamer_client()
+
+        self.assertIs(i3s.connection.get_connection()._context, client.connection.get_connection()._context)
+
+    def test_response_cache_is_disabled_by_default(self):
+        self.assertIsNone(self._oneview.connection.get_response_cache())
+
+    @mock.patch.object(connection, 'login')
+    def test_response_cache_from_config(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "image_streamer_ip": "172.16.102.50",
+                  "response_cache": {"max_size": 50, "policies": {"/rest/enclosure-groups": 30, "/rest/version": 0}},
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+        response_cache = client.connection.get_response_cache()
+        i3s_response_cache = client.create_image_streamer_client().connection.get_response_cache()
+
+        self.assertEqual(response_cache.max_size, 50)
+        self.assertEqual(response_cache.get_ttl("/rest/enclosure-groups/1"), 30)
+        self.assertEqual(response_cache.get_ttl("/rest/switch-types"), ResponseCache.DEFAULT_TTL)
+        self.assertIsNone(response_cache.get_ttl("/rest/version"))
+        self.assertIsNot(i3s_response_cache, response_cache)
+        self.assertEqual(i3s_response_cache.policies, response_cache.policies)
+
+    @mock.patch.object(connection, 'login')
+    def test_response_cache_with_default_values(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "response_cache": True,
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+        response_cache = client.connection.get_response_cache()
+
+        self.assertEqual(response_cache.max_size, ResponseCache.DEFAULT_MAX_SIZE)
+        self.assertEqual(response_cache.policies, ResponseCache.DEFAULT_POLICIES)
+
+    def test_default_retry_policy(self):
+        retry_policy = self._oneview.connection.get_retry_policy()
+
+        self.assertIsInstance(retry_policy, RetryPolicy)
+        self.assertEqual(retry_policy.max_attempts, RetryPolicy.DEFAULT_MAX_ATTEMPTS)
+        self.assertIsNone(self._oneview.connection.get_circuit_breaker())
+
+    @mock.patch.object(connection, 'login')
+    def test_retries_from_config(self, mock_login):
+        config = {"ip": "172.16.102.60",
+                  "image_streamer_ip": "172.16.102.50",
+                  "retry_policy": {"max_attempts": 3, "max_delay": 10},
+                  "circuit_breaker": {"failure_threshold": 4, "reset_timeout": 60},
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+        retry_policy = client.connection.get_retry_policy()
+        circuit_breaker = client.connection.get_circuit_breaker()
+        i3s_connection = client.create_image_streamer_client().connection
+
+        self.assertEqual(retry_policy.max_attempts, 3)
+        self.assertEqual(retry_policy.max_delay, 10)
+        self.assertIsInstance(circuit_breaker, CircuitBreaker)
+        self.assertEqual(circuit_breaker.failure_threshold, 4)
+        self.assertEqual(circuit_breaker.reset_timeout, 60)
+        self.assertIs(OneViewClient(config).connection.get_circuit_breaker(), circuit_breaker)
+        self.assertIs(i3s_connection.get_retry_policy(), retry_policy)
+        self.assertIsNot(i3s_connection.get_circuit_breaker(), circuit_breaker)
+        self.assertEqual(i3s_connection.get_circuit_breaker().failure_threshold, 4)
+
+    @mock.patch.object(connection, 'login')
+    def test_circuit_breaker_with_defaults(self, mock_login):
+        config = {"ip": "172.16.102.61",
+                  "circuit_breaker": True,
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        circuit_breaker = OneViewClient(config).connection.get_circuit_breaker()
+
+        self.assertEqual(circuit_breaker.failure_threshold, CircuitBreaker.DEFAULT_FAILURE_THRESHOLD)
+        self.assertEqual(circuit_breaker.reset_timeout, CircuitBreaker.DEFAULT_RESET_TIMEOUT)
+
+    def test_request_limits_are_disabled_by_default(self):
+        self.assertIsNone(self._oneview.connection.get_request_limiter())
+
+    @mock.patch.object(connection, 'login')
+    def test_request_limits_from_config(self, mock_login):
+        limits = {"read": {"rate": 20, "burst": 40, "max_in_flight": 8},
+                  "task": {"rate": 2}}
+        config = {"ip": "172.16.102.59",
+                  "image_streamer_ip": "172.16.102.50",
+                  "request_limits": limits,
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+        other_client = OneViewClient(config)
+        request_limiter = client.connection.get_request_limiter()
+        i3s_request_limiter = client.create_image_streamer_client().connection.get_request_limiter()
+
+        self.assertIsInstance(request_limiter, RequestLimiter)
+        self.assertEqual(request_limiter.limits, limits)
+        self.assertIs(other_client.connection.get_request_limiter(), request_limiter)
+        self.assertIsNot(i3s_request_limiter, request_limiter)
+        self.assertEqual(i3s_request_limiter.limits, limits)
+
+    def test_session_cache_is_disabled_by_default(self):
+        self.assertIsNone(self._oneview.connection.get_session_cache())
+
+    @mock.patch.object(connection, 'login')
+    def test_session_cache_from_config(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "session_cache": {"path": "/tmp/sessions", "ttl": 600},
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        session_cache = OneViewClient(config).connection.get_session_cache()
+
+        self.assertIsInstance(session_cache, SessionCache)
+        self.assertEqual(session_cache.path, "/tmp/sessions")
+        self.assertEqual(session_cache.ttl, 600)
+
+    @mock.patch.object(connection, 'login')
+    def test_session_cache_with_defaults(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "session_cache": True,
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        session_cache = OneViewClient(config).connection.get_session_cache()
+
+        self.assertEqual(session_cache.path, SessionCache.DEFAULT_PATH)
+        self.assertEqual(session_cache.ttl, SessionCache.DEFAULT_TTL)
+
+    def test_conditional_requests_are_disabled_by_default(self):
+        self.assertIsNone(self._oneview.connection.get_etag_cache())
+
+    @mock.patch.object(connection, 'login')
+    def test_conditional_requests_from_config(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "image_streamer_ip": "172.16.102.50",
+                  "conditional_requests": {"max_size": 1000},
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+        etag_cache = client.connection.get_etag_cache()
+        i3s_etag_cache = client.create_image_streamer_client().connection.get_etag_cache()
+
+        self.assertIsInstance(etag_cache, ETagCache)
+        self.assertEqual(etag_cache.max_size, 1000)
+        self.assertIsNot(i3s_etag_cache, etag_cache)
+        self.assertEqual(i3s_etag_cache.max_size, 1000)
+
+    def test_trusted_data_age_is_disabled_by_default(self):
+        self.assertIsNone(self._oneview.connection.get_trusted_data_age())
+
+    @mock.patch.object(connection, 'login')
+    def test_trusted_data_age_from_config(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "image_streamer_ip": "172.16.102.50",
+                  "trusted_data_age": 30,
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+
+        self.assertEqual(client.connection.get_trusted_data_age(), 30)
+        self.assertEqual(client.create_image_streamer_client().connection.get_trusted_data_age(), 30)
+
+    def test_parallel_pagination_is_disabled_by_default(self):
+        self.assertEqual(self._oneview.connection.get_max_page_workers(), 1)
+
+    @mock.patch.object(connection, 'login')
+    def test_parallel_pagination_from_config(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "image_streamer_ip": "172.16.102.50",
+                  "parallel_pagination": {"max_workers": 8},
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+
+        self.assertEqual(client.connection.get_max_page_workers(), 8)
+        self.assertEqual(client.create_image_streamer_client().connection.get_max_page_workers(), 8)
+
+    def test_task_polling_uses_default_poll_policy(self):
+        self.assertIsNone(self._oneview.connection.get_poll_policy())
+
+    @mock.patch.object(connection, 'login')
+    def test_task_polling_from_config(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "image_streamer_ip": "172.16.102.50",
+                  "task_polling": {"min_interval": 0.5, "max_interval": 20, "jitter": 0, "use_task_progress": True},
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+        poll_policy = client.connection.get_poll_policy()
+
+        self.assertIsInstance(poll_policy, ExponentialPollPolicy)
+        self.assertEqual(poll_policy.min_interval, 0.5)
+        self.assertEqual(poll_policy.max_interval, 20)
+        self.assertEqual(poll_policy.multiplier, ExponentialPollPolicy.DEFAULT_MULTIPLIER)
+        self.assertEqual(poll_policy.jitter, 0)
+        self.assertTrue(poll_policy.use_task_progress)
+        self.assertIs(client.create_image_streamer_client().connection.get_poll_policy(), poll_policy)
+
+    def test_file_transfer_uses_default_upload_chunk_size(self):
+        self.assertEqual(self._oneview.connection.get_upload_chunk_size(), connection.DEFAULT_UPLOAD_CHUNK_SIZE)
+
+    @mock.patch.object(connection, 'login')
+    def test_file_transfer_from_config(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "image_streamer_ip": "172.16.102.50",
+                  "file_transfer": {"upload_chunk_size": 1048576,
+                                    "download_chunk_size": 65536,
+                                    "max_download_workers": 4,
+                                    "download_segment_size": 33554432},
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+        i3s = client.create_image_streamer_client()
+
+        for oneview_connection in (client.connection, i3s.connection):
+            self.assertEqual(oneview_connection.get_upload_chunk_size(), 1048576)
+            self.assertEqual(oneview_connection.get_download_chunk_size(), 65536)
+            self.assertEqual(oneview_connection.get_max_download_workers(), 4)
+            self.assertEqual(oneview_connection.get_download_segment_size(), 33554432)
+
+    @mock.patch.object(connection, 'login')
+    def test_file_transfer_with_default_values(self, mock_login):
+        config = {"ip": "172.16.102.59",
+                  "file_transfer": True,
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+
+        self.assertEqual(client.connection.get_upload_chunk_size(), connection.DEFAULT_UPLOAD_CHUNK_SIZE)
+        self.assertEqual(client.connection.get_download_chunk_size(), connection.DEFAULT_DOWNLOAD_CHUNK_SIZE)
+        self.assertEqual(client.connection.get_max_download_workers(), 1)
+        self.assertEqual(client.connection.get_download_segment_size(), connection.DEFAULT_DOWNLOAD_SEGMENT_SIZE)
+
+    def test_task_notifications_are_disabled_by_default(self):
+        self.assertIsNone(self._oneview.connection.get_task_listener())
+
+    @mock.patch.object(ScmbTaskListener, 'start')
+    @mock.patch.object(CertificateAuthority, 'get')
+    @mock.patch.object(CertificateRabbitMQ, 'get_key_pair')
+    @mock.patch.object(connection, 'login')
+    def test_task_notifications_from_config(self, mock_login, mock_get_key_pair, mock_get_ca, mock_start):
+        mock_get_key_pair.return_value = {"base64SSLCertData": "cert", "base64SSLKeyData": "key"}
+        mock_get_ca.return_value = "ca"
+        config = {"ip": "172.16.102.59",
+                  "task_notifications": {"alias_name": "my_alias"},
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+        task_listener = client.connection.get_task_listener()
+
+        mock_get_key_pair.assert_called_once_with("my_alias")
+        mock_start.assert_called_once_with()
+        self.assertIsInstance(task_listener, ScmbTaskListener)
+        self.assertEqual(task_listener._host, "172.16.102.59")
+        self.assertEqual(task_listener._ca_certificate, "ca")
+
+    @mock.patch.object(ScmbTaskListener, 'start')
+    @mock.patch.object(CertificateAuthority, 'get')
+    @mock.patch.object(CertificateRabbitMQ, 'get_key_pair')
+    @mock.patch.object(connection, 'login')
+    def test_task_notifications_fall_back_to_polling_when_unavailable(self, mock_login, mock_get_key_pair, mock_get_ca,
+                                                                      mock_start):
+        mock_start.side_effect = HPOneViewException("amqp not installed")
+        config = {"ip": "172.16.102.59",
+                  "task_notifications": True,
+                  "credentials": {
+                      "userName": "administrator",
+                      "password": "password"}}
+
+        client = OneViewClient(config)
+
+        mock_get_key_pair.assert_called_once_with("default")
+        self.assertIsNone(client.connection.get_task_listener())
+
     def test_fc_networks_has_right_type(self):
         self.assertIsInstance(self._oneview.fc_networks, FcNetworks)
 
@@ -400,6 +747,19 @@ class OneViewClientTest(unittest.TestCase):
     def test_fcoe_networks_has_value(self):
         self.assertIsNotNone(self._oneview.fcoe_networks)
 
+    def test_resource_clients_are_created_for_each_property(self):
+        for name in RESOURCE_CLIENTS:
+            if name in NEW_RESOURCE_CLIENTS:
+                self.assertIsNot(getattr(self._oneview, name), getattr(self._oneview, name))
+            else:
+                self.assertIs(getattr(self._oneview, name), getattr(self._oneview, name))
+
+    def test_resource_clients_are_not_shared_between_clients(self):
+        with mock.patch.object(connection, 'login'):
+            other_client = OneViewClient({"ip": "172.16.102.59", "credentials": {"userName": "administrator"}})
+
+        self.assertIsNot(self._oneview.fcoe_networks, other_client.fcoe_networks)
+
     def test_lazy_loading_fcoe_networks(self):
         fcn = self._oneview.fcoe_networks
         self.assertEqual(fcn, self._oneview.fcoe_networks)